@@ -1,13 +1,19 @@
 """The Norway Alerts integration."""
 import logging
+from datetime import timedelta
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryNotReady
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
 
 from .const import (
     DOMAIN,
     PLATFORMS,
+    DATA_SESSION_PROVIDER,
+    DATA_SNAPSHOT_STORES,
+    WARNING_TYPE_AVALANCHE,
     CONF_LANG,
     CONF_COUNTY_ID,
     CONF_COUNTY_NAME,
@@ -19,11 +25,34 @@ from .const import (
     CONF_ENABLE_NOTIFICATIONS,
     CONF_NOTIFICATION_SEVERITY,
     NOTIFICATION_SEVERITY_YELLOW_PLUS,
+    CONF_SNAPSHOT_MAX_AGE,
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
+    STORAGE_VERSION,
+    STORAGE_KEY,
 )
+from .api import async_get_avalanche_snapshot, async_get_session_provider
+from .formatting import RENDERER
+from .hub import async_get_coordinator_hub
+from .icons import async_register_icon_view
+from .scheduler import async_get_poll_scheduler, poll_offset
 from .sensor import NorwayAlertsCoordinator
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+
+async def async_setup(hass: HomeAssistant, config: dict) -> bool:
+    """Set up the Norway Alerts services and icon view."""
+    async_setup_services(hass)
+    async_register_icon_view(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Norway Alerts from a config entry."""
@@ -31,50 +60,14 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     _LOGGER.debug("Setting up Norway Alerts entry: %s", entry.entry_id)
     
-    # Get config from entry.options (preferred) or entry.data (fallback)
-    config = entry.options if entry.options else entry.data
+    settings = _get_entry_settings(entry)
+    key = _coordinator_key(settings)
     
-    warning_type = config.get(CONF_WARNING_TYPE) or entry.data.get(CONF_WARNING_TYPE)
-    lang = config.get(CONF_LANG) or entry.data.get(CONF_LANG, "en")
-    test_mode = config.get(CONF_TEST_MODE, False)
-    cap_format = config.get(CONF_CAP_FORMAT, True)  # Default to True for CAP format
-    enable_notifications = config.get(CONF_ENABLE_NOTIFICATIONS, False)
-    notification_severity = config.get(CONF_NOTIFICATION_SEVERITY, NOTIFICATION_SEVERITY_YELLOW_PLUS)
-    
-    # Determine if this is a county-based or lat/lon-based configuration
-    county_id = config.get(CONF_COUNTY_ID) or entry.data.get(CONF_COUNTY_ID)
-    latitude = config.get(CONF_LATITUDE) or entry.data.get(CONF_LATITUDE)
-    longitude = config.get(CONF_LONGITUDE) or entry.data.get(CONF_LONGITUDE)
-    
-    _LOGGER.debug("Config: warning_type=%s, county_id=%s, lat=%s, lon=%s, cap_format=%s", 
-                  warning_type, county_id, latitude, longitude, cap_format)
-    
-    if county_id:
-        # County-based configuration (NVE warnings)
-        county_name = config.get(CONF_COUNTY_NAME) or entry.data.get(CONF_COUNTY_NAME, "Unknown")
-        _LOGGER.debug("Creating county-based coordinator for %s (%s)", county_name, county_id)
-        coordinator = NorwayAlertsCoordinator(
-            hass, county_id, county_name, warning_type, lang, test_mode,
-            enable_notifications, notification_severity, cap_format,
-            latitude=None, longitude=None, config_entry=entry
-        )
-    else:
-        # Lat/lon-based configuration (Met.no metalerts)
-        _LOGGER.debug("Creating coordinate-based coordinator for lat=%s, lon=%s", latitude, longitude)
-        coordinator = NorwayAlertsCoordinator(
-            hass, None, None, warning_type, lang, test_mode,
-            enable_notifications, notification_severity, cap_format,
-            latitude=latitude, longitude=longitude, config_entry=entry
-        )
-    
-    # Do the first refresh before setting up platforms
-    _LOGGER.debug("Performing first refresh for coordinator")
-    try:
-        await coordinator.async_config_entry_first_refresh()
-        _LOGGER.debug("First refresh completed successfully")
-    except Exception as err:
-        _LOGGER.error("Failed to initialize coordinator: %s", err, exc_info=True)
-        raise ConfigEntryNotReady(f"Failed to connect to API: {err}") from err
+    # Entries with the same upstream query share one coordinator (one poll, one dataset)
+    hub = async_get_coordinator_hub(hass)
+    coordinator = await hub.async_acquire(
+        key, entry.entry_id, lambda: _async_create_coordinator(hass, entry, settings, key)
+    )
     
     # Store coordinator in hass.data for the sensor platform
     _LOGGER.debug("Storing coordinator in hass.data")
@@ -91,16 +84,176 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def _async_create_coordinator(hass: HomeAssistant, entry: ConfigEntry, settings: dict, key: tuple) -> NorwayAlertsCoordinator:
+    """Create a coordinator for an upstream query and load its first data."""
+    # All entries share one pooled HTTP session
+    session_provider = async_get_session_provider(hass)
+    
+    warning_type = settings[CONF_WARNING_TYPE]
+    county_id = settings[CONF_COUNTY_ID]
+    latitude = settings[CONF_LATITUDE]
+    longitude = settings[CONF_LONGITUDE]
+    
+    # Avalanche entries share one nationwide forecast download per poll window
+    avalanche_snapshot = async_get_avalanche_snapshot(hass) if warning_type == WARNING_TYPE_AVALANCHE else None
+    
+    _LOGGER.debug("Config: warning_type=%s, county_id=%s, lat=%s, lon=%s, cap_format=%s", 
+                  warning_type, county_id, latitude, longitude, settings[CONF_CAP_FORMAT])
+    
+    if county_id:
+        # County-based configuration (NVE warnings)
+        county_name = settings[CONF_COUNTY_NAME]
+        _LOGGER.debug("Creating county-based coordinator for %s (%s)", county_name, county_id)
+        latitude = longitude = None
+    else:
+        # Lat/lon-based configuration (Met.no metalerts)
+        _LOGGER.debug("Creating coordinate-based coordinator for lat=%s, lon=%s", latitude, longitude)
+        county_name = None
+    
+    coordinator = NorwayAlertsCoordinator(
+        hass, county_id, county_name, warning_type, settings[CONF_LANG], settings[CONF_TEST_MODE],
+        settings[CONF_ENABLE_NOTIFICATIONS], settings[CONF_NOTIFICATION_SEVERITY], settings[CONF_CAP_FORMAT],
+        latitude=latitude, longitude=longitude,
+        session_provider=session_provider, avalanche_snapshot=avalanche_snapshot,
+        snapshot_store=_get_snapshot_store(hass, entry.entry_id),
+        min_poll_interval=timedelta(minutes=settings[CONF_MIN_POLL_INTERVAL]),
+        max_poll_interval=timedelta(minutes=settings[CONF_MAX_POLL_INTERVAL]),
+        poll_offset=poll_offset(key),
+    )
+    
+    # Spread first refreshes at startup and limit how many run at once
+    scheduler = async_get_poll_scheduler(hass)
+    
+    snapshot_max_age = timedelta(minutes=settings[CONF_SNAPSHOT_MAX_AGE])
+    if await coordinator.async_restore_snapshot(snapshot_max_age):
+        # Start from the saved warnings and refresh without blocking startup.
+        # The coordinator owns the task (it may outlive this entry): it is cancelled when the hub shuts it down.
+        delay = scheduler.startup_delay(coordinator.poll_offset)
+        _LOGGER.debug("Restored saved warnings, refreshing in the background in %.0f s", delay)
+        coordinator.first_refresh_task = hass.async_create_background_task(
+            scheduler.async_first_refresh(coordinator, delay),
+            f"{DOMAIN} refresh {warning_type} {county_id or (latitude, longitude)}",
+        )
+    else:
+        # Do the first refresh before setting up platforms.
+        # The coordinator is shared, so it is not tied to this entry (no async_config_entry_first_refresh).
+        _LOGGER.debug("Performing first refresh for coordinator")
+        await scheduler.async_first_refresh(coordinator)
+        if not coordinator.last_update_success:
+            await coordinator.async_shutdown()
+            _LOGGER.error("Failed to initialize coordinator: %s", coordinator.last_exception)
+            raise ConfigEntryNotReady(f"Failed to connect to API: {coordinator.last_exception}")
+        _LOGGER.debug("First refresh completed successfully")
+    
+    return coordinator
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        
+        # Shut the coordinator down if no other entry shares it
+        hub = async_get_coordinator_hub(hass)
+        others = hub.shared_with(entry.entry_id) - {entry.entry_id}
+        await hub.async_release(entry.entry_id)
+        
+        # A shared coordinator that saved to this entry's store saves to a remaining entry's store instead,
+        # so removing this entry deletes its file for good
+        if others and coordinator.snapshot_store is _get_snapshot_store(hass, entry.entry_id):
+            coordinator.snapshot_store = _get_snapshot_store(hass, min(others))
+        
+        # Recompile formatted_content.j2 when the entry is set up again (reload picks up template edits)
+        RENDERER.reset()
+        
+        # Close the shared HTTP session when the last entry goes away
+        if _is_last_loaded_entry(hass, entry):
+            session_provider = hass.data[DOMAIN].get(DATA_SESSION_PROVIDER)
+            if session_provider is not None:
+                await session_provider.async_close()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the entry's saved warnings (and cancel a pending save to them)."""
+    await _get_snapshot_store(hass, entry.entry_id).async_remove()
+    hass.data.get(DOMAIN, {}).get(DATA_SNAPSHOT_STORES, {}).pop(entry.entry_id, None)
+
+
+def _get_entry_settings(entry: ConfigEntry) -> dict:
+    """Return the coordinator settings of an entry, with defaults filled in."""
+    # Get config from entry.options (preferred) or entry.data (fallback)
+    config = entry.options if entry.options else entry.data
+    
+    county_id = config.get(CONF_COUNTY_ID) or entry.data.get(CONF_COUNTY_ID)
+    return {
+        CONF_WARNING_TYPE: config.get(CONF_WARNING_TYPE) or entry.data.get(CONF_WARNING_TYPE),
+        CONF_LANG: config.get(CONF_LANG) or entry.data.get(CONF_LANG, "en"),
+        CONF_TEST_MODE: config.get(CONF_TEST_MODE, False),
+        CONF_CAP_FORMAT: config.get(CONF_CAP_FORMAT, True),  # Default to True for CAP format
+        CONF_ENABLE_NOTIFICATIONS: config.get(CONF_ENABLE_NOTIFICATIONS, False),
+        CONF_NOTIFICATION_SEVERITY: config.get(CONF_NOTIFICATION_SEVERITY, NOTIFICATION_SEVERITY_YELLOW_PLUS),
+        CONF_SNAPSHOT_MAX_AGE: config.get(CONF_SNAPSHOT_MAX_AGE, DEFAULT_SNAPSHOT_MAX_AGE),
+        CONF_MIN_POLL_INTERVAL: config.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
+        CONF_MAX_POLL_INTERVAL: config.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+        # Determine if this is a county-based or lat/lon-based configuration
+        CONF_COUNTY_ID: county_id,
+        CONF_COUNTY_NAME: config.get(CONF_COUNTY_NAME) or entry.data.get(CONF_COUNTY_NAME, "Unknown"),
+        CONF_LATITUDE: config.get(CONF_LATITUDE) or entry.data.get(CONF_LATITUDE),
+        CONF_LONGITUDE: config.get(CONF_LONGITUDE) or entry.data.get(CONF_LONGITUDE),
+    }
+
+
+def _coordinator_key(settings: dict) -> tuple:
+    """Return the key of the upstream query an entry polls.
+    
+    Besides warning type, location, language and CAP format, test mode, the
+    notification settings and the poll interval bounds are part of the key
+    because the coordinator applies them. Municipality filter and display options are per sensor and are not.
+    """
+    county_id = settings[CONF_COUNTY_ID]
+    location = county_id if county_id else (settings[CONF_LATITUDE], settings[CONF_LONGITUDE])
+    return (
+        settings[CONF_WARNING_TYPE],
+        location,
+        settings[CONF_LANG],
+        settings[CONF_CAP_FORMAT],
+        settings[CONF_TEST_MODE],
+        settings[CONF_ENABLE_NOTIFICATIONS],
+        settings[CONF_NOTIFICATION_SEVERITY],
+        settings[CONF_MIN_POLL_INTERVAL],
+        settings[CONF_MAX_POLL_INTERVAL],
+    )
+
+
+def _get_snapshot_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding the warm-start snapshot of an entry.
+    
+    Keyed by entry ID, so options changes reuse the same file and removing
+    the entry deletes it. There is one Store per entry, so removing it also
+    cancels a delayed save still pending from its coordinator. A shared
+    coordinator saves to the store of one of the loaded entries using it;
+    snapshots record their query, so one saved before the location or
+    warning type changed is not restored.
+    """
+    stores = hass.data.setdefault(DOMAIN, {}).setdefault(DATA_SNAPSHOT_STORES, {})
+    store = stores.get(entry_id)
+    if store is None:
+        store = stores[entry_id] = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+    return store
+
+
+def _is_last_loaded_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Return True if no other Norway Alerts entry is still loaded."""
+    return not any(
+        other.entry_id != entry.entry_id and other.state is ConfigEntryState.LOADED
+        for other in hass.config_entries.async_entries(DOMAIN)
+    )
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -5,16 +5,56 @@ import datetime as dt
 import json
 import logging
 import os
+import random
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Callable
+from urllib.parse import urlsplit
 
 import aiohttp
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with Home Assistant
+    orjson = None
+
+from .models import (
+    AvalancheWarning,
+    AvalancheWarningModel,
+    MetAlertWarning,
+    MetAlertWarningModel,
+    NveWarningModel,
+    WarningModel,
+)
 from .const import (
+    DOMAIN,
     API_BASE_LANDSLIDE, 
     API_BASE_FLOOD, 
     API_BASE_AVALANCHE,
-    API_BASE_METALERTS
+    API_BASE_METALERTS,
+    DATA_SESSION_PROVIDER,
+    HTTP_TIMEOUT,
+    HTTP_POOL_LIMIT,
+    HTTP_POOL_LIMIT_PER_HOST,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+    RESPONSE_CACHE_TTL,
+    RESPONSE_CACHE_MAX_ENTRIES,
+    HTTP_RETRY_ATTEMPTS,
+    HTTP_RETRY_BACKOFF,
+    HTTP_RETRY_BACKOFF_MAX,
+    HTTP_RETRY_AFTER_MAX,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    STALE_RESULT_MAX_AGE,
+    AVALANCHE_DETAIL_CONCURRENCY,
+    AVALANCHE_DETAIL_TIMEOUT,
+    AVALANCHE_SNAPSHOT_MAX_AGE,
+    DATA_AVALANCHE_SNAPSHOT,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -41,20 +81,506 @@ def _get_user_agent() -> str:
     return f"norway_alerts/{_VERSION} jeremy.m.cook@gmail.com"
 
 
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Decode a raw JSON response body, using orjson when it is installed."""
+    if raw.startswith(_UTF8_BOM):
+        raw = raw[len(_UTF8_BOM):]
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class WarningAPIError(Exception):
+    """Raised when a warning API request does not return usable JSON."""
+
+
+class TransientAPIError(WarningAPIError):
+    """A server error worth retrying (429 or 5xx), with the server's Retry-After if given."""
+    
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(WarningAPIError):
+    """Raised without sending a request while a host's circuit breaker is open."""
+
+
+def _parse_retry_after(value: Any) -> float | None:
+    """Parse a Retry-After header (delay in seconds or HTTP date) into seconds."""
+    if not isinstance(value, str):
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - dt.datetime.now(dt.timezone.utc)).total_seconds())
+
+
+def _retry_delay(attempt: int, backoff: float, retry_after: float | None = None) -> float:
+    """Return the delay before retry number attempt (1-based).
+    
+    Exponential backoff with full jitter, so many entries failing together do
+    not retry in lockstep, but never sooner than the server's Retry-After.
+    """
+    delay = random.uniform(0, min(HTTP_RETRY_BACKOFF_MAX, backoff * 2 ** (attempt - 1)))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+class ResponseCache:
+    """Parsed API responses and their HTTP validators, keyed by URL.
+    
+    Responses younger than ttl are served straight from memory. Older ones
+    keep their ETag/Last-Modified validators and parsed JSON, so a 304 Not
+    Modified can hand back the previous object without decoding anything.
+    Requests for a URL that is already being fetched wait for that fetch
+    (see in_flight). Old URLs (e.g. yesterday's avalanche dates) are evicted
+    once max_entries is reached.
+    """
+    
+    def __init__(self, ttl: float = RESPONSE_CACHE_TTL, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES):
+        self.ttl = ttl  # Seconds a response is served without asking the server
+        self.max_entries = max_entries
+        self.in_flight: Dict[str, asyncio.Task] = {}  # URL -> fetch shared by concurrent callers
+        self._entries: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, url: str) -> Dict[str, Any] | None:
+        """Return the cached entry for a URL, if any."""
+        entry = self._entries.get(url)
+        if entry is not None:
+            self._entries.move_to_end(url)
+        return entry
+    
+    def get_fresh(self, url: str) -> Dict[str, Any] | None:
+        """Return the cached entry for a URL if it is younger than ttl."""
+        entry = self.get(url)
+        if entry is not None and time.monotonic() - entry["fetched_at"] < self.ttl:
+            return entry
+        return None
+    
+    def store(self, url: str, data: Any, etag: str | None, last_modified: str | None) -> None:
+        """Store a parsed response and its validators."""
+        self._entries[url] = {
+            "data": data,
+            "etag": etag,
+            "last_modified": last_modified,
+            "fetched_at": time.monotonic(),
+        }
+        self._entries.move_to_end(url)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def touch(self, url: str) -> None:
+        """Mark a cached response as confirmed current (after a 304)."""
+        entry = self._entries.get(url)
+        if entry is not None:
+            entry["fetched_at"] = time.monotonic()
+
+
+class CircuitBreaker:
+    """Circuit breaker for one API host.
+    
+    After failure_threshold consecutive failed requests (or a Retry-After too
+    long to wait for inline) the circuit opens and requests to the host fail
+    fast with CircuitOpenError. Once the open period has passed, a single
+    trial request is let through (half open): success closes the circuit,
+    failure opens it again.
+    """
+    
+    def __init__(self, host: str, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 reset_timeout: float = CIRCUIT_RESET_TIMEOUT):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0  # Consecutive failed requests
+        self._opened_until = 0.0  # Monotonic time; 0 while closed
+        self._trial_in_flight = False
+    
+    @property
+    def state(self) -> str:
+        """Return "closed", "open" or "half_open"."""
+        if not self._opened_until:
+            return "closed"
+        if time.monotonic() < self._opened_until:
+            return "open"
+        return "half_open"
+    
+    def acquire(self) -> bool:
+        """Reserve a request to the host.
+        
+        Returns True if the caller holds the half-open trial, which it must
+        pass back to record_success, record_failure and release. Raises
+        CircuitOpenError if no request may be sent now.
+        """
+        state = self.state
+        if state == "closed":
+            return False
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        raise CircuitOpenError(f"Circuit open for {self.host}")
+    
+    def record_success(self, trial: bool = False) -> None:
+        """Close the circuit after the host answered."""
+        if self._opened_until:
+            _LOGGER.info("Circuit closed for %s", self.host)
+        self.failures = 0
+        self._opened_until = 0.0
+        self.release(trial)
+    
+    def record_failure(self, retry_after: float | None = None, trial: bool = False) -> None:
+        """Count a failed request, opening the circuit when the threshold is reached (or the trial failed)."""
+        self.failures += 1
+        self.release(trial)
+        if retry_after is not None or trial or self.failures >= self.failure_threshold:
+            open_for = retry_after if retry_after is not None else self.reset_timeout
+            self._opened_until = time.monotonic() + open_for
+            _LOGGER.warning(
+                "Circuit opened for %s after %d failed requests, pausing requests for %.0fs",
+                self.host, self.failures, open_for,
+            )
+    
+    def release(self, trial: bool) -> None:
+        """End the caller's request; only the trial holder frees the half-open trial."""
+        if trial:
+            self._trial_in_flight = False
+
+
+class SessionProvider:
+    """Shared, pooled HTTP session for all warning API clients.
+    
+    Holds one aiohttp session on top of a keep-alive connector with a DNS cache
+    and per-host connection limits, so polls reuse open connections instead of
+    paying for a new connector, DNS lookup and TLS handshake every time.
+    The session is created on first use and can be closed and reopened.
+    
+    The provider also owns the HTTP state shared by its clients: the response
+    cache (TTL, request coalescing and conditional requests), the retry
+    policy, one circuit breaker per API host and the request counters.
+    With pooled=False every fetch opens and closes its own session instead.
+    """
+    
+    def __init__(
+        self,
+        limit: int = HTTP_POOL_LIMIT,
+        limit_per_host: int = HTTP_POOL_LIMIT_PER_HOST,
+        dns_cache_ttl: int = HTTP_DNS_CACHE_TTL,
+        keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT,
+        pooled: bool = True,
+        cache_ttl: float = RESPONSE_CACHE_TTL,
+        retry_attempts: int = HTTP_RETRY_ATTEMPTS,
+        retry_backoff: float = HTTP_RETRY_BACKOFF,
+    ):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self.pooled = pooled
+        self.response_cache = ResponseCache(ttl=cache_ttl)
+        self.retry_attempts = retry_attempts
+        self.retry_backoff = retry_backoff
+        self.breakers: Dict[str, CircuitBreaker] = {}
+        self.stats = {
+            "modified": 0,  # 200 OK, body downloaded and decoded
+            "not_modified": 0,  # 304 Not Modified, previous result reused
+            "errors": 0,
+            "cache_hits": 0,  # Served from memory within the cache TTL
+            "cache_misses": 0,  # Sent to the server
+            "coalesced": 0,  # Waited for an identical in-flight request
+            "retries": 0,  # Attempts repeated after a transient failure
+            "circuit_open": 0,  # Failed fast because the host's circuit was open
+        }
+        self._session: aiohttp.ClientSession | None = None
+    
+    def get_breaker(self, url: str) -> CircuitBreaker:
+        """Return the circuit breaker for the host of a URL."""
+        host = urlsplit(url).netloc
+        breaker = self.breakers.get(host)
+        if breaker is None:
+            breaker = self.breakers[host] = CircuitBreaker(host)
+        return breaker
+    
+    @property
+    def closed(self) -> bool:
+        """Return True if there is no open session."""
+        return self._session is None or self._session.closed
+    
+    def get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                use_dns_cache=True,
+                ttl_dns_cache=self.dns_cache_ttl,
+                keepalive_timeout=self.keepalive_timeout,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+            _LOGGER.debug(
+                "Opened shared HTTP session (limit=%d, limit_per_host=%d)",
+                self.limit, self.limit_per_host,
+            )
+        return self._session
+    
+    async def async_close(self) -> None:
+        """Close the shared session and its connection pool."""
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+            _LOGGER.debug("Closed shared HTTP session")
+    
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Yield the session to use for one fetch."""
+        if self.pooled:
+            yield self.get_session()
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+
+
+def async_get_session_provider(hass) -> SessionProvider:
+    """Return the integration-wide session provider stored in hass.data."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    provider = domain_data.get(DATA_SESSION_PROVIDER)
+    if provider is None:
+        provider = domain_data[DATA_SESSION_PROVIDER] = SessionProvider()
+        
+        async def _async_close_provider(_event) -> None:
+            await provider.async_close()
+        
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_provider)
+    return provider
+
+
 class BaseWarningAPI(ABC):
-    """Base class for warning API clients."""
+    """Base class for warning API clients.
     
-    def __init__(self, county_id: str, county_name: str, lang: str = "en"):
+    Clients keep their last successful result. When a fetch fails, that result
+    is served again (with stale set) for up to stale_max_age seconds, so a
+    flaky network does not make every active alert disappear and reappear.
+    """
+    
+    def __init__(self, county_id: str, county_name: str, lang: str = "en", session_provider: SessionProvider | None = None,
+                 stale_max_age: float = STALE_RESULT_MAX_AGE):
         self.county_id = county_id
         self.county_name = county_name
         self.lang = lang
+        # Without a shared provider, use a private one with a one-off session per fetch
+        self.session_provider = session_provider or SessionProvider(pooled=False)
         self.warning_type = self._get_warning_type()
+        self.stale_max_age = stale_max_age
+        self.stale = False  # True while the last fetch failed and an older result is served
+        self.last_success: dt.datetime | None = None
+        self._last_good: List[Dict[str, Any]] | None = None
+        self._last_good_at = 0.0
+        self._last_payload: Any = None
+        self._last_converted: Any = None
     
     @abstractmethod
     def _get_warning_type(self) -> str:
         """Return the warning type identifier."""
         pass
     
+    def _session(self):
+        """Return a context manager yielding the session for one fetch."""
+        return self.session_provider.session()
+    
+    async def _async_fetch_json(self, session: aiohttp.ClientSession, url: str,
+                                headers: Dict[str, str] | None = None,
+                                check_content_type: bool = True,
+                                timeout: float = HTTP_TIMEOUT) -> Any:
+        """GET a JSON document through the shared response cache.
+        
+        Responses younger than the cache TTL are returned from memory, and
+        concurrent requests for the same URL share a single fetch. Returned
+        objects may be shared with other clients and earlier polls; callers
+        can skip conversion by checking identity (see _convert_cached).
+        Raises WarningAPIError for unexpected status codes or content types.
+        """
+        provider = self.session_provider
+        cache = provider.response_cache
+        
+        fresh = cache.get_fresh(url)
+        if fresh is not None:
+            provider.stats["cache_hits"] += 1
+            return fresh["data"]
+        
+        task = cache.in_flight.get(url)
+        if task is not None:
+            provider.stats["coalesced"] += 1
+            _LOGGER.debug("Waiting for in-flight request: %s", url)
+        else:
+            provider.stats["cache_misses"] += 1
+            task = asyncio.ensure_future(
+                self._async_request_with_retry(session, url, headers, check_content_type, timeout)
+            )
+            cache.in_flight[url] = task
+            task.add_done_callback(lambda _task: cache.in_flight.pop(url, None))
+            # Retrieve the outcome even if every caller was cancelled meanwhile
+            task.add_done_callback(lambda _task: _task.cancelled() or _task.exception())
+        
+        # Shield so one caller timing out does not cancel the fetch for the others
+        return await asyncio.shield(task)
+    
+    async def _async_request_with_retry(self, session: aiohttp.ClientSession, url: str,
+                                        headers: Dict[str, str] | None, check_content_type: bool,
+                                        timeout: float) -> Any:
+        """GET a URL through its host's circuit breaker, retrying transient failures.
+        
+        Timeouts, connection errors, 429 and 5xx responses are retried up to
+        retry_attempts times with jittered exponential backoff, honouring
+        Retry-After. Raises CircuitOpenError without sending anything while
+        the host's circuit is open.
+        """
+        provider = self.session_provider
+        breaker = provider.get_breaker(url)
+        try:
+            trial = breaker.acquire()
+        except CircuitOpenError:
+            provider.stats["circuit_open"] += 1
+            raise
+        
+        try:
+            for attempt in range(1, provider.retry_attempts + 1):
+                try:
+                    data = await self._async_request_json(session, url, headers, check_content_type, timeout)
+                except (TransientAPIError, aiohttp.ClientError, TimeoutError) as err:
+                    retry_after = getattr(err, "retry_after", None)
+                    if retry_after is not None and retry_after > HTTP_RETRY_AFTER_MAX:
+                        # Too long to wait inline: pause the whole host instead
+                        breaker.record_failure(retry_after, trial)
+                        raise
+                    if attempt == provider.retry_attempts:
+                        breaker.record_failure(trial=trial)
+                        raise
+                    delay = _retry_delay(attempt, provider.retry_backoff, retry_after)
+                    provider.stats["retries"] += 1
+                    _LOGGER.debug("Request to %s failed (%s), retry %d in %.1fs",
+                                  url, err or type(err).__name__, attempt, delay)
+                    await asyncio.sleep(delay)
+                except WarningAPIError:
+                    # The host answered; the problem is the response, not the endpoint
+                    breaker.record_success(trial)
+                    raise
+                else:
+                    breaker.record_success(trial)
+                    return data
+        finally:
+            # A half-open trial that was cancelled must not block the host
+            breaker.release(trial)
+    
+    async def _async_request_json(self, session: aiohttp.ClientSession, url: str,
+                                  headers: Dict[str, str] | None, check_content_type: bool,
+                                  timeout: float) -> Any:
+        """Perform one GET, sending a conditional request if the URL was seen before.
+        
+        On 304 Not Modified the previously parsed object is returned as-is.
+        Raises TransientAPIError for 429 and 5xx responses.
+        """
+        provider = self.session_provider
+        cached = provider.response_cache.get(url)
+        
+        request_headers = dict(headers or {})
+        if cached is not None:
+            if cached["etag"]:
+                request_headers["If-None-Match"] = cached["etag"]
+            if cached["last_modified"]:
+                request_headers["If-Modified-Since"] = cached["last_modified"]
+        
+        async with asyncio.timeout(timeout):
+            async with session.get(url, headers=request_headers) as response:
+                if response.status == 304 and cached is not None:
+                    provider.stats["not_modified"] += 1
+                    provider.response_cache.touch(url)
+                    _LOGGER.debug("Not modified, reusing previous response: %s", url)
+                    return cached["data"]
+                
+                if response.status != 200:
+                    provider.stats["errors"] += 1
+                    if response.status == 429 or response.status >= 500:
+                        raise TransientAPIError(
+                            f"HTTP {response.status}",
+                            _parse_retry_after(response.headers.get("Retry-After")),
+                        )
+                    raise WarningAPIError(f"HTTP {response.status}")
+                
+                if check_content_type:
+                    content_type = response.headers.get("Content-Type", "")
+                    if "application/json" not in content_type:
+                        provider.stats["errors"] += 1
+                        raise WarningAPIError(f"Unexpected content type: {content_type}")
+                
+                # Decode the raw body once, skipping aiohttp's bytes -> str -> json round trip
+                raw = await response.read()
+                try:
+                    data = _json_loads(raw)
+                except ValueError as err:
+                    provider.stats["errors"] += 1
+                    raise WarningAPIError(f"Invalid JSON: {err}") from err
+                provider.stats["modified"] += 1
+                provider.response_cache.store(
+                    url, data, response.headers.get("ETag"), response.headers.get("Last-Modified")
+                )
+                return data
+    
+    def _convert_cached(self, payload: Any, convert: Callable[[Any], Any]) -> Any:
+        """Convert a payload, reusing the previous result if the payload object is unchanged."""
+        if payload is not None and payload is self._last_payload:
+            return self._last_converted
+        converted = convert(payload)
+        self._last_payload, self._last_converted = payload, converted
+        return converted
+    
+    def _remember_result(self, warnings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Record a successful fetch result and return it."""
+        self._last_good = warnings
+        self._last_good_at = time.monotonic()
+        self.last_success = dt.datetime.now(dt.timezone.utc)
+        self.stale = False
+        return warnings
+    
+    def restore_result(self, warnings: List[Dict[str, Any]], fetched_at: dt.datetime) -> None:
+        """Seed the last good result from a saved snapshot (e.g. after a restart).
+        
+        The snapshot then counts as stale data: it is served if the next fetch
+        fails, until it is older than stale_max_age.
+        """
+        age = max(0.0, (dt.datetime.now(dt.timezone.utc) - fetched_at).total_seconds())
+        self._last_good = warnings
+        self._last_good_at = time.monotonic() - age
+        self.last_success = fetched_at
+        self.stale = True
+    
+    def _stale_result(self) -> List[Dict[str, Any]]:
+        """Return the last good result after a failed fetch.
+        
+        Raises WarningAPIError if there is none recent enough, so the failure
+        is not mistaken for "no active warnings".
+        """
+        if self._last_good is None or time.monotonic() - self._last_good_at > self.stale_max_age:
+            self._last_good = None
+            self.stale = False
+            raise WarningAPIError(f"Fetching {self.warning_type} warnings failed and no recent result is available")
+        
+        self.stale = True
+        _LOGGER.warning(
+            "Fetching %s warnings failed, keeping %d warnings from %s",
+            self.warning_type, len(self._last_good), self.last_success.isoformat(),
+        )
+        return self._last_good
+    
     @abstractmethod
     async def fetch_warnings(self) -> List[Dict[str, Any]]:
         """Fetch warnings from the API."""
@@ -64,8 +590,8 @@ class BaseWarningAPI(ABC):
 class CountyBasedAPI(BaseWarningAPI):
     """Base class for county-based APIs (landslide/flood)."""
     
-    async def _fetch_county_warnings(self, base_url: str, warning_type: str) -> List[Dict[str, Any]]:
-        """Fetch warnings using county-based API."""
+    async def _fetch_county_warnings(self, base_url: str, warning_type: str) -> List[Dict[str, Any]] | None:
+        """Fetch warnings using county-based API, or return None if the fetch failed."""
         lang_key = "2" if self.lang == "en" else "1"
         url = f"{base_url}/Warning/County/{self.county_id}/{lang_key}"
         
@@ -77,32 +603,30 @@ class CountyBasedAPI(BaseWarningAPI):
         _LOGGER.debug("Fetching %s warnings from: %s", warning_type, url)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with asyncio.timeout(10):
-                    async with session.get(url, headers=headers) as response:
-                        if response.status != 200:
-                            _LOGGER.error("Error fetching %s data: %s", warning_type, response.status)
-                            return []
-
-                        content_type = response.headers.get("Content-Type", "")
-                        if "application/json" in content_type:
-                            json_data = await response.json()
-                            if json_data:
-                                _LOGGER.info("Successfully fetched %s warnings (count: %d)", warning_type, len(json_data))
-                                return json_data
-                            else:
-                                _LOGGER.info("No %s warnings found", warning_type)
-                                return []
-                        else:
-                            _LOGGER.error("Unexpected content type for %s: %s", warning_type, content_type)
-                            return []
+            async with self._session() as session:
+                json_data = await self._async_fetch_json(session, url, headers)
+            
+            if json_data:
+                _LOGGER.info("Successfully fetched %s warnings (count: %d)", warning_type, len(json_data))
+                return json_data
+            else:
+                _LOGGER.info("No %s warnings found", warning_type)
+                return []
                         
+        except WarningAPIError as err:
+            _LOGGER.error("Error fetching %s data: %s", warning_type, err)
+            return None
         except aiohttp.ClientError as err:
             _LOGGER.error("Error fetching %s warnings: %s", warning_type, err)
-            return []
+            return None
         except Exception as err:
             _LOGGER.error("Unexpected error fetching %s warnings: %s", warning_type, err)
-            return []
+            return None
+    
+    @staticmethod
+    def _tag_warnings(warnings: List[Dict[str, Any]], warning_type: str) -> List[WarningModel]:
+        """Build warning models tagged with the warning type (the payload is left untouched)."""
+        return [NveWarningModel({**warning, "_warning_type": warning_type}) for warning in warnings]
 
 
 class LandslideAPI(CountyBasedAPI):
@@ -114,10 +638,10 @@ class LandslideAPI(CountyBasedAPI):
     async def fetch_warnings(self) -> List[Dict[str, Any]]:
         """Fetch landslide warnings from NVE API."""
         warnings = await self._fetch_county_warnings(API_BASE_LANDSLIDE, "landslide")
-        # Add warning type to each warning
-        for warning in warnings:
-            warning["_warning_type"] = "landslide"
-        return warnings
+        if warnings is None:
+            return self._stale_result()
+        # Add warning type to each warning (skipped when the response was not modified)
+        return self._remember_result(self._convert_cached(warnings, lambda data: self._tag_warnings(data, "landslide")))
 
 
 class FloodAPI(CountyBasedAPI):
@@ -129,30 +653,324 @@ class FloodAPI(CountyBasedAPI):
     async def fetch_warnings(self) -> List[Dict[str, Any]]:
         """Fetch flood warnings from NVE API."""
         warnings = await self._fetch_county_warnings(API_BASE_FLOOD, "flood")
-        # Add warning type to each warning
-        for warning in warnings:
-            warning["_warning_type"] = "flood"
-        return warnings
+        if warnings is None:
+            return self._stale_result()
+        # Add warning type to each warning (skipped when the response was not modified)
+        return self._remember_result(self._convert_cached(warnings, lambda data: self._tag_warnings(data, "flood")))
+
+
+class AvalancheSnapshot:
+    """Nationwide avalanche forecast shared by all avalanche entries.
+    
+    Avalanche regions do not follow county borders, so every county entry needs
+    the same region summary and Detail downloads. The first entry to poll in a
+    window fetches them for the whole country; the others reuse the snapshot
+    and select their county's regions in memory.
+    """
+    
+    def __init__(self, max_age: float = AVALANCHE_SNAPSHOT_MAX_AGE):
+        self.max_age = max_age  # Seconds a snapshot is reused
+        self._lock = asyncio.Lock()
+        self._region_details: Dict[Any, List[Dict[str, Any]] | None] | None = None
+        self._window: str | None = None  # Forecast dates the snapshot was fetched for
+        self._fetched_at = 0.0
+    
+    def _is_fresh(self, window: str) -> bool:
+        """Return True if the stored snapshot can be reused for this forecast window."""
+        return (
+            self._region_details is not None
+            and self._window == window
+            and time.monotonic() - self._fetched_at < self.max_age
+        )
+    
+    async def async_get(
+        self,
+        window: str,
+        fetch: Callable[[], Awaitable[Dict[Any, List[Dict[str, Any]] | None] | None]],
+    ) -> Dict[Any, List[Dict[str, Any]] | None] | None:
+        """Return the snapshot for a forecast window, fetching it if stale.
+        
+        Concurrent callers wait for a single fetch. Failed fetches (None) and
+        snapshots with failed regions are returned but not stored, so the next
+        caller tries again.
+        """
+        if self._is_fresh(window):
+            return self._region_details
+        
+        async with self._lock:
+            if self._is_fresh(window):
+                return self._region_details
+            
+            region_details = await fetch()
+            if region_details is not None and None not in region_details.values():
+                self._region_details = region_details
+                self._window = window
+                self._fetched_at = time.monotonic()
+                _LOGGER.debug("Stored nationwide avalanche snapshot with %d regions", len(region_details))
+            return region_details
+    
+    def invalidate(self) -> None:
+        """Drop the stored snapshot so the next caller fetches a fresh one."""
+        self._region_details = None
+        self._window = None
+
+
+def async_get_avalanche_snapshot(hass) -> AvalancheSnapshot:
+    """Return the integration-wide avalanche snapshot stored in hass.data."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    snapshot = domain_data.get(DATA_AVALANCHE_SNAPSHOT)
+    if snapshot is None:
+        snapshot = domain_data[DATA_AVALANCHE_SNAPSHOT] = AvalancheSnapshot()
+    return snapshot
 
 
 class AvalancheAPI(BaseWarningAPI):
     """API client for avalanche warnings."""
     
+    def __init__(self, county_id: str, county_name: str, lang: str = "en", session_provider: SessionProvider | None = None,
+                 max_concurrency: int = AVALANCHE_DETAIL_CONCURRENCY, detail_timeout: float = AVALANCHE_DETAIL_TIMEOUT,
+                 snapshot: AvalancheSnapshot | None = None):
+        super().__init__(county_id, county_name, lang, session_provider)
+        self.max_concurrency = max(1, max_concurrency)  # Parallel Detail requests per poll
+        self.detail_timeout = detail_timeout  # Seconds per Detail request
+        self.snapshot = snapshot  # Nationwide forecast shared with other avalanche entries
+        self._region_conversions: Dict[int, tuple] = {}  # id(payload) -> (payload, converted warnings)
+        self._region_relevance: Dict[Any, bool] = {}  # Region ID -> whether its details concerned the county
+    
     def _get_warning_type(self) -> str:
         return "avalanche"
     
-    def _extract_weather_value(self, warning: Dict[str, Any], measurement_type: str, field: str) -> str:
-        """Extract weather values from the complex MountainWeather structure."""
+    # Flattened attribute -> (MountainWeather measurement name, field)
+    _WEATHER_FIELDS = {
+        "WindSpeed": ("wind", "Speed"),
+        "WindDirection": ("wind", "Direction"),
+        "Temperature": ("temperature", "Value"),
+        "Precipitation": ("precipitation", "Value"),
+    }
+    
+    def _extract_weather_values(self, warning: Dict[str, Any]) -> Dict[str, str]:
+        """Flatten the complex MountainWeather structure in a single pass over its measurements."""
+        values = dict.fromkeys(self._WEATHER_FIELDS, "")
         try:
-            mountain_weather = warning.get("MountainWeather", {})
-            measurement_types = mountain_weather.get("MeasurementTypes", [])
+            measurements = {}
+            for measurement in warning.get("MountainWeather", {}).get("MeasurementTypes", []):
+                measurements.setdefault(measurement.get("Name", "").lower(), measurement)
             
-            for measurement in measurement_types:
-                if measurement.get("Name", "").lower() == measurement_type.lower():
-                    return str(measurement.get(field, ""))
-            return ""
+            for attribute, (name, field) in self._WEATHER_FIELDS.items():
+                measurement = measurements.get(name)
+                if measurement is not None:
+                    values[attribute] = str(measurement.get(field, ""))
         except (KeyError, TypeError, AttributeError):
-            return ""
+            pass
+        return values
+    
+    async def _fetch_region_detail(self, session: aiohttp.ClientSession, semaphore: asyncio.Semaphore,
+                                   region_id: Any, today: str, tomorrow: str) -> List[Dict[str, Any]] | None:
+        """Fetch the detailed forecast for one region.
+        
+        Failures and timeouts are logged without holding up the other regions.
+        A failed region falls back to its last response for the same dates (from
+        the response cache); without one it returns None, so a failure is never
+        mistaken for a region without warnings.
+        """
+        detail_url = f"{API_BASE_AVALANCHE}/api/AvalancheWarningByRegion/Detail/{region_id}/2/{today}/{tomorrow}"
+        
+        try:
+            async with semaphore:
+                detail_data = await self._async_fetch_json(
+                    session, detail_url, check_content_type=False, timeout=self.detail_timeout
+                )
+        except Exception as e:
+            if isinstance(e, TimeoutError):
+                _LOGGER.debug("Timed out fetching details for region %s after %ss", region_id, self.detail_timeout)
+            else:
+                _LOGGER.debug("Error fetching details for region %s: %s", region_id, e)
+            cached = self.session_provider.response_cache.get(detail_url)
+            if cached is None:
+                return None
+            _LOGGER.debug("Using the previous details for region %s", region_id)
+            detail_data = cached["data"]
+        
+        return detail_data if isinstance(detail_data, list) else []
+    
+    async def _fetch_region_details(self, session: aiohttp.ClientSession, region_ids: List[Any],
+                                    today: str, tomorrow: str) -> List[List[Dict[str, Any]] | None]:
+        """Fetch detail forecasts for several regions concurrently.
+        
+        At most max_concurrency requests are in flight at once. Results are
+        returned in the same order as region_ids, with None for failed regions.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await asyncio.gather(*(
+            self._fetch_region_detail(session, semaphore, region_id, today, tomorrow)
+            for region_id in region_ids
+        ))
+    
+    def _is_relevant(self, warning: Dict[str, Any]) -> bool:
+        """Return True if a region detail warning concerns the county."""
+        # Calculate county relevance score
+        municipality_list = warning.get("MunicipalityList", [])
+        
+        # Check if this region has relevance to target county
+        # First check by county name in CountyList since CountyId is often empty
+        county_list = warning.get("CountyList", [])
+        county_names = [county.get("Name", "") for county in county_list]
+        if self.county_name in county_names:
+            return True
+        
+        # If not found by county name, fall back to municipality CountyId check
+        target_county_municipalities = 0
+        total_municipalities = len(municipality_list)
+        
+        for municipality in municipality_list:
+            muni_county_id = municipality.get("CountyId")
+            if str(muni_county_id) == str(self.county_id):
+                target_county_municipalities += 1
+        
+        # Calculate relevance score (0.0 to 1.0)
+        relevance_score = target_county_municipalities / total_municipalities if total_municipalities > 0 else 0
+        
+        # Only include regions with some relevance (>= 10% of municipalities)
+        return relevance_score >= 0.1
+    
+    def _convert_region_warning(self, warning: Dict[str, Any]) -> AvalancheWarningModel | None:
+        """Convert a region detail warning, or return None if it is inactive or not relevant to the county."""
+        danger_level = warning.get("DangerLevel", 0)
+        if isinstance(danger_level, str):
+            danger_level = int(danger_level) if danger_level.isdigit() else 0
+        if danger_level <= 0 or not self._is_relevant(warning):
+            return None
+        
+        region_name = warning.get("RegionName", "Unknown")
+        _LOGGER.debug("Including avalanche region '%s': relevant to %s (county in region or municipalities match)", 
+                    region_name, self.county_name)
+        converted_warning: AvalancheWarning = {
+            "Id": warning.get("RegionId"),
+            "ActivityLevel": str(warning.get("DangerLevel", 1)),
+            "DangerLevel": f"Level {warning.get('DangerLevel', 1)}",
+            "DangerTypeName": "Skredfare",
+            "MainText": warning.get("MainText", "Snøskredvarsel"),
+            "RegionName": warning.get("RegionName", "Ukjent område"),
+            "ValidFrom": warning.get("ValidFrom"),
+            "ValidTo": warning.get("ValidTo"),
+            "PublishTime": warning.get("PublishTime"),
+            "CountyList": warning.get("CountyList", []),
+            "MunicipalityList": warning.get("MunicipalityList", []),
+            "_region_id": warning.get("RegionId"),
+            "_region_name": warning.get("RegionName"),
+            "_warning_type": "avalanches",  # Plural to match icon naming
+            "UtmZone": warning.get("UtmZone"),
+            "UtmEast": warning.get("UtmEast"),
+            "UtmNorth": warning.get("UtmNorth"),
+            
+            # Avalanche-specific attributes (instead of generic WarningText/AdviceText/ConsequenceText)
+            "AvalancheDanger": warning.get("AvalancheDanger", ""),
+            "EmergencyWarning": warning.get("EmergencyWarning", ""),
+            "AvalancheProblems": warning.get("AvalancheProblems", []),
+            "AvalancheAdvices": warning.get("AvalancheAdvices", []),
+            "SnowSurface": warning.get("SnowSurface", ""),
+            "CurrentWeaklayers": warning.get("CurrentWeaklayers", ""),
+            "LatestAvalancheActivity": warning.get("LatestAvalancheActivity", ""),
+            "LatestObservations": warning.get("LatestObservations", ""),
+            "Author": warning.get("Author", ""),
+            "DangerLevelName": warning.get("DangerLevelName", ""),
+            "ExposedHeightFill": warning.get("ExposedHeightFill", 0),
+            "ExposedHeight1": warning.get("ExposedHeight1", 0),
+            
+            # Flattened mountain weather for easy template access
+            **self._extract_weather_values(warning),
+            "MountainWeather": warning.get("MountainWeather", {}),  # Keep raw data too
+        }
+        return AvalancheWarningModel(converted_warning)
+    
+    def _convert_region_details(
+        self, region_details: Dict[Any, List[Dict[str, Any]] | None]
+    ) -> List[AvalancheWarningModel] | None:
+        """Convert the county's regions, reusing conversions of unchanged (not modified) region payloads.
+        
+        Returns None if a failed region (None) concerned the county when its
+        details were last seen, or has not been seen yet: the county's result
+        would be incomplete. Failed regions of other counties are skipped.
+        """
+        previous = self._region_conversions
+        self._region_conversions = {}
+        
+        warnings = []
+        missing = []
+        for region_id, detail_data in region_details.items():
+            if detail_data is None:
+                if self._region_relevance.get(region_id, True):
+                    missing.append(region_id)
+                continue
+            cached = previous.get(id(detail_data))
+            if cached is not None and cached[0] is detail_data:
+                converted = cached[1]
+            else:
+                converted = [
+                    converted_warning
+                    for converted_warning in map(self._convert_region_warning, detail_data)
+                    if converted_warning is not None
+                ]
+                self._region_relevance[region_id] = any(map(self._is_relevant, detail_data))
+            # Keep a reference to the payload so its id() cannot be reused
+            self._region_conversions[id(detail_data)] = (detail_data, converted)
+            warnings.extend(converted)
+        
+        if missing:
+            _LOGGER.warning(
+                "Avalanche details for regions %s may concern %s but could not be fetched",
+                ", ".join(map(str, missing)), self.county_name,
+            )
+            return None
+        return warnings
+    
+    async def _fetch_national_details(self, today: str, tomorrow: str) -> Dict[Any, List[Dict[str, Any]] | None] | None:
+        """Fetch Detail forecasts for every active avalanche region in Norway.
+        
+        Returns the detail warnings of each active region by region ID, in
+        summary order, or None if the region summary could not be fetched.
+        Regions whose details could not be fetched map to None, so only the
+        counties they concern are affected.
+        """
+        # Language key: 2 = Norwegian, 1 = English  
+        summary_url = f"{API_BASE_AVALANCHE}/api/RegionSummary/Simple/2/{today}/{tomorrow}"
+        
+        _LOGGER.info("Fetching avalanche summary from: %s", summary_url)
+        
+        async with self._session() as session:
+            # Get region summary to find active regions
+            try:
+                summary_data = await self._async_fetch_json(session, summary_url, check_content_type=False)
+            except WarningAPIError as err:
+                _LOGGER.error("Error fetching avalanche warnings summary: %s", err)
+                return None
+            
+            if not summary_data:
+                _LOGGER.info("No avalanche warnings found")
+                return {}
+            
+            # Find regions with active warnings
+            active_regions = []
+            for region in summary_data:
+                if "AvalancheWarningList" in region and region["AvalancheWarningList"]:
+                    for warning in region["AvalancheWarningList"]:
+                        danger_level = warning.get("DangerLevel", 0)
+                        if isinstance(danger_level, str):
+                            danger_level = int(danger_level) if danger_level.isdigit() else 0
+                        if danger_level > 0:
+                            active_regions.append(warning.get("RegionId"))
+                            break
+            
+            _LOGGER.debug("Found %d active avalanche regions", len(active_regions))
+            
+            # Get detailed data for active regions (concurrently, merged back in region order)
+            region_details = dict(zip(
+                active_regions, await self._fetch_region_details(session, active_regions, today, tomorrow)
+            ))
+            failed = [region_id for region_id, details in region_details.items() if details is None]
+            if failed:
+                _LOGGER.warning("Could not fetch avalanche details for regions %s", ", ".join(map(str, failed)))
+            return region_details
     
     async def fetch_warnings(self) -> List[Dict[str, Any]]:
         """Fetch avalanche warnings from NVE API."""
@@ -160,137 +978,29 @@ class AvalancheAPI(BaseWarningAPI):
             today = dt.datetime.now().strftime("%Y-%m-%d")
             tomorrow = (dt.datetime.now() + dt.timedelta(days=1)).strftime("%Y-%m-%d")
             
-            # Language key: 2 = Norwegian, 1 = English  
-            summary_url = f"{API_BASE_AVALANCHE}/api/RegionSummary/Simple/2/{today}/{tomorrow}"
-            
-            _LOGGER.info("Fetching avalanche summary from: %s", summary_url)
+            # Regions are the same for every county, so share one nationwide download when possible
+            if self.snapshot is not None:
+                region_details = await self.snapshot.async_get(
+                    f"{today}/{tomorrow}",
+                    lambda: self._fetch_national_details(today, tomorrow),
+                )
+            else:
+                region_details = await self._fetch_national_details(today, tomorrow)
             
-            async with aiohttp.ClientSession() as session:
-                # Get region summary to find active regions
-                async with session.get(summary_url) as response:
-                    if response.status != 200:
-                        _LOGGER.error("Error fetching avalanche warnings summary: HTTP %d", response.status)
-                        return []
-                    
-                    summary_data = await response.json()
-                    if not summary_data:
-                        _LOGGER.info("No avalanche warnings found")
-                        return []
-                    
-                    # Find regions with active warnings
-                    active_regions = []
-                    for region in summary_data:
-                        if "AvalancheWarningList" in region and region["AvalancheWarningList"]:
-                            for warning in region["AvalancheWarningList"]:
-                                danger_level = warning.get("DangerLevel", 0)
-                                if isinstance(danger_level, str):
-                                    danger_level = int(danger_level) if danger_level.isdigit() else 0
-                                if danger_level > 0:
-                                    active_regions.append(warning.get("RegionId"))
-                                    break
-                    
-                    _LOGGER.debug("Found %d active avalanche regions", len(active_regions))
-                    
-                    # Get detailed data for active regions
-                    warnings = []
-                    for region_id in active_regions:
-                        detail_url = f"{API_BASE_AVALANCHE}/api/AvalancheWarningByRegion/Detail/{region_id}/2/{today}/{tomorrow}"
-                        
-                        try:
-                            async with session.get(detail_url) as detail_response:
-                                if detail_response.status == 200:
-                                    detail_data = await detail_response.json()
-                                    
-                                    if isinstance(detail_data, list):
-                                        for warning in detail_data:
-                                            danger_level = warning.get("DangerLevel", 0)
-                                            if isinstance(danger_level, str):
-                                                danger_level = int(danger_level) if danger_level.isdigit() else 0
-                                            if danger_level > 0:
-                                                # Calculate county relevance score
-                                                municipality_list = warning.get("MunicipalityList", [])
-                                                county_list = warning.get("CountyList", [])
-                                                
-                                                # Check if this region has relevance to target county
-                                                # First check by county name in CountyList since CountyId is often empty
-                                                county_list = warning.get("CountyList", [])
-                                                county_names = [county.get("Name", "") for county in county_list]
-                                                is_relevant = self.county_name in county_names
-                                                
-                                                # If not found by county name, fall back to municipality CountyId check
-                                                if not is_relevant:
-                                                    target_county_municipalities = 0
-                                                    total_municipalities = len(municipality_list)
-                                                    
-                                                    for municipality in municipality_list:
-                                                        muni_county_id = municipality.get("CountyId")
-                                                        if str(muni_county_id) == str(self.county_id):
-                                                            target_county_municipalities += 1
-                                                    
-                                                    # Calculate relevance score (0.0 to 1.0)
-                                                    relevance_score = target_county_municipalities / total_municipalities if total_municipalities > 0 else 0
-                                                    
-                                                    # Only include regions with some relevance (>= 10% of municipalities)
-                                                    is_relevant = relevance_score >= 0.1
-                                                
-                                                if is_relevant:
-                                                    region_name = warning.get("RegionName", "Unknown")
-                                                    _LOGGER.debug("Including avalanche region '%s': relevant to %s (county in region or municipalities match)", 
-                                                                region_name, self.county_name)
-                                                    converted_warning = {
-                                                        "Id": warning.get("RegionId"),
-                                                        "ActivityLevel": str(warning.get("DangerLevel", 1)),
-                                                        "DangerLevel": f"Level {warning.get('DangerLevel', 1)}",
-                                                        "DangerTypeName": "Skredfare",
-                                                        "MainText": warning.get("MainText", "Snøskredvarsel"),
-                                                        "RegionName": warning.get("RegionName", "Ukjent område"),
-                                                        "ValidFrom": warning.get("ValidFrom"),
-                                                        "ValidTo": warning.get("ValidTo"),
-                                                        "PublishTime": warning.get("PublishTime"),
-                                                        "CountyList": warning.get("CountyList", []),
-                                                        "MunicipalityList": warning.get("MunicipalityList", []),
-                                                        "_region_id": warning.get("RegionId"),
-                                                        "_region_name": warning.get("RegionName"),
-                                                        "_warning_type": "avalanches",  # Plural to match icon naming
-                                                        "UtmZone": warning.get("UtmZone"),
-                                                        "UtmEast": warning.get("UtmEast"),
-                                                        "UtmNorth": warning.get("UtmNorth"),
-                                                        
-                                                        # Avalanche-specific attributes (instead of generic WarningText/AdviceText/ConsequenceText)
-                                                        "AvalancheDanger": warning.get("AvalancheDanger", ""),
-                                                        "EmergencyWarning": warning.get("EmergencyWarning", ""),
-                                                        "AvalancheProblems": warning.get("AvalancheProblems", []),
-                                                        "AvalancheAdvices": warning.get("AvalancheAdvices", []),
-                                                        "SnowSurface": warning.get("SnowSurface", ""),
-                                                        "CurrentWeaklayers": warning.get("CurrentWeaklayers", ""),
-                                                        "LatestAvalancheActivity": warning.get("LatestAvalancheActivity", ""),
-                                                        "LatestObservations": warning.get("LatestObservations", ""),
-                                                        "Author": warning.get("Author", ""),
-                                                        "DangerLevelName": warning.get("DangerLevelName", ""),
-                                                        "ExposedHeightFill": warning.get("ExposedHeightFill", 0),
-                                                        "ExposedHeight1": warning.get("ExposedHeight1", 0),
-                                                        
-                                                        # Flattened mountain weather for easy template access
-                                                        "WindSpeed": self._extract_weather_value(warning, "wind", "Speed"),
-                                                        "WindDirection": self._extract_weather_value(warning, "wind", "Direction"),
-                                                        "Temperature": self._extract_weather_value(warning, "temperature", "Value"),
-                                                        "Precipitation": self._extract_weather_value(warning, "precipitation", "Value"),
-                                                        "MountainWeather": warning.get("MountainWeather", {}),  # Keep raw data too
-                                                    }
-                                                    warnings.append(converted_warning)
-                        except Exception as e:
-                            _LOGGER.debug("Error fetching details for region %s: %s", region_id, e)
-                            continue
-                    
-                    _LOGGER.info("Successfully fetched avalanche warnings for %s: %d", self.county_name, len(warnings))
-                    return warnings
+            # Select this county's regions in memory
+            warnings = None if region_details is None else self._convert_region_details(region_details)
                         
         except aiohttp.ClientError as err:
             _LOGGER.error("Error fetching avalanche warnings: %s", err)
-            return []
+            return self._stale_result()
         except Exception as err:
             _LOGGER.error("Unexpected error fetching avalanche warnings: %s", err)
-            return []
+            return self._stale_result()
+        
+        if warnings is None:
+            return self._stale_result()
+        _LOGGER.info("Successfully fetched avalanche warnings for %s: %d", self.county_name, len(warnings))
+        return self._remember_result(warnings)
 
 
 # MetAlerts API (originally authored by @kutern84 and @svenove for met_alerts integration)
@@ -305,7 +1015,7 @@ class MetAlertsAPI(BaseWarningAPI):
     unifying all Norwegian geohazard services.
     """
     
-    def __init__(self, latitude: float = None, longitude: float = None, county_id: str = None, county_name: str = None, lang: str = "en", test_mode: bool = False):
+    def __init__(self, latitude: float = None, longitude: float = None, county_id: str = None, county_name: str = None, lang: str = "en", test_mode: bool = False, session_provider: SessionProvider | None = None):
         """Initialize the MetAlerts API client.
         
         Can operate in two modes:
@@ -313,7 +1023,7 @@ class MetAlertsAPI(BaseWarningAPI):
         2. County-based: Uses county_id for administrative filtering
         """
         # Call parent with county values (may be empty for lat/lon mode)
-        super().__init__(county_id or "", county_name or "", lang)
+        super().__init__(county_id or "", county_name or "", lang, session_provider)
         self.latitude = latitude
         self.longitude = longitude
         self.test_mode = test_mode
@@ -365,166 +1075,166 @@ class MetAlertsAPI(BaseWarningAPI):
         _LOGGER.debug("Fetching metalerts from: %s", url)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with asyncio.timeout(10):
-                    async with session.get(url, headers=headers) as response:
-                        if response.status != 200:
-                            _LOGGER.error("Error fetching metalerts data: %s", response.status)
-                            return []
-                        
-                        content_type = response.headers.get("Content-Type", "")
-                        if "application/json" not in content_type:
-                            _LOGGER.error("Unexpected content type for metalerts: %s", content_type)
-                            return []
-                        
-                        json_data = await response.json()
-                        if not json_data:
-                            _LOGGER.info("No metalerts found")
-                            return []
-                        
-                        features = json_data.get("features", [])
-                        _LOGGER.info("Successfully fetched %d metalerts", len(features))
-                        
-                        # Convert metalerts format to common Norway Alerts warning format
-                        warnings = []
-                        for feature in features:
-                            props = feature.get("properties", {})
-                            
-                            # Extract basic information
-                            title, starttime, endtime = self._extract_times_from_title(props.get("title", ""))
-                            
-                            # Parse awareness_level (format: "2; orange; Moderate")
-                            awareness_level = props.get("awareness_level", "")
-                            try:
-                                awareness_level_numeric, awareness_level_color, awareness_level_name = awareness_level.split("; ")
-                                activity_level = awareness_level_numeric
-                            except ValueError:
-                                awareness_level_numeric = "1"
-                                awareness_level_color = "yellow"
-                                awareness_level_name = "Minor"
-                                activity_level = "1"
-                            
-                            # Get resource URL
-                            resources = props.get("resources", [])
-                            resource_url = ""
-                            map_url = None
-                            if resources and len(resources) > 0:
-                                resource_url = resources[0].get("uri", "")
-                                # Extract PNG map URL
-                                for resource in resources:
-                                    if resource.get("mimeType") == "image/png":
-                                        map_url = resource.get("uri")
-                                        break
-                            
-                            # Convert to Norway Alerts warning format
-                            # Map event types for icon compatibility
-                            event_type = props.get("event", "").lower()
-                            # Handle special mappings for icons
-                            if event_type == "gale":
-                                icon_event_type = "wind"
-                            elif event_type == "icing":
-                                icon_event_type = "ice"
-                            elif event_type == "blowingsnow":
-                                icon_event_type = "snow"
-                            else:
-                                icon_event_type = event_type
-                            
-                            converted_warning = {
-                                "Id": props.get("id", ""),
-                                "ActivityLevel": activity_level,
-                                "DangerLevel": f"Level {activity_level}",
-                                "DangerTypeName": props.get("event", "Weather warning"),
-                                "MainText": props.get("description", ""),
-                                "RegionName": props.get("area", ""),
-                                "ValidFrom": starttime or props.get("eventEndingTime", ""),
-                                "ValidTo": endtime or props.get("eventEndingTime", ""),
-                                "PublishTime": "",  # Not provided by metalerts
-                                "_warning_type": icon_event_type,
-                                
-                                # Metalerts-specific attributes (preserving original structure)
-                                "title": title,
-                                "starttime": starttime,
-                                "endtime": endtime,
-                                "description": props.get("description", ""),
-                                "awareness_level": awareness_level,
-                                "awareness_level_numeric": awareness_level_numeric,
-                                "awareness_level_color": awareness_level_color,
-                                "awareness_level_name": awareness_level_name,
-                                "certainty": props.get("certainty", ""),
-                                "severity": props.get("severity", ""),
-                                "instruction": props.get("instruction", ""),
-                                "contact": props.get("contact", ""),
-                                "resources": resources,
-                                "area": props.get("area", ""),
-                                "event": props.get("event", ""),
-                                "event_awareness_name": props.get("eventAwarenessName", ""),
-                                "consequences": props.get("consequences", ""),
-                                "map_url": map_url,
-                                "resource_url": resource_url,
-                                "awareness_type": props.get("awareness_type", ""),
-                                "ceiling": props.get("ceiling"),
-                                "county": props.get("county", []),
-                                "geographic_domain": props.get("geographicDomain", ""),
-                                "risk_matrix_color": props.get("riskMatrixColor", ""),
-                                "trigger_level": props.get("triggerLevel"),
-                                "web": props.get("web", ""),
-                            }
-                            warnings.append(converted_warning)
-                        
-                        return warnings
+            async with self._session() as session:
+                json_data = await self._async_fetch_json(session, url, headers)
+            
+            if not json_data:
+                _LOGGER.info("No metalerts found")
+                return self._remember_result([])
+            
+            # Convert to the common warning format (skipped when the response was not modified)
+            return self._remember_result(self._convert_cached(json_data, self._convert_features))
         
+        except WarningAPIError as err:
+            _LOGGER.error("Error fetching metalerts data: %s", err)
+            return self._stale_result()
         except aiohttp.ClientError as err:
             _LOGGER.error("Error fetching metalerts: %s", err)
-            return []
+            return self._stale_result()
         except Exception as err:
             _LOGGER.error("Unexpected error fetching metalerts: %s", err)
-            return []
+            return self._stale_result()
+    
+    def _convert_features(self, json_data: Dict[str, Any]) -> List[MetAlertWarningModel]:
+        """Convert a metalerts GeoJSON response to the common Norway Alerts warning format."""
+        features = json_data.get("features", [])
+        _LOGGER.info("Successfully fetched %d metalerts", len(features))
+        
+        # Convert metalerts format to common Norway Alerts warning format
+        warnings = []
+        for feature in features:
+            props = feature.get("properties", {})
+            
+            # Extract basic information
+            title, starttime, endtime = self._extract_times_from_title(props.get("title", ""))
+            
+            # Parse awareness_level (format: "2; orange; Moderate")
+            awareness_level = props.get("awareness_level", "")
+            try:
+                awareness_level_numeric, awareness_level_color, awareness_level_name = awareness_level.split("; ")
+                activity_level = awareness_level_numeric
+            except ValueError:
+                awareness_level_numeric = "1"
+                awareness_level_color = "yellow"
+                awareness_level_name = "Minor"
+                activity_level = "1"
+            
+            # Get resource URL
+            resources = props.get("resources", [])
+            resource_url = ""
+            map_url = None
+            if resources and len(resources) > 0:
+                resource_url = resources[0].get("uri", "")
+                # Extract PNG map URL
+                for resource in resources:
+                    if resource.get("mimeType") == "image/png":
+                        map_url = resource.get("uri")
+                        break
+            
+            # Convert to Norway Alerts warning format
+            # Map event types for icon compatibility
+            event_type = props.get("event", "").lower()
+            # Handle special mappings for icons
+            if event_type == "gale":
+                icon_event_type = "wind"
+            elif event_type == "icing":
+                icon_event_type = "ice"
+            elif event_type == "blowingsnow":
+                icon_event_type = "snow"
+            else:
+                icon_event_type = event_type
+            
+            converted_warning: MetAlertWarning = {
+                "Id": props.get("id", ""),
+                "ActivityLevel": activity_level,
+                "DangerLevel": f"Level {activity_level}",
+                "DangerTypeName": props.get("event", "Weather warning"),
+                "MainText": props.get("description", ""),
+                "RegionName": props.get("area", ""),
+                "ValidFrom": starttime or props.get("eventEndingTime", ""),
+                "ValidTo": endtime or props.get("eventEndingTime", ""),
+                "PublishTime": "",  # Not provided by metalerts
+                "_warning_type": icon_event_type,
+                
+                # Metalerts-specific attributes (preserving original structure)
+                "title": title,
+                "starttime": starttime,
+                "endtime": endtime,
+                "description": props.get("description", ""),
+                "awareness_level": awareness_level,
+                "awareness_level_numeric": awareness_level_numeric,
+                "awareness_level_color": awareness_level_color,
+                "awareness_level_name": awareness_level_name,
+                "certainty": props.get("certainty", ""),
+                "severity": props.get("severity", ""),
+                "instruction": props.get("instruction", ""),
+                "contact": props.get("contact", ""),
+                "resources": resources,
+                "area": props.get("area", ""),
+                "event": props.get("event", ""),
+                "event_awareness_name": props.get("eventAwarenessName", ""),
+                "consequences": props.get("consequences", ""),
+                "map_url": map_url,
+                "resource_url": resource_url,
+                "awareness_type": props.get("awareness_type", ""),
+                "ceiling": props.get("ceiling"),
+                "county": props.get("county", []),
+                "geographic_domain": props.get("geographicDomain", ""),
+                "risk_matrix_color": props.get("riskMatrixColor", ""),
+                "trigger_level": props.get("triggerLevel"),
+                "web": props.get("web", ""),
+            }
+            warnings.append(MetAlertWarningModel(converted_warning))
+        
+        return warnings
 
 
 class WarningAPIFactory:
     """Factory for creating warning API clients."""
     
-    def __init__(self, county_id: str = "", county_name: str = "", latitude: float = None, longitude: float = None, lang: str = "en", test_mode: bool = False):
+    def __init__(self, county_id: str = "", county_name: str = "", latitude: float = None, longitude: float = None, lang: str = "en", test_mode: bool = False, session_provider: SessionProvider | None = None, avalanche_snapshot: AvalancheSnapshot | None = None):
         self.county_id = county_id
         self.county_name = county_name
         self.latitude = latitude
         self.longitude = longitude
         self.lang = lang
         self.test_mode = test_mode
+        self.session_provider = session_provider
+        self.avalanche_snapshot = avalanche_snapshot
     
     def get_api(self, warning_type: str) -> BaseWarningAPI:
         """Create appropriate API client for warning type."""
         if warning_type == "landslide":
-            return LandslideAPI(self.county_id, self.county_name, self.lang)
+            return LandslideAPI(self.county_id, self.county_name, self.lang, self.session_provider)
         elif warning_type == "flood":
-            return FloodAPI(self.county_id, self.county_name, self.lang)
+            return FloodAPI(self.county_id, self.county_name, self.lang, self.session_provider)
         elif warning_type == "avalanche":
-            return AvalancheAPI(self.county_id, self.county_name, self.lang)
+            return AvalancheAPI(self.county_id, self.county_name, self.lang, self.session_provider, snapshot=self.avalanche_snapshot)
         elif warning_type == "metalerts":
             # MetAlerts (weather) - supports both lat/lon and county
             if self.latitude is not None and self.longitude is not None:
                 # Location-based mode
-                return MetAlertsAPI(latitude=self.latitude, longitude=self.longitude, lang=self.lang, test_mode=self.test_mode)
+                return MetAlertsAPI(latitude=self.latitude, longitude=self.longitude, lang=self.lang, test_mode=self.test_mode, session_provider=self.session_provider)
             elif self.county_id:
                 # County-based mode  
-                return MetAlertsAPI(county_id=self.county_id, county_name=self.county_name, lang=self.lang, test_mode=self.test_mode)
+                return MetAlertsAPI(county_id=self.county_id, county_name=self.county_name, lang=self.lang, test_mode=self.test_mode, session_provider=self.session_provider)
             else:
                 raise ValueError("MetAlerts requires either lat/lon coordinates or county_id")
         else:
             raise ValueError(f"Unknown warning type: {warning_type}")
     
     @staticmethod
-    def create_api(warning_type: str, county_id: str = "", county_name: str = "", latitude: float = None, longitude: float = None, lang: str = "en") -> BaseWarningAPI:
+    def create_api(warning_type: str, county_id: str = "", county_name: str = "", latitude: float = None, longitude: float = None, lang: str = "en", session_provider: SessionProvider | None = None) -> BaseWarningAPI:
         """Create appropriate API client for warning type (static method)."""
         if warning_type == "landslide":
-            return LandslideAPI(county_id, county_name, lang)
+            return LandslideAPI(county_id, county_name, lang, session_provider)
         elif warning_type == "flood":
-            return FloodAPI(county_id, county_name, lang)
+            return FloodAPI(county_id, county_name, lang, session_provider)
         elif warning_type == "avalanche":
-            return AvalancheAPI(county_id, county_name, lang)
+            return AvalancheAPI(county_id, county_name, lang, session_provider)
         elif warning_type == "metalerts":
             if latitude is None or longitude is None:
                 raise ValueError("Latitude and longitude are required for metalerts")
-            return MetAlertsAPI(latitude, longitude, lang)
+            return MetAlertsAPI(latitude, longitude, lang=lang, session_provider=session_provider)
         else:
             raise ValueError(f"Unknown warning type: {warning_type}")
\ No newline at end of file
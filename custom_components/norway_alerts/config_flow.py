@@ -10,7 +10,8 @@ from homeassistant.const import CONF_NAME, CONF_LATITUDE, CONF_LONGITUDE
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
 
-from .api import _get_user_agent
+from .api import _get_user_agent, async_get_session_provider
+from .municipality_lookup import get_county_from_coordinates
 from .const import (
     DOMAIN,
     DEFAULT_NAME,
@@ -31,8 +32,17 @@ from .const import (
     CONF_SHOW_ICON,
     CONF_SHOW_STATUS,
     CONF_SHOW_MAP,
+    CONF_SNAPSHOT_MAX_AGE,
+    DEFAULT_SNAPSHOT_MAX_AGE,
+    CONF_LEAN_ATTRIBUTES,
+    CONF_EMBED_ICONS,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
     API_BASE_LANDSLIDE,
     API_BASE_AVALANCHE,
+    HTTP_TIMEOUT,
     COUNTIES,
     WARNING_TYPE_LANDSLIDE,
     WARNING_TYPE_FLOOD,
@@ -46,6 +56,8 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+FALLBACK_COUNTY_ID = "46"  # Vestland, when Home Assistant's location is in no known county
+
 
 async def validate_api_connection(hass: HomeAssistant, county_id: str, warning_type: str, lang: str):
     """Validate that the API connection works."""
@@ -59,19 +71,19 @@ async def validate_api_connection(hass: HomeAssistant, county_id: str, warning_t
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with asyncio.timeout(10):
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        raise ValueError(f"API returned status {response.status}")
-                    
-                    content_type = response.headers.get('Content-Type', '')
-                    if 'application/json' not in content_type:
-                        raise ValueError(f"Unexpected content type: {content_type}")
-                    
-                    # Try to parse JSON
-                    await response.json()
-                    return True
+        session = async_get_session_provider(hass).get_session()
+        async with asyncio.timeout(HTTP_TIMEOUT):
+            async with session.get(url, headers=headers) as response:
+                if response.status != 200:
+                    raise ValueError(f"API returned status {response.status}")
+                
+                content_type = response.headers.get('Content-Type', '')
+                if 'application/json' not in content_type:
+                    raise ValueError(f"Unexpected content type: {content_type}")
+                
+                # Try to parse JSON
+                await response.json()
+                return True
     except aiohttp.ClientError as err:
         raise ValueError(f"Cannot connect to API: {err}")
     except Exception as err:
@@ -246,14 +258,17 @@ class NorwayAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # Build conditional schema based on needs
         schema_dict = {}
         
+        if needs_county or needs_metalerts_county:
+            default_county = await self._async_home_county()
+        
         if needs_county:
-            schema_dict[vol.Required(CONF_COUNTY_ID, default="46")] = vol.In(
+            schema_dict[vol.Required(CONF_COUNTY_ID, default=default_county)] = vol.In(
                 {k: v for k, v in sorted(COUNTIES.items(), key=lambda x: x[1])}
             )
             schema_dict[vol.Optional(CONF_MUNICIPALITY_FILTER, default="")] = cv.string
         
         if needs_metalerts_county:
-            schema_dict[vol.Required(CONF_COUNTY_ID, default="46")] = vol.In(
+            schema_dict[vol.Required(CONF_COUNTY_ID, default=default_county)] = vol.In(
                 {k: v for k, v in sorted(COUNTIES.items(), key=lambda x: x[1])}
             )
         
@@ -278,6 +293,15 @@ class NorwayAlertsConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             description_placeholders=description_placeholders,
         )
 
+    async def _async_home_county(self) -> str:
+        """Return the county containing Home Assistant's location, to preselect in the form."""
+        county_id = await self.hass.async_add_executor_job(
+            get_county_from_coordinates,
+            self.hass.config.latitude,
+            self.hass.config.longitude,
+        )
+        return county_id if county_id in COUNTIES else FALLBACK_COUNTY_ID
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry):
@@ -324,6 +348,12 @@ class NorwayAlertsOptionsFlow(config_entries.OptionsFlow):
                     county_name = COUNTIES.get(county_id, "Unknown")
                     user_input[CONF_COUNTY_NAME] = county_name
                 
+                min_poll_interval = user_input.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL)
+                max_poll_interval = user_input.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL)
+                if min_poll_interval > max_poll_interval:
+                    errors["base"] = "invalid_poll_interval"
+                    raise ValueError("Minimum poll interval is above the maximum")
+                
                 if needs_metalerts_latlon:
                     latitude = user_input.get(CONF_LATITUDE)
                     longitude = user_input.get(CONF_LONGITUDE)
@@ -425,6 +455,21 @@ class NorwayAlertsOptionsFlow(config_entries.OptionsFlow):
         current_show_map = self.config_entry.options.get(
             CONF_SHOW_MAP, self.config_entry.data.get(CONF_SHOW_MAP, True)
         )
+        current_lean_attributes = self.config_entry.options.get(
+            CONF_LEAN_ATTRIBUTES, self.config_entry.data.get(CONF_LEAN_ATTRIBUTES, False)
+        )
+        current_embed_icons = self.config_entry.options.get(
+            CONF_EMBED_ICONS, self.config_entry.data.get(CONF_EMBED_ICONS, False)
+        )
+        current_snapshot_max_age = self.config_entry.options.get(
+            CONF_SNAPSHOT_MAX_AGE, self.config_entry.data.get(CONF_SNAPSHOT_MAX_AGE, DEFAULT_SNAPSHOT_MAX_AGE)
+        )
+        current_min_poll_interval = self.config_entry.options.get(
+            CONF_MIN_POLL_INTERVAL, self.config_entry.data.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL)
+        )
+        current_max_poll_interval = self.config_entry.options.get(
+            CONF_MAX_POLL_INTERVAL, self.config_entry.data.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL)
+        )
         
         schema_dict.update({
             vol.Optional(CONF_LANG, default=current_lang): vol.In(["no", "en"]),
@@ -434,6 +479,21 @@ class NorwayAlertsOptionsFlow(config_entries.OptionsFlow):
             vol.Optional(CONF_SHOW_ICON, default=current_show_icon): cv.boolean,
             vol.Optional(CONF_SHOW_STATUS, default=current_show_status): cv.boolean,
             vol.Optional(CONF_SHOW_MAP, default=current_show_map): cv.boolean,
+            # Keep alert details out of the recorder (available via the get_alerts service)
+            vol.Optional(CONF_LEAN_ATTRIBUTES, default=current_lean_attributes): cv.boolean,
+            # Base64 data URLs instead of icon URLs served by Home Assistant
+            vol.Optional(CONF_EMBED_ICONS, default=current_embed_icons): cv.boolean,
+            # Minutes; 0 always waits for the APIs at startup
+            vol.Optional(CONF_SNAPSHOT_MAX_AGE, default=current_snapshot_max_age): vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=24 * 60)
+            ),
+            # Minutes; adaptive polling stays within these bounds
+            vol.Optional(CONF_MIN_POLL_INTERVAL, default=current_min_poll_interval): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=24 * 60)
+            ),
+            vol.Optional(CONF_MAX_POLL_INTERVAL, default=current_max_poll_interval): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=24 * 60)
+            ),
         })
         
         # Only show CAP format option for NVE warnings (not for MetAlerts which are always CAP)
@@ -24,6 +24,11 @@ CONF_ENABLE_NOTIFICATIONS = "enable_notifications"
 CONF_NOTIFICATION_SEVERITY = "notification_severity"
 CONF_METALERTS_LOCATION_MODE = "metalerts_location_mode"
 CONF_CAP_FORMAT = "cap_format"
+CONF_SNAPSHOT_MAX_AGE = "snapshot_max_age"
+CONF_MIN_POLL_INTERVAL = "min_poll_interval"
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+CONF_LEAN_ATTRIBUTES = "lean_attributes"
+CONF_EMBED_ICONS = "embed_icons"
 
 # Display formatting options (for formatted_content attribute)
 CONF_SHOW_ICON = "show_icon"
@@ -36,6 +41,16 @@ METALERTS_MODE_COUNTY = "county"
 
 PLATFORMS = ["sensor"]
 
+# Full alert details on demand (lean attributes mode keeps them out of the recorder)
+SERVICE_GET_ALERTS = "get_alerts"
+WS_TYPE_ALERTS = f"{DOMAIN}/alerts"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_ALERT_ID = "alert_id"
+
+# Warning icons served over HTTP (short URLs instead of data URLs in every state)
+ICON_URL_PATH = f"/{DOMAIN}/icons"
+ICON_CACHE_MAX_AGE = 31 * 24 * 3600  # Seconds; browsers revalidate with the ETag afterwards
+
 # Notification settings
 NOTIFICATION_SEVERITY_ALL = "all"
 NOTIFICATION_SEVERITY_YELLOW_PLUS = "yellow_plus"
@@ -49,6 +64,29 @@ NOTIFICATION_SEVERITIES = {
     NOTIFICATION_SEVERITY_RED_ONLY: "Red warnings only",
 }
 
+# Adaptive polling (minutes). Polls speed up while orange or higher alerts are
+# active, back off when nothing is active, and run shortly after the next
+# expected publication, always within the user's min/max bounds.
+DEFAULT_MIN_POLL_INTERVAL = 5
+DEFAULT_MAX_POLL_INTERVAL = 120
+POLL_INTERVAL_ACTIVE = 10  # orange, red or black alerts active
+POLL_INTERVAL_NORMAL = 30  # yellow alerts active
+PUBLISH_POLL_DELAY = 2  # poll this long after an expected publication time
+NVE_TIME_ZONE = "Europe/Oslo"  # NVE timestamps carry no UTC offset
+
+# Poll scheduling across entries. Each shared coordinator gets a stable offset
+# in the poll cycle so entries do not hit the APIs in one burst.
+DATA_POLL_SCHEDULER = "poll_scheduler"
+FIRST_REFRESH_CONCURRENCY = 3  # max first refreshes running at once during startup
+STARTUP_REFRESH_SPREAD = 60  # seconds; warm-started refreshes are spread over this window
+PUBLISH_POLL_SPREAD = 3  # minutes; polls after a publication are spread over this window
+
+# CAP conversions shared by sensors and reused across polls while a warning is unchanged
+CAP_CACHE_MAX_ENTRIES = 512
+
+# Rendered formatted_content fragments (one per alert, display options and status)
+FRAGMENT_CACHE_MAX_ENTRIES = 512
+
 # NVE API Base URLs
 API_BASE_LANDSLIDE = "https://api01.nve.no/hydrology/forecast/landslide/v1.0.10/api"
 API_BASE_FLOOD = "https://api01.nve.no/hydrology/forecast/flood/v1.0.10/api"
@@ -57,6 +95,41 @@ API_BASE_AVALANCHE = "https://api01.nve.no/hydrology/forecast/avalanche/v6.3.0"
 # Met.no API Base URL (using Home Assistant proxy)
 API_BASE_METALERTS = "https://aa015h6buqvih86i1.api.met.no/weatherapi/metalerts/2.0"
 
+# Coordinators shared by entries with the same upstream query
+DATA_COORDINATOR_HUB = "coordinator_hub"
+
+# Shared HTTP session (one pooled connector for all entries)
+DATA_SESSION_PROVIDER = "session_provider"
+HTTP_TIMEOUT = 10  # seconds per request
+HTTP_POOL_LIMIT = 30  # total open connections
+HTTP_POOL_LIMIT_PER_HOST = 6  # open connections per API host
+HTTP_DNS_CACHE_TTL = 300  # seconds
+HTTP_KEEPALIVE_TIMEOUT = 75  # seconds an idle connection is kept open
+RESPONSE_CACHE_TTL = 120  # seconds a response is shared without asking the server again
+RESPONSE_CACHE_MAX_ENTRIES = 256  # URLs whose validators and parsed body are kept
+HTTP_RETRY_ATTEMPTS = 3  # attempts per request for timeouts, connection errors, 429 and 5xx
+HTTP_RETRY_BACKOFF = 1.0  # seconds, doubled per retry (with full jitter)
+HTTP_RETRY_BACKOFF_MAX = 30  # seconds
+HTTP_RETRY_AFTER_MAX = 60  # longer Retry-After values are not waited for inline
+CIRCUIT_FAILURE_THRESHOLD = 5  # consecutive failed requests before a host's circuit opens
+CIRCUIT_RESET_TIMEOUT = 60  # seconds a host's circuit stays open before a trial request
+STALE_RESULT_MAX_AGE = 6 * 60 * 60  # seconds the last good result is served while an API is failing
+
+# Warm start: last warnings per entry are saved to .storage and shown at startup
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.snapshot"  # suffixed with the entry ID
+DATA_SNAPSHOT_STORES = "snapshot_stores"  # entry ID -> Store, one instance per file
+SNAPSHOT_SAVE_DELAY = 60  # seconds, batches writes to disk
+DEFAULT_SNAPSHOT_MAX_AGE = 180  # minutes; older snapshots are ignored, 0 disables warm start
+
+# Avalanche region Detail requests
+AVALANCHE_DETAIL_CONCURRENCY = 4  # max parallel Detail requests per poll
+AVALANCHE_DETAIL_TIMEOUT = 10  # seconds per Detail request
+
+# Nationwide avalanche snapshot shared by all avalanche entries
+DATA_AVALANCHE_SNAPSHOT = "avalanche_snapshot"
+AVALANCHE_SNAPSHOT_MAX_AGE = 20 * 60  # seconds, kept below the 30 minute poll interval
+
 # Warning types
 WARNING_TYPE_LANDSLIDE = "landslide"
 WARNING_TYPE_FLOOD = "flood"
@@ -78,80 +151,26 @@ ACTIVITY_LEVEL_NAMES = {
     "5": "black",  # Extreme avalanche danger
 }
 
-# Yr.no warning icons (base64 encoded SVG data URLs)
+# Yr.no warning icons, stored as SVG files in assets/icons and loaded on first use (see icons.py)
 # Source: https://nrkno.github.io/yr-warning-icons/
-ICON_DATA_URLS = {
-    # Avalanches icons
-    "avalanches-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xOCAxN2EyIDIgMCAxIDAgMCA0IDIgMiAwIDAgMCAwLTR6bS00LTNhMSAxIDAgMSAwIDAgMiAxIDEgMCAwIDAgMC0yem05IDE0YTMgMyAwIDEgMCAwLTYgMyAzIDAgMCAwIDAgNnoiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjxwYXRoIGZpbGw9IiNGRjlEMDAiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTIwLjMxMyAyOS40OTZMOS41MSAxNC4zNzEgMS4yOTMgMjguNzQ4YS41LjUgMCAwIDAgLjQzNC43NDhoMTguNTg2eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PC9zdmc+",
-    "avalanches-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0M2MDAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xOCAxN2EyIDIgMCAxIDAgMCA0IDIgMiAwIDAgMCAwLTR6bS00LTNhMSAxIDAgMSAwIDAgMiAxIDEgMCAwIDAgMC0yem05IDE0YTMgMyAwIDEgMCAwLTYgMyAzIDAgMCAwIDAgNnptLTIuNjg3IDEuNDk2TDkuNTEgMTQuMzcxIDEuMjkzIDI4Ljc0OGEuNS41IDAgMCAwIC40MzQuNzQ4aDE4LjU4NnoiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjwvc3ZnPg==",
-    "avalanches-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xOCAxN2EyIDIgMCAxIDAgMCA0IDIgMiAwIDAgMCAwLTR6bS00LTNhMSAxIDAgMSAwIDAgMiAxIDEgMCAwIDAgMC0yem05IDE0YTMgMyAwIDEgMCAwLTYgMyAzIDAgMCAwIDAgNnoiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjxwYXRoIGZpbGw9IiNGRkU2MDAiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTIwLjMxMyAyOS40OTZMOS41MSAxNC4zNzEgMS4yOTMgMjguNzQ4YS41LjUgMCAwIDAgLjQzNC43NDhoMTguNTg2eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PC9zdmc+",
-    # Drivingconditions icons
-    "drivingconditions-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGOUQwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0yMi4zNzEgMjMuNzI0Yy0uOTE1LS44NjItNC4yMTUtMS4xMjMtNS40NzYtMS41OS0uMTM4LS4wNjctLjIyNy0uMDU1LS40MDYtLjI1Ni0uMjAyLS4yOC4wOS0uNDYuMjAzLS41NzRsLjY2LS40NjVzLS4zMTItLjE1LS41NTItLjExNGMtLjU1NS4wODQtLjg3Ny4zNzQtMS4wNDUuNzFhLjg1Mi44NTIgMCAwIDAtLjA2LjMyN2MwIC4yMTMuMDMyLjQ1Ny40NzMuODAyIDEuNzU4Ljk4NiA0LjMxMy45OTcgNC44MTMgMS44NDIuMTM0LjE3OC40NDYuNjczLjEzIDEuNTg4LS4xMy4zODItLjM5NiAxLjMyNC0uMzk2IDEuMzI0aDEuODg0bC4wMi0uMDg4Yy4yMTYtLjY5LjMyNi0xLjQyLjMyNi0yLjE0MiAwLS4xIDAtLjg4My0uNTc0LTEuMzY0em0tNS4yMjEuODc0cy00LjEwOC0uOTk3LTYuMzkxLTIuMTg5Yy0uNDQ3LS4yMzMtLjUzNC0uNTA5LS4zMi0uNzAzLjM0LS4zMSAxLjIwMy0uODU4IDEuMjAzLTEuMTEgMC0uMDk1LS41ODYtLjA3OC0uNzA1LS4wNzgtLjAwMyAwLS45NzYuNDk2LTEuNTU3IDEuMTcxLS4xNjIuMjEtLjA5Ny4xOTktLjEyLjM2NyAwIC4yMDcuMTk1LjQxLjM0My41NTMgMSAuOTU2IDYuMzMyIDIuNzE2IDYuMzMyIDIuNzE2LjExMi4wMzguMjA2LjA3NS4zMTEuMTIzLjEzOC4wNjkuMjc2LjE4NS4zNzcuMzEyLjA3LjEwNi4xMTIuMjM4LjExNC4zMzJhMS4wNiAxLjA2IDAgMCAxLS4wOC4yMzRjLS4wNjUuMTI4LS40NjEuNjYtLjYxMi44MmwtLjE0LjE0OSAxLjg0MS4wMS4wMjgtLjAzM2MuMTIyLS4xNTMuMjIyLS4zMTIuMzIyLS40NzUuMTk1LS4yOTYuMjI0LS43LjIzMy0uODk3LjAxOC0uNjgyLS41NjUtMS4xMjUtMS4xNzgtMS4zMDJ6bS40ODUtNi40OTRsLTEuMTg5LS4xOTguMDY2LS4zOTcgMS4xOS4xOTktLjA2Ny4zOTZ6bS0yLjE4Ljg1OGwtMS45OC0uMzMuMDY2LS4zOTcgMS45OC4zMy0uMDY1LjM5N3ptLTIuNTc0LTEuNjUxbC0xLjE4OC0uMi4wNjYtLjM5NSAxLjE4OC4xOTgtLjA2Ni4zOTd6bS4xNC0yLjgyOGw0LjIxLjcwM2MuMTIuMTYuNDU4LjcxLjM4MiAxLjcxMmEuNzYuNzYgMCAwIDAtLjE2LS4wNDZsLTIuMzktLjQ5My0yLjc3Ni0uMzdhLjgwOC44MDggMCAwIDAtLjE4My0uMDA3Yy4yNTQtLjk3OS43NTQtMS4zODkuOTE3LTEuNDk4em00Ljk2MiAyLjczMmMuMjE3LTEuNTY4LS40NjgtMi4zMi0uNDk4LTIuMzUybC0uMDQ3LS4wNS00LjQ5LS43NDktLjA2LjAzYy0uMDM5LjAyMS0uOTMyLjUwNS0xLjIzNiAyLjA2NmEuNzk1Ljc5NSAwIDAgMC0uMjkuNDlsLS4yNjQgMS41ODUtLjA2Ni4zOTYtLjA2Ni4zOTZhLjQwMS40MDEgMCAxIDAgLjc5Mi4xMzJsLjA2Ni0uMzk2IDUuMTUuODYtLjA2Ni4zOTZhLjQwMi40MDIgMCAwIDAgLjc5My4xMzJsLjA2Ni0uMzk2LjA2Ni0uMzk2LjI2NS0xLjU4NWEuODA2LjgwNiAwIDAgMC0uMTE1LS41NnoiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjwvc3ZnPg==",
-    "drivingconditions-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0M2MDAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0yMi4zNzEgMjMuNzI0Yy0uOTE1LS44NjItNC4yMTUtMS4xMjMtNS40NzYtMS41OS0uMTM4LS4wNjctLjIyNy0uMDU1LS40MDYtLjI1Ni0uMjAyLS4yOC4wOS0uNDYuMjAzLS41NzRsLjY2LS40NjVzLS4zMTItLjE1LS41NTItLjExNGMtLjU1NS4wODQtLjg3Ny4zNzQtMS4wNDUuNzFhLjg1Mi44NTIgMCAwIDAtLjA2LjMyN2MwIC4yMTMuMDMyLjQ1Ny40NzMuODAyIDEuNzU4Ljk4NiA0LjMxMy45OTcgNC44MTMgMS44NDIuMTM0LjE3OC40NDYuNjczLjEzIDEuNTg4LS4xMy4zODItLjM5NiAxLjMyNC0uMzk2IDEuMzI0aDEuODg0bC4wMi0uMDg4Yy4yMTYtLjY5LjMyNi0xLjQyLjMyNi0yLjE0MiAwLS4xIDAtLjg4My0uNTc0LTEuMzY0em0tNS4yMjEuODc0cy00LjEwOC0uOTk3LTYuMzkxLTIuMTg5Yy0uNDQ3LS4yMzMtLjUzNC0uNTA5LS4zMi0uNzAzLjM0LS4zMSAxLjIwMy0uODU4IDEuMjAzLTEuMTEgMC0uMDk1LS41ODYtLjA3OC0uNzA1LS4wNzgtLjAwMyAwLS45NzYuNDk2LTEuNTU3IDEuMTcxLS4xNjIuMjEtLjA5Ny4xOTktLjEyLjM2NyAwIC4yMDcuMTk1LjQxLjM0My41NTMgMSAuOTU2IDYuMzMyIDIuNzE2IDYuMzMyIDIuNzE2LjExMi4wMzguMjA2LjA3NS4zMTEuMTIzLjEzOC4wNjkuMjc2LjE4NS4zNzcuMzEyLjA3LjEwNi4xMTIuMjM4LjExNC4zMzJhMS4wNiAxLjA2IDAgMCAxLS4wOC4yMzRjLS4wNjUuMTI4LS40NjEuNjYtLjYxMi44MmwtLjE0LjE0OSAxLjg0MS4wMS4wMjgtLjAzM2MuMTIyLS4xNTMuMjIyLS4zMTIuMzIyLS40NzUuMTk1LS4yOTYuMjI0LS43LjIzMy0uODk3LjAxOC0uNjgyLS41NjUtMS4xMjUtMS4xNzgtMS4zMDJ6bS40ODUtNi40OTRsLTEuMTg5LS4xOTguMDY2LS4zOTcgMS4xOS4xOTktLjA2Ny4zOTZ6bS0yLjE4Ljg1OGwtMS45OC0uMzMuMDY2LS4zOTcgMS45OC4zMy0uMDY1LjM5N3ptLTIuNTc0LTEuNjUxbC0xLjE4OC0uMi4wNjYtLjM5NSAxLjE4OC4xOTgtLjA2Ni4zOTd6bS4xNC0yLjgyOGw0LjIxLjcwM2MuMTIuMTYuNDU4LjcxLjM4MiAxLjcxMmEuNzYuNzYgMCAwIDAtLjE2LS4wNDZsLTIuMzktLjQ5My0yLjc3Ni0uMzdhLjgwOC44MDggMCAwIDAtLjE4My0uMDA3Yy4yNTQtLjk3OS43NTQtMS4zODkuOTE3LTEuNDk4em00Ljk2MiAyLjczMmMuMjE3LTEuNTY4LS40NjgtMi4zMi0uNDk4LTIuMzUybC0uMDQ3LS4wNS00LjQ5LS43NDktLjA2LjAzYy0uMDM5LjAyMS0uOTMyLjUwNS0xLjIzNiAyLjA2NmEuNzk1Ljc5NSAwIDAgMC0uMjkuNDlsLS4yNjQgMS41ODUtLjA2Ni4zOTYtLjA2Ni4zOTZhLjQwMS40MDEgMCAxIDAgLjc5Mi4xMzJsLjA2Ni0uMzk2IDUuMTUuODYtLjA2Ni4zOTZhLjQwMi40MDIgMCAwIDAgLjc5My4xMzJsLjA2Ni0uMzk2LjA2Ni0uMzk2LjI2NS0xLjU4NWEuODA2LjgwNiAwIDAgMC0uMTE1LS41NnoiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjwvc3ZnPg==",
-    "drivingconditions-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGRTYwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUwMS41MDEgMCAwIDEtLjQzNC43NDhIMS43MjNhLjUuNSAwIDAgMS0uNDM0LS43NDhMMTUuNTY2IDMuNzY3YS41LjUgMCAwIDEgLjg2OCAweiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMjIuMzcxIDIzLjcyNGMtLjkxNS0uODYyLTQuMjE1LTEuMTIzLTUuNDc2LTEuNTktLjEzOC0uMDY3LS4yMjctLjA1NS0uNDA2LS4yNTYtLjIwMi0uMjguMDktLjQ2LjIwMy0uNTc0bC42Ni0uNDY1cy0uMzEyLS4xNS0uNTUyLS4xMTRjLS41NTUuMDg0LS44NzcuMzc0LTEuMDQ1LjcxYS44NTIuODUyIDAgMCAwLS4wNi4zMjdjMCAuMjEzLjAzMi40NTcuNDczLjgwMiAxLjc1OC45ODYgNC4zMTMuOTk3IDQuODEzIDEuODQyLjEzNC4xNzguNDQ2LjY3My4xMyAxLjU4OC0uMTMuMzgyLS4zOTYgMS4zMjQtLjM5NiAxLjMyNGgxLjg4NGwuMDItLjA4OGMuMjE2LS42OS4zMjYtMS40Mi4zMjYtMi4xNDIgMC0uMSAwLS44ODMtLjU3NC0xLjM2NHptLTUuMjIxLjg3NHMtNC4xMDgtLjk5Ny02LjM5MS0yLjE4OWMtLjQ0Ny0uMjMzLS41MzQtLjUwOS0uMzItLjcwMy4zNC0uMzEgMS4yMDMtLjg1OCAxLjIwMy0xLjExIDAtLjA5NS0uNTg2LS4wNzgtLjcwNS0uMDc4LS4wMDMgMC0uOTc2LjQ5Ni0xLjU1NyAxLjE3MS0uMTYyLjIxLS4wOTcuMTk5LS4xMi4zNjcgMCAuMjA3LjE5NS40MS4zNDMuNTUzIDEgLjk1NiA2LjMzMiAyLjcxNiA2LjMzMiAyLjcxNi4xMTIuMDM4LjIwNi4wNzUuMzExLjEyMy4xMzguMDY5LjI3Ni4xODUuMzc3LjMxMi4wNy4xMDYuMTEyLjIzOC4xMTQuMzMyYTEuMDYgMS4wNiAwIDAgMS0uMDguMjM0Yy0uMDY1LjEyOC0uNDYxLjY2LS42MTIuODJsLS4xNC4xNDkgMS44NDEuMDEuMDI4LS4wMzNjLjEyMi0uMTUzLjIyMi0uMzEyLjMyMi0uNDc1LjE5NS0uMjk2LjIyNC0uNy4yMzMtLjg5Ny4wMTgtLjY4Mi0uNTY1LTEuMTI1LTEuMTc4LTEuMzAyem0uNDg1LTYuNDk0bC0xLjE4OS0uMTk4LjA2Ni0uMzk3IDEuMTkuMTk5LS4wNjcuMzk2em0tMi4xOC44NThsLTEuOTgtLjMzLjA2Ni0uMzk3IDEuOTguMzMtLjA2NS4zOTd6bS0yLjU3NC0xLjY1MWwtMS4xODgtLjIuMDY2LS4zOTUgMS4xODguMTk4LS4wNjYuMzk3em0uMTQtMi44MjhsNC4yMS43MDNjLjEyLjE2LjQ1OC43MS4zODIgMS43MTJhLjc2Ljc2IDAgMCAwLS4xNi0uMDQ2bC0yLjM5LS40OTMtMi43NzYtLjM3YS44MDguODA4IDAgMCAwLS4xODMtLjAwN2MuMjU0LS45NzkuNzU0LTEuMzg5LjkxNy0xLjQ5OHptNC45NjIgMi43MzJjLjIxNy0xLjU2OC0uNDY4LTIuMzItLjQ5OC0yLjM1MmwtLjA0Ny0uMDUtNC40OS0uNzQ5LS4wNi4wM2MtLjAzOS4wMjEtLjkzMi41MDUtMS4yMzYgMi4wNjZhLjc5NS43OTUgMCAwIDAtLjI5LjQ5bC0uMjY0IDEuNTg1LS4wNjYuMzk2LS4wNjYuMzk2YS40MDEuNDAxIDAgMSAwIC43OTIuMTMybC4wNjYtLjM5NiA1LjE1Ljg2LS4wNjYuMzk2YS40MDIuNDAyIDAgMCAwIC43OTMuMTMybC4wNjYtLjM5Ni4wNjYtLjM5Ni4yNjUtMS41ODVhLjgwNi44MDYgMCAwIDAtLjExNS0uNTZ6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48L3N2Zz4=",
-    # Extreme icons
-    "extreme": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU2IDI4Ljc2YTEuNDYgMS40NiAwIDAgMSAuMTkuNzQgMS41IDEuNSAwIDAgMS0xLjUgMS41SDEuN2ExLjQ3IDEuNDcgMCAwIDEtLjctLjIgMS40OSAxLjQ5IDAgMCAxLS41Ni0ybDE0LjI3LTI1YTEuNjcgMS42NyAwIDAgMSAuNTYtLjU2IDEuNSAxLjUgMCAwIDEgMi4wNS41NnoiLz48cGF0aCBmaWxsPSIjYzAwMDAwIiBkPSJNMTYuNDEgNC4yN2EuNS41IDAgMCAwLS42OC0uMTkuNTguNTggMCAwIDAtLjE5LjE5bC0xNC4yNyAyNWEuNDkuNDkgMCAwIDAgLjE4LjY4LjQ1LjQ1IDAgMCAwIC4yNS4wNWgyOC41NWEuNS41IDAgMCAwIC41LS41LjU0LjU0IDAgMCAwLS4wNi0uMjV6Ii8+PGNpcmNsZSBjeD0iMTUuOTciIGN5PSIyNS45NyIgcj0iLjk3IiBmaWxsPSIjZmZmIi8+PHJlY3Qgd2lkdGg9IjQ4IiBoZWlnaHQ9IjQ4IiB4PSIxNSIgeT0iMTMiIGZpbGw9IiNmZmYiIHJ4PSIxIi8+PC9zdmc+",
-    # Flood icons
-    "flood-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGOUQwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48bWFzayBpZD0iYSIgd2lkdGg9IjQ4IiBoZWlnaHQ9IjQ4IiB4PSI5IiB5PSIxMiIgbWFza1VuaXRzPSJ1c2VyU3BhY2VPblVzZSI+PHBhdGggZmlsbD0iI2ZmZiIgZD0iTTIzIDIyYy0uNjI3IDAtLjkxNC0uMDk4LTEuNTAyLS40MzQtLjcyNS0uNDE0LTEuMTY3LS41NjYtMS45OTgtLjU2Ni0uODMgMC0xLjI3Mi4xNTItMS45OTcuNTY2LS41ODcuMzM2LS44NzQuNDM0LTEuNTAxLjQzNC0uNjI4IDAtLjkxNS0uMDk4LTEuNTAyLS40MzQtLjcyNi0uNDE0LTEuMTY4LS41NjYtMS45OTktLjU2Ni0uODMxIDAtMS4yNzMuMTUyLTEuOTk4LjU2NkM5LjkxNSAyMS45MDIgOS42MjcgMjIgOSAyMnYtOS41aDE0VjIyeiIvPjwvbWFzaz48ZyBmaWxsPSIjMDAwIiBtYXNrPSJ1cmwoI2EpIj48cGF0aCBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNiAxNC41bC01IDRoMXY0aDN2LTNoMnYzaDN2LTRoMWwtNS00eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZD0iTTE4IDE0LjVoMXYzaC0xeiIvPjwvZz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMjMgMjN2MWMtLjgzIDAtMS4yNzMtLjE1Mi0xLjk5OC0uNTY2LS41ODctLjMzNi0uODc0LS40MzQtMS41MDItLjQzNC0uNjI3IDAtLjkxMy4wOTgtMS41LjQzNC0uNzI1LjQxNC0xLjE2Ny41NjYtMS45OTguNTY2cy0xLjI3My0uMTUyLTEuOTk5LS41NjZjLS41ODctLjMzNi0uODc0LS40MzQtMS41MDItLjQzNHMtLjkxNS4wOTgtMS41MDIuNDM0QzEwLjI3MyAyMy44NDggOS44MyAyNCA5IDI0di0xYy42MjggMCAuOTE1LS4wOTggMS41MDItLjQzNC43MjYtLjQxNCAxLjE2OC0uNTY2IDEuOTk5LS41NjYuODMxIDAgMS4yNzMuMTUyIDEuOTk4LjU2Ni41ODguMzM2Ljg3NS40MzQgMS41MDMuNDM0LjYyNyAwIC45MTQtLjA5OCAxLjUwMS0uNDM0LjcyNS0uNDE0IDEuMTY3LS41NjYgMS45OTctLjU2Ni44MzEgMCAxLjI3My4xNTIgMS45OTguNTY2LjU4OC4zMzYuODc1LjQzNCAxLjUwMi40MzR6bTAgMnYxYy0uODMgMC0xLjI3My0uMTUyLTEuOTk4LS41NjYtLjU4Ny0uMzM2LS44NzQtLjQzNC0xLjUwMi0uNDM0LS42MjcgMC0uOTEzLjA5OC0xLjUuNDM0LS43MjUuNDE0LTEuMTY3LjU2Ni0xLjk5OC41NjZzLTEuMjczLS4xNTItMS45OTktLjU2NmMtLjU4Ny0uMzM2LS44NzQtLjQzNC0xLjUwMi0uNDM0cy0uOTE1LjA5OC0xLjUwMi40MzRDMTAuMjczIDI1Ljg0OCA5LjgzIDI2IDkgMjZ2LTFjLjYyOCAwIC45MTUtLjA5OCAxLjUwMi0uNDM0LjcyNi0uNDE0IDEuMTY4LS41NjYgMS45OTktLjU2Ni44MzEgMCAxLjI3My4xNTIgMS45OTguNTY2LjU4OC4zMzYuODc1LjQzNCAxLjUwMy40MzQuNjI3IDAgLjkxNC0uMDk4IDEuNTAxLS40MzQuNzI1LS40MTQgMS4xNjctLjU2NiAxLjk5Ny0uNTY2LjgzMSAwIDEuMjczLjE1MiAxLjk5OC41NjYuNTg4LjMzNi44NzUuNDM0IDEuNTAyLjQzNHoiLz48L3N2Zz4=",
-    "flood-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0M2MDAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48bWFzayBpZD0iYSIgd2lkdGg9IjQ4IiBoZWlnaHQ9IjQ4IiB4PSI5IiB5PSIxMiIgbWFza1VuaXRzPSJ1c2VyU3BhY2VPblVzZSI+PHBhdGggZmlsbD0iI2ZmZiIgZD0iTTIzIDIyYy0uNjI3IDAtLjkxNC0uMDk4LTEuNTAyLS40MzQtLjcyNS0uNDE0LTEuMTY3LS41NjYtMS45OTgtLjU2Ni0uODMgMC0xLjI3Mi4xNTItMS45OTcuNTY2LS41ODcuMzM2LS44NzQuNDM0LTEuNTAxLjQzNC0uNjI4IDAtLjkxNS0uMDk4LTEuNTAyLS40MzQtLjcyNi0uNDE0LTEuMTY4LS41NjYtMS45OTktLjU2Ni0uODMxIDAtMS4yNzMuMTUyLTEuOTk4LjU2NkM5LjkxNSAyMS45MDIgOS42MjcgMjIgOSAyMnYtOS41aDE0VjIyeiIvPjwvbWFzaz48ZyBmaWxsPSIjZmZmIiBtYXNrPSJ1cmwoI2EpIj48cGF0aCBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNiAxNC41bC01IDRoMXY0aDN2LTNoMnYzaDN2LTRoMWwtNS00eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZD0iTTE4IDE0LjVoMXYzaC0xeiIvPjwvZz48cGF0aCBmaWxsPSIjZmZmIiBkPSJNMjMgMjN2MWMtLjgzIDAtMS4yNzMtLjE1Mi0xLjk5OC0uNTY2LS41ODctLjMzNi0uODc0LS40MzQtMS41MDItLjQzNC0uNjI3IDAtLjkxMy4wOTgtMS41LjQzNC0uNzI1LjQxNC0xLjE2Ny41NjYtMS45OTguNTY2cy0xLjI3My0uMTUyLTEuOTk5LS41NjZjLS41ODctLjMzNi0uODc0LS40MzQtMS41MDItLjQzNHMtLjkxNS4wOTgtMS41MDIuNDM0QzEwLjI3MyAyMy44NDggOS44MyAyNCA5IDI0di0xYy42MjggMCAuOTE1LS4wOTggMS41MDItLjQzNC43MjYtLjQxNCAxLjE2OC0uNTY2IDEuOTk5LS41NjYuODMxIDAgMS4yNzMuMTUyIDEuOTk4LjU2Ni41ODguMzM2Ljg3NS40MzQgMS41MDMuNDM0LjYyNyAwIC45MTQtLjA5OCAxLjUwMS0uNDM0LjcyNS0uNDE0IDEuMTY3LS41NjYgMS45OTctLjU2Ni44MzEgMCAxLjI3My4xNTIgMS45OTguNTY2LjU4OC4zMzYuODc1LjQzNCAxLjUwMi40MzR6bTAgMnYxYy0uODMgMC0xLjI3My0uMTUyLTEuOTk4LS41NjYtLjU4Ny0uMzM2LS44NzQtLjQzNC0xLjUwMi0uNDM0LS42MjcgMC0uOTEzLjA5OC0xLjUuNDM0LS43MjUuNDE0LTEuMTY3LjU2Ni0xLjk5OC41NjZzLTEuMjczLS4xNTItMS45OTktLjU2NmMtLjU4Ny0uMzM2LS44NzQtLjQzNC0xLjUwMi0uNDM0cy0uOTE1LjA5OC0xLjUwMi40MzRDMTAuMjczIDI1Ljg0OCA5LjgzIDI2IDkgMjZ2LTFjLjYyOCAwIC45MTUtLjA5OCAxLjUwMi0uNDM0LjcyNi0uNDE0IDEuMTY4LS41NjYgMS45OTktLjU2Ni44MzEgMCAxLjI3My4xNTIgMS45OTguNTY2LjU4OC4zMzYuODc1LjQzNCAxLjUwMy40MzQuNjI3IDAgLjkxNC0uMDk4IDEuNTAxLS40MzQuNzI1LS40MTQgMS4xNjctLjU2NiAxLjk5Ny0uNTY2LjgzMSAwIDEuMjczLjE1MiAxLjk5OC41NjYuNTg4LjMzNi44NzUuNDM0IDEuNTAyLjQzNHoiLz48L3N2Zz4=",
-    "flood-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGRTYwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48bWFzayBpZD0iYSIgd2lkdGg9IjQ4IiBoZWlnaHQ9IjQ4IiB4PSI5IiB5PSIxMiIgbWFza1VuaXRzPSJ1c2VyU3BhY2VPblVzZSI+PHBhdGggZmlsbD0iI2ZmZiIgZD0iTTIzIDIyYy0uNjI3IDAtLjkxNC0uMDk4LTEuNTAyLS40MzQtLjcyNS0uNDE0LTEuMTY3LS41NjYtMS45OTgtLjU2Ni0uODMgMC0xLjI3Mi4xNTItMS45OTcuNTY2LS41ODcuMzM2LS44NzQuNDM0LTEuNTAxLjQzNC0uNjI4IDAtLjkxNS0uMDk4LTEuNTAyLS40MzQtLjcyNi0uNDE0LTEuMTY4LS41NjYtMS45OTktLjU2Ni0uODMxIDAtMS4yNzMuMTUyLTEuOTk4LjU2NkM5LjkxNSAyMS45MDIgOS42MjcgMjIgOSAyMnYtOS41aDE0VjIyeiIvPjwvbWFzaz48ZyBmaWxsPSIjMDAwIiBtYXNrPSJ1cmwoI2EpIj48cGF0aCBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNiAxNC41bC01IDRoMXY0aDN2LTNoMnYzaDN2LTRoMWwtNS00eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZD0iTTE4IDE0LjVoMXYzaC0xeiIvPjwvZz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMjMgMjN2MWMtLjgzIDAtMS4yNzMtLjE1Mi0xLjk5OC0uNTY2LS41ODctLjMzNi0uODc0LS40MzQtMS41MDItLjQzNC0uNjI3IDAtLjkxMy4wOTgtMS41LjQzNC0uNzI1LjQxNC0xLjE2Ny41NjYtMS45OTguNTY2cy0xLjI3My0uMTUyLTEuOTk5LS41NjZjLS41ODctLjMzNi0uODc0LS40MzQtMS41MDItLjQzNHMtLjkxNS4wOTgtMS41MDIuNDM0QzEwLjI3MyAyMy44NDggOS44MyAyNCA5IDI0di0xYy42MjggMCAuOTE1LS4wOTggMS41MDItLjQzNC43MjYtLjQxNCAxLjE2OC0uNTY2IDEuOTk5LS41NjYuODMxIDAgMS4yNzMuMTUyIDEuOTk4LjU2Ni41ODguMzM2Ljg3NS40MzQgMS41MDMuNDM0LjYyNyAwIC45MTQtLjA5OCAxLjUwMS0uNDM0LjcyNS0uNDE0IDEuMTY3LS41NjYgMS45OTctLjU2Ni44MzEgMCAxLjI3My4xNTIgMS45OTguNTY2LjU4OC4zMzYuODc1LjQzNCAxLjUwMi40MzR6bTAgMnYxYy0uODMgMC0xLjI3My0uMTUyLTEuOTk4LS41NjYtLjU4Ny0uMzM2LS44NzQtLjQzNC0xLjUwMi0uNDM0LS42MjcgMC0uOTEzLjA5OC0xLjUuNDM0LS43MjUuNDE0LTEuMTY3LjU2Ni0xLjk5OC41NjZzLTEuMjczLS4xNTItMS45OTktLjU2NmMtLjU4Ny0uMzM2LS44NzQtLjQzNC0xLjUwMi0uNDM0cy0uOTE1LjA5OC0xLjUwMi40MzRDMTAuMjczIDI1Ljg0OCA5LjgzIDI2IDkgMjZ2LTFjLjYyOCAwIC45MTUtLjA5OCAxLjUwMi0uNDM0LjcyNi0uNDE0IDEuMTY4LS41NjYgMS45OTktLjU2Ni44MzEgMCAxLjI3My4xNTIgMS45OTguNTY2LjU4OC4zMzYuODc1LjQzNCAxLjUwMy40MzQuNjI3IDAgLjkxNC0uMDk4IDEuNTAxLS40MzQuNzI1LS40MTQgMS4xNjctLjU2NiAxLjk5Ny0uNTY2LjgzMSAwIDEuMjczLjE1MiAxLjk5OC41NjYuNTg4LjMzNi44NzUuNDM0IDEuNTAyLjQzNHoiLz48L3N2Zz4=",
-    # Forestfire icons
-    "forestfire-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGOUQwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNy4xNDYgMjYuNDJjLS4yNDEuMDItLjY4IDAtLjkyNiAwLS41OTkgMC0yLjIyLS4xMzktMi4yMi0xLjM1IDAtLjYuMzA4LS44NjguNTQzLTEuNjE0LjIyNy0uNzIyLS4wNjYtMS4zNjQtLjE3Ny0xLjgzLjE3Ny0uMDIyLjU4MyAwIC45NDMuNTkuMTguMjk1LjI0LjcxMy4yMzUuODUyLjE2NS0uMTExLjYyLS41MDYuODQtMS4zNS4yMjYtLjg3Mi0uMjkyLTEuNTU0LS4zODQtMS43MTggMS4xMTIuNzE3IDEuMzA1IDEuNzk4IDEuMzEgMi4xNjMuMDA3LjUzMSAwIDAtLjAwNy42OTMtLjAwNC4zNjIuMTAzLjgyLjIzNi45ODNhMS41MjQgMS41MjQgMCAwIDEgLjExNS0uOTYyYy4yMjEtLjQ2NC43MjEtLjgxNC44NDYtLjg3Ny0uMTgzLjQ5OC0uMTc1LjY0Ny0uMTYgMS4wNjkuMDI4LjcyOC42Ni45NS42NiAxLjc0NiAwIDEuMTI2LS44NjEgMS41MTktMS44NTQgMS42MDV6TTIwIDE2Yy0uMjcyLjExNy0xLjA0OC44Mi0xLjQzNiAxLjU0OS0uMzM1LjYyNi0uNDkyIDEuNDY1LS40ODMgMS43NTQtLjMzOC0uMjMtMS40NjItMS41MzYtMS43Mi0yLjc4OS0uMjgxLTEuMzY2LjQ1MS0zLjE3NS42MzktMy41MTQtMi4yNzggMS40NzktMi41MzcgNC40MzEtMi41MzcgNC40MzFsLjAxNCAxLjQyOGMuMDA4Ljc0Ni0uMjEgMS42OTMtLjQ4MyAyLjAyOWEzLjE2IDMuMTYgMCAwIDAtLjIzNi0xLjk4NUMxMy4zMDQgMTcuOTQ2IDEyLjI1NiAxNy4xMyAxMiAxN2MuMTcxLjM0Ny40NDMgMS4yNTguNDU3IDEuOTE4QzEyLjUgMjAuODggMTEgMjEuMzM0IDExIDIyLjk3OGMwIDIuODg3IDIuMzMzIDMuNTk1IDQuOTEyIDMuNTk1aC45NTljMS45MTcgMCA0LjA2LTEuMDA3IDQuMzc0LTMuMDcuMjA1LTEuMzQxLS44NDQtMi42OS0xLjE1LTMuMjc4LS43MjctMS4zOTItLjMyMi0zLjI2NS0uMDk1LTQuMjI1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PC9zdmc+",
-    "forestfire-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0M2MDAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNy4xNDYgMjYuNDJjLS4yNDEuMDItLjY4IDAtLjkyNiAwLS41OTkgMC0yLjIyLS4xMzktMi4yMi0xLjM1IDAtLjYuMzA4LS44NjguNTQzLTEuNjE0LjIyNy0uNzIyLS4wNjYtMS4zNjQtLjE3Ny0xLjgzLjE3Ny0uMDIyLjU4MyAwIC45NDMuNTkuMTguMjk1LjI0LjcxMy4yMzUuODUyLjE2NS0uMTExLjYyLS41MDYuODQtMS4zNS4yMjYtLjg3Mi0uMjkyLTEuNTU0LS4zODQtMS43MTggMS4xMTIuNzE3IDEuMzA1IDEuNzk4IDEuMzEgMi4xNjMuMDA3LjUzMSAwIDAtLjAwNy42OTMtLjAwNC4zNjIuMTAzLjgyLjIzNi45ODNhMS41MjQgMS41MjQgMCAwIDEgLjExNS0uOTYyYy4yMjEtLjQ2NC43MjEtLjgxNC44NDYtLjg3Ny0uMTgzLjQ5OC0uMTc1LjY0Ny0uMTYgMS4wNjkuMDI4LjcyOC42Ni45NS42NiAxLjc0NiAwIDEuMTI2LS44NjEgMS41MTktMS44NTQgMS42MDV6TTIwIDE2Yy0uMjcyLjExNy0xLjA0OC44Mi0xLjQzNiAxLjU0OS0uMzM1LjYyNi0uNDkyIDEuNDY1LS40ODMgMS43NTQtLjMzOC0uMjMtMS40NjItMS41MzYtMS43Mi0yLjc4OS0uMjgxLTEuMzY2LjQ1MS0zLjE3NS42MzktMy41MTQtMi4yNzggMS40NzktMi41MzcgNC40MzEtMi41MzcgNC40MzFsLjAxNCAxLjQyOGMuMDA4Ljc0Ni0uMjEgMS42OTMtLjQ4MyAyLjAyOWEzLjE2IDMuMTYgMCAwIDAtLjIzNi0xLjk4NUMxMy4zMDQgMTcuOTQ2IDEyLjI1NiAxNy4xMyAxMiAxN2MuMTcxLjM0Ny40NDMgMS4yNTguNDU3IDEuOTE4QzEyLjUgMjAuODggMTEgMjEuMzM0IDExIDIyLjk3OGMwIDIuODg3IDIuMzMzIDMuNTk1IDQuOTEyIDMuNTk1aC45NTljMS45MTcgMCA0LjA2LTEuMDA3IDQuMzc0LTMuMDcuMjA1LTEuMzQxLS44NDQtMi42OS0xLjE1LTMuMjc4LS43MjctMS4zOTItLjMyMi0zLjI2NS0uMDk1LTQuMjI1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PC9zdmc+",
-    "forestfire-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGRTYwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNy4xNDYgMjYuNDJjLS4yNDEuMDItLjY4IDAtLjkyNiAwLS41OTkgMC0yLjIyLS4xMzktMi4yMi0xLjM1IDAtLjYuMzA4LS44NjguNTQzLTEuNjE0LjIyNy0uNzIyLS4wNjYtMS4zNjQtLjE3Ny0xLjgzLjE3Ny0uMDIyLjU4MyAwIC45NDMuNTkuMTguMjk1LjI0LjcxMy4yMzUuODUyLjE2NS0uMTExLjYyLS41MDYuODQtMS4zNS4yMjYtLjg3Mi0uMjkyLTEuNTU0LS4zODQtMS43MTggMS4xMTIuNzE3IDEuMzA1IDEuNzk4IDEuMzEgMi4xNjMuMDA3LjUzMSAwIDAtLjAwNy42OTMtLjAwNC4zNjIuMTAzLjgyLjIzNi45ODNhMS41MjQgMS41MjQgMCAwIDEgLjExNS0uOTYyYy4yMjEtLjQ2NC43MjEtLjgxNC44NDYtLjg3Ny0uMTgzLjQ5OC0uMTc1LjY0Ny0uMTYgMS4wNjkuMDI4LjcyOC42Ni45NS42NiAxLjc0NiAwIDEuMTI2LS44NjEgMS41MTktMS44NTQgMS42MDV6TTIwIDE2Yy0uMjcyLjExNy0xLjA0OC44Mi0xLjQzNiAxLjU0OS0uMzM1LjYyNi0uNDkyIDEuNDY1LS40ODMgMS43NTQtLjMzOC0uMjMtMS40NjItMS41MzYtMS43Mi0yLjc4OS0uMjgxLTEuMzY2LjQ1MS0zLjE3NS42MzktMy41MTQtMi4yNzggMS40NzktMi41MzcgNC40MzEtMi41MzcgNC40MzFsLjAxNCAxLjQyOGMuMDA4Ljc0Ni0uMjEgMS42OTMtLjQ4MyAyLjAyOWEzLjE2IDMuMTYgMCAwIDAtLjIzNi0xLjk4NUMxMy4zMDQgMTcuOTQ2IDEyLjI1NiAxNy4xMyAxMiAxN2MuMTcxLjM0Ny40NDMgMS4yNTguNDU3IDEuOTE4QzEyLjUgMjAuODggMTEgMjEuMzM0IDExIDIyLjk3OGMwIDIuODg3IDIuMzMzIDMuNTk1IDQuOTEyIDMuNTk1aC45NTljMS45MTcgMCA0LjA2LTEuMDA3IDQuMzc0LTMuMDcuMjA1LTEuMzQxLS44NDQtMi42OS0xLjE1LTMuMjc4LS43MjctMS4zOTItLjMyMi0zLjI2NS0uMDk1LTQuMjI1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PC9zdmc+",
-    # Generic icons
-    "generic-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGOUQwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNC44MTQgMTRoMi4zOTJsLS4yMDIgNy4yMzNoLTEuOTk1TDE0LjgxNCAxNHptMS4xOTYgMTEuMDA3Yy0uODM3IDAtMS4zNi0uNDg2LTEuMzYtMS4yNyAwLS43OTIuNTIzLTEuMjc4IDEuMzYtMS4yNzguODQ0IDAgMS4zNi40ODYgMS4zNiAxLjI3OCAwIC43ODQtLjUxNiAxLjI3LTEuMzYgMS4yN3oiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjwvc3ZnPg==",
-    "generic-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0M2MDAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNC44MTQgMTRoMi4zOTJsLS4yMDIgNy4yMzNoLTEuOTk1TDE0LjgxNCAxNHptMS4xOTYgMTEuMDA3Yy0uODM3IDAtMS4zNi0uNDg2LTEuMzYtMS4yNyAwLS43OTIuNTIzLTEuMjc4IDEuMzYtMS4yNzguODQ0IDAgMS4zNi40ODYgMS4zNiAxLjI3OCAwIC43ODQtLjUxNiAxLjI3LTEuMzYgMS4yN3oiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjwvc3ZnPg==",
-    "generic-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGRTYwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNC44MTQgMTRoMi4zOTJsLS4yMDIgNy4yMzNoLTEuOTk1TDE0LjgxNCAxNHptMS4xOTYgMTEuMDA3Yy0uODM3IDAtMS4zNi0uNDg2LTEuMzYtMS4yNyAwLS43OTIuNTIzLTEuMjc4IDEuMzYtMS4yNzguODQ0IDAgMS4zNi40ODYgMS4zNiAxLjI3OCAwIC43ODQtLjUxNiAxLjI3LTEuMzYgMS4yN3oiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjwvc3ZnPg==",
-    # Ice icons
-    "ice-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU2IDI4Ljc2YTEuNTEgMS41MSAwIDAgMS0xLjMxIDIuMjZIMS43YTEuNDYgMS40NiAwIDAgMS0uNzQtLjE5IDEuNSAxLjUgMCAwIDEtLjU2LTIuMDdMMTQuNjcgMy43OGExLjUgMS41IDAgMCAxIDIuNjEgMHoiLz48cGF0aCBmaWxsPSIjZmY5ZDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0zMS4xMiAyOS4wMmwtMTQuMjctMjVhMSAxIDAgMCAwLTEuMzctLjM3IDEuMDkgMS4wOSAwIDAgMC0uMzcuMzdsLTE0LjI4IDI1YTEgMSAwIDAgMCAuMzcgMS4zNSAxIDEgMCAwIDAgLjUuMTNoMjguNTVhMSAxIDAgMCAwIDEtMSAxIDEgMCAwIDAtLjEzLS40OHoiLz48cGF0aCBkPSJNMzEuMTIgMjkuMDJhMSAxIDAgMCAxIC4xMy40OSAxIDEgMCAwIDEtMSAxSDEuN2ExIDEgMCAwIDEtLjUtLjEzIDEgMSAwIDAgMS0uMzctMS4zNmwxNC4yOC0yNWExLjA5IDEuMDkgMCAwIDEgLjM3LS4zNyAxIDEgMCAwIDEgMS4zNy4zN3ptLS40My4yNWwtMTQuMjgtMjVhLjQ5LjQ5IDAgMCAwLS42OC0uMTguNDcuNDcgMCAwIDAtLjE5LjE4bC0xNC4yNyAyNWEuNDkuNDkgMCAwIDAgLjE4LjY4LjU0LjU0IDAgMCAwIC4yNS4wN2gyOC41NWEuNS41IDAgMCAwIC41LS41LjUuNSAwIDAgMC0uMDYtLjI2eiIgb3BhY2l0eT0iLjUiLz48cGF0aCBkPSJNMjMuMjQgMjMuNzJjLS45MS0uODYtNC4yMS0xLjEyLTUuNDgtMS41OWEuOTIuOTIgMCAwIDEtLjQtLjI2Yy0uMi0uMjguMDktLjQ2LjItLjU3bC42Ni0uNDZhMS4wOCAxLjA4IDAgMCAwLS41NS0uMTIgMS4zMiAxLjMyIDAgMCAwLTEgLjcxIDEuMDggMS4wOCAwIDAgMC0uMDYuMzNjMCAuMjEgMCAuNDUuNDguOCAxLjc2IDEgNC4zMSAxIDQuODEgMS44NGExLjYgMS42IDAgMCAxIC4xMyAxLjU5Yy0uMTMuMzgtLjQgMS4zMi0uNCAxLjMyaDEuODl2LS4wOGE3LjQxIDcuNDEgMCAwIDAgLjI5LTIuMTcgMS44NCAxLjg0IDAgMCAwLS41Ny0xLjM2bS01LjIyLjg5YTM1LjkzIDM1LjkzIDAgMCAxLTYuMzktMi4xOGMtLjQ1LS4yNC0uNTMtLjUxLS4zMi0uNzFzMS4yLS44NiAxLjItMS4xMWMwLS4wOS0uNTgtLjA4LS43LS4wOGE1Ljc3IDUuNzcgMCAwIDAtMS41NiAxLjE4Yy0uMTIuMjEtLjEyLjE5LS4xMi4zN2EuODguODggMCAwIDAgLjM0LjU1YzEgMSA2LjM0IDIuNzIgNi4zNCAyLjcybC4zMS4xMmExLjI0IDEuMjQgMCAwIDEgLjM3LjMyLjc0Ljc0IDAgMCAxIC4xMi4zMyAxLjU1IDEuNTUgMCAwIDEtLjA4LjIzIDcuNTEgNy41MSAwIDAgMS0uNjEuODJsLS4xNS4xNWgxLjg1YTMuMTQgMy4xNCAwIDAgMCAuMzMtLjQ4IDEuODkgMS44OSAwIDAgMCAuMjMtLjg5QTEuNDMgMS40MyAwIDAgMCAxOCAyNC42Mm0uNS02LjU2bC0xLjE4LS4yLjA2LS4zOSAxLjE5LjE5em0tMi4xNy45bC0yLS4zMy4wNy0uNCAyIC4zM3ptLTIuNTgtMS42NWwtMS4xOS0uMi4wNy0uNCAxLjE5LjJ6bS4xNC0yLjgzbDQuMjQuN2EyLjUgMi41IDAgMCAxIC4zOCAxLjcxaC0uMTZsLTIuNDItLjU0LTIuOC0uMzZhLjYxLjYxIDAgMCAwLS4xOSAwIDIuNTYgMi41NiAwIDAgMSAuOTUtMS41MXptNSAyLjczYTIuODYgMi44NiAwIDAgMC0uNTQtMi4zNXYtLjA1bC00LjUzLS43NWgtLjA2YTIuODggMi44OCAwIDAgMC0xLjI0IDIuMS43OS43OSAwIDAgMC0uMjkuNDlsLS4yNiAxLjU4LS4wNy40LS4wNi40M2EuNDEuNDEgMCAwIDAgLjI5LjQzLjQyLjQyIDAgMCAwIC41LS4zM2wuMDYtLjQgNS4xNS44Ni0uMDYuNDRhLjQwMS40MDEgMCAxIDAgLjc5LjE0bC4wNy0uNC4wNi0uNC4yNy0xLjU4YS44My44MyAwIDAgMC0uMTItLjYxeiIvPjwvc3ZnPg==",
-    "ice-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU2IDI4Ljc2YTEuNTEgMS41MSAwIDAgMS0xLjMxIDIuMjZIMS43YTEuNDYgMS40NiAwIDAgMS0uNzQtLjE5IDEuNSAxLjUgMCAwIDEtLjU2LTIuMDdMMTQuNjcgMy43OGExLjUgMS41IDAgMCAxIDIuNjEgMHoiLz48cGF0aCBmaWxsPSIjYzAwMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0zMS4xMiAyOS4wMmwtMTQuMjctMjVhMSAxIDAgMCAwLTEuMzctLjM3IDEuMDkgMS4wOSAwIDAgMC0uMzcuMzdsLTE0LjI4IDI1YTEgMSAwIDAgMCAuMzcgMS4zNSAxIDEgMCAwIDAgLjUuMTNoMjguNTVhMSAxIDAgMCAwIDEtMSAxIDEgMCAwIDAtLjEzLS40OHoiLz48cGF0aCBkPSJNMzEuMTIgMjkuMDJhMSAxIDAgMCAxIC4xMy40OSAxIDEgMCAwIDEtMSAxSDEuN2ExIDEgMCAwIDEtLjUtLjEzIDEgMSAwIDAgMS0uMzctMS4zNmwxNC4yOC0yNWExLjA5IDEuMDkgMCAwIDEgLjM3LS4zNyAxIDEgMCAwIDEgMS4zNy4zN3ptLS40My4yNWwtMTQuMjgtMjVhLjQ5LjQ5IDAgMCAwLS42OC0uMTguNDcuNDcgMCAwIDAtLjE5LjE4bC0xNC4yNyAyNWEuNDkuNDkgMCAwIDAgLjE4LjY4LjU0LjU0IDAgMCAwIC4yNS4wN2gyOC41NWEuNS41IDAgMCAwIC41LS41LjUuNSAwIDAgMC0uMDYtLjI2eiIgb3BhY2l0eT0iLjUiLz48cGF0aCBmaWxsPSIjZmZmIiBkPSJNMjMuMjQgMjMuNzJjLS45MS0uODYtNC4yMS0xLjEyLTUuNDgtMS41OWEuOTIuOTIgMCAwIDEtLjQtLjI2Yy0uMi0uMjguMDktLjQ2LjItLjU3bC42Ni0uNDZhMS4wOCAxLjA4IDAgMCAwLS41NS0uMTIgMS4zMiAxLjMyIDAgMCAwLTEgLjcxIDEuMDggMS4wOCAwIDAgMC0uMDYuMzNjMCAuMjEgMCAuNDUuNDguOCAxLjc2IDEgNC4zMSAxIDQuODEgMS44NGExLjYgMS42IDAgMCAxIC4xMyAxLjU5Yy0uMTMuMzgtLjQgMS4zMi0uNCAxLjMyaDEuODl2LS4wOGE3LjQxIDcuNDEgMCAwIDAgLjI5LTIuMTcgMS44NCAxLjg0IDAgMCAwLS41Ny0xLjM2bS01LjIyLjg5YTM1LjkzIDM1LjkzIDAgMCAxLTYuMzktMi4xOGMtLjQ1LS4yNC0uNTMtLjUxLS4zMi0uNzFzMS4yLS44NiAxLjItMS4xMWMwLS4wOS0uNTgtLjA4LS43LS4wOGE1Ljc3IDUuNzcgMCAwIDAtMS41NiAxLjE4Yy0uMTIuMjEtLjEyLjE5LS4xMi4zN2EuODguODggMCAwIDAgLjM0LjU1YzEgMSA2LjM0IDIuNzIgNi4zNCAyLjcybC4zMS4xMmExLjI0IDEuMjQgMCAwIDEgLjM3LjMyLjc0Ljc0IDAgMCAxIC4xMi4zMyAxLjU1IDEuNTUgMCAwIDEtLjA4LjIzIDcuNTEgNy41MSAwIDAgMS0uNjEuODJsLS4xNS4xNWgxLjg1YTMuMTQgMy4xNCAwIDAgMCAuMzMtLjQ4IDEuODkgMS44OSAwIDAgMCAuMjMtLjg5QTEuNDMgMS40MyAwIDAgMCAxOCAyNC42Mm0uNS02LjU2bC0xLjE4LS4yLjA2LS4zOSAxLjE5LjE5em0tMi4xNy45bC0yLS4zMy4wNy0uNCAyIC4zM3ptLTIuNTgtMS42NWwtMS4xOS0uMi4wNy0uNCAxLjE5LjJ6bS4xNC0yLjgzbDQuMjQuN2EyLjUgMi41IDAgMCAxIC4zOCAxLjcxaC0uMTZsLTIuNDItLjU0LTIuOC0uMzZhLjYxLjYxIDAgMCAwLS4xOSAwIDIuNTYgMi41NiAwIDAgMSAuOTUtMS41MXptNSAyLjczYTIuODYgMi44NiAwIDAgMC0uNTQtMi4zNXYtLjA1bC00LjUzLS43NWgtLjA2YTIuODggMi44OCAwIDAgMC0xLjI0IDIuMS43OS43OSAwIDAgMC0uMjkuNDlsLS4yNiAxLjU4LS4wNy40LS4wNi40M2EuNDEuNDEgMCAwIDAgLjI5LjQzLjQyLjQyIDAgMCAwIC41LS4zM2wuMDYtLjQgNS4xNS44Ni0uMDYuNDRhLjQwMS40MDEgMCAxIDAgLjc5LjE0bC4wNy0uNC4wNi0uNC4yNy0xLjU4YS44My44MyAwIDAgMC0uMTItLjYxeiIvPjwvc3ZnPg==",
-    "ice-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU2IDI4Ljc2YTEuNTEgMS41MSAwIDAgMS0xLjMxIDIuMjZIMS43YTEuNDYgMS40NiAwIDAgMS0uNzQtLjE5IDEuNSAxLjUgMCAwIDEtLjU2LTIuMDdMMTQuNjcgMy43OGExLjUgMS41IDAgMCAxIDIuNjEgMHoiLz48cGF0aCBmaWxsPSIjZmZlNjAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0zMS4xMiAyOS4wMmwtMTQuMjctMjVhMSAxIDAgMCAwLTEuMzctLjM3IDEuMDkgMS4wOSAwIDAgMC0uMzcuMzdsLTE0LjI4IDI1YTEgMSAwIDAgMCAuMzcgMS4zNSAxIDEgMCAwIDAgLjUuMTNoMjguNTVhMSAxIDAgMCAwIDEtMSAxIDEgMCAwIDAtLjEzLS40OHoiLz48cGF0aCBkPSJNMzEuMTIgMjkuMDJhMSAxIDAgMCAxIC4xMy40OSAxIDEgMCAwIDEtMSAxSDEuN2ExIDEgMCAwIDEtLjUtLjEzIDEgMSAwIDAgMS0uMzctMS4zNmwxNC4yOC0yNWExLjA5IDEuMDkgMCAwIDEgLjM3LS4zNyAxIDEgMCAwIDEgMS4zNy4zN3ptLS40My4yNWwtMTQuMjgtMjVhLjQ5LjQ5IDAgMCAwLS42OC0uMTguNDcuNDcgMCAwIDAtLjE5LjE4bC0xNC4yNyAyNWEuNDkuNDkgMCAwIDAgLjE4LjY4LjU0LjU0IDAgMCAwIC4yNS4wN2gyOC41NWEuNS41IDAgMCAwIC41LS41LjUuNSAwIDAgMC0uMDYtLjI2eiIgb3BhY2l0eT0iLjUiLz48cGF0aCBkPSJNMjMuMjQgMjMuNzJjLS45MS0uODYtNC4yMS0xLjEyLTUuNDgtMS41OWEuOTIuOTIgMCAwIDEtLjQtLjI2Yy0uMi0uMjguMDktLjQ2LjItLjU3bC42Ni0uNDZhMS4wOCAxLjA4IDAgMCAwLS41NS0uMTIgMS4zMiAxLjMyIDAgMCAwLTEgLjcxIDEuMDggMS4wOCAwIDAgMC0uMDYuMzNjMCAuMjEgMCAuNDUuNDguOCAxLjc2IDEgNC4zMSAxIDQuODEgMS44NGExLjYgMS42IDAgMCAxIC4xMyAxLjU5Yy0uMTMuMzgtLjQgMS4zMi0uNCAxLjMyaDEuODl2LS4wOGE3LjQxIDcuNDEgMCAwIDAgLjI5LTIuMTcgMS44NCAxLjg0IDAgMCAwLS41Ny0xLjM2bS01LjIyLjg5YTM1LjkzIDM1LjkzIDAgMCAxLTYuMzktMi4xOGMtLjQ1LS4yNC0uNTMtLjUxLS4zMi0uNzFzMS4yLS44NiAxLjItMS4xMWMwLS4wOS0uNTgtLjA4LS43LS4wOGE1Ljc3IDUuNzcgMCAwIDAtMS41NiAxLjE4Yy0uMTIuMjEtLjEyLjE5LS4xMi4zN2EuODguODggMCAwIDAgLjM0LjU1YzEgMSA2LjM0IDIuNzIgNi4zNCAyLjcybC4zMS4xMmExLjI0IDEuMjQgMCAwIDEgLjM3LjMyLjc0Ljc0IDAgMCAxIC4xMi4zMyAxLjU1IDEuNTUgMCAwIDEtLjA4LjIzIDcuNTEgNy41MSAwIDAgMS0uNjEuODJsLS4xNS4xNWgxLjg1YTMuMTQgMy4xNCAwIDAgMCAuMzMtLjQ4IDEuODkgMS44OSAwIDAgMCAuMjMtLjg5QTEuNDMgMS40MyAwIDAgMCAxOCAyNC42Mm0uNS02LjU2bC0xLjE4LS4yLjA2LS4zOSAxLjE5LjE5em0tMi4xNy45bC0yLS4zMy4wNy0uNCAyIC4zM3ptLTIuNTgtMS42NWwtMS4xOS0uMi4wNy0uNCAxLjE5LjJ6bS4xNC0yLjgzbDQuMjQuN2EyLjUgMi41IDAgMCAxIC4zOCAxLjcxaC0uMTZsLTIuNDItLjU0LTIuOC0uMzZhLjYxLjYxIDAgMCAwLS4xOSAwIDIuNTYgMi41NiAwIDAgMSAuOTUtMS41MXptNSAyLjczYTIuODYgMi44NiAwIDAgMC0uNTQtMi4zNXYtLjA1bC00LjUzLS43NWgtLjA2YTIuODggMi44OCAwIDAgMC0xLjI0IDIuMS43OS43OSAwIDAgMC0uMjkuNDlsLS4yNiAxLjU4LS4wNy40LS4wNi40M2EuNDEuNDEgMCAwIDAgLjI5LjQzLjQyLjQyIDAgMCAwIC41LS4zM2wuMDYtLjQgNS4xNS44Ni0uMDYuNDRhLjQwMS40MDEgMCAxIDAgLjc5LjE0bC4wNy0uNC4wNi0uNC4yNy0xLjU4YS44My44MyAwIDAgMC0uMTItLjYxeiIvPjwvc3ZnPg==",
-    # Icing icons (aliases to ice icons)
-    "icing-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU2IDI4Ljc2YTEuNTEgMS41MSAwIDAgMS0xLjMxIDIuMjZIMS43YTEuNDYgMS40NiAwIDAgMS0uNzQtLjE5IDEuNSAxLjUgMCAwIDEtLjU2LTIuMDdMMTQuNjcgMy43OGExLjUgMS41IDAgMCAxIDIuNjEgMHoiLz48cGF0aCBmaWxsPSIjZmY5ZDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0zMS4xMiAyOS4wMmwtMTQuMjctMjVhMSAxIDAgMCAwLTEuMzctLjM3IDEuMDkgMS4wOSAwIDAgMC0uMzcuMzdsLTE0LjI4IDI1YTEgMSAwIDAgMCAuMzcgMS4zNSAxIDEgMCAwIDAgLjUuMTNoMjguNTVhMSAxIDAgMCAwIDEtMSAxIDEgMCAwIDAtLjEzLS40OHoiLz48cGF0aCBkPSJNMzEuMTIgMjkuMDJhMSAxIDAgMCAxIC4xMy40OSAxIDEgMCAwIDEtMSAxSDEuN2ExIDEgMCAwIDEtLjUtLjEzIDEgMSAwIDAgMS0uMzctMS4zNmwxNC4yOC0yNWExLjA5IDEuMDkgMCAwIDEgLjM3LS4zNyAxIDEgMCAwIDEgMS4zNy4zN3ptLS40My4yNWwtMTQuMjgtMjVhLjQ5LjQ5IDAgMCAwLS42OC0uMTguNDcuNDcgMCAwIDAtLjE5LjE4bC0xNC4yNyAyNWEuNDkuNDkgMCAwIDAgLjE4LjY4LjU0LjU0IDAgMCAwIC4yNS4wN2gyOC41NWEuNS41IDAgMCAwIC41LS41LjUuNSAwIDAgMC0uMDYtLjI2eiIgb3BhY2l0eT0iLjUiLz48cGF0aCBkPSJNMjMuMjQgMjMuNzJjLS45MS0uODYtNC4yMS0xLjEyLTUuNDgtMS41OWEuOTIuOTIgMCAwIDEtLjQtLjI2Yy0uMi0uMjguMDktLjQ2LjItLjU3bC42Ni0uNDZhMS4wOCAxLjA4IDAgMCAwLS41NS0uMTIgMS4zMiAxLjMyIDAgMCAwLTEgLjcxIDEuMDggMS4wOCAwIDAgMC0uMDYuMzNjMCAuMjEgMCAuNDUuNDguOCAxLjc2IDEgNC4zMSAxIDQuODEgMS44NGExLjYgMS42IDAgMCAxIC4xMyAxLjU5Yy0uMTMuMzgtLjQgMS4zMi0uNCAxLjMyaDEuODl2LS4wOGE3LjQxIDcuNDEgMCAwIDAgLjI5LTIuMTcgMS44NCAxLjg0IDAgMCAwLS41Ny0xLjM2bS01LjIyLjg5YTM1LjkzIDM1LjkzIDAgMCAxLTYuMzktMi4xOGMtLjQ1LS4yNC0uNTMtLjUxLS4zMi0uNzFzMS4yLS44NiAxLjItMS4xMWMwLS4wOS0uNTgtLjA4LS43LS4wOGE1Ljc3IDUuNzcgMCAwIDAtMS41NiAxLjE4Yy0uMTIuMjEtLjEyLjE5LS4xMi4zN2EuODguODggMCAwIDAgLjM0LjU1YzEgMSA2LjM0IDIuNzIgNi4zNCAyLjcybC4zMS4xMmExLjI0IDEuMjQgMCAwIDEgLjM3LjMyLjc0Ljc0IDAgMCAxIC4xMi4zMyAxLjU1IDEuNTUgMCAwIDEtLjA4LjIzIDcuNTEgNy41MSAwIDAgMS0uNjEuODJsLS4xNS4xNWgxLjg1YTMuMTQgMy4xNCAwIDAgMCAuMzMtLjQ4IDEuODkgMS44OSAwIDAgMCAuMjMtLjg5QTEuNDMgMS40MyAwIDAgMCAxOCAyNC42Mm0uNS02LjU2bC0xLjE4LS4yLjA2LS4zOSAxLjE5LjE5em0tMi4xNy45bC0yLS4zMy4wNy0uNCAyIC4zM3ptLTIuNTgtMS42NWwtMS4xOS0uMi4wNy0uNCAxLjE5LjJ6bS4xNC0yLjgzbDQuMjQuN2EyLjUgMi41IDAgMCAxIC4zOCAxLjcxaC0uMTZsLTIuNDItLjU0LTIuOC0uMzZhLjYxLjYxIDAgMCAwLS4xOSAwIDIuNTYgMi41NiAwIDAgMSAuOTUtMS41MXptNSAyLjczYTIuODYgMi44NiAwIDAgMC0uNTQtMi4zNXYtLjA1bC00LjUzLS43NWgtLjA2YTIuODggMi44OCAwIDAgMC0xLjI0IDIuMS43OS43OSAwIDAgMC0uMjkuNDlsLS4yNiAxLjU4LS4wNy40LS4wNi40M2EuNDEuNDEgMCAwIDAgLjI5LjQzLjQyLjQyIDAgMCAwIC41LS4zM2wuMDYtLjQgNS4xNS44Ni0uMDYuNDRhLjQwMS40MDEgMCAxIDAgLjc5LjE0bC4wNy0uNC4wNi0uNC4yNy0xLjU4YS44My44MyAwIDAgMC0uMTItLjYxeiIvPjwvc3ZnPg==",
-    "icing-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU2IDI4Ljc2YTEuNTEgMS41MSAwIDAgMS0xLjMxIDIuMjZIMS43YTEuNDYgMS40NiAwIDAgMS0uNzQtLjE5IDEuNSAxLjUgMCAwIDEtLjU2LTIuMDdMMTQuNjcgMy43OGExLjUgMS41IDAgMCAxIDIuNjEgMHoiLz48cGF0aCBmaWxsPSIjYzAwMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0zMS4xMiAyOS4wMmwtMTQuMjctMjVhMSAxIDAgMCAwLTEuMzctLjM3IDEuMDkgMS4wOSAwIDAgMC0uMzcuMzdsLTE0LjI4IDI1YTEgMSAwIDAgMCAuMzcgMS4zNSAxIDEgMCAwIDAgLjUuMTNoMjguNTVhMSAxIDAgMCAwIDEtMSAxIDEgMCAwIDAtLjEzLS40OHoiLz48cGF0aCBkPSJNMzEuMTIgMjkuMDJhMSAxIDAgMCAxIC4xMy40OSAxIDEgMCAwIDEtMSAxSDEuN2ExIDEgMCAwIDEtLjUtLjEzIDEgMSAwIDAgMS0uMzctMS4zNmwxNC4yOC0yNWExLjA5IDEuMDkgMCAwIDEgLjM3LS4zNyAxIDEgMCAwIDEgMS4zNy4zN3ptLS40My4yNWwtMTQuMjgtMjVhLjQ5LjQ5IDAgMCAwLS42OC0uMTguNDcuNDcgMCAwIDAtLjE5LjE4bC0xNC4yNyAyNWEuNDkuNDkgMCAwIDAgLjE4LjY4LjU0LjU0IDAgMCAwIC4yNS4wN2gyOC41NWEuNS41IDAgMCAwIC41LS41LjUuNSAwIDAgMC0uMDYtLjI2eiIgb3BhY2l0eT0iLjUiLz48cGF0aCBmaWxsPSIjZmZmIiBkPSJNMjMuMjQgMjMuNzJjLS45MS0uODYtNC4yMS0xLjEyLTUuNDgtMS41OWEuOTIuOTIgMCAwIDEtLjQtLjI2Yy0uMi0uMjguMDktLjQ2LjItLjU3bC42Ni0uNDZhMS4wOCAxLjA4IDAgMCAwLS41NS0uMTIgMS4zMiAxLjMyIDAgMCAwLTEgLjcxIDEuMDggMS4wOCAwIDAgMC0uMDYuMzNjMCAuMjEgMCAuNDUuNDguOCAxLjc2IDEgNC4zMSAxIDQuODEgMS44NGExLjYgMS42IDAgMCAxIC4xMyAxLjU5Yy0uMTMuMzgtLjQgMS4zMi0uNCAxLjMyaDEuODl2LS4wOGE3LjQxIDcuNDEgMCAwIDAgLjI5LTIuMTcgMS44NCAxLjg0IDAgMCAwLS41Ny0xLjM2bS01LjIyLjg5YTM1LjkzIDM1LjkzIDAgMCAxLTYuMzktMi4xOGMtLjQ1LS4yNC0uNTMtLjUxLS4zMi0uNzFzMS4yLS44NiAxLjItMS4xMWMwLS4wOS0uNTgtLjA4LS43LS4wOGE1Ljc3IDUuNzcgMCAwIDAtMS41NiAxLjE4Yy0uMTIuMjEtLjEyLjE5LS4xMi4zN2EuODguODggMCAwIDAgLjM0LjU1YzEgMSA2LjM0IDIuNzIgNi4zNCAyLjcybC4zMS4xMmExLjI0IDEuMjQgMCAwIDEgLjM3LjMyLjc0Ljc0IDAgMCAxIC4xMi4zMyAxLjU1IDEuNTUgMCAwIDEtLjA4LjIzIDcuNTEgNy41MSAwIDAgMS0uNjEuODJsLS4xNS4xNWgxLjg1YTMuMTQgMy4xNCAwIDAgMCAuMzMtLjQ4IDEuODkgMS44OSAwIDAgMCAuMjMtLjg5QTEuNDMgMS40MyAwIDAgMCAxOCAyNC42Mm0uNS02LjU2bC0xLjE4LS4yLjA2LS4zOSAxLjE5LjE5em0tMi4xNy45bC0yLS4zMy4wNy0uNCAyIC4zM3ptLTIuNTgtMS42NWwtMS4xOS0uMi4wNy0uNCAxLjE5LjJ6bS4xNC0yLjgzbDQuMjQuN2EyLjUgMi41IDAgMCAxIC4zOCAxLjcxaC0uMTZsLTIuNDItLjU0LTIuOC0uMzZhLjYxLjYxIDAgMCAwLS4xOSAwIDIuNTYgMi41NiAwIDAgMSAuOTUtMS41MXptNSAyLjczYTIuODYgMi44NiAwIDAgMC0uNTQtMi4zNXYtLjA1bC00LjUzLS43NWgtLjA2YTIuODggMi44OCAwIDAgMC0xLjI0IDIuMS43OS43OSAwIDAgMC0uMjkuNDlsLS4yNiAxLjU4LS4wNy40LS4wNi40M2EuNDEuNDEgMCAwIDAgLjI5LjQzLjQyLjQyIDAgMCAwIC41LS4zM2wuMDYtLjQgNS4xNS44Ni0uMDYuNDRhLjQwMS40MDEgMCAxIDAgLjc5LjE0bC4wNy0uNC4wNi0uNC4yNy0xLjU4YS44My44MyAwIDAgMC0uMTItLjYxeiIvPjwvc3ZnPg==",
-    "icing-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU2IDI4Ljc2YTEuNTEgMS41MSAwIDAgMS0xLjMxIDIuMjZIMS43YTEuNDYgMS40NiAwIDAgMS0uNzQtLjE5IDEuNSAxLjUgMCAwIDEtLjU2LTIuMDdMMTQuNjcgMy43OGExLjUgMS41IDAgMCAxIDIuNjEgMHoiLz48cGF0aCBmaWxsPSIjZmZlNjAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0zMS4xMiAyOS4wMmwtMTQuMjctMjVhMSAxIDAgMCAwLTEuMzctLjM3IDEuMDkgMS4wOSAwIDAgMC0uMzcuMzdsLTE0LjI4IDI1YTEgMSAwIDAgMCAuMzcgMS4zNSAxIDEgMCAwIDAgLjUuMTNoMjguNTVhMSAxIDAgMCAwIDEtMSAxIDEgMCAwIDAtLjEzLS40OHoiLz48cGF0aCBkPSJNMzEuMTIgMjkuMDJhMSAxIDAgMCAxIC4xMy40OSAxIDEgMCAwIDEtMSAxSDEuN2ExIDEgMCAwIDEtLjUtLjEzIDEgMSAwIDAgMS0uMzctMS4zNmwxNC4yOC0yNWExLjA5IDEuMDkgMCAwIDEgLjM3LS4zNyAxIDEgMCAwIDEgMS4zNy4zN3ptLS40My4yNWwtMTQuMjgtMjVhLjQ5LjQ5IDAgMCAwLS42OC0uMTguNDcuNDcgMCAwIDAtLjE5LjE4bC0xNC4yNyAyNWEuNDkuNDkgMCAwIDAgLjE4LjY4LjU0LjU0IDAgMCAwIC4yNS4wN2gyOC41NWEuNS41IDAgMCAwIC41LS41LjUuNSAwIDAgMC0uMDYtLjI2eiIgb3BhY2l0eT0iLjUiLz48cGF0aCBkPSJNMjMuMjQgMjMuNzJjLS45MS0uODYtNC4yMS0xLjEyLTUuNDgtMS41OWEuOTIuOTIgMCAwIDEtLjQtLjI2Yy0uMi0uMjguMDktLjQ2LjItLjU3bC42Ni0uNDZhMS4wOCAxLjA4IDAgMCAwLS41NS0uMTIgMS4zMiAxLjMyIDAgMCAwLTEgLjcxIDEuMDggMS4wOCAwIDAgMC0uMDYuMzNjMCAuMjEgMCAuNDUuNDguOCAxLjc2IDEgNC4zMSAxIDQuODEgMS44NGExLjYgMS42IDAgMCAxIC4xMyAxLjU5Yy0uMTMuMzgtLjQgMS4zMi0uNCAxLjMyaDEuODl2LS4wOGE3LjQxIDcuNDEgMCAwIDAgLjI5LTIuMTcgMS44NCAxLjg0IDAgMCAwLS41Ny0xLjM2bS01LjIyLjg5YTM1LjkzIDM1LjkzIDAgMCAxLTYuMzktMi4xOGMtLjQ1LS4yNC0uNTMtLjUxLS4zMi0uNzFzMS4yLS44NiAxLjItMS4xMWMwLS4wOS0uNTgtLjA4LS43LS4wOGE1Ljc3IDUuNzcgMCAwIDAtMS41NiAxLjE4Yy0uMTIuMjEtLjEyLjE5LS4xMi4zN2EuODguODggMCAwIDAgLjM0LjU1YzEgMSA2LjM0IDIuNzIgNi4zNCAyLjcybC4zMS4xMmExLjI0IDEuMjQgMCAwIDEgLjM3LjMyLjc0Ljc0IDAgMCAxIC4xMi4zMyAxLjU1IDEuNTUgMCAwIDEtLjA4LjIzIDcuNTEgNy41MSAwIDAgMS0uNjEuODJsLS4xNS4xNWgxLjg1YTMuMTQgMy4xNCAwIDAgMCAuMzMtLjQ4IDEuODkgMS44OSAwIDAgMCAuMjMtLjg5QTEuNDMgMS40MyAwIDAgMCAxOCAyNC42Mm0uNS02LjU2bC0xLjE4LS4yLjA2LS4zOSAxLjE5LjE5em0tMi4xNy45bC0yLS4zMy4wNy0uNCAyIC4zM3ptLTIuNTgtMS42NWwtMS4xOS0uMi4wNy0uNCAxLjE5LjJ6bS4xNC0yLjgzbDQuMjQuN2EyLjUgMi41IDAgMCAxIC4zOCAxLjcxaC0uMTZsLTIuNDItLjU0LTIuOC0uMzZhLjYxLjYxIDAgMCAwLS4xOSAwIDIuNTYgMi41NiAwIDAgMSAuOTUtMS41MXptNSAyLjczYTIuODYgMi44NiAwIDAgMC0uNTQtMi4zNXYtLjA1bC00LjUzLS43NWgtLjA2YTIuODggMi44OCAwIDAgMC0xLjI0IDIuMS43OS43OSAwIDAgMC0uMjkuNDlsLS4yNiAxLjU4LS4wNy40LS4wNi40M2EuNDEuNDEgMCAwIDAgLjI5LjQzLjQyLjQyIDAgMCAwIC41LS4zM2wuMDYtLjQgNS4xNS44Ni0uMDYuNDRhLjQwMS40MDEgMCAxIDAgLjc5LjE0bC4wNy0uNC4wNi0uNC4yNy0xLjU4YS44My44MyAwIDAgMC0uMTItLjYxeiIvPjwvc3ZnPg==",
-    # Landslide icons
-    "landslide-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGOUQwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xOCAxN2EyIDIgMCAxIDAgMCA0IDIgMiAwIDAgMCAwLTR6bS00LTNhMSAxIDAgMSAwIDAgMiAxIDEgMCAwIDAgMC0yem05IDE0YTMgMyAwIDEgMCAwLTYgMyAzIDAgMCAwIDAgNnptLTIuNjg3IDEuNDk2TDkuNTEgMTQuMzcxIDEuMjkzIDI4Ljc0OGEuNS41IDAgMCAwIC40MzQuNzQ4aDE4LjU4NnoiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjwvc3ZnPg==",
-    "landslide-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI2ZmZiIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xOCAxN2EyIDIgMCAxIDAgMCA0IDIgMiAwIDAgMCAwLTR6bS00LTNhMSAxIDAgMSAwIDAgMiAxIDEgMCAwIDAgMC0yem05IDE0YTMgMyAwIDEgMCAwLTYgMyAzIDAgMCAwIDAgNnoiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjxwYXRoIGZpbGw9IiNDNjAwMDAiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTIwLjMxMyAyOS40OTZMOS41MSAxNC4zNzEgMS4yOTMgMjguNzQ4YS41LjUgMCAwIDAgLjQzNC43NDhoMTguNTg2eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PC9zdmc+",
-    "landslide-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGRTYwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xOCAxN2EyIDIgMCAxIDAgMCA0IDIgMiAwIDAgMCAwLTR6bS00LTNhMSAxIDAgMSAwIDAgMiAxIDEgMCAwIDAgMC0yem05IDE0YTMgMyAwIDEgMCAwLTYgMyAzIDAgMCAwIDAgNnptLTIuNjg3IDEuNDk2TDkuNTEgMTQuMzcxIDEuMjkzIDI4Ljc0OGEuNS41IDAgMCAwIC40MzQuNzQ4aDE4LjU4NnoiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjwvc3ZnPg==",
-    # Lightning icons
-    "lightning-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGOUQwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xMiAyMGwzIDEtMSA2IDUtNy0zLTEgMS02LTUgN3oiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjwvc3ZnPg==",
-    "lightning-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0M2MDAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xMiAyMGwzIDEtMSA2IDUtNy0zLTEgMS02LTUgN3oiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjwvc3ZnPg==",
-    "lightning-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGRTYwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUwMS41MDEgMCAwIDEtLjQzNC43NDhIMS43MjNhLjUuNSAwIDAgMS0uNDM0LS43NDhMMTUuNTY2IDMuNzY3YS41LjUgMCAwIDEgLjg2OCAweiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMTIgMjBsMyAxLTEgNiA1LTctMy0xIDEtNi01IDd6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48L3N2Zz4=",
-    # Polarlow icons
-    "polarlow-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGOUQwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNiAyMi4yMzFhMS41OTQgMS41OTQgMCAxIDAgMC0zLjE4OCAxLjU5NCAxLjU5NCAwIDAgMCAwIDMuMTg4em0tNC4wNDQtLjE1YTUuMDU1IDUuMDU1IDAgMCAxIDEuNzU3LTQuOTIzIDUuMDQ1IDUuMDQ1IDAgMCAxIDQuMzk5LTEuMDJBNS4wNjcgNS4wNjcgMCAwIDEgMjIgMjAuOTMyYTUuMDkgNS4wOSAwIDAgMC0xLjk1Ni0xLjc0IDUuMDU2IDUuMDU2IDAgMCAxLTEuNzU3IDQuOTIzIDUuMDQ1IDUuMDQ1IDAgMCAxLTQuMzk5IDEuMDJBNS4wNjcgNS4wNjcgMCAwIDEgMTAgMjAuMzQzYTUuMDkgNS4wOSAwIDAgMCAxLjk1NiAxLjc0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PC9zdmc+",
-    "polarlow-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0M2MDAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNiAyMi4yMzFhMS41OTQgMS41OTQgMCAxIDAgMC0zLjE4OCAxLjU5NCAxLjU5NCAwIDAgMCAwIDMuMTg4em0tNC4wNDQtLjE1YTUuMDU1IDUuMDU1IDAgMCAxIDEuNzU3LTQuOTIzIDUuMDQ1IDUuMDQ1IDAgMCAxIDQuMzk5LTEuMDJBNS4wNjcgNS4wNjcgMCAwIDEgMjIgMjAuOTMyYTUuMDkgNS4wOSAwIDAgMC0xLjk1Ni0xLjc0IDUuMDU2IDUuMDU2IDAgMCAxLTEuNzU3IDQuOTIzIDUuMDQ1IDUuMDQ1IDAgMCAxLTQuMzk5IDEuMDJBNS4wNjcgNS4wNjcgMCAwIDEgMTAgMjAuMzQzYTUuMDkgNS4wOSAwIDAgMCAxLjk1NiAxLjc0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PC9zdmc+",
-    "polarlow-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGRTYwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNiAyMi4yMzFhMS41OTQgMS41OTQgMCAxIDAgMC0zLjE4OCAxLjU5NCAxLjU5NCAwIDAgMCAwIDMuMTg4em0tNC4wNDQtLjE1YTUuMDU1IDUuMDU1IDAgMCAxIDEuNzU3LTQuOTIzIDUuMDQ1IDUuMDQ1IDAgMCAxIDQuMzk5LTEuMDJBNS4wNjcgNS4wNjcgMCAwIDEgMjIgMjAuOTMyYTUuMDkgNS4wOSAwIDAgMC0xLjk1Ni0xLjc0IDUuMDU2IDUuMDU2IDAgMCAxLTEuNzU3IDQuOTIzIDUuMDQ1IDUuMDQ1IDAgMCAxLTQuMzk5IDEuMDJBNS4wNjcgNS4wNjcgMCAwIDEgMTAgMjAuMzQzYTUuMDkgNS4wOSAwIDAgMCAxLjk1NiAxLjc0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PC9zdmc+",
-    # Rain icons
-    "rain-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGOUQwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTYgMTVjLTMuMzE0IDAtNiAyLjk1NS02IDYuNmgxMmMwLTMuNjQ1LTIuNjg2LTYuNi02LTYuNnoiLz48cGF0aCBzdHJva2U9IiMwMDAiIGQ9Ik0xNiAyMXY0LjYxOWExIDEgMCAwIDAgLjMxLjcyNHYwYTEgMSAwIDAgMCAxLjM4IDBsLjMxLS4yOTUiLz48L3N2Zz4=",
-    "rain-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0M2MDAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBkPSJNMTYgMTVjLTMuMzE0IDAtNiAyLjk1NS02IDYuNmgxMmMwLTMuNjQ1LTIuNjg2LTYuNi02LTYuNnoiLz48cGF0aCBzdHJva2U9IiNmZmYiIGQ9Ik0xNiAyMXY0LjYxOWExIDEgMCAwIDAgLjMxLjcyNHYwYTEgMSAwIDAgMCAxLjM4IDBsLjMxLS4yOTUiLz48L3N2Zz4=",
-    "rain-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGRTYwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTYgMTVjLTMuMzE0IDAtNiAyLjk1NS02IDYuNmgxMmMwLTMuNjQ1LTIuNjg2LTYuNi02LTYuNnoiLz48cGF0aCBzdHJva2U9IiMwMDAiIGQ9Ik0xNiAyMXY0LjYxOWExIDEgMCAwIDAgLjMxLjcyNHYwYTEgMSAwIDAgMCAxLjM4IDBsLjMxLS4yOTUiLz48L3N2Zz4=",
-    # Rainflood icons
-    "rainflood-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGOUQwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xMS41ODMgMjMuMzJMMTAuNTg2IDI3aDEuMDM2bC45OTctMy42OGgtMS4wMzZ6bTIuNjY3IDBMMTMuMjUzIDI3aDEuMDM2bC45OTctMy42OEgxNC4yNXptMi42NjYgMEwxNS45MiAyN2gxLjAzN2wuOTk2LTMuNjhoLTEuMDM2em0yLjY2NyAwTDE4LjU4NiAyN2gxLjAzNmwuOTk3LTMuNjhoLTEuMDM2eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTIxLjEzNyAxNy40MjFsLS4yMDEtLjA5OC0uMDc4LS4yOThBMy44OTggMy44OTggMCAwIDAgMTcuMDY1IDE0YTMuODA1IDMuODA1IDAgMCAwLTMuMTg5IDEuNzQ1bC0uMTk3LjI5MWgtLjVhMS42MyAxLjYzIDAgMCAwLTEuMzk3Ljc1N2wtLjE2My4yNTZoLS4zMDNjLS42MjYuMDQtMS4yMTMuMzItMS42NC43OEEyLjYwNiAyLjYwNiAwIDAgMCA5IDE5LjQxdi4xNGEyLjU3MiAyLjU3MiAwIDAgMCAuNjUyIDEuNzggMi41MTQgMi41MTQgMCAwIDAgMS42MjkuODAzaDguOTQ4YTIuMzI3IDIuMzI3IDAgMCAwIDEuNjUyLS43MzRjLjE0My0uMTU4LjI3Mi0uMzMuMzg0LS41MTEuMDk2LS4xOTguMTc0LS40MDUuMjMzLS42MTdhMi41MiAyLjUyIDAgMCAwIC4wNy0uNTk0IDIuNDQ1IDIuNDQ1IDAgMCAwLTEuNDMyLTIuMjU3eiIvPjwvc3ZnPg==",
-    "rainflood-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0M2MDAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xMS41ODMgMjMuMzJMMTAuNTg2IDI3aDEuMDM2bC45OTctMy42OGgtMS4wMzZ6bTIuNjY3IDBMMTMuMjUzIDI3aDEuMDM2bC45OTctMy42OEgxNC4yNXptMi42NjYgMEwxNS45MiAyN2gxLjAzN2wuOTk2LTMuNjhoLTEuMDM2em0yLjY2NyAwTDE4LjU4NiAyN2gxLjAzNmwuOTk3LTMuNjhoLTEuMDM2eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI2ZmZiIgZD0iTTIxLjEzNyAxNy40MjFsLS4yMDEtLjA5OC0uMDc4LS4yOThBMy44OTggMy44OTggMCAwIDAgMTcuMDY1IDE0YTMuODA1IDMuODA1IDAgMCAwLTMuMTg5IDEuNzQ1bC0uMTk3LjI5MWgtLjVhMS42MyAxLjYzIDAgMCAwLTEuMzk3Ljc1N2wtLjE2My4yNTZoLS4zMDNjLS42MjYuMDQtMS4yMTMuMzItMS42NC43OEEyLjYwNiAyLjYwNiAwIDAgMCA5IDE5LjQxdi4xNGEyLjU3MiAyLjU3MiAwIDAgMCAuNjUyIDEuNzggMi41MTQgMi41MTQgMCAwIDAgMS42MjkuODAzaDguOTQ4YTIuMzI3IDIuMzI3IDAgMCAwIDEuNjUyLS43MzRjLjE0My0uMTU4LjI3Mi0uMzMuMzg0LS41MTEuMDk2LS4xOTguMTc0LS40MDUuMjMzLS42MTdhMi41MiAyLjUyIDAgMCAwIC4wNy0uNTk0IDIuNDQ1IDIuNDQ1IDAgMCAwLTEuNDMyLTIuMjU3eiIvPjwvc3ZnPg==",
-    "rainflood-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGRTYwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUwMS41MDEgMCAwIDEtLjQzNC43NDhIMS43MjNhLjUuNSAwIDAgMS0uNDM0LS43NDhMMTUuNTY2IDMuNzY3YS41LjUgMCAwIDEgLjg2OCAweiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMTEuNTgzIDIzLjMyTDEwLjU4NiAyN2gxLjAzNmwuOTk3LTMuNjhoLTEuMDM2em0yLjY2NyAwTDEzLjI1MyAyN2gxLjAzNmwuOTk3LTMuNjhIMTQuMjV6bTIuNjY2IDBMMTUuOTIgMjdoMS4wMzdsLjk5Ni0zLjY4aC0xLjAzNnptMi42NjcgMEwxOC41ODYgMjdoMS4wMzZsLjk5Ny0zLjY4aC0xLjAzNnoiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0yMS4xMzcgMTcuNDIxbC0uMjAxLS4wOTgtLjA3OC0uMjk4QTMuODk4IDMuODk4IDAgMCAwIDE3LjA2NSAxNGEzLjgwNSAzLjgwNSAwIDAgMC0zLjE4OSAxLjc0NWwtLjE5Ny4yOTFoLS41YTEuNjMgMS42MyAwIDAgMC0xLjM5Ny43NTdsLS4xNjMuMjU2aC0uMzAzYy0uNjI2LjA0LTEuMjEzLjMyLTEuNjQuNzhBMi42MDYgMi42MDYgMCAwIDAgOSAxOS40MXYuMTRhMi41NzIgMi41NzIgMCAwIDAgLjY1MiAxLjc4IDIuNTE0IDIuNTE0IDAgMCAwIDEuNjI5LjgwM2g4Ljk0OGEyLjMyNyAyLjMyNyAwIDAgMCAxLjY1Mi0uNzM0Yy4xNDMtLjE1OC4yNzItLjMzLjM4NC0uNTExLjA5Ni0uMTk4LjE3NC0uNDA1LjIzMy0uNjE3YTIuNTIgMi41MiAwIDAgMCAuMDctLjU5NCAyLjQ0NSAyLjQ0NSAwIDAgMC0xLjQzMi0yLjI1N3oiLz48L3N2Zz4=",
-    # Snow icons
-    "snow-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGOUQwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTUuNSAxNGgxdjdoLTF2LTd6Ii8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTE1LjcwMiAxNi4zMzVMMTguMDE1IDE1bC41Ljg2Ni0yLjMxMyAxLjMzNS0uNS0uODY2eiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0xNi4zNSAxNi4zNDdMMTQuMDE5IDE1bC0uNS44NjYgMi4zMzMgMS4zNDcuNS0uODY2ek0xNS41IDI4aDF2LTdoLTF2N3oiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTUuNzAyIDI1LjY2NUwxOC4wMTUgMjdsLjUtLjg2Ni0yLjMxMy0xLjMzNS0uNS44NjZ6Ii8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTE2LjM1IDI1LjY1M0wxNC4wMTkgMjdsLS41LS44NjYgMi4zMzMtMS4zNDcuNS44NjZ6bS02LjY1NC03LjcwNmwuNS0uODY2IDYuMDYyIDMuNS0uNS44NjYtNi4wNjItMy41eiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0xMS44MiAxOC45NHYtMi42N2gxdjIuNjdoLTF6Ii8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTEyLjE1NCAxOC4zODRMOS44MiAxOS43M2wuNS44NjYgMi4zMzMtMS4zNDctLjUtLjg2NnptOS42NjYgNi41NjNsLjUtLjg2Ni02LjA2Mi0zLjUtLjUuODY2IDYuMDYzIDMuNXoiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTkuODk5IDIzLjYwNWwyLjMxMy0xLjMzNi0uNS0uODY2LTIuMzEzIDEuMzM2LjUuODY2eiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0yMC4yMTQgMjMuMDM3djIuNjk0aC0xdi0yLjY5NGgxem0tMTAuMDAxIDEuOTFsLS41LS44NjYgNi4wNjItMy41LjUuODY2LTYuMDYyIDMuNXoiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTIuMTM0IDIzLjYwNWwtMi4zMTMtMS4zMzYuNS0uODY2IDIuMzEzIDEuMzM2LS41Ljg2NnoiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTEuODIgMjMuMDM3djIuNjk0aDF2LTIuNjk0aC0xem0xMC41MTctNS4wOWwtLjUtLjg2Ni02LjA2MiAzLjUuNS44NjYgNi4wNjItMy41eiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0yMC4yMTQgMTguOTR2LTIuNjdoLTF2Mi42N2gxeiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0xOS44OCAxOC4zODRsMi4zMzIgMS4zNDctLjUuODY2LTIuMzMzLTEuMzQ3LjUtLjg2NnoiLz48L3N2Zz4=",
-    "snow-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0M2MDAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBkPSJNMTUuNSAxNGgxdjdoLTF2LTd6Ii8+PHBhdGggZmlsbD0iI2ZmZiIgZD0iTTE1LjcwMiAxNi4zMzVMMTguMDE1IDE1bC41Ljg2Ni0yLjMxMyAxLjMzNS0uNS0uODY2eiIvPjxwYXRoIGZpbGw9IiNmZmYiIGQ9Ik0xNi4zNSAxNi4zNDdMMTQuMDE5IDE1bC0uNS44NjYgMi4zMzMgMS4zNDcuNS0uODY2ek0xNS41IDI4aDF2LTdoLTF2N3oiLz48cGF0aCBmaWxsPSIjZmZmIiBkPSJNMTUuNzAyIDI1LjY2NUwxOC4wMTUgMjdsLjUtLjg2Ni0yLjMxMy0xLjMzNS0uNS44NjZ6Ii8+PHBhdGggZmlsbD0iI2ZmZiIgZD0iTTE2LjM1IDI1LjY1M0wxNC4wMTkgMjdsLS41LS44NjYgMi4zMzMtMS4zNDcuNS44NjZ6bS02LjY1NC03LjcwNmwuNS0uODY2IDYuMDYyIDMuNS0uNS44NjYtNi4wNjItMy41eiIvPjxwYXRoIGZpbGw9IiNmZmYiIGQ9Ik0xMS44MiAxOC45NHYtMi42N2gxdjIuNjdoLTF6Ii8+PHBhdGggZmlsbD0iI2ZmZiIgZD0iTTEyLjE1NCAxOC4zODRMOS44MiAxOS43M2wuNS44NjYgMi4zMzMtMS4zNDctLjUtLjg2NnptOS42NjYgNi41NjNsLjUtLjg2Ni02LjA2Mi0zLjUtLjUuODY2IDYuMDYzIDMuNXoiLz48cGF0aCBmaWxsPSIjZmZmIiBkPSJNMTkuODk5IDIzLjYwNWwyLjMxMy0xLjMzNi0uNS0uODY2LTIuMzEzIDEuMzM2LjUuODY2eiIvPjxwYXRoIGZpbGw9IiNmZmYiIGQ9Ik0yMC4yMTQgMjMuMDM3djIuNjk0aC0xdi0yLjY5NGgxem0tMTAuMDAxIDEuOTFsLS41LS44NjYgNi4wNjItMy41LjUuODY2LTYuMDYyIDMuNXoiLz48cGF0aCBmaWxsPSIjZmZmIiBkPSJNMTIuMTM0IDIzLjYwNWwtMi4zMTMtMS4zMzYuNS0uODY2IDIuMzEzIDEuMzM2LS41Ljg2NnoiLz48cGF0aCBmaWxsPSIjZmZmIiBkPSJNMTEuODIgMjMuMDM3djIuNjk0aDF2LTIuNjk0aC0xem0xMC41MTctNS4wOWwtLjUtLjg2Ni02LjA2MiAzLjUuNS44NjYgNi4wNjItMy41eiIvPjxwYXRoIGZpbGw9IiNmZmYiIGQ9Ik0yMC4yMTQgMTguOTR2LTIuNjdoLTF2Mi42N2gxeiIvPjxwYXRoIGZpbGw9IiNmZmYiIGQ9Ik0xOS44OCAxOC4zODRsMi4zMzIgMS4zNDctLjUuODY2LTIuMzMzLTEuMzQ3LjUtLjg2NnoiLz48L3N2Zz4=",
-    "snow-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGRTYwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTUuNSAxNGgxdjdoLTF2LTd6Ii8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTE1LjcwMiAxNi4zMzVMMTguMDE1IDE1bC41Ljg2Ni0yLjMxMyAxLjMzNS0uNS0uODY2eiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0xNi4zNSAxNi4zNDdMMTQuMDE5IDE1bC0uNS44NjYgMi4zMzMgMS4zNDcuNS0uODY2ek0xNS41IDI4aDF2LTdoLTF2N3oiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTUuNzAyIDI1LjY2NUwxOC4wMTUgMjdsLjUtLjg2Ni0yLjMxMy0xLjMzNS0uNS44NjZ6Ii8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTE2LjM1IDI1LjY1M0wxNC4wMTkgMjdsLS41LS44NjYgMi4zMzMtMS4zNDcuNS44NjZ6bS02LjY1NC03LjcwNmwuNS0uODY2IDYuMDYyIDMuNS0uNS44NjYtNi4wNjItMy41eiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0xMS44MiAxOC45NHYtMi42N2gxdjIuNjdoLTF6Ii8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTEyLjE1NCAxOC4zODRMOS44MiAxOS43M2wuNS44NjYgMi4zMzMtMS4zNDctLjUtLjg2NnptOS42NjYgNi41NjNsLjUtLjg2Ni02LjA2Mi0zLjUtLjUuODY2IDYuMDYzIDMuNXoiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTkuODk5IDIzLjYwNWwyLjMxMy0xLjMzNi0uNS0uODY2LTIuMzEzIDEuMzM2LjUuODY2eiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0yMC4yMTQgMjMuMDM3djIuNjk0aC0xdi0yLjY5NGgxem0tMTAuMDAxIDEuOTFsLS41LS44NjYgNi4wNjItMy41LjUuODY2LTYuMDYyIDMuNXoiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTIuMTM0IDIzLjYwNWwtMi4zMTMtMS4zMzYuNS0uODY2IDIuMzEzIDEuMzM2LS41Ljg2NnoiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTEuODIgMjMuMDM3djIuNjk0aDF2LTIuNjk0aC0xem0xMC41MTctNS4wOWwtLjUtLjg2Ni02LjA2MiAzLjUuNS44NjYgNi4wNjItMy41eiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0yMC4yMTQgMTguOTR2LTIuNjdoLTF2Mi42N2gxeiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0xOS44OCAxOC4zODRsMi4zMzIgMS4zNDctLjUuODY2LTIuMzMzLTEuMzQ3LjUtLjg2NnoiLz48L3N2Zz4=",
-    # Blowing snow icons (aliases to snow icons)
-    "blowingsnow-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGOUQwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTUuNSAxNGgxdjdoLTF2LTd6Ii8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTE1LjcwMiAxNi4zMzVMMTguMDE1IDE1bC41Ljg2Ni0yLjMxMyAxLjMzNS0uNS0uODY2eiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0xNi4zNSAxNi4zNDdMMTQuMDE5IDE1bC0uNS44NjYgMi4zMzMgMS4zNDcuNS0uODY2ek0xNS41IDI4aDF2LTdoLTF2N3oiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTUuNzAyIDI1LjY2NUwxOC4wMTUgMjdsLjUtLjg2Ni0yLjMxMy0xLjMzNS0uNS44NjZ6Ii8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTE2LjM1IDI1LjY1M0wxNC4wMTkgMjdsLS41LS44NjYgMi4zMzMtMS4zNDcuNS44NjZ6bS02LjY1NC03LjcwNmwuNS0uODY2IDYuMDYyIDMuNS0uNS44NjYtNi4wNjItMy41eiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0xMS44MiAxOC45NHYtMi42N2gxdjIuNjdoLTF6Ii8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTEyLjE1NCAxOC4zODRMOS44MiAxOS43M2wuNS44NjYgMi4zMzMtMS4zNDctLjUtLjg2NnptOS42NjYgNi41NjNsLjUtLjg2Ni02LjA2Mi0zLjUtLjUuODY2IDYuMDYzIDMuNXoiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTkuODk5IDIzLjYwNWwyLjMxMy0xLjMzNi0uNS0uODY2LTIuMzEzIDEuMzM2LjUuODY2eiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0yMC4yMTQgMjMuMDM3djIuNjk0aC0xdi0yLjY5NGgxem0tMTAuMDAxIDEuOTFsLS41LS44NjYgNi4wNjItMy41LjUuODY2LTYuMDYyIDMuNXoiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTIuMTM0IDIzLjYwNWwtMi4zMTMtMS4zMzYuNS0uODY2IDIuMzEzIDEuMzM2LS41Ljg2NnoiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTEuODIgMjMuMDM3djIuNjk0aDF2LTIuNjk0aC0xem0xMC41MTctNS4wOWwtLjUtLjg2Ni02LjA2MiAzLjUuNS44NjYgNi4wNjItMy41eiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0yMC4yMTQgMTguOTR2LTIuNjdoLTF2Mi42N2gxeiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0xOS44OCAxOC4zODRsMi4zMzIgMS4zNDctLjUuODY2LTIuMzMzLTEuMzQ3LjUtLjg2NnoiLz48L3N2Zz4=",
-    "blowingsnow-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0M2MDAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBkPSJNMTUuNSAxNGgxdjdoLTF2LTd6Ii8+PHBhdGggZmlsbD0iI2ZmZiIgZD0iTTE1LjcwMiAxNi4zMzVMMTguMDE1IDE1bC41Ljg2Ni0yLjMxMyAxLjMzNS0uNS0uODY2eiIvPjxwYXRoIGZpbGw9IiNmZmYiIGQ9Ik0xNi4zNSAxNi4zNDdMMTQuMDE5IDE1bC0uNS44NjYgMi4zMzMgMS4zNDcuNS0uODY2ek0xNS41IDI4aDF2LTdoLTF2N3oiLz48cGF0aCBmaWxsPSIjZmZmIiBkPSJNMTUuNzAyIDI1LjY2NUwxOC4wMTUgMjdsLjUtLjg2Ni0yLjMxMy0xLjMzNS0uNS44NjZ6Ii8+PHBhdGggZmlsbD0iI2ZmZiIgZD0iTTE2LjM1IDI1LjY1M0wxNC4wMTkgMjdsLS41LS44NjYgMi4zMzMtMS4zNDcuNS44NjZ6bS02LjY1NC03LjcwNmwuNS0uODY2IDYuMDYyIDMuNS0uNS44NjYtNi4wNjItMy41eiIvPjxwYXRoIGZpbGw9IiNmZmYiIGQ9Ik0xMS44MiAxOC45NHYtMi42N2gxdjIuNjdoLTF6Ii8+PHBhdGggZmlsbD0iI2ZmZiIgZD0iTTEyLjE1NCAxOC4zODRMOS44MiAxOS43M2wuNS44NjYgMi4zMzMtMS4zNDctLjUtLjg2NnptOS42NjYgNi41NjNsLjUtLjg2Ni02LjA2Mi0zLjUtLjUuODY2IDYuMDYzIDMuNXoiLz48cGF0aCBmaWxsPSIjZmZmIiBkPSJNMTkuODk5IDIzLjYwNWwyLjMxMy0xLjMzNi0uNS0uODY2LTIuMzEzIDEuMzM2LjUuODY2eiIvPjxwYXRoIGZpbGw9IiNmZmYiIGQ9Ik0yMC4yMTQgMjMuMDM3djIuNjk0aC0xdi0yLjY5NGgxem0tMTAuMDAxIDEuOTFsLS41LS44NjYgNi4wNjItMy41LjUuODY2LTYuMDYyIDMuNXoiLz48cGF0aCBmaWxsPSIjZmZmIiBkPSJNMTIuMTM0IDIzLjYwNWwtMi4zMTMtMS4zMzYuNS0uODY2IDIuMzEzIDEuMzM2LS41Ljg2NnoiLz48cGF0aCBmaWxsPSIjZmZmIiBkPSJNMTEuODIgMjMuMDM3djIuNjk0aDF2LTIuNjk0aC0xem0xMC41MTctNS4wOWwtLjUtLjg2Ni02LjA2MiAzLjUuNS44NjYgNi4wNjItMy41eiIvPjxwYXRoIGZpbGw9IiNmZmYiIGQ9Ik0yMC4yMTQgMTguOTR2LTIuNjdoLTF2Mi42N2gxeiIvPjxwYXRoIGZpbGw9IiNmZmYiIGQ9Ik0xOS44OCAxOC4zODRsMi4zMzIgMS4zNDctLjUuODY2LTIuMzMzLTEuMzQ3LjUtLjg2NnoiLz48L3N2Zz4=",
-    "blowingsnow-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGRTYwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUwMS41MDEgMCAwIDEtLjQzNC43NDhIMS43MjNhLjUuNSAwIDAgMS0uNDM0LS43NDhMMTUuNTY2IDMuNzY3YS41LjUgMCAwIDEgLjg2OCAweiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTE1LjUgMTRoMXY3aC0xdi03eiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0xNS43MDIgMTYuMzM1TDE4LjAxNSAxNWwuNS44NjYtMi4zMTMgMS4zMzUtLjUtLjg2NnoiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTYuMzUgMTYuMzQ3TDE0LjAxOSAxNWwtLjUuODY2IDIuMzMzIDEuMzQ3LjUtLjg2NnpNMTUuNSAyOGgxdi03aC0xdjd6Ii8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTE1LjcwMiAyNS42NjVMMTguMDE1IDI3bC41LS44NjYtMi4zMTMtMS4zMzUtLjUuODY2eiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0xNi4zNSAyNS42NTNMMTQuMDE5IDI3bC0uNS0uODY2IDIuMzMzLTEuMzQ3LjUuODY2em0tNi42NTQtNy43MDZsLjUtLjg2NiA2LjA2MiAzLjUtLjUuODY2LTYuMDYyLTMuNXoiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTEuODIgMTguOTR2LTIuNjdoMXYyLjY3aC0xeiIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik0xMi4xNTQgMTguMzg0TDkuODIgMTkuNzNsLjUuODY2IDIuMzMzLTEuMzQ3LS41LS44NjZ6bTkuNjY2IDYuNTYzbC41LS44NjYtNi4wNjItMy41LS41Ljg2NiA2LjA2MyAzLjV6Ii8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTE5Ljg5OSAyMy42MDVsMi4zMTMtMS4zMzYtLjUtLjg2Ni0yLjMxMyAxLjMzNi41Ljg2NnoiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMjAuMjE0IDIzLjAzN3YyLjY5NGgtMXYtMi42OTRoMXptLTEwLjAwMSAxLjkxbC0uNS0uODY2IDYuMDYyLTMuNS41Ljg2Ni02LjA2MiAzLjV6Ii8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTEyLjEzNCAyMy42MDVsLTIuMzEzLTEuMzM2LjUtLjg2NiAyLjMxMyAxLjMzNi0uNS44NjZ6Ii8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTExLjgyIDIzLjAzN3YyLjY5NGgxdi0yLjY5NGgtMXptMTAuNTE3LTUuMDlsLS41LS44NjYtNi4wNjIgMy41LjUuODY2IDYuMDYyLTMuNXoiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMjAuMjE0IDE4Ljk0di0yLjY3aC0xdjIuNjdoMXoiLz48cGF0aCBmaWxsPSIjMDAwIiBkPSJNMTkuODggMTguMzg0bDIuMzMyIDEuMzQ3LS41Ljg2Ni0yLjMzMy0xLjM0Ny41LS44NjZ6Ii8+PC9zdmc+",
-    # Stormsurge icons
-    "stormsurge-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGOUQwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xMC41MDIgMjIuNTY2Yy40NjYtLjI2Ni45OTQtLjU2NiAxLjk5OS0uNTY2IDEuMDA0IDAgMS41MzMuMyAxLjk5OC41NjZsLjAwNi4wMDNjLjQwOC4yMzMuNzU0LjQzMSAxLjQ5Ny40MzEuNzQyIDAgMS4wODgtLjE5OCAxLjQ5NS0uNDNsLjAwNi0uMDA0Yy40NjUtLjI2Ni45OTQtLjU2NiAxLjk5Ny0uNTY2IDEuMDA1IDAgMS41MzMuMyAxLjk5OC41NjZsLjAwNi4wMDNjLjQwNy4yMzMuNzU0LjQzMSAxLjQ5Ni40MzF2MWMtMS4wMDQgMC0xLjUzMy0uMy0xLjk5OC0uNTY2bC0uMDA2LS4wMDNjLS40MDctLjIzMy0uNzUzLS40MzEtMS40OTUtLjQzMS0uNzQyIDAtMS4wODkuMTk4LTEuNDk2LjQzbC0uMDA2LjAwNGMtLjQ2NS4yNjYtLjk5My41NjYtMS45OTcuNTY2cy0xLjUzMy0uMy0xLjk5OS0uNTY2bC0uMDA1LS4wMDNDMTMuNTkgMjMuMTk4IDEzLjI0MyAyMyAxMi41IDIzcy0xLjA5LjE5OC0xLjQ5Ny40M2wtLjAwNS4wMDRDMTAuNTMzIDIzLjcgMTAuMDA0IDI0IDkgMjR2LTFjLjc0MyAwIDEuMDktLjE5OCAxLjQ5Ny0uNDNsLjAwNS0uMDA0em0wIDJjLjQ2Ni0uMjY2Ljk5NC0uNTY2IDEuOTk5LS41NjYgMS4wMDQgMCAxLjUzMy4zIDEuOTk4LjU2NmwuMDA2LjAwM2MuNDA4LjIzMy43NTQuNDMxIDEuNDk3LjQzMS43NDIgMCAxLjA4OC0uMTk4IDEuNDk1LS40M2wuMDA2LS4wMDRjLjQ2NS0uMjY2Ljk5NC0uNTY2IDEuOTk3LS41NjYgMS4wMDUgMCAxLjUzMy4zIDEuOTk4LjU2NmwuMDA2LjAwM2MuNDA3LjIzMy43NTQuNDMxIDEuNDk2LjQzMXYxYy0xLjAwNCAwLTEuNTMzLS4zLTEuOTk4LS41NjZsLS4wMDYtLjAwM2MtLjQwNy0uMjMzLS43NTMtLjQzMS0xLjQ5NS0uNDMxLS43NDIgMC0xLjA4OS4xOTgtMS40OTYuNDNsLS4wMDYuMDA0Yy0uNDY1LjI2Ni0uOTkzLjU2Ni0xLjk5Ny41NjZzLTEuNTMzLS4zLTEuOTk5LS41NjZsLS4wMDUtLjAwM0MxMy41OSAyNS4xOTggMTMuMjQzIDI1IDEyLjUgMjVzLTEuMDkuMTk4LTEuNDk3LjQzbC0uMDA1LjAwNEMxMC41MzMgMjUuNyAxMC4wMDQgMjYgOSAyNnYtMWMuNzQzIDAgMS4wOS0uMTk4IDEuNDk3LS40M2wuMDA1LS4wMDR6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBzdHJva2U9IiMwMDAiIGQ9Ik0xNiAyMHYtNiIvPjxwYXRoIHN0cm9rZT0iIzAwMCIgc3Ryb2tlLWxpbmVjYXA9InNxdWFyZSIgZD0iTTE2IDE0bDIuNSAyLjVNMTYgMTRsLTIuNSAyLjUiLz48L3N2Zz4=",
-    "stormsurge-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0M2MDAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xMC41MDIgMjIuNTY2Yy40NjYtLjI2Ni45OTQtLjU2NiAxLjk5OS0uNTY2IDEuMDA0IDAgMS41MzMuMyAxLjk5OC41NjZsLjAwNi4wMDNjLjQwOC4yMzMuNzU0LjQzMSAxLjQ5Ny40MzEuNzQyIDAgMS4wODgtLjE5OCAxLjQ5NS0uNDNsLjAwNi0uMDA0Yy40NjUtLjI2Ni45OTQtLjU2NiAxLjk5Ny0uNTY2IDEuMDA1IDAgMS41MzMuMyAxLjk5OC41NjZsLjAwNi4wMDNjLjQwNy4yMzMuNzU0LjQzMSAxLjQ5Ni40MzF2MWMtMS4wMDQgMC0xLjUzMy0uMy0xLjk5OC0uNTY2bC0uMDA2LS4wMDNjLS40MDctLjIzMy0uNzUzLS40MzEtMS40OTUtLjQzMS0uNzQyIDAtMS4wODkuMTk4LTEuNDk2LjQzbC0uMDA2LjAwNGMtLjQ2NS4yNjYtLjk5My41NjYtMS45OTcuNTY2cy0xLjUzMy0uMy0xLjk5OS0uNTY2bC0uMDA1LS4wMDNDMTMuNTkgMjMuMTk4IDEzLjI0MyAyMyAxMi41IDIzcy0xLjA5LjE5OC0xLjQ5Ny40M2wtLjAwNS4wMDRDMTAuNTMzIDIzLjcgMTAuMDA0IDI0IDkgMjR2LTFjLjc0MyAwIDEuMDktLjE5OCAxLjQ5Ny0uNDNsLjAwNS0uMDA0em0wIDJjLjQ2Ni0uMjY2Ljk5NC0uNTY2IDEuOTk5LS41NjYgMS4wMDQgMCAxLjUzMy4zIDEuOTk4LjU2NmwuMDA2LjAwM2MuNDA4LjIzMy43NTQuNDMxIDEuNDk3LjQzMS43NDIgMCAxLjA4OC0uMTk4IDEuNDk1LS40M2wuMDA2LS4wMDRjLjQ2NS0uMjY2Ljk5NC0uNTY2IDEuOTk3LS41NjYgMS4wMDUgMCAxLjUzMy4zIDEuOTk4LjU2NmwuMDA2LjAwM2MuNDA3LjIzMy43NTQuNDMxIDEuNDk2LjQzMXYxYy0xLjAwNCAwLTEuNTMzLS4zLTEuOTk4LS41NjZsLS4wMDYtLjAwM2MtLjQwNy0uMjMzLS43NTMtLjQzMS0xLjQ5NS0uNDMxLS43NDIgMC0xLjA4OS4xOTgtMS40OTYuNDNsLS4wMDYuMDA0Yy0uNDY1LjI2Ni0uOTkzLjU2Ni0xLjk5Ny41NjZzLTEuNTMzLS4zLTEuOTk5LS41NjZsLS4wMDUtLjAwM0MxMy41OSAyNS4xOTggMTMuMjQzIDI1IDEyLjUgMjVzLTEuMDkuMTk4LTEuNDk3LjQzbC0uMDA1LjAwNEMxMC41MzMgMjUuNyAxMC4wMDQgMjYgOSAyNnYtMWMuNzQzIDAgMS4wOS0uMTk4IDEuNDk3LS40M2wuMDA1LS4wMDR6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBzdHJva2U9IiNmZmYiIGQ9Ik0xNiAyMHYtNiIvPjxwYXRoIHN0cm9rZT0iI2ZmZiIgc3Ryb2tlLWxpbmVjYXA9InNxdWFyZSIgZD0iTTE2IDE0bDIuNSAyLjVNMTYgMTRsLTIuNSAyLjUiLz48L3N2Zz4=",
-    "stormsurge-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGRTYwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUwMS41MDEgMCAwIDEtLjQzNC43NDhIMS43MjNhLjUuNSAwIDAgMS0uNDM0LS43NDhMMTUuNTY2IDMuNzY3YS41LjUgMCAwIDEgLjg2OCAweiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMTAuNTAyIDIyLjU2NmMuNDY2LS4yNjYuOTk0LS41NjYgMS45OTktLjU2NiAxLjAwNCAwIDEuNTMzLjMgMS45OTguNTY2bC4wMDYuMDAzYy40MDguMjMzLjc1NC40MzEgMS40OTcuNDMxLjc0MiAwIDEuMDg4LS4xOTggMS40OTUtLjQzbC4wMDYtLjAwNGMuNDY1LS4yNjYuOTk0LS41NjYgMS45OTctLjU2NiAxLjAwNSAwIDEuNTMzLjMgMS45OTguNTY2bC4wMDYuMDAzYy40MDcuMjMzLjc1NC40MzEgMS40OTYuNDMxdjFjLTEuMDA0IDAtMS41MzMtLjMtMS45OTgtLjU2NmwtLjAwNi0uMDAzYy0uNDA3LS4yMzMtLjc1My0uNDMxLTEuNDk1LS40MzEtLjc0MiAwLTEuMDg5LjE5OC0xLjQ5Ni40M2wtLjAwNi4wMDRjLS40NjUuMjY2LS45OTMuNTY2LTEuOTk3LjU2NnMtMS41MzMtLjMtMS45OTktLjU2NmwtLjAwNS0uMDAzQzEzLjU5IDIzLjE5OCAxMy4yNDMgMjMgMTIuNSAyM3MtMS4wOS4xOTgtMS40OTcuNDNsLS4wMDUuMDA0QzEwLjUzMyAyMy43IDEwLjAwNCAyNCA5IDI0di0xYy43NDMgMCAxLjA5LS4xOTggMS40OTctLjQzbC4wMDUtLjAwNHptMCAyYy40NjYtLjI2Ni45OTQtLjU2NiAxLjk5OS0uNTY2IDEuMDA0IDAgMS41MzMuMyAxLjk5OC41NjZsLjAwNi4wMDNjLjQwOC4yMzMuNzU0LjQzMSAxLjQ5Ny40MzEuNzQyIDAgMS4wODgtLjE5OCAxLjQ5NS0uNDNsLjAwNi0uMDA0Yy40NjUtLjI2Ni45OTQtLjU2NiAxLjk5Ny0uNTY2IDEuMDA1IDAgMS41MzMuMyAxLjk5OC41NjZsLjAwNi4wMDNjLjQwNy4yMzMuNzU0LjQzMSAxLjQ5Ni40MzF2MWMtMS4wMDQgMC0xLjUzMy0uMy0xLjk5OC0uNTY2bC0uMDA2LS4wMDNjLS40MDctLjIzMy0uNzUzLS40MzEtMS40OTUtLjQzMS0uNzQyIDAtMS4wODkuMTk4LTEuNDk2LjQzbC0uMDA2LjAwNGMtLjQ2NS4yNjYtLjk5My41NjYtMS45OTcuNTY2cy0xLjUzMy0uMy0xLjk5OS0uNTY2bC0uMDA1LS4wMDNDMTMuNTkgMjUuMTk4IDEzLjI0MyAyNSAxMi41IDI1cy0xLjA5LjE5OC0xLjQ5Ny40M2wtLjAwNS4wMDRDMTAuNTMzIDI1LjcgMTAuMDA0IDI2IDkgMjZ2LTFjLjc0MyAwIDEuMDktLjE5OCAxLjQ5Ny0uNDNsLjAwNS0uMDA0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggc3Ryb2tlPSIjMDAwIiBkPSJNMTYgMjB2LTYiLz48cGF0aCBzdHJva2U9IiMwMDAiIHN0cm9rZS1saW5lY2FwPSJzcXVhcmUiIGQ9Ik0xNiAxNGwyLjUgMi41TTE2IDE0bC0yLjUgMi41Ii8+PC9zdmc+",
-    # Wind icons
-    "wind-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGOUQwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNiAxNmExIDEgMCAwIDAtMSAxaC0xYTIgMiAwIDEgMSAyIDJ2LTFhMSAxIDAgMSAwIDAtMnptMiAxMGExIDEgMCAwIDEtMS0xaC0xYTIgMiAwIDEgMCAyLTJ2MWExIDEgMCAxIDEgMCAyem0yLjUtNy41YTEgMSAwIDAgMC0xIDFoLTFhMiAyIDAgMSAxIDIgMnYtMWExIDEgMCAxIDAgMC0yeiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTkgMThoN3YxSDl6bTAgMi41aDExLjV2MUg5ek05IDIzaDl2MUg5eiIvPjwvc3ZnPg==",
-    "wind-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0M2MDAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNiAxNmExIDEgMCAwIDAtMSAxaC0xYTIgMiAwIDEgMSAyIDJ2LTFhMSAxIDAgMSAwIDAtMnptMiAxMGExIDEgMCAwIDEtMS0xaC0xYTIgMiAwIDEgMCAyLTJ2MWExIDEgMCAxIDEgMCAyem0yLjUtNy41YTEgMSAwIDAgMC0xIDFoLTFhMiAyIDAgMSAxIDIgMnYtMWExIDEgMCAxIDAgMC0yeiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI2ZmZiIgZD0iTTkgMThoN3YxSDl6bTAgMi41aDExLjV2MUg5ek05IDIzaDl2MUg5eiIvPjwvc3ZnPg==",
-    "wind-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGRTYwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUwMS41MDEgMCAwIDEtLjQzNC43NDhIMS43MjNhLjUuNSAwIDAgMS0uNDM0LS43NDhMMTUuNTY2IDMuNzY3YS41LjUgMCAwIDEgLjg2OCAweiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMTYgMTZhMSAxIDAgMCAwLTEgMWgtMWEyIDIgMCAxIDEgMiAydi0xYTEgMSAwIDEgMCAwLTJ6bTIgMTBhMSAxIDAgMCAxLTEtMWgtMWEyIDIgMCAxIDAgMi0ydjFhMSAxIDAgMSAxIDAgMnptMi41LTcuNWExIDEgMCAwIDAtMSAxaC0xYTIgMiAwIDEgMSAyIDJ2LTFhMSAxIDAgMSAwIDAtMnoiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik05IDE4aDd2MUg5em0wIDIuNWgxMS41djFIOXpNOSAyM2g5djFIOXoiLz48L3N2Zz4=",
-    # Gale icons (aliases to wind icons)
-    "gale-orange": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGOUQwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwNjMxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjMDAwIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNiAxNmExIDEgMCAwIDAtMSAxaC0xYTIgMiAwIDEgMSAyIDJ2LTFhMSAxIDAgMSAwIDAtMnptMiAxMGExIDEgMCAwIDEtMS0xaC0xYTIgMiAwIDEgMCAyLTJ2MWExIDEgMCAxIDEgMCAyem0yLjUtNy41YTEgMSAwIDAgMC0xIDFoLTFhMiAyIDAgMSAxIDIgMnYtMWExIDEgMCAxIDAgMC0yeiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzAwMCIgZD0iTTkgMThoN3YxSDl6bTAgMi41aDExLjV2MUg5ek05IDIzaDl2MUg5eiIvPjwvc3ZnPg==",
-    "gale-red": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0M2MDAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzczMTQxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUuNSAwIDAgMS0uNDM0Ljc0OEgxLjcyM2EuNS41IDAgMCAxLS40MzQtLjc0OEwxNS41NjYgMy43NjdhLjUuNSAwIDAgMSAuODY4IDB6IiBjbGlwLXJ1bGU9ImV2ZW5vZGQiLz48cGF0aCBmaWxsPSIjZmZmIiBmaWxsLXJ1bGU9ImV2ZW5vZGQiIGQ9Ik0xNiAxNmExIDEgMCAwIDAtMSAxaC0xYTIgMiAwIDEgMSAyIDJ2LTFhMSAxIDAgMSAwIDAtMnptMiAxMGExIDEgMCAwIDEtMS0xaC0xYTIgMiAwIDEgMCAyLTJ2MWExIDEgMCAxIDEgMCAyem0yLjUtNy41YTEgMSAwIDAgMC0xIDFoLTFhMiAyIDAgMSAxIDIgMnYtMWExIDEgMCAxIDAgMC0yeiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI2ZmZiIgZD0iTTkgMThoN3YxSDl6bTAgMi41aDExLjV2MUg5ek05IDIzaDl2MUg5eiIvPjwvc3ZnPg==",
-    "gale-yellow": "data:image/svg+xml;base64,PHN2ZyB2aWV3Qm94PSItOCAtOCA0OCA0OCIgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB3aWR0aD0iNDgiIGhlaWdodD0iNDgiIGZpbGw9Im5vbmUiPjxwYXRoIGZpbGw9IiNmZmYiIGZpbGwtcnVsZT0iZXZlbm9kZCIgZD0iTTMxLjU1NiAyOC4yNGExLjUgMS41IDAgMCAxLTEuMzAyIDIuMjQ1SDEuN0ExLjUgMS41IDAgMCAxIC4zOTggMjguMjRMMTQuNjc1IDMuMjU2YTEuNSAxLjUgMCAwIDEgMi42MDQgMGwxNC4yNzcgMjQuOTg1eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iI0ZGRTYwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzAuMjc3IDMwYTEgMSAwIDAgMCAuODY4LTEuNDk2TDE2Ljg2OCAzLjUxOWExIDEgMCAwIDAtMS43MzYgMEwuODU1IDI4LjUwNEExIDEgMCAwIDAgMS43MjMgMzBoMjguNTU0eiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzkwODcxNSIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMzEuMjc3IDI5YTEgMSAwIDAgMC0uMTMyLS40OTZMMTYuODY4IDMuNTE5YTEgMSAwIDAgMC0xLjczNiAwTC44NTUgMjguNTA0QTEgMSAwIDAgMCAxLjcyMyAzMGgyOC41NTRhMSAxIDAgMCAwIDEtMXpNMTYuNDM0IDMuNzY3bDE0LjI3NyAyNC45ODVhLjUwMS41MDEgMCAwIDEtLjQzNC43NDhIMS43MjNhLjUuNSAwIDAgMS0uNDM0LS43NDhMMTUuNTY2IDMuNzY3YS41LjUgMCAwIDEgLjg2OCAweiIgY2xpcC1ydWxlPSJldmVub2RkIi8+PHBhdGggZmlsbD0iIzAwMCIgZmlsbC1ydWxlPSJldmVub2RkIiBkPSJNMTYgMTZhMSAxIDAgMCAwLTEgMWgtMWEyIDIgMCAxIDEgMiAydi0xYTEgMSAwIDEgMCAwLTJ6bTIgMTBhMSAxIDAgMCAxLTEtMWgtMWEyIDIgMCAxIDAgMi0ydjFhMSAxIDAgMSAxIDAgMnptMi41LTcuNWExIDEgMCAwIDAtMSAxaC0xYTIgMiAwIDEgMSAyIDJ2LTFhMSAxIDAgMSAwIDAtMnoiIGNsaXAtcnVsZT0iZXZlbm9kZCIvPjxwYXRoIGZpbGw9IiMwMDAiIGQ9Ik05IDE4aDd2MUg5em0wIDIuNWgxMS41djFIOXpNOSAyM2g5djFIOXoiLz48L3N2Zz4=",
+ICON_TYPES = (
+    "avalanches", "blowingsnow", "drivingconditions", "flood", "forestfire", "gale", "generic",
+    "ice", "icing", "landslide", "lightning", "polarlow", "rain", "rainflood", "snow",
+    "stormsurge", "wind",
+)
+ICON_COLORS = ("yellow", "orange", "red")
+# Icons with the same artwork as another icon (stored once)
+ICON_ALIASES = {
+    "icing-yellow": "ice-yellow",
+    "icing-orange": "ice-orange",
+    "icing-red": "ice-red",
+    "gale-yellow": "wind-yellow",
+    "gale-orange": "wind-orange",
+    "gale-red": "wind-red",
+    "blowingsnow-orange": "snow-orange",
+    "blowingsnow-red": "snow-red",
 }
+ICON_CACHE_MAX_ENTRIES = 16  # Decoded SVGs kept for the icon view
 
 # Norwegian counties with IDs (based on NVE API and current administrative divisions)
 # Source: https://snl.no/fylkesnummer
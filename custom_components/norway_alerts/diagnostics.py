@@ -0,0 +1,101 @@
+"""Diagnostics support for Norway Alerts."""
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .hub import async_get_coordinator_hub
+from .scheduler import async_get_poll_scheduler
+from .formatting import RENDERER
+from .sensor import CAP_CACHE
+from .const import (
+    DOMAIN,
+    CONF_LATITUDE,
+    CONF_LONGITUDE,
+    DATA_SESSION_PROVIDER,
+)
+
+# Home location is private
+TO_REDACT = {CONF_LATITUDE, CONF_LONGITUDE}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    domain_data = hass.data[DOMAIN]
+    coordinator = domain_data[entry.entry_id]
+    session_provider = domain_data.get(DATA_SESSION_PROVIDER)
+    
+    diagnostics = {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "coordinator": {
+            "warning_type": coordinator.warning_type,
+            "last_update_success": coordinator.last_update_success,
+            "alert_count": len(coordinator.data or []),
+            # Data version and what the last change touched
+            "generation": coordinator.generation,
+            "last_changeset": {kind: len(keys) for kind, keys in coordinator.changeset.items()},
+            # State writes by this coordinator's sensors vs writes skipped because nothing changed
+            "state_writes": dict(coordinator.write_stats),
+            "stale": coordinator.stale,
+            "last_success": coordinator.last_success.isoformat() if coordinator.last_success else None,
+            # Entries polling the same upstream query share this coordinator
+            "shared_by_entries": len(async_get_coordinator_hub(hass).shared_with(entry.entry_id)),
+        },
+    }
+    
+    # Poll schedule of all coordinators: each polls on its own slot in the cycle
+    scheduler = async_get_poll_scheduler(hass)
+    diagnostics["schedule"] = {
+        "max_concurrent_first_refreshes": scheduler.max_concurrent,
+        "first_refreshes_waiting": scheduler.waiting,
+        "first_refreshes_running": scheduler.running,
+        "coordinators": [
+            _schedule_info(other, other is coordinator)
+            for other in async_get_coordinator_hub(hass).coordinators().values()
+        ],
+    }
+    
+    # CAP conversions reused across polls and sensors
+    diagnostics["cap_cache"] = {
+        "entries": len(CAP_CACHE),
+        "hits": CAP_CACHE.hits,
+        "misses": CAP_CACHE.misses,
+    }
+    
+    # Formatted content fragments reused across updates and sensors
+    diagnostics["formatted_content"] = {
+        "template_loaded": RENDERER.template is not None,
+        "fragments": len(RENDERER),
+        "hits": RENDERER.hits,
+        "misses": RENDERER.misses,
+    }
+    
+    # Shared HTTP statistics (all entries): 200 vs 304 counts show conditional request savings
+    if session_provider is not None:
+        diagnostics["http"] = {
+            "requests": dict(session_provider.stats),
+            "cached_responses": len(session_provider.response_cache),
+            "circuit_breakers": {
+                host: {"state": breaker.state, "failures": breaker.failures}
+                for host, breaker in session_provider.breakers.items()
+            },
+        }
+    
+    return diagnostics
+
+
+def _schedule_info(coordinator, is_current: bool) -> dict[str, Any]:
+    """Return the poll schedule of a coordinator (no location details)."""
+    interval = coordinator.update_interval
+    return {
+        "this_entry": is_current,
+        "warning_type": coordinator.warning_type,
+        "poll_offset": round(coordinator.poll_offset, 3),
+        "update_interval": interval.total_seconds() if interval else None,
+        "slot_seconds": round(coordinator.poll_offset * interval.total_seconds()) if interval else None,
+        "next_poll": coordinator.next_poll.isoformat() if coordinator.next_poll else None,
+    }
@@ -0,0 +1,172 @@
+"""Rendering of the formatted_content attribute.
+
+All sensors share one Jinja environment holding the compiled
+templates/formatted_content.j2. The template renders one alert; the document
+is assembled from per-alert fragments cached by alert content, display
+options and status, so an update only re-renders alerts that changed or whose
+Expected/Ongoing/Ended status flipped.
+
+Customised templates written for the whole list (using the `alerts`
+variable) are still supported: they are rendered once per list of alerts,
+cached the same way.
+"""
+
+from collections import ChainMap, OrderedDict
+from datetime import datetime
+import logging
+from pathlib import Path
+from typing import Callable
+
+from jinja2 import Environment, FileSystemLoader, Template, meta
+
+from homeassistant.core import HomeAssistant
+
+from .const import FRAGMENT_CACHE_MAX_ENTRIES
+from .models import content_hash
+
+_LOGGER = logging.getLogger(__name__)
+
+TEMPLATE_DIR = Path(__file__).parent / "templates"
+TEMPLATE_NAME = "formatted_content.j2"
+
+
+def _timestamp(value: str) -> float | None:
+    """Return the Unix timestamp of an ISO time (naive times are local), or None."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except (ValueError, AttributeError):
+        return None
+
+
+def alert_status(alert, now_timestamp: float) -> str | None:
+    """Return Expected, Ongoing or Ended for an alert with start and end times, else None."""
+    start_ts = _timestamp(alert.get("starttime", ""))
+    end_ts = _timestamp(alert.get("endtime", ""))
+    if start_ts is None or end_ts is None:
+        return None
+    if start_ts > now_timestamp:
+        return "Expected"
+    return "Ended" if end_ts < now_timestamp else "Ongoing"
+
+
+def _enrich(alert) -> ChainMap:
+    """Return the alert overlaid with the computed fields the template uses."""
+    # Computed fields overlay the alert instead of copying it
+    enriched = {}
+
+    # Parse timestamps
+    starttime = alert.get("starttime", "")
+    endtime = alert.get("endtime", "")
+    if starttime and endtime:
+        try:
+            start_dt = datetime.fromisoformat(starttime.replace("Z", "+00:00"))
+            end_dt = datetime.fromisoformat(endtime.replace("Z", "+00:00"))
+            enriched["starttime_timestamp"] = start_dt.timestamp()
+            enriched["endtime_timestamp"] = end_dt.timestamp()
+            enriched["start_formatted"] = start_dt.strftime("%A, %d %B kl. %H:%M")
+            enriched["end_formatted"] = end_dt.strftime("%A, %d %B kl. %H:%M")
+        except (ValueError, AttributeError) as err:
+            _LOGGER.debug("Failed to parse timestamps for alert: %s", err)
+
+    # Handle area with municipality fallback
+    if not alert.get("area") and alert.get("municipalities"):
+        municipalities = alert["municipalities"][:5]
+        area = ", ".join(municipalities)
+        if len(alert["municipalities"]) > 5:
+            area += f" (+{len(alert['municipalities']) - 5} more)"
+        enriched["area"] = area
+
+    return ChainMap(enriched, alert)
+
+
+class ContentRenderer:
+    """Compiled formatted_content template and LRU of rendered alert fragments."""
+
+    def __init__(self, template_dir: Path = TEMPLATE_DIR, max_fragments: int = FRAGMENT_CACHE_MAX_ENTRIES):
+        # auto_reload: get_template recompiles the template when the file's mtime changes
+        self.environment = Environment(loader=FileSystemLoader(template_dir), auto_reload=True)
+        self.template: Template | None = None
+        self.whole_list = False  # True for templates rendering the `alerts` list (the previous contract)
+        self._fragments: OrderedDict = OrderedDict()
+        self.max_fragments = max_fragments
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+    def load(self) -> None:
+        """Compile the template, or recompile it if the file changed (blocking)."""
+        template = self.environment.get_template(TEMPLATE_NAME)
+        if template is not self.template:
+            source, _, _ = self.environment.loader.get_source(self.environment, TEMPLATE_NAME)
+            self.whole_list = "alerts" in meta.find_undeclared_variables(self.environment.parse(source))
+            _LOGGER.debug("Compiled formatted_content template%s", " (renders the alerts list)" if self.whole_list else "")
+            self.template = template
+            self._fragments.clear()
+
+    async def async_load(self, hass: HomeAssistant) -> None:
+        """Load the template in the executor; a failure keeps the previous template."""
+        try:
+            await hass.async_add_executor_job(self.load)
+        except Exception as err:
+            _LOGGER.error(
+                "Failed to load formatted_content.j2 template: %s. Formatted content will not be available.",
+                err,
+                exc_info=True
+            )
+
+    def reset(self) -> None:
+        """Forget compiled templates and fragments, so the next load recompiles the file.
+
+        The current template keeps serving other entries until then.
+        """
+        self.environment.cache.clear()
+        self._fragments.clear()
+
+    def render(self, alerts: list, show_icon: bool, show_status: bool, show_map: bool) -> str:
+        """Return the formatted content of the alerts, rendering only fragments not cached."""
+        options = (show_icon, show_status, show_map)
+        now_timestamp = datetime.now().timestamp()
+        if self.whole_list:
+            statuses = tuple(alert_status(alert, now_timestamp) for alert in alerts) if show_status else None
+            return self._fragment(
+                (tuple(content_hash(alert) for alert in alerts), options, statuses), options, now_timestamp,
+                lambda: {"alerts": [_enrich(alert) for alert in alerts]},
+            )
+        if not alerts:
+            return self._fragment((None, options, None), options, now_timestamp, lambda: {"alert": None, "status": None})
+        return "".join(self._alert_fragment(alert, options, show_status, now_timestamp) for alert in alerts)
+
+    def _alert_fragment(self, alert, options: tuple, show_status: bool, now_timestamp: float) -> str:
+        """Return the rendered fragment of one alert."""
+        status = alert_status(alert, now_timestamp) if show_status else None
+        return self._fragment(
+            (content_hash(alert), options, status), options, now_timestamp,
+            lambda: {"alert": _enrich(alert), "status": status},
+        )
+
+    def _fragment(self, key: tuple, options: tuple, now_timestamp: float, context: Callable[[], dict]) -> str:
+        """Return the cached fragment for key, rendering the template with context() on a miss."""
+        fragment = self._fragments.get(key)
+        if fragment is not None:
+            self._fragments.move_to_end(key)
+            self.hits += 1
+            return fragment
+
+        self.misses += 1
+        show_icon, show_status, show_map = options
+        fragment = self._fragments[key] = self.template.render(
+            show_icon=show_icon,
+            show_status=show_status,
+            show_map=show_map,
+            now_timestamp=now_timestamp,
+            **context(),
+        )
+        if len(self._fragments) > self.max_fragments:
+            self._fragments.popitem(last=False)
+        return fragment
+
+
+# Shared by all sensors: one compiled template and one fragment cache
+RENDERER = ContentRenderer()
@@ -0,0 +1,87 @@
+"""Coordinators shared by config entries with the same upstream query."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Set, Tuple
+
+from .const import DOMAIN, DATA_COORDINATOR_HUB
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CoordinatorHub:
+    """Reference-counted registry of coordinators keyed by their upstream query.
+
+    Entries that only differ in sensor-level settings (municipality filter,
+    display options) get the same key and therefore share one coordinator:
+    one poll and one in-memory dataset. The coordinator is shut down when
+    the last entry using it is released.
+    """
+
+    def __init__(self):
+        self._coordinators: Dict[Tuple, Any] = {}
+        self._entry_ids: Dict[Tuple, Set[str]] = {}
+        self._keys: Dict[str, Tuple] = {}  # entry_id -> key
+        self._locks: Dict[Tuple, asyncio.Lock] = {}
+
+    def __len__(self) -> int:
+        return len(self._coordinators)
+
+    async def async_acquire(self, key: Tuple, entry_id: str,
+                            async_create: Callable[[], Awaitable[Any]]) -> Any:
+        """Return the coordinator for key, creating it with async_create if needed.
+
+        Entries setting up the same key concurrently wait for the first one, so
+        only one coordinator (and one first refresh) is created. If
+        async_create raises, nothing is registered.
+        """
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            coordinator = self._coordinators.get(key)
+            if coordinator is None:
+                coordinator = await async_create()
+                self._coordinators[key] = coordinator
+            else:
+                _LOGGER.debug("Entry %s shares the coordinator for %s", entry_id, key)
+            self._entry_ids.setdefault(key, set()).add(entry_id)
+            self._keys[entry_id] = key
+            return coordinator
+
+    async def async_release(self, entry_id: str) -> bool:
+        """Release an entry's coordinator, shutting it down if no other entry uses it.
+
+        Returns True if the coordinator was shut down.
+        """
+        key = self._keys.pop(entry_id, None)
+        if key is None:
+            return False
+
+        entry_ids = self._entry_ids.get(key, set())
+        entry_ids.discard(entry_id)
+        if entry_ids:
+            return False
+
+        self._entry_ids.pop(key, None)
+        self._locks.pop(key, None)
+        coordinator = self._coordinators.pop(key, None)
+        if coordinator is not None:
+            await coordinator.async_shutdown()
+            _LOGGER.debug("Shut down coordinator for %s", key)
+        return True
+
+    def coordinators(self) -> Dict[Tuple, Any]:
+        """Return the active coordinators by key."""
+        return dict(self._coordinators)
+
+    def shared_with(self, entry_id: str) -> Set[str]:
+        """Return the IDs of all entries using the same coordinator as entry_id."""
+        key = self._keys.get(entry_id)
+        return set(self._entry_ids.get(key, ())) if key is not None else set()
+
+
+def async_get_coordinator_hub(hass) -> CoordinatorHub:
+    """Return the integration-wide coordinator hub stored in hass.data."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    hub = domain_data.get(DATA_COORDINATOR_HUB)
+    if hub is None:
+        hub = domain_data[DATA_COORDINATOR_HUB] = CoordinatorHub()
+    return hub
@@ -0,0 +1,133 @@
+"""Warning icons for entity pictures and alert attributes.
+
+The icons are SVG files in assets/icons, read on first use instead of being
+imported with the integration. Icons that share artwork (ICON_ALIASES) are
+stored and cached once.
+
+Icons are served by NorwayAlertsIconView under ICON_URL_PATH, so states carry
+a short URL instead of a base64 data URL. Browsers cache the SVGs and
+revalidate them with an ETag. Data URLs remain available through the
+embed_icons option (e.g. for dashboards that cannot reach Home Assistant's
+HTTP server); async_load_embedded_icons loads them before the sensors need
+them, so the event loop never reads icon files.
+"""
+
+import base64
+from functools import lru_cache
+import hashlib
+import logging
+from pathlib import Path
+
+from aiohttp import hdrs, web
+
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    ICON_ALIASES,
+    ICON_CACHE_MAX_AGE,
+    ICON_CACHE_MAX_ENTRIES,
+    ICON_COLORS,
+    ICON_TYPES,
+    ICON_URL_PATH,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+ICON_DIR = Path(__file__).parent / "assets" / "icons"
+
+# Every icon name, including aliases
+ICON_NAMES = frozenset(
+    [f"{icon_type}-{color}" for icon_type in ICON_TYPES for color in ICON_COLORS] + ["extreme"]
+)
+
+# Data URLs of all stored icons, loaded by async_load_embedded_icons
+_DATA_URLS: dict[str, str] = {}
+
+
+def resolve_icon(key: str) -> str:
+    """Return the name of the stored icon for an icon name or alias."""
+    return ICON_ALIASES.get(key, key)
+
+
+def icon_key(warning_type: str, level_color: str) -> str | None:
+    """Return the icon name for a warning type and level color.
+
+    Falls back to the generic icon of the color; returns None for green and
+    unknown levels, which have no icon.
+    """
+    if not warning_type or not level_color or level_color == "green":
+        return None
+    key = f"{warning_type}-{level_color}"
+    if key in ICON_NAMES:
+        return key
+    generic_key = f"generic-{level_color}"
+    _LOGGER.debug("Icon not found for %s, using %s", key, generic_key)
+    return generic_key if generic_key in ICON_NAMES else None
+
+
+def icon_url(warning_type: str, level_color: str, embed: bool = False) -> str | None:
+    """Return the icon URL (or the data URL if embed) for a warning type and level color."""
+    key = icon_key(warning_type, level_color)
+    if key is None:
+        return None
+    if embed:
+        data_url = _DATA_URLS.get(resolve_icon(key))
+        if data_url is not None:
+            return data_url
+        _LOGGER.debug("Icon %s not loaded for embedding, using its URL", key)
+    return f"{ICON_URL_PATH}/{key}.svg"
+
+
+def icon_svg(key: str) -> tuple[bytes, str]:
+    """Return the SVG document and ETag of an icon (blocking on the first use of an icon)."""
+    return _read_icon(resolve_icon(key))
+
+
+@lru_cache(maxsize=ICON_CACHE_MAX_ENTRIES)
+def _read_icon(name: str) -> tuple[bytes, str]:
+    """Read a stored icon."""
+    svg = (ICON_DIR / f"{name}.svg").read_bytes()
+    return svg, f'"{hashlib.blake2b(svg, digest_size=8).hexdigest()}"'
+
+
+def _load_data_urls() -> None:
+    """Build the data URLs of all stored icons (blocking)."""
+    for path in sorted(ICON_DIR.glob("*.svg")):
+        _DATA_URLS[path.stem] = "data:image/svg+xml;base64," + base64.b64encode(path.read_bytes()).decode("ascii")
+
+
+async def async_load_embedded_icons(hass: HomeAssistant) -> None:
+    """Load the data URLs used by the embed_icons option, once."""
+    if not _DATA_URLS:
+        await hass.async_add_executor_job(_load_data_urls)
+
+
+class NorwayAlertsIconView(HomeAssistantView):
+    """Serve the warning icons with long-lived cache headers."""
+
+    url = ICON_URL_PATH + "/{filename}"
+    name = "api:norway_alerts:icons"
+    # Entity pictures are loaded by <img> tags, which send no auth header; the icons are public
+    requires_auth = False
+
+    async def get(self, request: web.Request, filename: str) -> web.Response:
+        """Return an icon, or 304 if the browser's copy is current."""
+        key = filename.removesuffix(".svg")
+        if key not in ICON_NAMES:
+            return web.Response(status=404)
+
+        svg, etag = await request.app[KEY_HASS].async_add_executor_job(icon_svg, key)
+        headers = {
+            hdrs.CACHE_CONTROL: f"public, max-age={ICON_CACHE_MAX_AGE}",
+            hdrs.ETAG: etag,
+        }
+        if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=svg, content_type="image/svg+xml", headers=headers)
+
+
+@callback
+def async_register_icon_view(hass: HomeAssistant) -> None:
+    """Register the icon view with Home Assistant's HTTP server."""
+    hass.http.register_view(NorwayAlertsIconView())
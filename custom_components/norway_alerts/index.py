@@ -0,0 +1,84 @@
+"""Lookups over one version of a coordinator's warnings.
+
+Built once per data version (see NorwayAlertsCoordinator.alert_index) so
+filtered sensors and master-id deduplication answer lookups from dicts
+instead of rescanning every alert and municipality.
+"""
+
+from typing import Any, Dict, List
+
+from .matcher import normalize_name, normalize_number
+
+
+def alert_master_id(alert: Dict[str, Any]) -> Any:
+    """Return the ID identifying a warning on Varsom.no (MasterId, else Id)."""
+    return alert.get("MasterId") or alert.get("Id", "")
+
+
+def is_active(alert: Dict[str, Any]) -> bool:
+    """Return True for alerts above green (level 0 is unknown, 1 is green)."""
+    return alert.get("ActivityLevel", "1") not in ("0", "1")
+
+
+class AlertIndex:
+    """Inverted index of a list of warnings.
+
+    Alerts are referred to by their position in the list, so lookups return
+    alerts in their original order.
+    """
+
+    def __init__(self, alerts: List[Dict[str, Any]]):
+        self.alerts = alerts
+        self.by_municipality_id: Dict[str, List[int]] = {}  # normalized number -> positions
+        self.by_municipality_name: Dict[str, List[int]] = {}  # normalized name -> positions
+
+        for position, alert in enumerate(alerts):
+            for municipality in alert.get("MunicipalityList") or []:
+                muni_id = municipality.get("Id")
+                if muni_id not in (None, ""):
+                    _append_unique(self.by_municipality_id, normalize_number(muni_id), position)
+                name = municipality.get("Name")
+                if name:
+                    _append_unique(self.by_municipality_name, normalize_name(name), position)
+
+        # Merged over all active alerts, so only valid for sensors showing every alert
+        self.merged = merge_municipalities([alert for alert in alerts if is_active(alert)])
+
+    def __len__(self) -> int:
+        return len(self.alerts)
+
+    def alerts_at(self, positions) -> List[Dict[str, Any]]:
+        """Return the alerts at the given positions, in list order."""
+        return [self.alerts[position] for position in sorted(positions)]
+
+    def merged_municipalities(self, master_id: Any) -> List[str] | None:
+        """Return the sorted municipality names of a warning split over several active alerts.
+
+        Returns None if only one active alert has this master id, so callers
+        keep that alert's own municipality order.
+        """
+        merged = self.merged.get(master_id)
+        return list(merged) if merged is not None else None
+
+
+def merge_municipalities(alerts: List[Dict[str, Any]]) -> Dict[Any, List[str]]:
+    """Return the sorted municipality names of each warning split over several of the alerts, by master id."""
+    master_names: Dict[Any, set] = {}
+    master_counts: Dict[Any, int] = {}
+    for alert in alerts:
+        master_id = alert_master_id(alert)
+        master_counts[master_id] = master_counts.get(master_id, 0) + 1
+        master_names.setdefault(master_id, set()).update(
+            m.get("Name", "") for m in alert.get("MunicipalityList") or []
+        )
+    return {
+        master_id: sorted(master_names[master_id])
+        for master_id, count in master_counts.items() if count > 1
+    }
+
+
+def _append_unique(index: Dict[str, List[int]], key: str, position: int) -> None:
+    """Add position to index[key] unless the same alert was just added."""
+    positions = index.setdefault(key, [])
+    if not positions or positions[-1] != position:
+        positions.append(position)
@@ -0,0 +1,145 @@
+"""Municipality matching for the "My Area" filter.
+
+The filter is compiled once per sensor: names are normalized the Norwegian
+way and all name terms are matched in a single pass over an alert's
+municipality names (Aho-Corasick), while numeric terms match municipality
+numbers exactly.
+"""
+
+import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List
+
+# Old spellings and transliterations of æ, ø and å ("Aalesund" -> "ålesund")
+_DIGRAPHS = (("aa", "å"), ("ae", "æ"), ("oe", "ø"))
+_LETTERS = str.maketrans({"ä": "æ", "ö": "ø", "-": " ", "–": " ", "\n": " "})
+_NORWEGIAN = frozenset("æøå")
+
+# Joins municipality names so one pass covers them all; never part of a normalized term
+_SEPARATOR = "\n"
+
+
+@lru_cache(maxsize=2048)
+def normalize_name(name: str) -> str:
+    """Return a municipality name normalized for matching.
+
+    Case-folded, with diacritics removed except æ/ø/å, old digraphs
+    (aa, ae, oe) mapped to æ/ø/å, hyphens treated as spaces and runs of
+    whitespace collapsed, so "Ålesund" and "AALESUND" both become "ålesund".
+    """
+    text = name.casefold().translate(_LETTERS)
+    for digraph, letter in _DIGRAPHS:
+        text = text.replace(digraph, letter)
+    # Strip accents (e.g. Sámi "Kárášjohka") while keeping æ, ø and å intact
+    text = "".join(
+        char if char in _NORWEGIAN else unicodedata.normalize("NFD", char)[0]
+        for char in text
+    )
+    return " ".join(text.split())
+
+
+def normalize_number(value: Any) -> str:
+    """Return a municipality number without leading zeros ("0301" -> "301")."""
+    return str(value).strip().lstrip("0")
+
+
+class _Automaton:
+    """Aho-Corasick automaton answering whether any term occurs in a text."""
+
+    def __init__(self, terms: Iterable[str]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._match: List[bool] = [False]
+
+        for term in terms:
+            state = 0
+            for char in term:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._match.append(False)
+                state = next_state
+            self._match[state] = True
+
+        # Breadth-first failure links; a state matches if its fallback does
+        queue = list(self._goto[0].values())
+        for state in queue:
+            for char, next_state in self._goto[state].items():
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                self._match[next_state] = self._match[next_state] or self._match[self._fail[next_state]]
+                queue.append(next_state)
+
+    def search(self, text: str) -> bool:
+        """Return True if any term occurs in text."""
+        goto, fail, match = self._goto, self._fail, self._match
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if match[state]:
+                return True
+        return False
+
+
+class MunicipalityMatcher:
+    """Compiled "My Area" filter.
+
+    The filter is a comma-separated list. Numeric terms ("4601", "0301")
+    match municipality numbers exactly; other terms match any part of a
+    normalized municipality name ("berg" matches "Bergen").
+    """
+
+    def __init__(self, filter_string: str):
+        self.filter_string = filter_string.strip()
+        self.numbers = set()
+        self.names = set()
+        for term in self.filter_string.split(","):
+            term = term.strip()
+            if not term:
+                continue
+            if term.isdigit():
+                self.numbers.add(normalize_number(term))
+            else:
+                normalized = normalize_name(term)
+                if normalized:
+                    self.names.add(normalized)
+        self._automaton = _Automaton(self.names) if self.names else None
+
+    def __bool__(self) -> bool:
+        return bool(self.numbers or self.names)
+
+    def matches(self, municipalities: List[Dict[str, Any]]) -> bool:
+        """Return True if any municipality in an alert's MunicipalityList matches."""
+        if self.numbers:
+            for municipality in municipalities:
+                if normalize_number(municipality.get("Id", "")) in self.numbers:
+                    return True
+        if self._automaton is not None:
+            text = _SEPARATOR.join(normalize_name(m.get("Name") or "") for m in municipalities)
+            return self._automaton.search(text)
+        return False
+
+    def filter_alerts(self, alerts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return the alerts affecting a matching municipality."""
+        return [alert for alert in alerts if self.matches(alert.get("MunicipalityList") or [])]
+
+    def filter_index(self, index) -> List[Dict[str, Any]]:
+        """Return the matching alerts using an AlertIndex of the alerts.
+
+        Each distinct municipality is checked once instead of once per alert.
+        """
+        positions = set()
+        for number in self.numbers:
+            positions.update(index.by_municipality_id.get(number, ()))
+        if self._automaton is not None:
+            for name, name_positions in index.by_municipality_name.items():
+                if self._automaton.search(name):
+                    positions.update(name_positions)
+        return index.alerts_at(positions)
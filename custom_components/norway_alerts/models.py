@@ -0,0 +1,281 @@
+"""Warnings produced by the API clients.
+
+The TypedDicts describe the fields of each kind of warning. At runtime the
+API clients produce immutable WarningModel objects built from them: read-only
+mappings (the sensor, templates and CAP conversion read warnings by key) that
+store fields in __slots__ instead of a per-warning dict. Short strings are
+interned and municipality/county entries are shared between warnings, so a
+region listed in many warnings is stored once.
+"""
+
+import hashlib
+import json
+import sys
+from collections.abc import Mapping
+from typing import Any, Dict, List, Tuple, TypedDict
+
+from .const import WARNING_TYPE_AVALANCHE, WARNING_TYPE_METALERTS
+
+
+class NveWarning(TypedDict, total=False):
+    """A landslide or flood warning as returned by the NVE API (tagged with _warning_type)."""
+
+    Id: Any
+    MasterId: Any
+    ActivityLevel: str
+    DangerLevel: str
+    DangerTypeName: str
+    DangerIncreaseDateTime: str | None
+    DangerDecreaseDateTime: str | None
+    MainText: str
+    WarningText: str
+    AdviceText: str
+    ConsequenceText: str
+    ValidFrom: str
+    ValidTo: str
+    PublishTime: str
+    NextWarningTime: str | None
+    Author: str
+    LangKey: int
+    CountyList: List[Dict[str, Any]]
+    MunicipalityList: List[Dict[str, Any]]
+    CauseList: List[Dict[str, Any]]
+    _warning_type: str
+
+
+class AvalancheWarning(TypedDict):
+    """An avalanche region warning converted from an NVE Detail payload."""
+
+    Id: Any
+    ActivityLevel: str
+    DangerLevel: str
+    DangerTypeName: str
+    MainText: str
+    RegionName: str
+    ValidFrom: str | None
+    ValidTo: str | None
+    PublishTime: str | None
+    CountyList: List[Dict[str, Any]]
+    MunicipalityList: List[Dict[str, Any]]
+    _region_id: Any
+    _region_name: str | None
+    _warning_type: str
+    UtmZone: Any
+    UtmEast: Any
+    UtmNorth: Any
+
+    # Avalanche-specific attributes
+    AvalancheDanger: str
+    EmergencyWarning: str
+    AvalancheProblems: List[Dict[str, Any]]
+    AvalancheAdvices: List[Dict[str, Any]]
+    SnowSurface: str
+    CurrentWeaklayers: str
+    LatestAvalancheActivity: str
+    LatestObservations: str
+    Author: str
+    DangerLevelName: str
+    ExposedHeightFill: int
+    ExposedHeight1: int
+
+    # Flattened mountain weather
+    WindSpeed: str
+    WindDirection: str
+    Temperature: str
+    Precipitation: str
+    MountainWeather: Dict[str, Any]
+
+
+class MetAlertWarning(TypedDict):
+    """A Met.no metalerts feature converted to the common warning format."""
+
+    Id: str
+    ActivityLevel: str
+    DangerLevel: str
+    DangerTypeName: str
+    MainText: str
+    RegionName: str
+    ValidFrom: str
+    ValidTo: str
+    PublishTime: str
+    _warning_type: str
+
+    # Metalerts-specific attributes
+    title: str
+    starttime: str | None
+    endtime: str | None
+    description: str
+    awareness_level: str
+    awareness_level_numeric: str
+    awareness_level_color: str
+    awareness_level_name: str
+    certainty: str
+    severity: str
+    instruction: str
+    contact: str
+    resources: List[Dict[str, Any]]
+    area: str
+    event: str
+    event_awareness_name: str
+    consequences: str
+    map_url: str | None
+    resource_url: str
+    awareness_type: str
+    ceiling: Any
+    county: List[str]
+    geographic_domain: str
+    risk_matrix_color: str
+    trigger_level: Any
+    web: str
+
+
+# Strings up to this length (names, levels, types) are interned; longer texts are unique anyway
+_INTERN_MAX_LENGTH = 100
+
+# Lists of municipality/county entries; entries are shared between warnings
+_PLACE_LISTS = frozenset({"MunicipalityList", "CountyList"})
+_PLACES_MAX = 4096
+_places: Dict[Tuple, Dict[str, Any]] = {}
+
+
+def _intern(value: Any) -> Any:
+    """Intern short strings, return anything else unchanged."""
+    if type(value) is str and len(value) <= _INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def _shared_place(place: Any) -> Any:
+    """Return the shared copy of a municipality or county entry.
+
+    Entries are only read, so every warning listing the same municipality can
+    use the same dict. Entries with unhashable values are kept as they are.
+    """
+    if not isinstance(place, dict):
+        return place
+    try:
+        key = tuple(place.items())
+        shared = _places.get(key)
+    except TypeError:
+        return place
+    if shared is None:
+        if len(_places) >= _PLACES_MAX:
+            _places.clear()
+        shared = _places[key] = {_intern(name): _intern(value) for name, value in place.items()}
+    return shared
+
+
+class WarningModel(Mapping):
+    """Immutable warning in the common Norway Alerts format.
+
+    Subclasses declare their fields as __slots__; keys outside them (e.g. new
+    API fields) are kept in a small extra dict, so no data is dropped.
+    """
+
+    __slots__ = ("_extra", "_digest")
+    _fields: Tuple[str, ...] = ()
+    _field_set: frozenset = frozenset()
+
+    def __init__(self, values: Mapping):
+        extra = None
+        fields = self._field_set
+        for key, value in values.items():
+            if key in _PLACE_LISTS and isinstance(value, (list, tuple)):
+                value = tuple(map(_shared_place, value))
+            else:
+                value = _intern(value)
+            if key in fields:
+                object.__setattr__(self, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[_intern(key)] = value
+        object.__setattr__(self, "_extra", extra)
+        object.__setattr__(self, "_digest", None)  # content hash, computed on first use
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._field_set:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._field_set:
+            return getattr(self, key, default)
+        return self._extra.get(key, default) if self._extra is not None else default
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._field_set:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for field in self._fields:
+            if hasattr(self, field):
+                yield field
+        if self._extra is not None:
+            yield from self._extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self)!r})"
+
+    def __reduce__(self):
+        return (type(self), (dict(self),))
+
+
+def content_hash(warning: Mapping) -> bytes:
+    """Return a stable hash of a warning's content.
+
+    Equal content gives the same hash across polls and restarts. Models are
+    immutable, so their hash is computed once and kept.
+    """
+    if isinstance(warning, WarningModel) and warning._digest is not None:
+        return warning._digest
+    encoded = json.dumps(dict(warning), sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).digest()
+    if isinstance(warning, WarningModel):
+        object.__setattr__(warning, "_digest", digest)
+    return digest
+
+
+def _model(name: str, schema: type) -> type:
+    """Create a slotted WarningModel subclass with the fields of a TypedDict."""
+    fields = tuple(schema.__annotations__)
+    clashes = {field for field in fields if hasattr(WarningModel, field)}
+    assert not clashes, f"{name} fields clash with mapping methods: {clashes}"
+    return type(name, (WarningModel,), {
+        "__slots__": fields,
+        "_fields": fields,
+        "_field_set": frozenset(fields),
+        "__doc__": schema.__doc__,
+        "__module__": __name__,
+    })
+
+
+NveWarningModel = _model("NveWarningModel", NveWarning)
+AvalancheWarningModel = _model("AvalancheWarningModel", AvalancheWarning)
+MetAlertWarningModel = _model("MetAlertWarningModel", MetAlertWarning)
+
+
+def warning_from_dict(values: Mapping, warning_type: str) -> WarningModel:
+    """Build the model for a warning of an integration warning type (e.g. from a saved snapshot)."""
+    if isinstance(values, WarningModel):
+        return values
+    if warning_type == WARNING_TYPE_AVALANCHE:
+        return AvalancheWarningModel(values)
+    if warning_type == WARNING_TYPE_METALERTS:
+        return MetAlertWarningModel(values)
+    return NveWarningModel(values)
@@ -1,8 +1,17 @@
 """Municipality lookup helper for Norway Alerts integration."""
+import json
 import logging
+from math import cos, radians
+from pathlib import Path
+import zipfile
+
+from .spatial import GridIndex, PolygonShape, utm33_from_wgs84
 
 _LOGGER = logging.getLogger(__name__)
 
+# Kartverket's county boundaries simplified to about 250 m (municipalities/simplify_counties.py)
+COUNTY_BOUNDARIES = Path(__file__).parent / "assets" / "boundaries" / "counties.geojson"
+
 # Basic municipality lookup by approximate coordinates
 # This is a simple implementation - can be enhanced with GeoJSON boundaries
 MUNICIPALITY_LOOKUP = {
@@ -57,6 +66,8 @@ def get_municipality_from_coordinates(latitude: float, longitude: float) -> tupl
     
     This is a basic implementation using bounding boxes.
     For more accuracy, use GeoJSON polygon intersection.
+    Where boxes overlap, the box whose centre is nearest to the point wins
+    (first in the table on a tie).
     """
     _LOGGER.debug("Looking up municipality for coordinates: %s, %s", latitude, longitude)
     
@@ -74,50 +85,180 @@ def get_municipality_from_coordinates(latitude: float, longitude: float) -> tupl
         return None
     
     if len(matches) > 1:
-        _LOGGER.warning("Multiple municipalities found for coordinates: %s, %s - using first match", latitude, longitude)
+        _LOGGER.debug("Multiple municipalities found for coordinates: %s, %s - using the nearest", latitude, longitude)
+        return min(matches, key=lambda match: _distance_to_centre(latitude, longitude, match[0]))
     
     return matches[0]
 
 
-def load_geojson_boundaries(geojson_path: str) -> dict:
+def _distance_to_centre(latitude: float, longitude: float, municipality: str) -> float:
+    """Return the squared distance (in degrees of latitude) from a point to the centre of a municipality's box."""
+    data = MUNICIPALITY_LOOKUP[municipality]
+    centre_lat = sum(data["lat_range"]) / 2
+    centre_lon = sum(data["lon_range"]) / 2
+    # A degree of longitude is cos(latitude) degrees of latitude long
+    return (latitude - centre_lat) ** 2 + ((longitude - centre_lon) * cos(radians(latitude))) ** 2
+
+
+class BoundaryIndex:
+    """Boundary polygons of named areas with point lookup.
+    
+    Each polygon of a (multi)polygon is a PolygonShape, indexed by a GridIndex:
+    most points resolve from their grid cell alone, points near a boundary are
+    tested exactly against the few polygons crossing their cell.
+    Polygons are kept in the CRS of the source data; lookups project the
+    point instead (EPSG:25833 for Kartverket's data).
     """
-    Load municipality boundaries from GeoJSON file.
     
-    This function can be implemented to use precise polygon boundaries
-    instead of the approximate bounding boxes above.
+    def __init__(self, shapes: list[PolygonShape], projected: bool):
+        self._grid = GridIndex(shapes)
+        self._projected = projected
+    
+    def __len__(self) -> int:
+        """Return the number of polygons."""
+        return len(self._grid.shapes)
+    
+    def lookup(self, latitude: float, longitude: float) -> tuple[str, str] | None:
+        """Return (name, county_id) of the area containing the point, or None."""
+        x, y = utm33_from_wgs84(latitude, longitude) if self._projected else (longitude, latitude)
+        return self._grid.lookup(x, y)
+
+
+def load_geojson_boundaries(geojson_path: str) -> BoundaryIndex:
+    """
+    Load area boundaries from a GeoJSON file and index them for point lookups.
+    
+    Reads a .geojson file or a .zip of them, such as Kartverket's
+    Basisdata_0000_Norge_25833_Fylker_GeoJSON.zip. Counties (fylkesnummer) and
+    municipalities (kommunenummer) are supported, in EPSG:25833 or WGS84.
+    This reads and parses the file, so call it in the executor.
     
     Parameters:
-        geojson_path: Path to GeoJSON file with municipality boundaries
+        geojson_path: Path to a GeoJSON file (or zip of GeoJSON files) with boundaries
     
     Returns:
-        Dictionary mapping municipality names to boundary polygons
+        BoundaryIndex of the boundary polygons
+    """
+    if zipfile.is_zipfile(geojson_path):
+        with zipfile.ZipFile(geojson_path) as archive:
+            # Basisdata zips also hold the boundary lines ("Grense"), which are not areas
+            documents = [
+                json.loads(archive.read(name)) for name in archive.namelist()
+                if name.endswith(".geojson") and "Grense" not in name
+            ]
+    else:
+        with open(geojson_path, encoding="utf-8") as geojson_file:
+            documents = [json.load(geojson_file)]
+    
+    shapes = []
+    projected = None
+    for collection in (c for document in documents for c in _feature_collections(document)):
+        crs = str(collection.get("crs", {}).get("properties", {}).get("name", "EPSG:4326"))
+        if "25833" in crs:
+            collection_projected = True
+        elif "4326" in crs or "CRS84" in crs:
+            collection_projected = False
+        else:
+            raise ValueError(f"Unsupported CRS {crs} in {geojson_path}")
+        if projected is not None and projected != collection_projected:
+            raise ValueError(f"Mixed coordinate systems in {geojson_path}")
+        projected = collection_projected
+        
+        for feature in collection.get("features", []):
+            area = _feature_area(feature.get("properties") or {})
+            geometry = feature.get("geometry") or {}
+            if area is None or geometry.get("type") not in ("Polygon", "MultiPolygon"):
+                continue
+            polygons = geometry["coordinates"] if geometry["type"] == "MultiPolygon" else [geometry["coordinates"]]
+            shapes.extend(PolygonShape(rings, area) for rings in polygons if rings)
+    
+    _LOGGER.debug("Loaded %d boundary polygons from %s", len(shapes), geojson_path)
+    return BoundaryIndex(shapes, bool(projected))
+
+
+def _feature_collections(document: dict) -> list[dict]:
+    """Return the feature collections of a GeoJSON document.
+    
+    Kartverket's files wrap the collection in an object keyed by the theme (e.g. "Fylke").
     """
-    # TODO: Implement GeoJSON loading
-    # Can use shapely library for point-in-polygon tests
-    raise NotImplementedError("GeoJSON boundary loading not yet implemented")
+    if document.get("type") == "FeatureCollection":
+        return [document]
+    return [value for value in document.values() if isinstance(value, dict) and value.get("type") == "FeatureCollection"]
+
+
+def _feature_area(properties: dict) -> tuple[str, str] | None:
+    """Return (name, county_id) of a county or municipality feature."""
+    if properties.get("fylkesnummer"):
+        number = str(properties["fylkesnummer"])
+        name = properties.get("fylkesnavn")
+        county_id = number
+    elif properties.get("kommunenummer"):
+        number = str(properties["kommunenummer"])
+        name = properties.get("kommunenavn")
+        county_id = number[:2]
+    else:
+        return None
+    
+    # Prefer the Norwegian name over the combined multilingual one ("Troms - Romsa - Tromssa")
+    for official_name in properties.get("administrativenhetnavn") or []:
+        if isinstance(official_name, dict) and official_name.get("sprak") == "nor":
+            name = official_name.get("navn", name)
+            break
+    return (name or number, county_id)
 
 
 def get_municipality_from_coordinates_precise(
     latitude: float, 
     longitude: float, 
-    boundaries: dict
+    boundaries: BoundaryIndex
 ) -> tuple[str, str] | None:
     """
-    Get municipality using precise GeoJSON polygon boundaries.
+    Get the area containing the coordinates using precise GeoJSON polygon boundaries.
+    
+    With the bundled Fylker data the areas are counties, so the name is the
+    county name. Lookups take microseconds, so they can run on every
+    device tracker update.
     
     Parameters:
         latitude: Latitude coordinate
         longitude: Longitude coordinate
-        boundaries: Municipality boundaries from load_geojson_boundaries()
+        boundaries: Boundaries from load_geojson_boundaries()
     
     Returns:
-        tuple of (municipality_name, county_id) or None if not found
+        tuple of (name, county_id) or None if not found
+    """
+    area = boundaries.lookup(latitude, longitude)
+    if area is None:
+        _LOGGER.debug("No boundary contains coordinates: %s, %s", latitude, longitude)
+    return area
+
+
+
+def load_county_boundaries() -> BoundaryIndex | None:
+    """Return the bundled county boundaries, or None if they cannot be read.
+    
+    The simplified boundaries load in well under a second and are not kept,
+    so call this in the executor and only when a lookup is needed.
+    """
+    try:
+        return load_geojson_boundaries(str(COUNTY_BOUNDARIES))
+    except (OSError, ValueError) as err:
+        _LOGGER.warning("Could not load county boundaries from %s: %s", COUNTY_BOUNDARIES, err)
+        return None
+
+
+def get_county_from_coordinates(latitude: float, longitude: float) -> str | None:
+    """
+    Get the county ID for lat/lon coordinates.
+    
+    Uses the bundled county boundaries, falling back to the approximate
+    MUNICIPALITY_LOOKUP table if they are missing. Returns None if the
+    point is in no known county. Loads the boundaries, so call it in
+    the executor.
     """
-    # TODO: Implement point-in-polygon check using shapely
-    # from shapely.geometry import Point, shape
-    # point = Point(longitude, latitude)
-    # for municipality, geojson_feature in boundaries.items():
-    #     polygon = shape(geojson_feature['geometry'])
-    #     if polygon.contains(point):
-    #         return (municipality, geojson_feature['properties']['county_id'])
-    raise NotImplementedError("Precise GeoJSON lookup not yet implemented")
+    boundaries = load_county_boundaries()
+    if boundaries is not None:
+        area = get_municipality_from_coordinates_precise(latitude, longitude, boundaries)
+    else:
+        area = get_municipality_from_coordinates(latitude, longitude)
+    return area[1] if area else None
@@ -0,0 +1,88 @@
+"""Spread coordinator polls over time and limit concurrent first refreshes."""
+
+import asyncio
+import logging
+import zlib
+from datetime import datetime, timedelta
+from typing import Tuple
+
+from .const import (
+    DOMAIN,
+    DATA_POLL_SCHEDULER,
+    FIRST_REFRESH_CONCURRENCY,
+    STARTUP_REFRESH_SPREAD,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def poll_offset(key: Tuple) -> float:
+    """Return a stable offset in [0, 1) for a coordinator key.
+
+    The same key gets the same offset on every restart (crc32 of the key, not
+    Python's randomized hash), so an entry keeps its slot in the poll cycle.
+    """
+    return zlib.crc32(repr(key).encode("utf-8")) / 2**32
+
+
+def align_interval(interval: timedelta, offset: float, now: datetime) -> timedelta:
+    """Return the delay to the next poll slot of a coordinator.
+
+    Slots repeat every interval, shifted by offset * interval from the epoch, so
+    coordinators with different offsets poll at different times instead of all
+    at once. The delay is between half and one and a half intervals; once a
+    coordinator is on its slot it stays there and the delay equals interval.
+    """
+    period = interval.total_seconds()
+    if period <= 0:
+        return interval
+    delay = (offset * period - now.timestamp()) % period
+    if delay < period / 2:
+        delay += period
+    return timedelta(seconds=delay)
+
+
+class PollScheduler:
+    """Integration-wide poll scheduling.
+
+    Each coordinator polls on its own slot (see align_interval), and first
+    refreshes at startup go through a semaphore so a restart with many
+    entries does not open every API request at the same moment.
+    """
+
+    def __init__(self, max_concurrent: int = FIRST_REFRESH_CONCURRENCY,
+                 startup_spread: float = STARTUP_REFRESH_SPREAD):
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self.max_concurrent = max_concurrent
+        self.startup_spread = startup_spread  # seconds over which warm-started refreshes are spread
+        self.waiting = 0  # first refreshes waiting for a free slot
+        self.running = 0
+
+    async def async_first_refresh(self, coordinator, delay: float = 0) -> None:
+        """Run a coordinator's first refresh after delay seconds, within the concurrency limit."""
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self.waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.running += 1
+        try:
+            await coordinator.async_refresh()
+        finally:
+            self.running -= 1
+            self._semaphore.release()
+
+    def startup_delay(self, offset: float) -> float:
+        """Return how long a warm-started coordinator waits before its first refresh."""
+        return offset * self.startup_spread
+
+
+def async_get_poll_scheduler(hass) -> PollScheduler:
+    """Return the integration-wide poll scheduler stored in hass.data."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler = domain_data.get(DATA_POLL_SCHEDULER)
+    if scheduler is None:
+        scheduler = domain_data[DATA_POLL_SCHEDULER] = PollScheduler()
+    return scheduler
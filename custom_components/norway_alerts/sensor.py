@@ -1,17 +1,18 @@
 """Norway Alerts sensor platform."""
 import logging
-from datetime import timedelta
-import os
+from collections import OrderedDict
+from datetime import datetime, timedelta
 
 import voluptuous as vol
-from jinja2 import Environment, FileSystemLoader
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_utc_time
 import homeassistant.helpers.config_validation as cv
+from homeassistant.util import dt as dt_util
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -34,54 +35,52 @@ from .const import (
     CONF_SHOW_ICON,
     CONF_SHOW_STATUS,
     CONF_SHOW_MAP,
+    CONF_LEAN_ATTRIBUTES,
     WARNING_TYPE_LANDSLIDE,
     WARNING_TYPE_FLOOD,
     WARNING_TYPE_AVALANCHE,
     WARNING_TYPE_METALERTS,
     ACTIVITY_LEVEL_NAMES,
-    ICON_DATA_URLS,
+    CONF_EMBED_ICONS,
     NOTIFICATION_SEVERITY_ALL,
     NOTIFICATION_SEVERITY_YELLOW_PLUS,
     NOTIFICATION_SEVERITY_ORANGE_PLUS,
     NOTIFICATION_SEVERITY_RED_ONLY,
+    SNAPSHOT_SAVE_DELAY,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_MAX_POLL_INTERVAL,
+    POLL_INTERVAL_ACTIVE,
+    POLL_INTERVAL_NORMAL,
+    PUBLISH_POLL_DELAY,
+    PUBLISH_POLL_SPREAD,
+    CAP_CACHE_MAX_ENTRIES,
+    NVE_TIME_ZONE,
 )
 from .api import WarningAPIFactory
+from .formatting import RENDERER
+from .icons import async_load_embedded_icons, icon_url
+from .index import AlertIndex, is_active, merge_municipalities
+from .models import content_hash, warning_from_dict
+from .matcher import MunicipalityMatcher
+from .scheduler import align_interval
 
 _LOGGER = logging.getLogger(__name__)
 
 SCAN_INTERVAL = timedelta(minutes=30)
 
+# Attributes that change on every successful poll; they alone never trigger a state write
+VOLATILE_ATTRIBUTES = frozenset({"last_success"})
 
-async def _async_load_template(hass: HomeAssistant) -> str | None:
-    """Load Jinja2 template file asynchronously."""
-    try:
-        template_path = os.path.join(
-            os.path.dirname(__file__), "templates", "formatted_content.j2"
-        )
-        
-        # Use executor to read file without blocking event loop
-        def _read_template():
-            with open(template_path, "r", encoding="utf-8") as f:
-                return f.read()
-        
-        content = await hass.async_add_executor_job(_read_template)
-        _LOGGER.debug("Successfully loaded formatted_content.j2 template")
-        return content
-        
-    except Exception as err:
-        _LOGGER.error(
-            "Failed to load formatted_content.j2 template: %s. Formatted content will not be available.",
-            err,
-            exc_info=True
-        )
-        return None
+# Resolved once at import (done in the executor), so polls never load time zone data
+NVE_TZ = dt_util.get_time_zone(NVE_TIME_ZONE)
 
 
-def convert_nve_to_cap(alert: dict, warning_type: str, lang: str) -> dict:
+def convert_nve_to_cap(alert: dict, warning_type: str, lang: str, entity_picture: str | None = None) -> dict:
     """Convert NVE warning format to CAP format for unified display.
     
     Maps NVE fields to Common Alerting Protocol (CAP) fields used by Met.no,
     enabling a single card design to work for both NVE and Met.no alerts.
+    The alert is not modified; use CAP_CACHE to reuse conversions.
     """
     activity_level = alert.get("ActivityLevel", "1")
     
@@ -192,7 +191,7 @@ def convert_nve_to_cap(alert: dict, warning_type: str, lang: str) -> dict:
         "warning_type": warning_type,
         
         # Icon
-        "entity_picture": alert.get("entity_picture"),
+        "entity_picture": entity_picture,
     }
     
     # Add avalanche-specific fields if applicable
@@ -218,6 +217,66 @@ def convert_nve_to_cap(alert: dict, warning_type: str, lang: str) -> dict:
     return cap_alert
 
 
+def _next_status_change(alerts: list):
+    """Return the next start or end time of the alerts, when their shown status changes."""
+    now = dt_util.utcnow()
+    upcoming = []
+    for alert in alerts:
+        for field in ("starttime", "endtime"):
+            value = alert.get(field)
+            if not value:
+                continue
+            try:
+                # Parsed like the formatted content template does (naive times are local)
+                when = dt_util.utc_from_timestamp(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+            except (ValueError, AttributeError):
+                continue
+            if when > now:
+                upcoming.append(when)
+    return min(upcoming, default=None)
+
+
+def _alert_key(alert) -> tuple:
+    """Return the key identifying an alert between polls."""
+    return (alert.get("_warning_type"), alert.get("Id"), alert.get("ValidFrom"))
+
+
+class CapCache:
+    """LRU of CAP conversions keyed by warning content, warning type, language and icon.
+    
+    Unchanged warnings reuse the same CAP dict across polls and across sensors,
+    so callers must not modify the returned dicts.
+    """
+    
+    def __init__(self, max_entries: int = CAP_CACHE_MAX_ENTRIES):
+        self._entries: OrderedDict = OrderedDict()
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def convert(self, alert, warning_type: str, lang: str, entity_picture: str | None = None) -> dict:
+        """Return the CAP conversion of an alert, converting it only if not cached."""
+        key = (content_hash(alert), warning_type, lang, entity_picture)
+        cap_alert = self._entries.get(key)
+        if cap_alert is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return cap_alert
+        
+        self.misses += 1
+        cap_alert = self._entries[key] = convert_nve_to_cap(alert, warning_type, lang, entity_picture)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return cap_alert
+
+
+# Shared by all sensors: conversions only depend on the warning content
+CAP_CACHE = CapCache()
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -229,8 +288,8 @@ async def async_setup_entry(
     
     _LOGGER.debug("Setting up sensor for entry %s", entry.entry_id)
     
-    # Load Jinja2 template asynchronously to avoid blocking I/O
-    template_content = await _async_load_template(hass)
+    # Compile the shared template in the executor (recompiled if the file changed since)
+    await RENDERER.async_load(hass)
     
     # Get config from entry.options (preferred) or entry.data (fallback)
     config = entry.options if entry.options else entry.data
@@ -238,6 +297,13 @@ async def async_setup_entry(
     warning_type = config.get(CONF_WARNING_TYPE) or entry.data.get(CONF_WARNING_TYPE)
     municipality_filter = config.get(CONF_MUNICIPALITY_FILTER, "")
     
+    # Data URLs are loaded up front so the sensors never read icon files in the event loop
+    if config.get(CONF_EMBED_ICONS, False):
+        await async_load_embedded_icons(hass)
+    
+    # Lean attributes mode keeps alert details out of the recorder
+    sensor_class = NorwayAlertsLeanSensor if config.get(CONF_LEAN_ATTRIBUTES, False) else NorwayAlertsSensor
+    
     # Determine if this is a county-based or lat/lon-based configuration
     county_id = config.get(CONF_COUNTY_ID) or entry.data.get(CONF_COUNTY_ID)
     latitude = config.get(CONF_LATITUDE) or entry.data.get(CONF_LATITUDE)
@@ -247,40 +313,50 @@ async def async_setup_entry(
         # County-based configuration (NVE warnings)
         county_name = config.get(CONF_COUNTY_NAME) or entry.data.get(CONF_COUNTY_NAME, "Unknown")
         
-        # Create sensors with pre-loaded template
+        # Create sensors
         entities = [
             # Main sensor with all county alerts
-            NorwayAlertsSensor(coordinator, entry.entry_id, county_name, warning_type, municipality_filter, template_content, is_main=True),
+            sensor_class(coordinator, entry.entry_id, county_name, warning_type, municipality_filter, is_main=True, config_entry=entry),
         ]
         
         # If municipality filter is set, create an additional "My Area" sensor
         if municipality_filter:
             entities.append(
-                NorwayAlertsSensor(coordinator, entry.entry_id, county_name, warning_type, municipality_filter, template_content, is_main=False)
+                sensor_class(coordinator, entry.entry_id, county_name, warning_type, municipality_filter, is_main=False, config_entry=entry)
             )
     else:
         # Lat/lon-based configuration (Met.no metalerts)
         # Create a descriptive location name
         location_name = f"({latitude:.2f}, {longitude:.2f})"
         entities = [
-            NorwayAlertsSensor(coordinator, entry.entry_id, location_name, warning_type, "", template_content, is_main=True),
+            sensor_class(coordinator, entry.entry_id, location_name, warning_type, "", is_main=True, config_entry=entry),
         ]
     
     async_add_entities(entities)
 
 
 class NorwayAlertsCoordinator(DataUpdateCoordinator):
-    """Class to manage fetching Norway Alerts data."""
+    """Class to manage fetching Norway Alerts data.
+    
+    A coordinator can be shared by several config entries (see hub.py), so it
+    is not bound to any one entry; sensors use their own entry for options.
+    """
 
     def __init__(self, hass, county_id, county_name, warning_type, lang, test_mode=False, 
                  enable_notifications=False, notification_severity=NOTIFICATION_SEVERITY_YELLOW_PLUS,
-                 cap_format=True, latitude=None, longitude=None, config_entry=None):
+                 cap_format=True, latitude=None, longitude=None,
+                 session_provider=None, avalanche_snapshot=None, snapshot_store=None,
+                 min_poll_interval=timedelta(minutes=DEFAULT_MIN_POLL_INTERVAL),
+                 max_poll_interval=timedelta(minutes=DEFAULT_MAX_POLL_INTERVAL),
+                 poll_offset=0.0):
         """Initialize coordinator."""
         super().__init__(
             hass,
             _LOGGER,
+            # Not bound to the entry being set up: that would shut the coordinator down when it unloads
+            config_entry=None,
             name=DOMAIN,
-            update_interval=SCAN_INTERVAL,
+            update_interval=max(min_poll_interval, min(SCAN_INTERVAL, max_poll_interval)),
         )
         self.county_id = county_id
         self.county_name = county_name
@@ -292,8 +368,77 @@ class NorwayAlertsCoordinator(DataUpdateCoordinator):
         self.notification_severity = notification_severity
         self.latitude = latitude
         self.longitude = longitude
-        self.config_entry = config_entry  # Store config entry for device info
+        self.session_provider = session_provider  # Shared pooled HTTP session
+        self.avalanche_snapshot = avalanche_snapshot  # Shared nationwide avalanche forecast
         self.previous_alerts = {}  # Track previous alerts for change detection
+        self.snapshot_store = snapshot_store  # Store for the warm-start snapshot (optional)
+        self.min_poll_interval = min_poll_interval  # Bounds for the adaptive poll interval
+        self.max_poll_interval = max_poll_interval
+        self.poll_offset = poll_offset  # Position in the poll cycle (0-1), see scheduler.py
+        self.next_poll = None  # Approximate time of the next scheduled poll
+        self.first_refresh_task = None  # Background first refresh after a warm start, cancelled on shutdown
+        self.api_client = None  # Created on first update, kept so it remembers its last good result
+        self.stale = False  # True while the API is failing and the last good warnings are shown
+        self.last_success = None  # When the API last answered successfully
+        self._alert_index = None  # Lookups over the current data, see alert_index
+        self._alert_index_data = None
+        self.generation = 0  # Incremented whenever the warnings change
+        self.write_stats = {"writes": 0, "skipped": 0}  # State writes by this coordinator's sensors
+        self.changeset = {"added": [], "changed": [], "removed": []}  # Alert keys changed by the last update
+
+    async def async_shutdown(self) -> None:
+        """Cancel a pending background first refresh and shut down."""
+        if self.first_refresh_task is not None and not self.first_refresh_task.done():
+            self.first_refresh_task.cancel()
+        await super().async_shutdown()
+
+    @property
+    def alert_index(self) -> AlertIndex:
+        """Return the index of the current data, built once per data version."""
+        if self._alert_index is None or self._alert_index_data is not self.data:
+            self._alert_index = AlertIndex(self.data or [])
+            self._alert_index_data = self.data
+        return self._alert_index
+
+    def _reconcile(self, warnings):
+        """Carry unchanged alerts over from the previous data.
+        
+        Alerts are matched by warning type, Id and ValidFrom (avalanche regions
+        have one alert per day) and compared by content hash. Unchanged alerts
+        keep the previous object; if nothing changed at all, the previous list
+        itself is returned so caches keyed on it stay valid. Records the
+        changeset and bumps the generation when something changed.
+        """
+        previous = self.data or []
+        previous_by_key = {_alert_key(alert): alert for alert in previous}
+        
+        reconciled = []
+        added, changed = [], []
+        for alert in warnings:
+            key = _alert_key(alert)
+            old = previous_by_key.get(key)
+            if old is None:
+                added.append(key)
+            elif old is alert or content_hash(old) == content_hash(alert):
+                alert = old
+            else:
+                changed.append(key)
+            reconciled.append(alert)
+        
+        new_keys = {_alert_key(alert) for alert in reconciled}
+        removed = [key for key in previous_by_key if key not in new_keys]
+        
+        if not (added or changed or removed) and len(reconciled) == len(previous) and all(
+            new is old for new, old in zip(reconciled, previous)
+        ):
+            self.changeset = {"added": [], "changed": [], "removed": []}
+            return previous
+        
+        self.generation += 1
+        self.changeset = {"added": added, "changed": changed, "removed": removed}
+        _LOGGER.debug("%s warnings generation %d: %d added, %d changed, %d removed",
+                      self.warning_type, self.generation, len(added), len(changed), len(removed))
+        return reconciled
 
     # Old _fetch_warnings method removed - replaced by API classes
 
@@ -427,21 +572,17 @@ class NorwayAlertsCoordinator(DataUpdateCoordinator):
                 all_warnings.append(test_alert)
                 _LOGGER.info("Test mode: Injected fake orange %s alert", test_warning_type)
             
-            # Use API factory to get appropriate API client and fetch warnings
-            api_factory = WarningAPIFactory(
-                county_id=self.county_id, 
-                county_name=self.county_name, 
-                latitude=self.latitude,
-                longitude=self.longitude,
-                lang=self.lang,
-                test_mode=self.test_mode
-            )
-            
             # Fetch warnings for the configured warning type
-            api_client = api_factory.get_api(self.warning_type)
+            api_client = self._get_api_client()
             warnings = await api_client.fetch_warnings()
             all_warnings.extend(warnings)
-            _LOGGER.info("Fetched %d %s warnings", len(warnings), self.warning_type)
+            self.stale = api_client.stale
+            self.last_success = api_client.last_success
+            _LOGGER.info("Fetched %d %s warnings%s", len(warnings), self.warning_type,
+                         " (stale, API unavailable)" if self.stale else "")
+            
+            if not self.stale:
+                self._schedule_snapshot_save(warnings)
             
             _LOGGER.info("Total warnings fetched: %d", len(all_warnings))
             
@@ -452,15 +593,154 @@ class NorwayAlertsCoordinator(DataUpdateCoordinator):
                 warning_types_count[wtype] = warning_types_count.get(wtype, 0) + 1
             _LOGGER.info("Warning types breakdown: %s", warning_types_count)
             
+            # Keep unchanged alerts (and the list, if nothing changed) from the previous poll
+            all_warnings = self._reconcile(all_warnings)
+            
             # Send notifications if enabled
             if self.enable_notifications:
                 await self._send_notifications(all_warnings)
             
+            # Schedule the next poll from alert levels and expected publication times
+            now = dt_util.now()
+            self.update_interval = self._compute_update_interval(all_warnings, now)
+            self.next_poll = now + self.update_interval
+            _LOGGER.debug("Next %s poll in %s", self.warning_type, self.update_interval)
+            
             return all_warnings
             
         except Exception as err:
             raise UpdateFailed(f"Error fetching data: {err}")
 
+    def _compute_update_interval(self, warnings, now):
+        """Return the delay until the next poll.
+        
+        Polls every POLL_INTERVAL_ACTIVE minutes while orange or higher alerts
+        are active, every POLL_INTERVAL_NORMAL minutes for yellow alerts (or
+        while the API is failing) and backs off to max_poll_interval otherwise.
+        If a warning announces its next publication (NextWarningTime, or a day
+        after PublishTime) or a danger increase, the poll is moved to shortly
+        after that time. Regular polls are aligned to this coordinator's slot
+        and polls after a publication are spread by poll_offset, so entries do
+        not all poll at once. The result is kept within the min/max bounds.
+        """
+        highest_level = 1
+        for warning in warnings:
+            try:
+                highest_level = max(highest_level, int(warning.get("ActivityLevel", "1")))
+            except (TypeError, ValueError):
+                continue
+        
+        if highest_level >= 3:
+            interval = timedelta(minutes=POLL_INTERVAL_ACTIVE)
+        elif highest_level == 2 or self.stale:
+            interval = timedelta(minutes=POLL_INTERVAL_NORMAL)
+        else:
+            interval = self.max_poll_interval
+        interval = align_interval(interval, self.poll_offset, now)
+        
+        publish_delay = timedelta(minutes=PUBLISH_POLL_DELAY + self.poll_offset * PUBLISH_POLL_SPREAD)
+        for warning in warnings:
+            expected = [
+                self._parse_nve_time(warning.get("NextWarningTime")),
+                self._parse_nve_time(warning.get("DangerIncreaseDateTime")),
+            ]
+            if expected[0] is None:
+                # No announced next warning: NVE usually publishes at the same time each day
+                published = self._parse_nve_time(warning.get("PublishTime"))
+                if published is not None:
+                    expected[0] = published + timedelta(days=1)
+            
+            for when in expected:
+                if when is not None and when > now:
+                    interval = min(interval, when - now + publish_delay)
+        
+        return max(self.min_poll_interval, min(interval, self.max_poll_interval))
+
+    def _parse_nve_time(self, value):
+        """Parse an NVE/Met.no timestamp; values without an offset are Norwegian local time."""
+        if not value or not isinstance(value, str):
+            return None
+        parsed = dt_util.parse_datetime(value)
+        if parsed is None:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=NVE_TZ or dt_util.get_default_time_zone())
+        return parsed
+
+    def _get_api_client(self):
+        """Return the API client, creating it with the API factory on first use."""
+        if self.api_client is None:
+            api_factory = WarningAPIFactory(
+                county_id=self.county_id, 
+                county_name=self.county_name, 
+                latitude=self.latitude,
+                longitude=self.longitude,
+                lang=self.lang,
+                test_mode=self.test_mode,
+                session_provider=self.session_provider,
+                avalanche_snapshot=self.avalanche_snapshot,
+            )
+            self.api_client = api_factory.get_api(self.warning_type)
+        return self.api_client
+
+    async def async_restore_snapshot(self, max_age: timedelta) -> bool:
+        """Show the warnings saved before the last shutdown, if they are recent enough.
+        
+        Returns True if a snapshot was restored. The restored warnings are
+        marked stale until the next successful refresh, and are served by the
+        API client if that refresh fails.
+        """
+        if self.snapshot_store is None or max_age <= timedelta(0):
+            return False
+        
+        try:
+            snapshot = await self.snapshot_store.async_load()
+        except Exception as err:
+            _LOGGER.warning("Could not load saved warnings: %s", err)
+            return False
+        
+        if not snapshot:
+            return False
+        
+        if snapshot.get("query") != self._snapshot_query():
+            _LOGGER.debug("Ignoring saved warnings for another query: %s", snapshot.get("query"))
+            return False
+        
+        saved_at = dt_util.parse_datetime(snapshot.get("saved_at") or "")
+        if saved_at is None or dt_util.utcnow() - saved_at > max_age:
+            _LOGGER.debug("Ignoring saved warnings from %s (older than %s)", saved_at, max_age)
+            return False
+        
+        warnings = [warning_from_dict(warning, self.warning_type) for warning in snapshot.get("warnings", [])]
+        api_client = self._get_api_client()
+        api_client.restore_result(warnings, saved_at)
+        self.stale = api_client.stale
+        self.last_success = api_client.last_success
+        self.async_set_updated_data(self._reconcile(warnings))
+        _LOGGER.debug("Restored %d %s warnings saved at %s", len(warnings), self.warning_type, saved_at)
+        return True
+
+    def _snapshot_query(self) -> list:
+        """Return what the saved warnings depend on (a list, as it is stored as JSON)."""
+        return [self.warning_type, self.county_id, self.latitude, self.longitude, self.lang]
+
+    def _schedule_snapshot_save(self, warnings):
+        """Save the latest warnings for the next startup (batched by the store)."""
+        if self.snapshot_store is None:
+            return
+        
+        saved_at = dt_util.utcnow().isoformat()
+        
+        def _snapshot():
+            # Warnings are immutable models; save them as plain dicts
+            return {
+                "saved_at": saved_at,
+                "query": self._snapshot_query(),
+                "warnings": [dict(warning) for warning in warnings],
+            }
+        
+        self.snapshot_store.async_delay_save(_snapshot, SNAPSHOT_SAVE_DELAY)
+
     async def _send_notifications(self, current_alerts):
         """Send notifications for new or changed alerts."""
         try:
@@ -603,10 +883,15 @@ class NorwayAlertsCoordinator(DataUpdateCoordinator):
 class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
     """Representation of a Norway Alerts sensor with all alerts in attributes."""
 
-    def __init__(self, coordinator: NorwayAlertsCoordinator, entry_id: str, county_name: str, warning_type: str, municipality_filter: str, template_content: str | None, is_main: bool = True):
+    def __init__(self, coordinator: NorwayAlertsCoordinator, entry_id: str, county_name: str, warning_type: str, municipality_filter: str = "", is_main: bool = True,
+                 config_entry: ConfigEntry | None = None):
         """Initialize the sensor."""
         super().__init__(coordinator)
         
+        # The coordinator may be shared with other entries; display options and device come from our own entry
+        self._entry_id = entry_id
+        self._config_entry = config_entry
+        
         # Create sensor name based on warning type
         warning_type_label = warning_type.replace("_", " ").title()
         
@@ -625,27 +910,15 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
         self._county_name = county_name
         self._warning_type = warning_type
         self._municipality_filter = municipality_filter.strip()
+        self._matcher = MunicipalityMatcher(self._municipality_filter)  # Compiled once per sensor
         self._is_main = is_main
+        options = config_entry.options if config_entry else {}
+        self._embed_icons = options.get(CONF_EMBED_ICONS, False)  # Data URLs instead of icon URLs
         
-        # Store pre-loaded template content (loaded async in async_setup_entry)
-        self._template_content = template_content
-        self._formatted_content_template = None
-        if template_content:
-            self._compile_template(template_content)
-    
-    def _compile_template(self, template_string: str):
-        """Compile Jinja2 template from string (no file I/O)."""
-        try:
-            from jinja2 import Template
-            self._formatted_content_template = Template(template_string)
-            _LOGGER.debug("Successfully compiled formatted_content template")
-        except Exception as err:
-            _LOGGER.error(
-                "Failed to compile formatted_content template: %s. Formatted content will not be available.",
-                err,
-                exc_info=True
-            )
-            self._formatted_content_template = None
+        # State, attributes and icon computed once per coordinator update (see _materialize)
+        self._view = None
+        self._written_fingerprint = None  # Fingerprint of the last state written to HA
+        self._unsub_status_change = None  # Timer re-rendering when an alert starts or ends
     
     def _add_metalert_attributes(self, alert_dict: dict, alert: dict) -> None:
         """Add MetAlerts-specific attributes to alert dict."""
@@ -736,106 +1009,48 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
             "consequence_text": alert.get("ConsequenceText", ""),
         })
     
-    def _filter_alerts(self, alerts):
-        """Filter alerts by municipality if filter is set."""
-        if not self._municipality_filter:
-            _LOGGER.debug("No municipality filter set, returning all %d alerts", len(alerts))
-            return alerts
-        
-        _LOGGER.info("Filtering %d alerts with municipality filter: '%s'", len(alerts), self._municipality_filter)
-        
-        # Split filter by comma for multiple municipalities
-        filter_terms = [term.strip().lower() for term in self._municipality_filter.split(",")]
-        _LOGGER.debug("Filter terms: %s", filter_terms)
-        
-        filtered = []
-        for alert in alerts:
-            municipalities = alert.get("MunicipalityList", [])
-            muni_names = [m.get("Name", "").lower() for m in municipalities]
-            
-            _LOGGER.debug("Checking alert ID %s with municipalities: %s", alert.get("Id"), muni_names)
-            
-            # Check if any municipality matches any filter term
-            matches = False
-            for filter_term in filter_terms:
-                for muni_name in muni_names:
-                    if filter_term in muni_name:
-                        matches = True
-                        _LOGGER.debug("  -> MATCH: '%s' in '%s'", filter_term, muni_name)
-                        break
-                if matches:
-                    break
-            
-            if matches:
-                filtered.append(alert)
-            else:
-                _LOGGER.debug("  -> NO MATCH for alert ID %s", alert.get("Id"))
+    def _add_freshness_attributes(self, attrs: dict) -> None:
+        """Mark alerts kept from an earlier poll while the API is failing."""
+        attrs["stale"] = self.coordinator.stale
+        if self.coordinator.last_success is not None:
+            attrs["last_success"] = self.coordinator.last_success.isoformat()
+    
+    def _filter_alerts(self, index):
+        """Filter the indexed alerts by municipality if filter is set."""
+        if not self._matcher:
+            _LOGGER.debug("No municipality filter set, returning all %d alerts", len(index))
+            return index.alerts
         
-        _LOGGER.info("Filtered to %d alerts matching '%s'", len(filtered), self._municipality_filter)
+        filtered = self._matcher.filter_index(index)
+        _LOGGER.debug("Filtered %d alerts to %d matching '%s'", len(index), len(filtered), self._municipality_filter)
         return filtered
 
     def _generate_formatted_content(self, alerts):
-        """Generate markdown-formatted content for display using cached Jinja2 template.
+        """Generate markdown-formatted content for display from the shared template.
         
         Only generates content for CAP-formatted alerts (weather alerts or NVE with CAP enabled).
-        Returns None for non-CAP sensors or if template failed to load.
+        Returns None for non-CAP sensors. Alert fragments are cached by RENDERER,
+        so only new or changed alerts (or alerts whose status changed) are rendered.
         """
-        from datetime import datetime
-        
         try:
             # Only generate formatted content for CAP format sensors
             if not self.coordinator.cap_format:
                 return None
             
             # Check if template loaded successfully
-            if self._formatted_content_template is None:
+            if RENDERER.template is None:
                 _LOGGER.warning(
                     "Formatted content template not available. Check earlier logs for template loading errors."
                 )
                 return "Template not available. Check logs for errors."
             
             # Get display options from config entry
-            show_icon = self.coordinator.config_entry.options.get(CONF_SHOW_ICON, True)
-            show_status = self.coordinator.config_entry.options.get(CONF_SHOW_STATUS, True)
-            show_map = self.coordinator.config_entry.options.get(CONF_SHOW_MAP, True)
-            
-            # Enrich alerts with computed fields for template
-            enriched_alerts = []
-            for alert in alerts:
-                enriched = dict(alert)
-                
-                # Parse timestamps
-                starttime = alert.get("starttime", "")
-                endtime = alert.get("endtime", "")
-                if starttime and endtime:
-                    try:
-                        start_dt = datetime.fromisoformat(starttime.replace("Z", "+00:00"))
-                        end_dt = datetime.fromisoformat(endtime.replace("Z", "+00:00"))
-                        enriched["starttime_timestamp"] = start_dt.timestamp()
-                        enriched["endtime_timestamp"] = end_dt.timestamp()
-                        enriched["start_formatted"] = start_dt.strftime("%A, %d %B kl. %H:%M")
-                        enriched["end_formatted"] = end_dt.strftime("%A, %d %B kl. %H:%M")
-                    except (ValueError, AttributeError) as err:
-                        _LOGGER.debug("Failed to parse timestamps for alert: %s", err)
-                        pass
-                
-                # Handle area with municipality fallback
-                if not enriched.get("area") and alert.get("municipalities"):
-                    municipalities = alert["municipalities"][:5]
-                    area = ", ".join(municipalities)
-                    if len(alert["municipalities"]) > 5:
-                        area += f" (+{len(alert['municipalities']) - 5} more)"
-                    enriched["area"] = area
-                
-                enriched_alerts.append(enriched)
-            
-            # Render using cached template (no blocking I/O)
-            return self._formatted_content_template.render(
-                alerts=enriched_alerts,
-                show_icon=show_icon,
-                show_status=show_status,
-                show_map=show_map,
-                now_timestamp=datetime.now().timestamp()
+            options = self._config_entry.options if self._config_entry else {}
+            return RENDERER.render(
+                alerts,
+                show_icon=options.get(CONF_SHOW_ICON, True),
+                show_status=options.get(CONF_SHOW_STATUS, True),
+                show_map=options.get(CONF_SHOW_MAP, True),
             )
             
         except Exception as err:
@@ -859,66 +1074,98 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
         warning_type_label = self._warning_type.replace("_", " ").title()
         
         return {
-            "identifiers": {(DOMAIN, self.coordinator.config_entry.entry_id)},
+            "identifiers": {(DOMAIN, self._entry_id)},
             "name": device_name,
             "manufacturer": "NVE / Met.no",
             "model": warning_type_label,
             "entry_type": "service",
         }
 
-    @property
-    def native_value(self):
-        """Return the state of the sensor (number of active alerts)."""
-        if not self.coordinator.data:
-            return 0
-        
-        # Apply municipality filter if this is the filtered sensor
-        data_to_use = self._filter_alerts(self.coordinator.data) if self._use_filter else self.coordinator.data
-        
-        # Filter out green level (1) and unknown level (0) alerts
-        active_alerts = [
-            alert for alert in data_to_use
-            if alert.get("ActivityLevel", "1") not in ("0", "1")
-        ]
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the sensor view once for new coordinator data, then write state if it changed."""
+        self._view = self._materialize()
+        self._schedule_status_change()
+        self._async_write_if_changed()
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write state unless state, attributes, icon and availability are unchanged.
         
-        return len(active_alerts)
+        Skipping identical writes avoids another large attributes row in the recorder.
+        last_success moves forward on every successful poll, so it is left out:
+        it is written along with the next real change.
+        """
+        view = self._view
+        attributes = view["attributes"]
+        fingerprint = content_hash({
+            "state": view["native_value"],
+            "attributes": {key: value for key, value in attributes.items() if key not in VOLATILE_ATTRIBUTES},
+            "entity_picture": view["entity_picture"],
+            "available": self.available,
+        })
+        if fingerprint == self._written_fingerprint:
+            self.coordinator.write_stats["skipped"] += 1
+            return
+        self._written_fingerprint = fingerprint
+        self.coordinator.write_stats["writes"] += 1
+        self.async_write_ha_state()
 
-    @property
-    def extra_state_attributes(self):
-        """Return the state attributes with all alerts."""
-        if not self.coordinator.data:
-            base_attrs = {
-                "active_alerts": 0,
-                "highest_level": "green",
-                "highest_level_numeric": 1,
-                "alerts": [],
+    @callback
+    def _schedule_status_change(self) -> None:
+        """Re-render when an alert starts or ends, since formatted content shows its status."""
+        if self._unsub_status_change is not None:
+            self._unsub_status_change()
+            self._unsub_status_change = None
+        when = self._view.get("next_status_change")
+        if when is None or self.hass is None:
+            return
+        self._unsub_status_change = async_track_point_in_utc_time(
+            self.hass, self._handle_status_change, when + timedelta(seconds=1)
+        )
+
+    @callback
+    def _handle_status_change(self, _now) -> None:
+        """Refresh the view when an alert's status (Expected/Ongoing/Ended) changes."""
+        self._unsub_status_change = None
+        self._handle_coordinator_update()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the status timer."""
+        if self._unsub_status_change is not None:
+            self._unsub_status_change()
+            self._unsub_status_change = None
+        await super().async_will_remove_from_hass()
+
+    def _get_view(self) -> dict:
+        """Return the view of the current coordinator data, computing it if needed."""
+        view = self._view
+        if view is None or view["data"] is not self.coordinator.data:
+            view = self._view = self._materialize()
+        return view
+
+    def _materialize(self) -> dict:
+        """Compute state, attributes and icon from the coordinator data.
+        
+        HA reads native_value, extra_state_attributes and entity_picture on
+        every state write, so filtering, CAP conversion and template rendering
+        run here once per update instead of in each property.
+        """
+        data = self.coordinator.data
+        if not data:
+            return {
+                "data": data,
+                "native_value": 0,
+                "attributes": self._build_empty_attributes(),
+                "entity_picture": None,
             }
-            
-            # Add location-specific attributes
-            if self.coordinator.county_id:
-                # County-based (NVE) attributes
-                base_attrs.update({
-                    "county_name": self._county_name,
-                    "county_id": self.coordinator.county_id,
-                    "municipality_filter": self._municipality_filter if self._use_filter else None,
-                })
-            else:
-                # Coordinate-based (Met.no) attributes
-                base_attrs.update({
-                    "latitude": self.coordinator.latitude,
-                    "longitude": self.coordinator.longitude,
-                })
-            
-            return base_attrs
         
-        # Apply municipality filter if this is the filtered sensor
-        data_to_use = self._filter_alerts(self.coordinator.data) if self._use_filter else self.coordinator.data
+        # Apply municipality filter if this is the filtered sensor (index is built once per data version)
+        index = self.coordinator.alert_index
+        data_to_use = self._filter_alerts(index) if self._use_filter else data
         
         # Filter out green level (1) and unknown level (0) alerts
-        active_alerts = [
-            alert for alert in data_to_use
-            if alert.get("ActivityLevel", "1") not in ("0", "1")
-        ]
+        active_alerts = [alert for alert in data_to_use if is_active(alert)]
         
         # Determine highest level
         if active_alerts:
@@ -926,9 +1173,67 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
         else:
             max_level = 1
         
+        attributes = self._build_attributes(active_alerts, max_level, index)
+        return {
+            "data": data,
+            "native_value": len(active_alerts),
+            "attributes": attributes,
+            "entity_picture": self._build_entity_picture(data, max_level),
+            "next_status_change": (
+                _next_status_change(attributes["alerts"]) if attributes.get("formatted_content") else None
+            ),
+        }
+
+    @property
+    def native_value(self):
+        """Return the state of the sensor (number of active alerts)."""
+        return self._get_view()["native_value"]
+
+    @property
+    def extra_state_attributes(self):
+        """Return the state attributes with all alerts."""
+        return self._get_view()["attributes"]
+
+    @property
+    def entity_picture(self):
+        """Return the Yr.no warning icon based on warning type and level."""
+        return self._get_view()["entity_picture"]
+
+    def _build_empty_attributes(self) -> dict:
+        """Return the state attributes when there is no data."""
+        base_attrs = {
+            "active_alerts": 0,
+            "highest_level": "green",
+            "highest_level_numeric": 1,
+            "alerts": [],
+        }
+        
+        # Add location-specific attributes
+        if self.coordinator.county_id:
+            # County-based (NVE) attributes
+            base_attrs.update({
+                "county_name": self._county_name,
+                "county_id": self.coordinator.county_id,
+                "municipality_filter": self._municipality_filter if self._use_filter else None,
+            })
+        else:
+            # Coordinate-based (Met.no) attributes
+            base_attrs.update({
+                "latitude": self.coordinator.latitude,
+                "longitude": self.coordinator.longitude,
+            })
+        
+        self._add_freshness_attributes(base_attrs)
+        return base_attrs
+
+    def _build_attributes(self, active_alerts: list, max_level: int, index: AlertIndex) -> dict:
+        """Return the state attributes for the active alerts."""
         # Build alerts array - deduplicate by master_id to avoid showing same warning multiple times
         alerts_dict = {}  # Use dict with master_id as key to deduplicate
         
+        # Alerts sharing a master_id are one warning: merge municipalities over the alerts this sensor shows
+        merged = merge_municipalities(active_alerts) if self._use_filter else index.merged
+        
         for alert in active_alerts:
             # NVE API may have multiple ID fields - try to find the correct one for Varsom.no URL
             forecast_id = alert.get("Id", "")
@@ -967,26 +1272,10 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
             # Get municipality list
             municipalities = [m.get("Name", "") for m in alert.get("MunicipalityList", [])]
             
-            # Check if we already have an alert with this master_id
-            if url_id in alerts_dict:
-                # Merge municipality lists (avoid duplicates)
-                existing_munis = set(alerts_dict[url_id]["municipalities"])
-                existing_munis.update(municipalities)
-                alerts_dict[url_id]["municipalities"] = sorted(list(existing_munis))
-                _LOGGER.debug("Merged duplicate alert %s, municipalities now: %s", url_id, alerts_dict[url_id]["municipalities"])
-            else:
+            if url_id not in alerts_dict:
                 # Generate individual icon for this alert
                 level_color = ACTIVITY_LEVEL_NAMES.get(activity_level, "green")
-                if warning_type and level_color != "green":
-                    icon_key = f"{warning_type}-{level_color}"
-                    # Try to get icon, fall back to generic if not found
-                    individual_icon = ICON_DATA_URLS.get(icon_key)
-                    if not individual_icon:
-                        generic_key = f"generic-{level_color}"
-                        individual_icon = ICON_DATA_URLS.get(generic_key)
-                        _LOGGER.debug("Icon not found for %s, using %s", icon_key, generic_key)
-                else:
-                    individual_icon = None
+                individual_icon = icon_url(warning_type, level_color, self._embed_icons)
                 
                 # Detect MetAlerts by presence of CAP-specific 'event' field
                 is_metalert = "event" in alert and "awareness_level" in alert
@@ -994,8 +1283,7 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
                 # If CAP format is enabled and this is an NVE warning, convert it
                 if self.coordinator.cap_format and not is_metalert:
                     # Convert NVE format to CAP format for unified display
-                    alert["entity_picture"] = individual_icon  # Add icon before conversion
-                    alert_dict = convert_nve_to_cap(alert, warning_type, self.coordinator.lang)
+                    alert_dict = CAP_CACHE.convert(alert, warning_type, self.coordinator.lang, individual_icon)
                 else:
                     # Use native format (either MetAlerts CAP or NVE native)
                     # Create base dict with common fields
@@ -1017,6 +1305,10 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
                     else:
                         self._add_nve_generic_attributes(alert_dict, alert, master_id, municipalities, varsom_url)
                 
+                if url_id in merged:
+                    # Copy: CAP dicts are shared through CAP_CACHE
+                    alert_dict = {**alert_dict, "municipalities": list(merged[url_id])}
+                
                 alerts_dict[url_id] = alert_dict
         
         # Convert dict back to list
@@ -1048,36 +1340,43 @@ class NorwayAlertsSensor(CoordinatorEntity, SensorEntity):
                 "longitude": self.coordinator.longitude,
             })
         
+        self._add_freshness_attributes(result)
         return result
 
-    @property
-    def entity_picture(self):
-        """Return embedded Yr.no warning icon based on warning type and level."""
-        state = self.native_value
-        
+    def _build_entity_picture(self, data: list, max_level: int):
+        """Return the icon for the highest active level and the warning type of the data."""
         # Determine warning type from coordinator data
         warning_type = None
-        if self.coordinator.data:
-            for alert in self.coordinator.data:
-                alert_warning_type = alert.get("_warning_type", "")
-                if alert_warning_type:
-                    warning_type = alert_warning_type
-                    break
-        
-        # Map level to color
-        level_color = ACTIVITY_LEVEL_NAMES.get(state)
+        for alert in data:
+            alert_warning_type = alert.get("_warning_type", "")
+            if alert_warning_type:
+                warning_type = alert_warning_type
+                break
         
-        if not level_color or level_color == "green" or not warning_type:
-            return None
-        
-        # Get base64 encoded SVG from const
-        icon_key = f"{warning_type}-{level_color}"
-        icon = ICON_DATA_URLS.get(icon_key)
-        
-        # Fall back to generic icon if specific type not found
-        if not icon:
-            generic_key = f"generic-{level_color}"
-            icon = ICON_DATA_URLS.get(generic_key)
-            _LOGGER.debug("Icon not found for %s, using %s", icon_key, generic_key)
-        
-        return icon
+        # Map level to color (no icon for green)
+        level_color = ACTIVITY_LEVEL_NAMES.get(str(max_level))
+        return icon_url(warning_type, level_color, self._embed_icons)
+
+
+class NorwayAlertsLeanSensor(NorwayAlertsSensor):
+    """Norway Alerts sensor in lean attributes mode.
+    
+    The alert details, formatted content and freshness attributes stay in the
+    state (for cards) but are not recorded, so history only keeps counts, the
+    highest level and the alert IDs. Full details are available from the get_alerts service.
+    """
+    
+    # Freshness changes with every poll and would add an attributes row each time
+    _unrecorded_attributes = frozenset({"alerts", "formatted_content", "last_success", "stale"})
+    
+    def _build_empty_attributes(self) -> dict:
+        """Return the state attributes when there is no data, with alert IDs."""
+        attrs = super()._build_empty_attributes()
+        attrs["alert_ids"] = []
+        return attrs
+    
+    def _build_attributes(self, active_alerts: list, max_level: int, index: AlertIndex) -> dict:
+        """Return the state attributes for the active alerts, with alert IDs."""
+        attrs = super()._build_attributes(active_alerts, max_level, index)
+        attrs["alert_ids"] = [alert.get("id") for alert in attrs["alerts"]]
+        return attrs
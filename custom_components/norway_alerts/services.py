@@ -0,0 +1,86 @@
+"""Service and websocket command returning full alert details on demand.
+
+Both read the coordinators' in-memory data, so dashboards and automations can
+get every field of an alert even when lean attributes mode keeps the details
+out of the sensor history.
+"""
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
+from homeassistant.exceptions import ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import (
+    DOMAIN,
+    SERVICE_GET_ALERTS,
+    WS_TYPE_ALERTS,
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_ALERT_ID,
+)
+
+GET_ALERTS_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_ALERT_ID): cv.string,
+})
+
+
+def async_get_alert_details(hass: HomeAssistant, entry_id: str | None = None,
+                            alert_id: str | None = None) -> dict[str, Any]:
+    """Return the current alerts of one or all loaded entries with all their fields."""
+    domain_data = hass.data.get(DOMAIN, {})
+    entries = [
+        entry for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.entry_id in domain_data and (entry_id is None or entry.entry_id == entry_id)
+    ]
+    if entry_id is not None and not entries:
+        raise ServiceValidationError(f"No loaded Norway Alerts entry with ID {entry_id}")
+
+    result = {}
+    for entry in entries:
+        coordinator = domain_data[entry.entry_id]
+        result[entry.entry_id] = {
+            "title": entry.title,
+            "warning_type": coordinator.warning_type,
+            "generation": coordinator.generation,
+            "stale": coordinator.stale,
+            "last_success": coordinator.last_success.isoformat() if coordinator.last_success else None,
+            "alerts": [
+                dict(alert) for alert in coordinator.data or []
+                if alert_id is None or str(alert.get("Id")) == alert_id
+            ],
+        }
+    return {"entries": result}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the get_alerts service and websocket command."""
+
+    async def _async_get_alerts(call: ServiceCall) -> ServiceResponse:
+        return async_get_alert_details(hass, call.data.get(ATTR_CONFIG_ENTRY_ID), call.data.get(ATTR_ALERT_ID))
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_GET_ALERTS, _async_get_alerts,
+        schema=GET_ALERTS_SCHEMA, supports_response=SupportsResponse.ONLY,
+    )
+    websocket_api.async_register_command(hass, websocket_get_alerts)
+
+
+@websocket_api.websocket_command({
+    vol.Required("type"): WS_TYPE_ALERTS,
+    vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    vol.Optional(ATTR_ALERT_ID): cv.string,
+})
+@callback
+def websocket_get_alerts(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict) -> None:
+    """Send the full details of the current alerts."""
+    try:
+        details = async_get_alert_details(hass, msg.get(ATTR_CONFIG_ENTRY_ID), msg.get(ATTR_ALERT_ID))
+    except ServiceValidationError as err:
+        connection.send_error(msg["id"], websocket_api.ERR_NOT_FOUND, str(err))
+        return
+    connection.send_result(msg["id"], details)
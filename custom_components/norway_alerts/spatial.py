@@ -0,0 +1,324 @@
+"""Coordinate conversion and spatial indexes for boundary lookups.
+
+Pure Python (no shapely/pyproj), so lookups work without extra requirements:
+- UTM zone 33N (EPSG:25833, the CRS of Kartverket's boundary data) to and from
+  WGS84 with Krüger's series, accurate to well below a millimetre in Norway
+- PolygonShape: exact point-in-polygon with edges bucketed into horizontal
+  bands, so a test only looks at the few edges near the point
+- STRtree: Sort-Tile-Recursive packed R-tree of bounding boxes
+- GridIndex: uniform grid over polygons; most cells resolve a point without
+  any polygon test
+"""
+
+from array import array
+from math import asin, atan2, atanh, ceil, cos, cosh, degrees, radians, sin, sinh, sqrt
+from typing import Any, Iterator, Sequence
+
+# Transverse Mercator series of Karney (2011), "Transverse Mercator with an accuracy of a few nanometers"
+# GRS80 ellipsoid (ETRS89 and WGS84 differ by well under a metre in Norway)
+_A = 6378137.0
+_F = 1 / 298.257222101
+_K0 = 0.9996
+_FALSE_EASTING = 500000.0
+_LON0 = radians(15.0)  # Central meridian of UTM zone 33
+
+_N = _F / (2 - _F)
+_SCALE = _K0 * _A / (1 + _N) * (1 + _N ** 2 / 4 + _N ** 4 / 64)
+_E2N = 2 * sqrt(_N) / (1 + _N)  # Eccentricity
+_ALPHA = (
+    _N / 2 - 2 * _N ** 2 / 3 + 5 * _N ** 3 / 16 + 41 * _N ** 4 / 180,
+    13 * _N ** 2 / 48 - 3 * _N ** 3 / 5 + 557 * _N ** 4 / 1440,
+    61 * _N ** 3 / 240 - 103 * _N ** 4 / 140,
+    49561 * _N ** 4 / 161280,
+)
+_BETA = (
+    _N / 2 - 2 * _N ** 2 / 3 + 37 * _N ** 3 / 96 - _N ** 4 / 360,
+    _N ** 2 / 48 + _N ** 3 / 15 - 437 * _N ** 4 / 1440,
+    17 * _N ** 3 / 480 - 37 * _N ** 4 / 840,
+    4397 * _N ** 4 / 161280,
+)
+_DELTA = (
+    2 * _N - 2 * _N ** 2 / 3 - 2 * _N ** 3 + 116 * _N ** 4 / 45,
+    7 * _N ** 2 / 3 - 8 * _N ** 3 / 5 - 227 * _N ** 4 / 45,
+    56 * _N ** 3 / 15 - 136 * _N ** 4 / 35,
+    4279 * _N ** 4 / 630,
+)
+
+EDGES_PER_BAND = 8  # Average edges per band of a PolygonShape
+NODE_CAPACITY = 16  # Children per STRtree node
+GRID_CELLS = 65536  # Approximate number of cells of a GridIndex
+
+
+def utm33_from_wgs84(latitude: float, longitude: float) -> tuple[float, float]:
+    """Return the EPSG:25833 (easting, northing) of a WGS84 latitude/longitude."""
+    phi = radians(latitude)
+    lam = radians(longitude) - _LON0
+    sin_phi = sin(phi)
+    t = sinh(atanh(sin_phi) - _E2N * atanh(_E2N * sin_phi))
+    xi = atan2(t, cos(lam))
+    eta = atanh(sin(lam) / sqrt(1 + t * t))
+    easting = eta
+    northing = xi
+    for j, alpha in enumerate(_ALPHA, 1):
+        easting += alpha * cos(2 * j * xi) * sinh(2 * j * eta)
+        northing += alpha * sin(2 * j * xi) * cosh(2 * j * eta)
+    return _FALSE_EASTING + _SCALE * easting, _SCALE * northing
+
+
+def wgs84_from_utm33(easting: float, northing: float) -> tuple[float, float]:
+    """Return the WGS84 (latitude, longitude) of an EPSG:25833 easting/northing."""
+    xi = northing / _SCALE
+    eta = (easting - _FALSE_EASTING) / _SCALE
+    xi_prime = xi
+    eta_prime = eta
+    for j, beta in enumerate(_BETA, 1):
+        xi_prime -= beta * sin(2 * j * xi) * cosh(2 * j * eta)
+        eta_prime -= beta * cos(2 * j * xi) * sinh(2 * j * eta)
+    chi = asin(sin(xi_prime) / cosh(eta_prime))
+    phi = chi
+    for j, delta in enumerate(_DELTA, 1):
+        phi += delta * sin(2 * j * chi)
+    return degrees(phi), degrees(_LON0 + atan2(sinh(eta_prime), cos(xi_prime)))
+
+
+class PolygonShape:
+    """Polygon (outer ring and holes) with exact point-in-polygon tests.
+
+    Edges are bucketed into horizontal bands; a horizontal ray from the point
+    only crosses edges in the point's band, so a test checks a handful of
+    edges instead of every vertex of a large county outline.
+    """
+
+    __slots__ = ("bbox", "value", "_min_y", "_band_height", "_bands")
+
+    def __init__(self, rings: Sequence[Sequence[Sequence[float]]], value: Any):
+        edges = []
+        xs = []
+        ys = []
+        for ring in rings:
+            points = [(point[0], point[1]) for point in ring]
+            if points and points[0] != points[-1]:
+                points.append(points[0])  # Close the ring
+            # Horizontal edges never cross the ray but are kept for edges()
+            edges.extend((x1, y1, x2, y2) for (x1, y1), (x2, y2) in zip(points, points[1:]))
+            xs.extend(x for x, _ in points)
+            ys.extend(y for _, y in points)
+        self.bbox = (min(xs), min(ys), max(xs), max(ys))
+        self.value = value
+
+        self._min_y = self.bbox[1]
+        band_count = max(1, ceil(len(edges) / EDGES_PER_BAND))
+        self._band_height = (self.bbox[3] - self._min_y) / band_count or 1.0
+        bands = self._bands = [array("d") for _ in range(band_count)]
+        for edge in edges:
+            _, y1, _, y2 = edge
+            for band in range(self._band(min(y1, y2)), self._band(max(y1, y2)) + 1):
+                bands[band].extend(edge)
+
+    def _band(self, y: float) -> int:
+        """Return the band of a y coordinate within the bounding box."""
+        return min(int((y - self._min_y) / self._band_height), len(self._bands) - 1)
+
+    def contains(self, x: float, y: float) -> bool:
+        """Return True if the point is inside the polygon (even-odd rule, so holes are excluded)."""
+        min_x, min_y, max_x, max_y = self.bbox
+        if not (min_x <= x <= max_x and min_y <= y <= max_y):
+            return False
+        edges = self._bands[min(int((y - self._min_y) / self._band_height), len(self._bands) - 1)]
+        inside = False
+        for i in range(0, len(edges), 4):
+            y1 = edges[i + 1]
+            y2 = edges[i + 3]
+            if (y1 > y) != (y2 > y):
+                x1 = edges[i]
+                if x < x1 + (y - y1) * (edges[i + 2] - x1) / (y2 - y1):
+                    inside = not inside
+        return inside
+
+    def edges(self) -> Iterator[tuple[float, float, float, float]]:
+        """Yield every edge (x1, y1, x2, y2) once."""
+        for band, edges in enumerate(self._bands):
+            for i in range(0, len(edges), 4):
+                # Edges spanning several bands are yielded from their first band
+                if self._band(min(edges[i + 1], edges[i + 3])) == band:
+                    yield edges[i], edges[i + 1], edges[i + 2], edges[i + 3]
+
+
+class STRtree:
+    """Static R-tree of bounding boxes packed with Sort-Tile-Recursive.
+
+    Items are (bbox, value) with bbox = (min_x, min_y, max_x, max_y). The tree
+    is stored as levels of node boxes with child ranges, leaves first.
+    """
+
+    def __init__(self, items: Sequence[tuple[tuple[float, float, float, float], Any]],
+                 node_capacity: int = NODE_CAPACITY):
+        entries = _str_order(list(items), node_capacity)
+        self._values = [value for _, value in entries]
+        self._boxes = [bbox for bbox, _ in entries]
+        # Each level: list of (bbox, first child, end child) over the level below (leaves for level 0)
+        self._levels: list[list[tuple]] = []
+        boxes = self._boxes
+        while True:
+            nodes = [
+                (_union(boxes[start:start + node_capacity]), start, min(start + node_capacity, len(boxes)))
+                for start in range(0, len(boxes), node_capacity)
+            ]
+            if len(nodes) > 1:
+                # Order nodes like the leaves, so the parents' child ranges are compact too
+                nodes = [node for _, node in _str_order([(node[0], node) for node in nodes], node_capacity)]
+            self._levels.append(nodes)
+            if len(nodes) <= 1:
+                break
+            boxes = [node[0] for node in nodes]
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def query_point(self, x: float, y: float) -> Iterator[Any]:
+        """Yield the values whose bounding box contains the point."""
+        if not self._values:
+            return
+        top = len(self._levels) - 1
+        stack = [(top, 0, len(self._levels[top]))]
+        while stack:
+            level, start, end = stack.pop()
+            if level < 0:
+                for i in range(start, end):
+                    min_x, min_y, max_x, max_y = self._boxes[i]
+                    if min_x <= x <= max_x and min_y <= y <= max_y:
+                        yield self._values[i]
+                continue
+            for (min_x, min_y, max_x, max_y), first, last in self._levels[level][start:end]:
+                if min_x <= x <= max_x and min_y <= y <= max_y:
+                    stack.append((level - 1, first, last))
+
+
+class GridIndex:
+    """Uniform grid over polygons for point lookups in (nearly) constant time.
+
+    Each cell holds one of:
+    - None: no polygon covers any part of the cell
+    - a PolygonShape: the whole cell lies inside this one polygon (fast path, no test needed)
+    - a tuple of PolygonShapes: candidates to test exactly, for cells crossed by
+      boundaries (or covered by overlapping polygons)
+
+    Cells crossed by boundaries are found from the polygon edges. Along a row,
+    the polygons covering the other cells only change at such a cell, so each
+    run of them is classified with one exact test through an STRtree.
+    """
+
+    def __init__(self, shapes: Sequence[PolygonShape], cell_count: int = GRID_CELLS):
+        self.shapes = list(shapes)
+        if not self.shapes:
+            self._min_x = self._min_y = 0.0
+            self._size = 1.0
+            self._columns = self._rows = 0
+            self._cells: list = []
+            return
+
+        self._min_x, self._min_y, max_x, max_y = _union([shape.bbox for shape in self.shapes])
+        width = max_x - self._min_x
+        height = max_y - self._min_y
+        self._size = sqrt(width * height / cell_count) or max(width, height) / cell_count or 1.0
+        self._columns = int(width / self._size) + 1
+        self._rows = int(height / self._size) + 1
+
+        # Cells crossed by the edges of each polygon (edge bounding boxes, so possibly a few more)
+        crossing: dict[int, list] = {}
+        for shape in self.shapes:
+            for x1, y1, x2, y2 in shape.edges():
+                first_column, last_column = self._span(min(x1, x2), max(x1, x2), self._min_x, self._columns)
+                first_row, last_row = self._span(min(y1, y2), max(y1, y2), self._min_y, self._rows)
+                for row in range(first_row, last_row + 1):
+                    for column in range(first_column, last_column + 1):
+                        cell_shapes = crossing.setdefault(row * self._columns + column, [])
+                        if not cell_shapes or cell_shapes[-1] is not shape:
+                            cell_shapes.append(shape)
+
+        tree = STRtree([(shape.bbox, shape) for shape in self.shapes])
+
+        def _containing(x: float, y: float) -> list:
+            return [shape for shape in tree.query_point(x, y) if shape.contains(x, y)]
+
+        cells = self._cells = [None] * (self._columns * self._rows)
+        for row in range(self._rows):
+            y = self._min_y + (row + 0.5) * self._size
+            run = None  # Polygons covering the current run of cells crossed by no boundary
+            for column in range(self._columns):
+                x = self._min_x + (column + 0.5) * self._size
+                cell = row * self._columns + column
+                cell_shapes = crossing.get(cell)
+                if cell_shapes is not None:
+                    run = None
+                    # Polygons containing the centre but not crossing the cell cover all of it
+                    cells[cell] = tuple(cell_shapes + [
+                        shape for shape in _containing(x, y) if shape not in cell_shapes
+                    ])
+                    continue
+                if run is None:
+                    run = _containing(x, y)
+                cells[cell] = (run[0] if len(run) == 1 else tuple(run)) if run else None
+
+    def _span(self, low: float, high: float, origin: float, count: int) -> tuple[int, int]:
+        """Return the first and last cell index along one axis covering [low, high]."""
+        # A boundary exactly on a cell border belongs to the cells on both sides
+        first = int(max(0.0, (low - origin) / self._size - 1e-9))
+        last = int(min(count - 1.0, (high - origin) / self._size + 1e-9))
+        return first, last
+
+    @property
+    def single_polygon_cells(self) -> int:
+        """Return the number of cells resolved without a polygon test."""
+        return sum(1 for cell in self._cells if isinstance(cell, PolygonShape))
+
+    def _cell(self, x: float, y: float):
+        """Return the content of the cell containing the point (None outside the grid)."""
+        column = (x - self._min_x) / self._size
+        row = (y - self._min_y) / self._size
+        if not (0 <= column < self._columns and 0 <= row < self._rows):
+            return None
+        return self._cells[int(row) * self._columns + int(column)]
+
+    def lookup(self, x: float, y: float) -> Any:
+        """Return the value of a polygon containing the point, or None."""
+        cell = self._cell(x, y)
+        if cell is None:
+            return None
+        if isinstance(cell, PolygonShape):
+            return cell.value
+        for shape in cell:
+            if shape.contains(x, y):
+                return shape.value
+        return None
+
+    def candidates(self, x: float, y: float) -> tuple:
+        """Return the polygons that may contain the point, including those it lies on the boundary of."""
+        cell = self._cell(x, y)
+        if cell is None:
+            return ()
+        if isinstance(cell, PolygonShape):
+            return (cell,)
+        return cell
+
+
+def _union(boxes: Sequence[tuple[float, float, float, float]]) -> tuple[float, float, float, float]:
+    """Return the bounding box of boxes."""
+    return (
+        min(box[0] for box in boxes), min(box[1] for box in boxes),
+        max(box[2] for box in boxes), max(box[3] for box in boxes),
+    )
+
+
+def _str_order(entries: list, capacity: int) -> list:
+    """Order (bbox, value) entries so consecutive runs of capacity form compact nodes."""
+    node_count = ceil(len(entries) / capacity)
+    slice_count = max(1, ceil(sqrt(node_count)))
+    slice_size = slice_count * capacity
+    entries.sort(key=lambda entry: entry[0][0] + entry[0][2])
+    ordered = []
+    for start in range(0, len(entries), slice_size):
+        vertical_slice = entries[start:start + slice_size]
+        vertical_slice.sort(key=lambda entry: entry[0][1] + entry[0][3])
+        ordered.extend(vertical_slice)
+    return ordered
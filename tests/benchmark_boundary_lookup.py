@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Benchmark point lookups in the boundary indexes.
+
+Looks up 1,000,000 random coordinates inside Norway's bounding box and
+compares, for the bundled Fylker (county) polygons, a linear scan of every
+polygon, the STR-packed R-tree and the GridIndex used by BoundaryIndex. All
+indexes are checked to return the same results.
+
+Run from the repository root (requires Home Assistant to be installed):
+    python tests/benchmark_boundary_lookup.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.norway_alerts.municipality_lookup import load_geojson_boundaries  # noqa: E402
+from custom_components.norway_alerts.spatial import STRtree, utm33_from_wgs84  # noqa: E402
+
+FYLKER_ZIP = os.path.join(
+    os.path.dirname(__file__), "..", "municipalities", "Basisdata_0000_Norge_25833_Fylker_GeoJSON.zip"
+)
+POINTS = 1_000_000
+LATITUDES = (57.9, 71.2)
+LONGITUDES = (4.5, 31.2)
+
+
+def _timed(name: str, lookup, points: list) -> list:
+    """Look up every point, print the time per lookup and return the results."""
+    start = time.perf_counter()
+    results = [lookup(x, y) for x, y in points]
+    elapsed = time.perf_counter() - start
+    print(f"  {name:<28} {elapsed:6.2f} s  {elapsed / len(points) * 1e6:6.2f} µs/lookup")
+    return results
+
+
+def main() -> None:
+    rng = random.Random(1)
+    coordinates = [(rng.uniform(*LATITUDES), rng.uniform(*LONGITUDES)) for _ in range(POINTS)]
+
+    start = time.perf_counter()
+    index = load_geojson_boundaries(FYLKER_ZIP)
+    print(f"Loaded {len(index)} county polygons in {time.perf_counter() - start:.2f} s")
+    grid = index._grid
+    cells = len(grid._cells)
+    empty = sum(cell is None for cell in grid._cells)
+    print(
+        f"  grid: {cells} cells, {empty / cells:.0%} empty, "
+        f"{grid.single_polygon_cells / cells:.0%} inside one polygon (no test needed)"
+    )
+
+    # Project once so the county timings compare the indexes only
+    projected = [utm33_from_wgs84(latitude, longitude) for latitude, longitude in coordinates]
+    tree = STRtree([(shape.bbox, shape) for shape in grid.shapes])
+
+    def scan(x, y):
+        for shape in grid.shapes:
+            if shape.contains(x, y):
+                return shape.value
+        return None
+
+    def rtree(x, y):
+        for shape in tree.query_point(x, y):
+            if shape.contains(x, y):
+                return shape.value
+        return None
+
+    print(f"County lookups, {POINTS:,} random points in Norway's bounding box (EPSG:25833)")
+    expected = _timed("linear scan", scan, projected)
+    assert _timed("R-tree", rtree, projected) == expected
+    assert _timed("grid", grid.lookup, projected) == expected
+    print(f"  {sum(result is not None for result in expected):,} points inside a county")
+
+
+if __name__ == "__main__":
+    main()
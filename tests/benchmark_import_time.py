@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark import time of the integration's modules.
+
+Imports the integration in fresh interpreters with ``-X importtime`` (the way
+Home Assistant loads it) and reports the time spent in each of its own
+modules, excluding Home Assistant and other dependencies. Also reports the
+import time and memory of const.py on its own, which used to hold every
+warning icon as a base64 string.
+
+Run from the repository root (requires Home Assistant to be installed):
+    python tests/benchmark_import_time.py
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(__file__), "..")
+PACKAGE = "custom_components.norway_alerts"
+RUNS = 5
+
+# const.py has no imports, so it can be loaded without the package (and Home Assistant)
+CONST_ONLY = f"""
+import importlib.util, time, tracemalloc
+spec = importlib.util.spec_from_file_location("const", "{PACKAGE.replace('.', '/')}/const.py")
+module = importlib.util.module_from_spec(spec)
+tracemalloc.start()
+start = time.perf_counter()
+spec.loader.exec_module(module)
+print(time.perf_counter() - start, tracemalloc.get_traced_memory()[0])
+"""
+
+
+def _module_times() -> dict[str, int]:
+    """Return the self import time in microseconds of each integration module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {PACKAGE}"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if name.startswith(PACKAGE):
+            times[name] = int(self_us)
+    return times
+
+
+def _const_only() -> tuple[float, int]:
+    """Return (seconds, bytes retained) to load const.py on its own."""
+    result = subprocess.run(
+        [sys.executable, "-c", CONST_ONLY], cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    seconds, allocated = result.stdout.split()
+    return float(seconds), int(allocated)
+
+
+def main() -> None:
+    runs = [_module_times() for _ in range(RUNS)]
+    print(f"Import time of the integration's modules (median of {RUNS} fresh interpreters)")
+    for name in runs[0]:
+        median = statistics.median(run.get(name, 0) for run in runs)
+        print(f"  {name:<45} {median / 1000:7.2f} ms")
+    total = statistics.median(sum(run.values()) for run in runs)
+    print(f"  {'total':<45} {total / 1000:7.2f} ms")
+
+    consts = [_const_only() for _ in range(RUNS)]
+    seconds = statistics.median(seconds for seconds, _ in consts)
+    allocated = statistics.median(allocated for _, allocated in consts)
+    print(f"const.py alone: {seconds * 1000:.2f} ms, {allocated / 1024:.0f} KiB retained")
+
+
+if __name__ == "__main__":
+    main()
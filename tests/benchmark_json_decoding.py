@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Benchmark JSON decoding of avalanche Detail payloads.
+
+Compares the previous path (aiohttp's response.json(): bytes -> str -> stdlib
+json) with the raw-bytes decoder used by the API clients (orjson when
+installed), and times conversion of the decoded payload.
+
+Run from the repository root (requires Home Assistant to be installed):
+    python tests/benchmark_json_decoding.py
+"""
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.norway_alerts import api  # noqa: E402
+from custom_components.norway_alerts.api import AvalancheAPI, _json_loads  # noqa: E402
+
+REGIONS = 25
+ROUNDS = 200
+
+
+def _make_payload() -> bytes:
+    """Build a nationwide set of Detail payloads similar in size to the real API."""
+    long_text = "Det er betydelig snøskredfare i området. " * 40
+    regions = []
+    for region_id in range(3001, 3001 + REGIONS):
+        regions.append({
+            "RegionId": region_id,
+            "RegionName": f"Region {region_id}",
+            "DangerLevel": 3,
+            "ValidFrom": "2024-01-01T00:00:00",
+            "ValidTo": "2024-01-01T23:59:59",
+            "PublishTime": "2023-12-31T16:00:00",
+            "MainText": long_text[:200],
+            "AvalancheDanger": long_text,
+            "SnowSurface": long_text,
+            "CurrentWeaklayers": long_text,
+            "LatestAvalancheActivity": long_text,
+            "LatestObservations": long_text,
+            "CountyList": [{"Id": "46", "Name": "Vestland"}],
+            "MunicipalityList": [
+                {"Id": str(4600 + i), "Name": f"Kommune {i}", "CountyId": "46", "CountyName": "Vestland"}
+                for i in range(12)
+            ],
+            "AvalancheProblems": [
+                {
+                    "AvalancheProblemId": i,
+                    "AvalancheExtName": "Tørre flakskred",
+                    "AvalCauseName": "Nedføyket svakt lag med nysnø",
+                    "ExposedHeight1": 600,
+                    "ValidExpositions": "11111111",
+                    "AvalancheProblemTypeName": "Vindtransportert snø",
+                }
+                for i in range(3)
+            ],
+            "MountainWeather": {
+                "MeasurementTypes": [
+                    {"Name": "Wind", "Speed": "Liten kuling", "Direction": "SV"},
+                    {"Name": "Temperature", "Value": "-6"},
+                    {"Name": "Precipitation", "Value": "10"},
+                ]
+            },
+        })
+    return json.dumps(regions, ensure_ascii=False).encode("utf-8")
+
+
+def main() -> None:
+    raw = _make_payload()
+    avalanche = AvalancheAPI(county_id="46", county_name="Vestland")
+    decoded = _json_loads(raw)
+
+    cases = {
+        "stdlib json (bytes -> str -> json)": lambda: json.loads(raw.decode("utf-8")),
+        f"raw bytes decoder ({'orjson' if api.orjson else 'stdlib json'})": lambda: _json_loads(raw),
+        "convert decoded regions": lambda: [avalanche._convert_region_warning(w) for w in decoded],
+    }
+
+    print(f"Payload: {REGIONS} regions, {len(raw) / 1024:.0f} KiB, {ROUNDS} rounds")
+    for name, func in cases.items():
+        elapsed = timeit.timeit(func, number=ROUNDS)
+        print(f"  {name:40s} {elapsed / ROUNDS * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
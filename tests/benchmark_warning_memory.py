@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Benchmark memory held by converted warnings.
+
+Decodes 1,000 landslide warnings the way the API returns them and compares
+the memory retained by plain dicts (the previous representation) with the
+slotted WarningModel objects built by the API clients, which intern short
+strings and share municipality/county entries between warnings.
+
+Run from the repository root (requires Home Assistant to be installed):
+    python tests/benchmark_warning_memory.py
+"""
+
+import gc
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.norway_alerts.models import NveWarningModel  # noqa: E402
+
+ALERTS = 1000
+MUNICIPALITIES_PER_ALERT = 12
+MUNICIPALITY_POOL = 60
+
+
+def _make_payload() -> bytes:
+    """Build a landslide API response with realistic field sizes."""
+    warnings = []
+    for alert_id in range(ALERTS):
+        first = alert_id % MUNICIPALITY_POOL
+        warnings.append({
+            "Id": 100000 + alert_id,
+            "MasterId": 200000 + alert_id // 4,
+            "ActivityLevel": str(2 + alert_id % 2),
+            "DangerLevel": "Moderat",
+            "DangerTypeName": "Jordskred",
+            "DangerIncreaseDateTime": None,
+            "DangerDecreaseDateTime": None,
+            "MainText": "Moderat fare for jordskred i deler av Vestland.",
+            "WarningText": "Det er ventet mye regn. " * 6,
+            "AdviceText": "Hold deg oppdatert på værmeldingen. " * 3,
+            "ConsequenceText": "Jordskred og sørpeskred kan forekomme. " * 3,
+            "ValidFrom": "2025-12-19T07:00:00",
+            "ValidTo": "2025-12-20T06:59:00",
+            "PublishTime": "2025-12-19T09:12:00",
+            "NextWarningTime": "2025-12-20T09:00:00",
+            "LangKey": 1,
+            "CountyList": [{"Id": "46", "Name": "Vestland"}],
+            "MunicipalityList": [
+                {"Id": str(4600 + (first + i) % MUNICIPALITY_POOL),
+                 "Name": f"Kommune {(first + i) % MUNICIPALITY_POOL}",
+                 "CountyId": "46", "CountyName": "Vestland"}
+                for i in range(MUNICIPALITIES_PER_ALERT)
+            ],
+            "CauseList": [{"Id": 1, "Name": "Regn"}],
+        })
+    return json.dumps(warnings, ensure_ascii=False).encode("utf-8")
+
+
+def _retained(build) -> int:
+    """Return the bytes still allocated by the result of build()."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def main() -> None:
+    raw = _make_payload()
+
+    def _plain():
+        warnings = json.loads(raw)
+        for warning in warnings:
+            warning["_warning_type"] = "landslide"
+        return warnings
+
+    def _models():
+        return [NveWarningModel({**warning, "_warning_type": "landslide"}) for warning in json.loads(raw)]
+
+    plain = _retained(_plain)
+    models = _retained(_models)
+
+    print(f"{ALERTS} warnings, {MUNICIPALITIES_PER_ALERT} municipalities each")
+    print(f"  plain dicts      {plain / 1024:8.0f} KiB")
+    print(f"  WarningModel     {models / 1024:8.0f} KiB")
+    print(f"  saved            {(plain - models) / 1024:8.0f} KiB ({(plain - models) / plain:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,13 @@ from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
 
 
+@pytest.fixture(autouse=True)
+def no_retry_delay():
+    """Retry transient API failures immediately instead of backing off."""
+    with patch("custom_components.norway_alerts.api._retry_delay", return_value=0):
+        yield
+
+
 @pytest.fixture
 def mock_hass():
     """Create a mock Home Assistant instance."""
@@ -1,4 +1,7 @@
 """Unit tests for Norway Alerts API clients."""
+import asyncio
+import json
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 from aiohttp import ClientError
@@ -7,8 +10,14 @@ from custom_components.norway_alerts.api import (
     LandslideAPI,
     FloodAPI,
     AvalancheAPI,
+    AvalancheSnapshot,
+    CircuitBreaker,
+    CircuitOpenError,
     MetAlertsAPI,
+    SessionProvider,
+    WarningAPIError,
     WarningAPIFactory,
+    _parse_retry_after,
 )
 
 
@@ -24,7 +33,7 @@ class TestLandslideAPI:
         mock_response = MagicMock()
         mock_response.status = 200
         mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.json = AsyncMock(return_value=mock_county_api_response)
+        mock_response.read = AsyncMock(return_value=json.dumps(mock_county_api_response).encode())
         
         with patch("aiohttp.ClientSession", mock_aiohttp_session(mock_response)):
             
@@ -42,7 +51,7 @@ class TestLandslideAPI:
         mock_response = MagicMock()
         mock_response.status = 200
         mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.json = AsyncMock(return_value=[])
+        mock_response.read = AsyncMock(return_value=json.dumps([]).encode())
         
         with patch("aiohttp.ClientSession", mock_aiohttp_session(mock_response)):
             
@@ -60,9 +69,55 @@ class TestLandslideAPI:
         
         with patch("aiohttp.ClientSession", mock_aiohttp_session(mock_response)):
             
-            warnings = await api.fetch_warnings()
+            with pytest.raises(WarningAPIError):
+                await api.fetch_warnings()
+
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_serves_stale_result(self, mock_county_api_response, mock_aiohttp_session):
+        """Test that a failed poll keeps the last good warnings, marked stale."""
+        ok = MagicMock()
+        ok.status = 200
+        ok.headers = {"Content-Type": "application/json"}
+        ok.read = AsyncMock(return_value=json.dumps(mock_county_api_response).encode())
+        
+        unavailable = MagicMock()
+        unavailable.status = 503
+        unavailable.headers = {}
+        
+        api = LandslideAPI(county_id="46", county_name="Vestland", session_provider=SessionProvider(pooled=False, cache_ttl=0))
+        
+        with patch("aiohttp.ClientSession", mock_aiohttp_session(ok, unavailable, unavailable, unavailable, ok)):
+            first = await api.fetch_warnings()
+            stale = await api.fetch_warnings()
+            assert stale is first
+            assert api.stale
             
-            assert warnings == []
+            await api.fetch_warnings()
+            assert not api.stale
+        
+        assert api.last_success is not None
+
+    @pytest.mark.asyncio
+    async def test_stale_result_expires(self, mock_county_api_response, mock_aiohttp_session):
+        """Test that results older than stale_max_age are not served."""
+        ok = MagicMock()
+        ok.status = 200
+        ok.headers = {"Content-Type": "application/json"}
+        ok.read = AsyncMock(return_value=json.dumps(mock_county_api_response).encode())
+        
+        not_found = MagicMock()
+        not_found.status = 404
+        
+        api = LandslideAPI(county_id="46", county_name="Vestland", stale_max_age=0,
+                           session_provider=SessionProvider(pooled=False, cache_ttl=0))
+        
+        with patch("aiohttp.ClientSession", mock_aiohttp_session(ok, not_found)):
+            await api.fetch_warnings()
+            with pytest.raises(WarningAPIError):
+                await api.fetch_warnings()
+        
+        assert not api.stale
 
 
 class TestFloodAPI:
@@ -76,7 +131,7 @@ class TestFloodAPI:
         mock_response = MagicMock()
         mock_response.status = 200
         mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.json = AsyncMock(return_value=mock_county_api_response)
+        mock_response.read = AsyncMock(return_value=json.dumps(mock_county_api_response).encode())
         
         with patch("aiohttp.ClientSession", mock_aiohttp_session(mock_response)):
             
@@ -106,12 +161,12 @@ class TestAvalancheAPI:
         # First call returns summary
         mock_summary_response = MagicMock()
         mock_summary_response.status = 200
-        mock_summary_response.json = AsyncMock(return_value=summary_data)
+        mock_summary_response.read = AsyncMock(return_value=json.dumps(summary_data).encode())
         
         # Second call returns details
         mock_detail_response = MagicMock()
         mock_detail_response.status = 200
-        mock_detail_response.json = AsyncMock(return_value=mock_avalanche_api_response)
+        mock_detail_response.read = AsyncMock(return_value=json.dumps(mock_avalanche_api_response).encode())
         
         with patch("aiohttp.ClientSession", mock_aiohttp_session(mock_summary_response, mock_detail_response)):
             
@@ -120,6 +175,267 @@ class TestAvalancheAPI:
             assert len(warnings) == 1
             assert warnings[0]["_warning_type"] == "avalanches"
 
+    def test_mountain_weather_flattened(self):
+        """Test that MountainWeather measurements are flattened into attributes."""
+        api = AvalancheAPI(county_id="46", county_name="Vestland", lang="en")
+        warning = {
+            "RegionId": 3022,
+            "DangerLevel": 3,
+            "CountyList": [{"Name": "Vestland"}],
+            "MountainWeather": {
+                "MeasurementTypes": [
+                    {"Name": "Wind", "Speed": "Strong breeze", "Direction": "SW"},
+                    {"Name": "Temperature", "Value": -5},
+                ]
+            },
+        }
+        
+        converted = api._convert_region_warning(warning)
+        
+        assert converted["WindSpeed"] == "Strong breeze"
+        assert converted["WindDirection"] == "SW"
+        assert converted["Temperature"] == "-5"
+        assert converted["Precipitation"] == ""
+
+    @pytest.mark.asyncio
+    async def test_region_details_fetched_concurrently(self):
+        """Test bounded parallel Detail fetching with ordered results and isolated failures."""
+        # No retries: this test is about concurrency and isolating slow or failing regions
+        provider = SessionProvider(pooled=False, retry_attempts=1)
+        api = AvalancheAPI(county_id="46", county_name="Vestland", lang="en", session_provider=provider,
+                           max_concurrency=2, detail_timeout=0.5)
+        
+        in_flight = 0
+        max_in_flight = 0
+        
+        def _detail(region_id, delay, status=200):
+            return [{
+                "RegionId": region_id,
+                "RegionName": f"Region {region_id}",
+                "DangerLevel": 2,
+                "CountyList": [{"Name": "Vestland"}],
+                "MunicipalityList": [],
+            }], delay, status
+        
+        responses = {
+            "3001": _detail(3001, 0.05),
+            "3002": _detail(3002, 0.01),
+            "3003": _detail(3003, 5),  # Slower than detail_timeout
+            "3004": _detail(3004, 0.0, status=503),
+            "3005": _detail(3005, 0.0),
+        }
+        
+        class _DetailContext:
+            def __init__(self, url, **kwargs):
+                self.url = url
+            
+            async def __aenter__(self):
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                data, delay, status = responses[self.url.split("/Detail/")[1].split("/")[0]]
+                try:
+                    await asyncio.sleep(delay)
+                finally:
+                    in_flight -= 1
+                response = MagicMock()
+                response.status = status
+                response.read = AsyncMock(return_value=json.dumps(data).encode())
+                return response
+            
+            async def __aexit__(self, *args):
+                return None
+        
+        session = MagicMock()
+        session.get = MagicMock(side_effect=_DetailContext)
+        
+        results = await api._fetch_region_details(session, list(responses), "2024-01-01", "2024-01-02")
+        
+        assert max_in_flight <= 2
+        assert [r[0]["RegionId"] if r else None for r in results] == [3001, 3002, None, None, 3005]
+
+
+class TestAvalancheSnapshot:
+    """Test the nationwide avalanche snapshot shared by county entries."""
+
+    @pytest.mark.asyncio
+    async def test_counties_share_one_download(self, mock_aiohttp_session):
+        """Test that two county entries trigger a single nationwide download."""
+        summary_data = [
+            {"AvalancheWarningList": [{"RegionId": 3022, "DangerLevel": 3}]},
+            {"AvalancheWarningList": [{"RegionId": 3015, "DangerLevel": 2}]},
+        ]
+        voss = [{
+            "RegionId": 3022, "RegionName": "Voss", "DangerLevel": 3,
+            "CountyList": [{"Name": "Vestland"}], "MunicipalityList": [],
+        }]
+        lyngen = [{
+            "RegionId": 3015, "RegionName": "Lyngen", "DangerLevel": 2,
+            "CountyList": [{"Name": "Troms"}], "MunicipalityList": [],
+        }]
+        
+        responses = []
+        for data in (summary_data, voss, lyngen):
+            response = MagicMock()
+            response.status = 200
+            response.read = AsyncMock(return_value=json.dumps(data).encode())
+            responses.append(response)
+        
+        mock_session_class = mock_aiohttp_session(*responses)
+        snapshot = AvalancheSnapshot()
+        vestland = AvalancheAPI(county_id="46", county_name="Vestland", snapshot=snapshot)
+        troms = AvalancheAPI(county_id="55", county_name="Troms", snapshot=snapshot)
+        
+        with patch("aiohttp.ClientSession", mock_session_class):
+            vestland_warnings, troms_warnings = await asyncio.gather(
+                vestland.fetch_warnings(), troms.fetch_warnings()
+            )
+        
+        assert mock_session_class.return_value.get.call_count == 3
+        assert [w["RegionName"] for w in vestland_warnings] == ["Voss"]
+        assert [w["RegionName"] for w in troms_warnings] == ["Lyngen"]
+
+    @pytest.mark.asyncio
+    async def test_failed_fetch_not_stored(self):
+        """Test that failed or incomplete downloads are retried by the next caller."""
+        snapshot = AvalancheSnapshot()
+        fetch = AsyncMock(side_effect=[None, {1: [{"RegionId": 1}], 2: None}, {1: [{"RegionId": 1}]}, {2: []}])
+        
+        assert await snapshot.async_get("2024-01-01/2024-01-02", fetch) is None
+        assert await snapshot.async_get("2024-01-01/2024-01-02", fetch) == {1: [{"RegionId": 1}], 2: None}
+        assert await snapshot.async_get("2024-01-01/2024-01-02", fetch) == {1: [{"RegionId": 1}]}
+        assert await snapshot.async_get("2024-01-01/2024-01-02", fetch) == {1: [{"RegionId": 1}]}
+        assert fetch.await_count == 3
+        
+        # A new forecast window is never served from the old snapshot
+        await snapshot.async_get("2024-01-02/2024-01-03", fetch)
+        assert fetch.await_count == 4
+
+
+    @pytest.mark.asyncio
+    async def test_failed_region_not_shared_as_empty(self):
+        """Test that a failed region is neither stored in the snapshot nor shown as having no warnings."""
+        summary_data = [
+            {"AvalancheWarningList": [{"RegionId": 3022, "DangerLevel": 3}]},
+            {"AvalancheWarningList": [{"RegionId": 3023, "DangerLevel": 2}]},
+        ]
+        details = {
+            "3022": [{
+                "RegionId": 3022, "RegionName": "Voss", "DangerLevel": 3,
+                "CountyList": [{"Name": "Vestland"}], "MunicipalityList": [],
+            }],
+            "3023": [{
+                "RegionId": 3023, "RegionName": "Hardanger", "DangerLevel": 2,
+                "CountyList": [{"Name": "Vestland"}], "MunicipalityList": [],
+            }],
+        }
+        failing = set()
+        
+        def _get(url, **kwargs):
+            region_id = url.split("/Detail/")[1].split("/")[0] if "/Detail/" in url else None
+            response = MagicMock()
+            response.status = 503 if region_id in failing else 200
+            response.read = AsyncMock(return_value=json.dumps(details[region_id] if region_id else summary_data).encode())
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=None)
+            return context
+        
+        session = MagicMock()
+        session.get = MagicMock(side_effect=_get)
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=None)
+        
+        provider = SessionProvider(pooled=False, retry_attempts=1)
+        snapshot = AvalancheSnapshot()
+        api = AvalancheAPI(county_id="46", county_name="Vestland", session_provider=provider, snapshot=snapshot)
+        
+        with patch("aiohttp.ClientSession", MagicMock(return_value=session)):
+            # Hardanger fails and was never fetched: the poll fails instead of dropping its alerts
+            failing.add("3023")
+            with pytest.raises(WarningAPIError):
+                await api.fetch_warnings()
+            assert api.last_success is None
+            assert snapshot._region_details is None
+            
+            failing.clear()
+            assert [w["RegionName"] for w in await api.fetch_warnings()] == ["Voss", "Hardanger"]
+            
+            # Hardanger fails on a later refresh: its previous details for the same dates are used
+            snapshot.invalidate()
+            provider.response_cache.ttl = 0
+            failing.add("3023")
+            assert [w["RegionName"] for w in await api.fetch_warnings()] == ["Voss", "Hardanger"]
+            assert not api.stale
+
+
+    @pytest.mark.asyncio
+    async def test_failed_region_only_affects_its_counties(self):
+        """Test that a failed region only holds back the counties it concerns."""
+        summary_data = [
+            {"AvalancheWarningList": [{"RegionId": 3022, "DangerLevel": 3}]},
+            {"AvalancheWarningList": [{"RegionId": 3015, "DangerLevel": 2}]},
+        ]
+        details = {
+            "3022": [{
+                "RegionId": 3022, "RegionName": "Voss", "DangerLevel": 3,
+                "CountyList": [{"Name": "Vestland"}], "MunicipalityList": [],
+            }],
+            "3015": [{
+                "RegionId": 3015, "RegionName": "Lyngen", "DangerLevel": 2,
+                "CountyList": [{"Name": "Troms"}], "MunicipalityList": [],
+            }],
+        }
+        failing = set()
+        
+        def _get(url, **kwargs):
+            region_id = url.split("/Detail/")[1].split("/")[0] if "/Detail/" in url else None
+            response = MagicMock()
+            response.status = 503 if region_id in failing else 200
+            response.read = AsyncMock(return_value=json.dumps(details[region_id] if region_id else summary_data).encode())
+            context = MagicMock()
+            context.__aenter__ = AsyncMock(return_value=response)
+            context.__aexit__ = AsyncMock(return_value=None)
+            return context
+        
+        session = MagicMock()
+        session.get = MagicMock(side_effect=_get)
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=None)
+        
+        provider = SessionProvider(pooled=False, retry_attempts=1)
+        snapshot = AvalancheSnapshot()
+        vestland = AvalancheAPI(county_id="46", county_name="Vestland", session_provider=provider, snapshot=snapshot)
+        troms = AvalancheAPI(county_id="55", county_name="Troms", session_provider=provider, snapshot=snapshot)
+        finnmark = AvalancheAPI(county_id="56", county_name="Finnmark", session_provider=provider, snapshot=snapshot)
+        
+        with patch("aiohttp.ClientSession", MagicMock(return_value=session)):
+            await asyncio.gather(vestland.fetch_warnings(), troms.fetch_warnings())
+            
+            # Lyngen fails with no earlier response for these dates (fresh response cache)
+            snapshot.invalidate()
+            provider = SessionProvider(pooled=False, retry_attempts=1)
+            for api in (vestland, troms, finnmark):
+                api.session_provider = provider
+            failing.add("3015")
+            
+            assert [w["RegionName"] for w in await vestland.fetch_warnings()] == ["Voss"]
+            assert not vestland.stale
+            
+            troms_warnings = await troms.fetch_warnings()
+            assert [w["RegionName"] for w in troms_warnings] == ["Lyngen"]
+            assert troms.stale
+            
+            # A county that has not seen Lyngen's details cannot rule it out
+            with pytest.raises(WarningAPIError):
+                await finnmark.fetch_warnings()
+            
+            # The incomplete snapshot is not stored: the next poll retries the failed region
+            assert snapshot._region_details is None
+            failing.clear()
+            assert [w["RegionName"] for w in await troms.fetch_warnings()] == ["Lyngen"]
+            assert not troms.stale
+
 
 class TestMetAlertsAPI:
     """Test MetAlertsAPI client."""
@@ -132,7 +448,7 @@ class TestMetAlertsAPI:
         mock_response = MagicMock()
         mock_response.status = 200
         mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.json = AsyncMock(return_value=mock_metalerts_api_response)
+        mock_response.read = AsyncMock(return_value=json.dumps(mock_metalerts_api_response).encode())
         
         with patch("aiohttp.ClientSession", mock_aiohttp_session(mock_response)):
             
@@ -150,7 +466,7 @@ class TestMetAlertsAPI:
         mock_response = MagicMock()
         mock_response.status = 200
         mock_response.headers = {"Content-Type": "application/json"}
-        mock_response.json = AsyncMock(return_value=mock_metalerts_api_response)
+        mock_response.read = AsyncMock(return_value=json.dumps(mock_metalerts_api_response).encode())
         
         with patch("aiohttp.ClientSession", mock_aiohttp_session(mock_response)):
             
@@ -172,6 +488,283 @@ class TestMetAlertsAPI:
         assert "2024-01-01T12:00:00+01:00" not in clean_title
 
 
+class TestSessionProvider:
+    """Test the shared pooled HTTP session."""
+
+    @pytest.mark.asyncio
+    async def test_clients_share_one_session(self, mock_county_api_response, mock_aiohttp_session):
+        """Test that all clients using a provider reuse the same session."""
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.read = AsyncMock(return_value=json.dumps(mock_county_api_response).encode())
+        
+        mock_session_class = mock_aiohttp_session(mock_response)
+        mock_session_class.return_value.closed = False
+        
+        with patch("aiohttp.ClientSession", mock_session_class), \
+             patch("aiohttp.TCPConnector") as mock_connector:
+            provider = SessionProvider()
+            landslide = LandslideAPI(county_id="46", county_name="Vestland", session_provider=provider)
+            flood = FloodAPI(county_id="46", county_name="Vestland", session_provider=provider)
+            
+            await landslide.fetch_warnings()
+            await flood.fetch_warnings()
+        
+        assert mock_session_class.call_count == 1
+        assert mock_connector.call_count == 1
+        assert mock_session_class.return_value.get.call_count == 2
+        # The shared session must not be closed after each request
+        mock_session_class.return_value.__aexit__.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_close_and_reopen(self):
+        """Test that closing the provider closes the session and allows reopening."""
+        with patch("aiohttp.ClientSession") as mock_session_class, \
+             patch("aiohttp.TCPConnector"):
+            mock_session_class.return_value.closed = False
+            mock_session_class.return_value.close = AsyncMock()
+            provider = SessionProvider()
+            
+            provider.get_session()
+            assert not provider.closed
+            
+            await provider.async_close()
+            assert provider.closed
+            mock_session_class.return_value.close.assert_awaited_once()
+            
+            provider.get_session()
+            assert mock_session_class.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_conditional_request_not_modified(self, mock_county_api_response, mock_aiohttp_session):
+        """Test that a 304 reuses the previous parsed and converted result."""
+        first = MagicMock()
+        first.status = 200
+        first.headers = {
+            "Content-Type": "application/json",
+            "ETag": '"abc123"',
+            "Last-Modified": "Mon, 01 Jan 2024 08:00:00 GMT",
+        }
+        first.read = AsyncMock(return_value=json.dumps(mock_county_api_response).encode())
+        
+        second = MagicMock()
+        second.status = 304
+        second.headers = {}
+        second.read = AsyncMock(side_effect=AssertionError("304 body must not be read"))
+        
+        mock_session_class = mock_aiohttp_session(first, second)
+        provider = SessionProvider(pooled=False, cache_ttl=0)
+        api = LandslideAPI(county_id="46", county_name="Vestland", session_provider=provider)
+        
+        with patch("aiohttp.ClientSession", mock_session_class):
+            first_warnings = await api.fetch_warnings()
+            second_warnings = await api.fetch_warnings()
+        
+        _, kwargs = mock_session_class.return_value.get.call_args
+        assert kwargs["headers"]["If-None-Match"] == '"abc123"'
+        assert kwargs["headers"]["If-Modified-Since"] == "Mon, 01 Jan 2024 08:00:00 GMT"
+        assert second_warnings is first_warnings
+        assert provider.stats["modified"] == 1
+        assert provider.stats["not_modified"] == 1
+
+    @pytest.mark.asyncio
+    async def test_raw_body_decoding(self, mock_county_api_response, mock_aiohttp_session):
+        """Test that bodies with a UTF-8 BOM decode and invalid JSON is reported as an error."""
+        with_bom = MagicMock()
+        with_bom.status = 200
+        with_bom.headers = {"Content-Type": "application/json"}
+        with_bom.read = AsyncMock(return_value=b"\xef\xbb\xbf" + json.dumps(mock_county_api_response).encode())
+        
+        invalid = MagicMock()
+        invalid.status = 200
+        invalid.headers = {"Content-Type": "application/json"}
+        invalid.read = AsyncMock(return_value=b"<html>maintenance</html>")
+        
+        provider = SessionProvider(pooled=False, cache_ttl=0)
+        api = LandslideAPI(county_id="46", county_name="Vestland", session_provider=provider)
+        
+        with patch("aiohttp.ClientSession", mock_aiohttp_session(with_bom, invalid)):
+            assert len(await api.fetch_warnings()) == 1
+            assert not api.stale
+            await api.fetch_warnings()
+        
+        assert api.stale
+        assert provider.stats["errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fresh_response_served_from_cache(self, mock_county_api_response, mock_aiohttp_session):
+        """Test that a response within the TTL is reused without a request."""
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        mock_response.read = AsyncMock(return_value=json.dumps(mock_county_api_response).encode())
+        
+        mock_session_class = mock_aiohttp_session(mock_response)
+        provider = SessionProvider(pooled=False, cache_ttl=60)
+        first = LandslideAPI(county_id="46", county_name="Vestland", session_provider=provider)
+        second = LandslideAPI(county_id="46", county_name="Vestland", session_provider=provider)
+        
+        with patch("aiohttp.ClientSession", mock_session_class):
+            await first.fetch_warnings()
+            warnings = await second.fetch_warnings()
+        
+        assert len(warnings) == 1
+        assert mock_session_class.return_value.get.call_count == 1
+        assert provider.stats["cache_misses"] == 1
+        assert provider.stats["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_coalesced(self, mock_county_api_response):
+        """Test that identical concurrent requests share one fetch."""
+        release = asyncio.Event()
+        
+        mock_response = MagicMock()
+        mock_response.status = 200
+        mock_response.headers = {"Content-Type": "application/json"}
+        
+        async def _slow_read():
+            await release.wait()
+            return json.dumps(mock_county_api_response).encode()
+        
+        mock_response.read = _slow_read
+        
+        mock_get_cm = MagicMock()
+        mock_get_cm.__aenter__ = AsyncMock(return_value=mock_response)
+        mock_get_cm.__aexit__ = AsyncMock(return_value=None)
+        mock_session = MagicMock()
+        mock_session.closed = False
+        mock_session.get = MagicMock(return_value=mock_get_cm)
+        
+        provider = SessionProvider()
+        apis = [
+            LandslideAPI(county_id="46", county_name="Vestland", session_provider=provider)
+            for _ in range(3)
+        ]
+        
+        with patch("aiohttp.ClientSession", return_value=mock_session), \
+             patch("aiohttp.TCPConnector"):
+            tasks = [asyncio.ensure_future(api.fetch_warnings()) for api in apis]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*tasks)
+        
+        assert mock_session.get.call_count == 1
+        assert all(len(warnings) == 1 for warnings in results)
+        assert provider.stats["cache_misses"] == 1
+        assert provider.stats["coalesced"] == 2
+        assert not provider.response_cache.in_flight
+
+    @pytest.mark.asyncio
+    async def test_transient_error_retried(self, mock_county_api_response, mock_aiohttp_session):
+        """Test that a 503 with Retry-After is retried and the retry honours it."""
+        unavailable = MagicMock()
+        unavailable.status = 503
+        unavailable.headers = {"Retry-After": "2"}
+        
+        ok = MagicMock()
+        ok.status = 200
+        ok.headers = {"Content-Type": "application/json"}
+        ok.read = AsyncMock(return_value=json.dumps(mock_county_api_response).encode())
+        
+        provider = SessionProvider(pooled=False)
+        api = LandslideAPI(county_id="46", county_name="Vestland", session_provider=provider)
+        
+        with patch("aiohttp.ClientSession", mock_aiohttp_session(unavailable, ok)), \
+             patch("custom_components.norway_alerts.api._retry_delay", return_value=0) as mock_delay:
+            warnings = await api.fetch_warnings()
+        
+        assert len(warnings) == 1
+        assert provider.stats["retries"] == 1
+        assert mock_delay.call_args.args[2] == 2.0
+        assert provider.breakers["api01.nve.no"].state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_client_error_not_retried(self, mock_aiohttp_session):
+        """Test that a 404 fails immediately without retrying."""
+        not_found = MagicMock()
+        not_found.status = 404
+        
+        provider = SessionProvider(pooled=False)
+        api = LandslideAPI(county_id="46", county_name="Vestland", session_provider=provider)
+        
+        with patch("aiohttp.ClientSession", mock_aiohttp_session(not_found)) as mock_session_class:
+            with pytest.raises(WarningAPIError):
+                await api.fetch_warnings()
+        
+        assert mock_session_class.return_value.get.call_count == 1
+        assert provider.stats["retries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_circuit_opens_and_fails_fast(self, mock_aiohttp_session):
+        """Test that repeated failures open the host's circuit so later requests are not sent."""
+        unavailable = MagicMock()
+        unavailable.status = 503
+        unavailable.headers = {}
+        
+        provider = SessionProvider(pooled=False, cache_ttl=0, retry_attempts=2)
+        landslide = LandslideAPI(county_id="46", county_name="Vestland", session_provider=provider)
+        flood = FloodAPI(county_id="46", county_name="Vestland", session_provider=provider)
+        breaker = provider.get_breaker("https://api01.nve.no/")
+        breaker.failure_threshold = 2
+        
+        with patch("aiohttp.ClientSession", mock_aiohttp_session(unavailable)) as mock_session_class:
+            for _ in range(2):
+                with pytest.raises(WarningAPIError):
+                    await landslide.fetch_warnings()
+            assert breaker.state == "open"
+            
+            with pytest.raises(WarningAPIError):
+                await flood.fetch_warnings()
+        
+        # Two requests with one retry each; the flood request never left
+        assert mock_session_class.return_value.get.call_count == 4
+        assert provider.stats["circuit_open"] == 1
+        
+        with pytest.raises(CircuitOpenError):
+            await flood._async_request_with_retry(MagicMock(), "https://api01.nve.no/x", None, True, 1)
+
+    def test_circuit_half_open_trial(self):
+        """Test that one trial request is allowed after the reset timeout."""
+        breaker = CircuitBreaker("api.met.no", failure_threshold=1, reset_timeout=0)
+        breaker.record_failure()
+        
+        assert breaker.state == "half_open"
+        assert breaker.acquire()
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire()  # Only one trial at a time
+        
+        breaker.record_success(trial=True)
+        assert breaker.state == "closed"
+        assert breaker.acquire() is False
+
+    def test_only_trial_frees_half_open(self):
+        """Test that a request sent before the circuit opened does not free the half-open trial."""
+        breaker = CircuitBreaker("api.met.no", failure_threshold=1, reset_timeout=0)
+        earlier = breaker.acquire()
+        breaker.record_failure()
+        
+        assert breaker.acquire()
+        breaker.release(earlier)
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire()
+
+    def test_parse_retry_after(self):
+        """Test Retry-After in seconds and as an HTTP date."""
+        assert _parse_retry_after("120") == 120.0
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        assert _parse_retry_after("soon") is None
+        assert _parse_retry_after(None) is None
+
+    def test_factory_passes_provider(self):
+        """Test that the factory hands the provider to every client."""
+        provider = SessionProvider()
+        factory = WarningAPIFactory(county_id="46", county_name="Vestland", session_provider=provider)
+        
+        for warning_type in ("landslide", "flood", "avalanche", "metalerts"):
+            assert factory.get_api(warning_type).session_provider is provider
+
+
 class TestWarningAPIFactory:
     """Test WarningAPIFactory."""
 
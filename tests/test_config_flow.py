@@ -13,6 +13,27 @@ from custom_components.norway_alerts.const import (
     WARNING_TYPE_LANDSLIDE,
     WARNING_TYPE_METALERTS,
 )
+from custom_components.norway_alerts import municipality_lookup
+
+
+def _schema_default(result, key):
+    """Return the default of a field in a shown form."""
+    for marker in result["data_schema"].schema:
+        if marker == key:
+            return marker.default()
+    raise KeyError(key)
+
+
+async def _location_form(hass, latitude, longitude):
+    """Start a landslide flow with Home Assistant at the coordinates and return the location form."""
+    from custom_components.norway_alerts.config_flow import NorwayAlertsConfigFlow
+
+    hass.config = MagicMock(latitude=latitude, longitude=longitude)
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    flow = NorwayAlertsConfigFlow()
+    flow.hass = hass
+    flow.context = {}
+    return await flow.async_step_user({CONF_WARNING_TYPE: WARNING_TYPE_LANDSLIDE})
 
 
 class TestConfigFlow:
@@ -63,3 +84,21 @@ class TestConfigFlow:
         assert flow is not None
         # Options flow testing requires complex HA infrastructure
         # This basic test ensures the class exists and is importable
+
+    @pytest.mark.asyncio
+    async def test_county_preselected_from_home_location(self, mock_hass):
+        """Test that the county form defaults to the county containing Home Assistant's location."""
+        result = await _location_form(mock_hass, 63.43, 10.39)  # Trondheim
+
+        assert result["step_id"] == "location"
+        assert _schema_default(result, CONF_COUNTY_ID) == "50"
+
+    @pytest.mark.asyncio
+    async def test_county_preselect_without_boundaries(self, mock_hass, tmp_path):
+        """Test that the approximate lookup and then Vestland are used if the boundary data is missing."""
+        with patch.object(municipality_lookup, "COUNTY_BOUNDARIES", tmp_path / "missing.geojson"):
+            outside = await _location_form(mock_hass, 63.43, 10.39)
+            bergen = await _location_form(mock_hass, 60.39, 5.32)
+
+        assert _schema_default(outside, CONF_COUNTY_ID) == "46"
+        assert _schema_default(bergen, CONF_COUNTY_ID) == "46"
@@ -0,0 +1,114 @@
+"""Unit tests for formatted_content rendering."""
+import os
+
+from custom_components.norway_alerts.formatting import ContentRenderer, alert_status
+
+ALERT = {
+    "id": "1",
+    "event": "Landslide",
+    "severity": "Moderate",
+    "starttime": "2020-01-01T00:00:00+00:00",
+    "endtime": "2099-01-01T00:00:00+00:00",
+    "municipalities": ["Bergen", "Voss"],
+}
+
+
+def _renderer():
+    """Return a renderer with the integration's template loaded."""
+    renderer = ContentRenderer()
+    renderer.load()
+    return renderer
+
+
+class TestAlertStatus:
+    """Test the Expected/Ongoing/Ended status of alerts."""
+
+    def test_status(self):
+        """Test the status at different times."""
+        assert alert_status(ALERT, 1.0e9) == "Expected"
+        assert alert_status(ALERT, 2.0e9) == "Ongoing"
+        assert alert_status(ALERT, 5.0e9) == "Ended"
+        assert alert_status({"starttime": "2020-01-01T00:00:00"}, 2.0e9) is None
+
+
+class TestContentRenderer:
+    """Test the shared template and fragment cache."""
+
+    def test_render(self):
+        """Test that alerts are rendered with their status and computed area."""
+        renderer = _renderer()
+
+        content = renderer.render([ALERT], show_icon=True, show_status=True, show_map=True)
+        assert "Ongoing - Landslide" in content
+        assert "**Area**: Bergen, Voss" in content
+        assert "Expected" not in renderer.render([ALERT], show_icon=True, show_status=False, show_map=True)
+        assert renderer.render([], show_icon=True, show_status=True, show_map=True).strip() == "No active alerts"
+
+    def test_only_changed_alerts_rendered(self):
+        """Test that unchanged alerts are served from the fragment cache."""
+        renderer = _renderer()
+        other = {**ALERT, "id": "2", "event": "Flood"}
+
+        first = renderer.render([ALERT, other], show_icon=True, show_status=True, show_map=True)
+        assert renderer.misses == 2
+        assert renderer.render([ALERT, other], show_icon=True, show_status=True, show_map=True) == first
+        assert renderer.misses == 2
+
+        changed = renderer.render([ALERT, {**other, "event": "Flood (updated)"}], show_icon=True, show_status=True, show_map=True)
+        assert renderer.misses == 3
+        assert "Flood (updated)" in changed and "Landslide" in changed
+
+    def test_template_reloaded_when_changed(self, tmp_path):
+        """Test that a changed template file is recompiled and drops cached fragments."""
+        template = tmp_path / "formatted_content.j2"
+        template.write_text("v1 {{ alert.event }}", encoding="utf-8")
+        renderer = ContentRenderer(template_dir=tmp_path)
+        renderer.load()
+        assert renderer.render([ALERT], show_icon=True, show_status=True, show_map=True) == "v1 Landslide"
+
+        renderer.load()
+        assert len(renderer) == 1
+
+        template.write_text("v2 {{ alert.event }}", encoding="utf-8")
+        mtime = os.path.getmtime(template) + 10
+        os.utime(template, (mtime, mtime))
+        renderer.load()
+        assert len(renderer) == 0
+        assert renderer.render([ALERT], show_icon=True, show_status=True, show_map=True) == "v2 Landslide"
+
+    def test_whole_list_template(self, tmp_path):
+        """Test that templates written for the alerts list (the previous contract) still work."""
+        (tmp_path / "formatted_content.j2").write_text(
+            "{% for alert in alerts %}[{{ alert.event }}: {{ alert.area }}]{% else %}none{% endfor %}",
+            encoding="utf-8",
+        )
+        renderer = ContentRenderer(template_dir=tmp_path)
+        renderer.load()
+        other = {**ALERT, "id": "2", "event": "Flood"}
+
+        assert renderer.whole_list
+        assert renderer.render([ALERT, other], show_icon=True, show_status=True, show_map=True) == (
+            "[Landslide: Bergen, Voss][Flood: Bergen, Voss]"
+        )
+        assert renderer.render([ALERT, other], show_icon=True, show_status=True, show_map=True)
+        assert renderer.misses == 1
+        assert renderer.render([], show_icon=True, show_status=True, show_map=True) == "none"
+
+    def test_reset_recompiles(self, tmp_path):
+        """Test that reset (on entry reload) recompiles the template even if its mtime did not change."""
+        template = tmp_path / "formatted_content.j2"
+        template.write_text("v1 {{ alert.event }}", encoding="utf-8")
+        renderer = ContentRenderer(template_dir=tmp_path)
+        renderer.load()
+        renderer.render([ALERT], show_icon=True, show_status=True, show_map=True)
+        mtime = os.path.getmtime(template)
+
+        template.write_text("v2 {{ alert.event }}", encoding="utf-8")
+        os.utime(template, (mtime, mtime))
+        renderer.reset()
+        assert len(renderer) == 0
+        # The current template serves other entries until the next load
+        assert renderer.render([ALERT], show_icon=True, show_status=True, show_map=True) == "v1 Landslide"
+
+        renderer.load()
+        assert renderer.render([ALERT], show_icon=True, show_status=True, show_map=True) == "v2 Landslide"
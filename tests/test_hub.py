@@ -0,0 +1,155 @@
+"""Unit tests for the Norway Alerts coordinator hub."""
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from homeassistant.exceptions import ConfigEntryNotReady
+
+from custom_components.norway_alerts.hub import CoordinatorHub
+
+KEY = ("flood", "46", "en", True, False, False, "yellow_plus")
+
+
+class TestCoordinatorHub:
+    """Test sharing and reference counting of coordinators."""
+
+    @pytest.mark.asyncio
+    async def test_entries_share_coordinator(self):
+        """Test that entries with the same key share one coordinator until the last is released."""
+        hub = CoordinatorHub()
+        coordinator = MagicMock()
+        coordinator.async_shutdown = AsyncMock()
+        create = AsyncMock(return_value=coordinator)
+
+        first = await hub.async_acquire(KEY, "entry_1", create)
+        second = await hub.async_acquire(KEY, "entry_2", create)
+
+        assert first is second is coordinator
+        create.assert_awaited_once()
+        assert hub.shared_with("entry_1") == {"entry_1", "entry_2"}
+
+        assert not await hub.async_release("entry_1")
+        coordinator.async_shutdown.assert_not_awaited()
+
+        assert await hub.async_release("entry_2")
+        coordinator.async_shutdown.assert_awaited_once()
+        assert len(hub) == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_not_shared(self):
+        """Test that a different upstream query gets its own coordinator."""
+        hub = CoordinatorHub()
+        create = AsyncMock(side_effect=[MagicMock(), MagicMock()])
+
+        flood = await hub.async_acquire(KEY, "entry_1", create)
+        landslide = await hub.async_acquire(("landslide",) + KEY[1:], "entry_2", create)
+
+        assert flood is not landslide
+        assert len(hub) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_setup_creates_once(self):
+        """Test that entries setting up at the same time wait for one coordinator."""
+        hub = CoordinatorHub()
+        coordinator = MagicMock()
+
+        async def _create():
+            await asyncio.sleep(0.01)
+            return coordinator
+
+        create = AsyncMock(side_effect=_create)
+        results = await asyncio.gather(
+            hub.async_acquire(KEY, "entry_1", create),
+            hub.async_acquire(KEY, "entry_2", create),
+        )
+
+        assert results == [coordinator, coordinator]
+        create.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_create_not_registered(self):
+        """Test that a coordinator failing its first refresh is not kept."""
+        hub = CoordinatorHub()
+        coordinator = MagicMock()
+        create = AsyncMock(side_effect=[ConfigEntryNotReady("offline"), coordinator])
+
+        with pytest.raises(ConfigEntryNotReady):
+            await hub.async_acquire(KEY, "entry_1", create)
+
+        assert hub.shared_with("entry_1") == set()
+        assert await hub.async_acquire(KEY, "entry_1", create) is coordinator
+
+
+    @pytest.mark.asyncio
+    async def test_release_cancels_background_refresh(self):
+        """Test that a warm-start refresh is cancelled once the last entry releases its coordinator."""
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator
+
+        hub = CoordinatorHub()
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(MagicMock(), "46", "Vestland", "flood", "en")
+        coordinator.first_refresh_task = asyncio.create_task(asyncio.sleep(3600))
+        create = AsyncMock(return_value=coordinator)
+
+        await hub.async_acquire(KEY, "entry_1", create)
+        await hub.async_acquire(KEY, "entry_2", create)
+
+        await hub.async_release("entry_1")
+        await asyncio.sleep(0)
+        assert not coordinator.first_refresh_task.done()
+
+        await hub.async_release("entry_2")
+        await asyncio.sleep(0)
+        assert coordinator.first_refresh_task.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_store_keyed_by_entry():
+    """Test that the snapshot store does not depend on options and is removed with the entry."""
+    from custom_components.norway_alerts import _get_snapshot_store, async_remove_entry
+
+    hass = MagicMock()
+    hass.data = {}
+    entry = MagicMock(entry_id="entry_1")
+    with patch("custom_components.norway_alerts.Store") as store_class:
+        store_class.return_value.async_remove = AsyncMock()
+        await async_remove_entry(hass, entry)
+        _get_snapshot_store(hass, "entry_1")
+
+    assert store_class.call_args_list[0].args == store_class.call_args_list[1].args
+    assert store_class.call_args_list[0].args[2] == "norway_alerts.snapshot.entry_1"
+    store_class.return_value.async_remove.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_shared_coordinator_store_moves_to_remaining_entry():
+    """Test that removing the entry a shared coordinator saved for does not leave its file being written."""
+    from custom_components.norway_alerts import _get_snapshot_store, async_remove_entry, async_unload_entry
+    from custom_components.norway_alerts.hub import async_get_coordinator_hub
+
+    hass = MagicMock()
+    hass.data = {}
+    hass.config_entries.async_unload_platforms = AsyncMock(return_value=True)
+    hass.config_entries.async_entries.return_value = []
+    entry = MagicMock(entry_id="entry_1")
+
+    def _store(hass, version, key):
+        return MagicMock(key=key, async_remove=AsyncMock())
+
+    with patch("custom_components.norway_alerts.Store", side_effect=_store):
+        coordinator = MagicMock(async_shutdown=AsyncMock())
+        coordinator.snapshot_store = removed_store = _get_snapshot_store(hass, "entry_1")
+        hub = async_get_coordinator_hub(hass)
+        for entry_id in ("entry_1", "entry_2"):
+            await hub.async_acquire(KEY, entry_id, AsyncMock(return_value=coordinator))
+            hass.data["norway_alerts"][entry_id] = coordinator
+
+        assert await async_unload_entry(hass, entry)
+        await async_remove_entry(hass, entry)
+
+        # The same Store instance is removed, which also cancels its pending delayed save
+        removed_store.async_remove.assert_awaited_once()
+        assert coordinator.snapshot_store is _get_snapshot_store(hass, "entry_2")
+        assert coordinator.snapshot_store.key == "norway_alerts.snapshot.entry_2"
+        coordinator.async_shutdown.assert_not_awaited()
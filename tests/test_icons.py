@@ -0,0 +1,90 @@
+"""Unit tests for the warning icons and their HTTP view."""
+from unittest.mock import AsyncMock, MagicMock
+
+from homeassistant.components.http import KEY_HASS
+
+from custom_components.norway_alerts.icons import (
+    ICON_DIR,
+    ICON_NAMES,
+    NorwayAlertsIconView,
+    async_load_embedded_icons,
+    icon_svg,
+    icon_url,
+    resolve_icon,
+)
+
+
+def _hass():
+    """Build a hass mock running executor jobs inline."""
+    hass = MagicMock()
+    hass.async_add_executor_job = AsyncMock(side_effect=lambda func, *args: func(*args))
+    return hass
+
+
+def _request(**headers):
+    """Build a request mock with the given headers."""
+    request = MagicMock()
+    request.headers = headers
+    request.app = {KEY_HASS: _hass()}
+    return request
+
+
+class TestIconUrl:
+    """Test icon URLs for warning types and levels."""
+
+    async def test_short_url(self):
+        """Test that icons are referenced by short URLs unless embedded."""
+        assert icon_url("landslide", "red") == "/norway_alerts/icons/landslide-red.svg"
+
+        await async_load_embedded_icons(_hass())
+        assert icon_url("landslide", "red", embed=True).startswith("data:image/svg+xml;base64,")
+
+    def test_fallback(self):
+        """Test the generic fallback and that green has no icon."""
+        assert icon_url("unknowntype", "yellow") == "/norway_alerts/icons/generic-yellow.svg"
+        assert icon_url("landslide", "green") is None
+        assert icon_url("", "red") is None
+
+
+class TestIconStore:
+    """Test the packaged icon files."""
+
+    def test_every_icon_stored(self):
+        """Test that every icon name resolves to a stored file."""
+        for key in ICON_NAMES:
+            assert (ICON_DIR / f"{resolve_icon(key)}.svg").is_file(), key
+
+    def test_aliases_stored_once(self):
+        """Test that aliases share the stored icon and its cache entry."""
+        assert resolve_icon("gale-red") == "wind-red"
+        assert not (ICON_DIR / "gale-red.svg").exists()
+        assert icon_svg("gale-red") is icon_svg("wind-red")
+        assert icon_url("gale", "red") == "/norway_alerts/icons/gale-red.svg"
+
+
+class TestIconView:
+    """Test serving icons over HTTP."""
+
+    async def test_serve_icon(self):
+        """Test that icons are served as SVG with cache headers."""
+        response = await NorwayAlertsIconView().get(_request(), "flood-orange.svg")
+
+        assert response.status == 200
+        assert response.content_type == "image/svg+xml"
+        assert response.body.startswith(b"<svg")
+        assert "max-age=" in response.headers["Cache-Control"]
+        assert response.headers["ETag"] == icon_svg("flood-orange")[1]
+
+    async def test_not_modified(self):
+        """Test that a matching ETag returns 304 without a body."""
+        etag = icon_svg("flood-orange")[1]
+        response = await NorwayAlertsIconView().get(_request(**{"If-None-Match": etag}), "flood-orange.svg")
+
+        assert response.status == 304
+        assert response.body is None
+
+    async def test_unknown_icon(self):
+        """Test that unknown icons are not found."""
+        response = await NorwayAlertsIconView().get(_request(), "../const.py")
+
+        assert response.status == 404
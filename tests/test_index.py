@@ -0,0 +1,44 @@
+"""Unit tests for the per-data-version alert index."""
+from custom_components.norway_alerts.index import AlertIndex, alert_master_id, merge_municipalities
+from custom_components.norway_alerts.matcher import MunicipalityMatcher
+
+ALERTS = [
+    {"Id": 1, "MasterId": 100, "ActivityLevel": "2",
+     "MunicipalityList": [{"Id": "4601", "Name": "Bergen"}, {"Id": "4621", "Name": "Voss"}]},
+    {"Id": 2, "MasterId": 100, "ActivityLevel": "2",
+     "MunicipalityList": [{"Id": "4640", "Name": "Sogndal"}, {"Id": "4601", "Name": "Bergen"}]},
+    {"Id": 3, "ActivityLevel": "3", "MunicipalityList": [{"Id": "1508", "Name": "Ålesund"}]},
+    {"Id": 4, "ActivityLevel": "1", "MunicipalityList": [{"Id": "0301", "Name": "Oslo"}]},
+]
+
+
+class TestAlertIndex:
+    """Test municipality and master-id lookups."""
+
+    def test_municipality_lookups(self):
+        """Test that municipality numbers and normalized names map to alert positions."""
+        index = AlertIndex(ALERTS)
+
+        assert index.by_municipality_id["4601"] == [0, 1]
+        assert index.by_municipality_id["301"] == [3]
+        assert index.by_municipality_name["ålesund"] == [2]
+
+    def test_merged_municipalities(self):
+        """Test that active alerts sharing a master id get one sorted municipality list."""
+        index = AlertIndex(ALERTS)
+
+        assert index.merged_municipalities(100) == ["Bergen", "Sogndal", "Voss"]
+        assert index.merged_municipalities(3) is None
+        assert alert_master_id(ALERTS[2]) == 3
+
+        # Only alerts passed in are merged (e.g. those left by a municipality filter)
+        assert merge_municipalities(ALERTS[:1] + ALERTS[2:3]) == {}
+        assert merge_municipalities(ALERTS[:2]) == {100: ["Bergen", "Sogndal", "Voss"]}
+
+    def test_filter_index_matches_scan(self):
+        """Test that filtering through the index gives the same alerts as scanning."""
+        index = AlertIndex(ALERTS)
+
+        for filter_string in ("bergen", "Aalesund, 0301", "sogn,voss", "4621", "trondheim"):
+            matcher = MunicipalityMatcher(filter_string)
+            assert matcher.filter_index(index) == matcher.filter_alerts(ALERTS)
@@ -0,0 +1,62 @@
+"""Unit tests for the "My Area" municipality matcher."""
+from custom_components.norway_alerts.matcher import MunicipalityMatcher, normalize_name
+
+
+def _alert(*municipalities):
+    """Build an alert with (Id, Name) municipalities."""
+    return {"MunicipalityList": [{"Id": muni_id, "Name": name} for muni_id, name in municipalities]}
+
+
+class TestNormalizeName:
+    """Test Norwegian-aware name normalization."""
+
+    def test_norwegian_letters(self):
+        """Test that old spellings and transliterations map to æ, ø and å."""
+        assert normalize_name("Aalesund") == normalize_name("Ålesund") == "ålesund"
+        assert normalize_name("Baerum") == normalize_name("Bærum") == "bærum"
+        assert normalize_name("Tromsö") == normalize_name("TROMSØ") == "tromsø"
+
+    def test_accents_and_hyphens(self):
+        """Test that Sámi accents are stripped and hyphens match spaces."""
+        assert normalize_name("Kárášjohka") == "karasjohka"
+        assert normalize_name("Nord-Fron") == normalize_name("nord  fron") == "nord fron"
+
+
+class TestMunicipalityMatcher:
+    """Test the compiled municipality filter."""
+
+    def test_substring_match(self):
+        """Test that name terms match any part of a municipality name."""
+        matcher = MunicipalityMatcher("berg, Aalesund")
+
+        assert matcher.matches(_alert(("4601", "Bergen"))["MunicipalityList"])
+        assert matcher.matches(_alert(("4203", "Arendal"), ("1508", "Ålesund"))["MunicipalityList"])
+        assert not matcher.matches(_alert(("4621", "Voss"))["MunicipalityList"])
+
+    def test_number_match_is_exact(self):
+        """Test that numeric terms match municipality numbers exactly, ignoring leading zeros."""
+        matcher = MunicipalityMatcher("0301, 46")
+
+        assert matcher.matches(_alert((301, "Oslo"))["MunicipalityList"])
+        assert not matcher.matches(_alert(("4601", "Bergen"))["MunicipalityList"])
+
+    def test_filter_alerts(self):
+        """Test filtering a list of alerts."""
+        matcher = MunicipalityMatcher("voss,4601")
+        alerts = [_alert(("4601", "Bergen")), _alert(("4621", "Voss")), _alert(("1508", "Ålesund")), {}]
+
+        assert matcher.filter_alerts(alerts) == alerts[:2]
+
+    def test_empty_filter(self):
+        """Test that an empty filter is falsy."""
+        assert not MunicipalityMatcher("")
+        assert not MunicipalityMatcher(" , ")
+        assert MunicipalityMatcher("Bergen")
+
+    def test_overlapping_terms(self):
+        """Test that a term inside a longer partial match is still found."""
+        matcher = MunicipalityMatcher("nesodden, odd")
+
+        assert matcher.matches(_alert(("5000", "Odda"))["MunicipalityList"])
+        assert matcher.matches(_alert(("3212", "Nesodden"))["MunicipalityList"])
+        assert not matcher.matches(_alert(("3000", "Nes"))["MunicipalityList"])
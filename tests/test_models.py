@@ -0,0 +1,67 @@
+"""Unit tests for the slotted warning models."""
+import pytest
+
+from custom_components.norway_alerts.const import WARNING_TYPE_AVALANCHE, WARNING_TYPE_LANDSLIDE
+from custom_components.norway_alerts.models import (
+    AvalancheWarningModel,
+    NveWarningModel,
+    content_hash,
+    warning_from_dict,
+)
+
+RAW = {
+    "Id": 123,
+    "ActivityLevel": "2",
+    "MunicipalityList": [{"Id": "4601", "Name": "Bergen"}],
+    "SomeNewField": "kept",
+}
+
+
+class TestWarningModel:
+    """Test the read-only mapping behaviour of warning models."""
+
+    def test_mapping_access(self):
+        """Test that models read like the dicts they replace."""
+        warning = NveWarningModel(RAW)
+
+        assert warning["Id"] == 123
+        assert warning.get("MasterId") is None
+        assert warning.get("MasterId", "") == ""
+        assert "ActivityLevel" in warning and "MasterId" not in warning
+        assert warning["SomeNewField"] == "kept"
+        assert set(warning) == set(RAW)
+        assert dict(warning)["MunicipalityList"] == ({"Id": "4601", "Name": "Bergen"},)
+        with pytest.raises(KeyError):
+            warning["MasterId"]
+
+    def test_immutable(self):
+        """Test that models cannot be changed."""
+        warning = NveWarningModel(RAW)
+
+        with pytest.raises(TypeError):
+            warning["ActivityLevel"] = "3"
+        with pytest.raises(AttributeError):
+            warning.ActivityLevel = "3"
+
+    def test_places_shared(self):
+        """Test that identical municipality entries are stored once across warnings."""
+        first = NveWarningModel(RAW)
+        second = NveWarningModel({**RAW, "Id": 456, "MunicipalityList": [{"Id": "4601", "Name": "Bergen"}]})
+
+        assert first["MunicipalityList"][0] is second["MunicipalityList"][0]
+
+    def test_warning_from_dict(self):
+        """Test that saved warnings get the model of their warning type."""
+        assert isinstance(warning_from_dict(RAW, WARNING_TYPE_AVALANCHE), AvalancheWarningModel)
+
+        warning = warning_from_dict(RAW, WARNING_TYPE_LANDSLIDE)
+        assert isinstance(warning, NveWarningModel)
+        assert warning_from_dict(warning, WARNING_TYPE_LANDSLIDE) is warning
+
+    def test_content_hash(self):
+        """Test that the content hash is stable and follows the content."""
+        warning = NveWarningModel(RAW)
+
+        assert content_hash(warning) == content_hash(NveWarningModel(dict(RAW)))
+        assert content_hash(warning) == content_hash(RAW)
+        assert content_hash(warning) != content_hash(NveWarningModel({**RAW, "ActivityLevel": "3"}))
@@ -0,0 +1,75 @@
+"""Unit tests for the Norway Alerts poll scheduler."""
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import MagicMock
+
+from custom_components.norway_alerts.scheduler import PollScheduler, align_interval, poll_offset
+
+KEY = ("flood", "46", "en", True, False, False, "yellow_plus", 5, 120)
+
+
+class TestPollScheduling:
+    """Test per-coordinator poll offsets and slot alignment."""
+
+    def test_poll_offset_stable(self):
+        """Test that offsets are deterministic, in range and differ between keys."""
+        offset = poll_offset(KEY)
+
+        assert offset == poll_offset(tuple(KEY))
+        assert 0 <= offset < 1
+        assert offset != poll_offset(("landslide",) + KEY[1:])
+
+    def test_align_interval(self):
+        """Test that polls land on the coordinator's slot and stay there."""
+        interval = timedelta(minutes=30)
+        now = datetime(2025, 12, 19, 8, 0, tzinfo=timezone.utc)
+
+        # Offset 0.25 of a 30 minute cycle: slots at :07:30 and :37:30.
+        # The slot 7.5 minutes away is too close, so the next one is used.
+        delay = align_interval(interval, 0.25, now)
+        assert delay == timedelta(minutes=37, seconds=30)
+
+        # Once on the slot, the next poll is one interval later
+        assert align_interval(interval, 0.25, now + delay) == interval
+
+    def test_align_interval_spreads_coordinators(self):
+        """Test that coordinators with different offsets do not poll at the same time."""
+        interval = timedelta(minutes=30)
+        now = datetime(2025, 12, 19, 8, 0, tzinfo=timezone.utc)
+
+        next_polls = {now + align_interval(interval, offset, now) for offset in (0.1, 0.4, 0.7)}
+
+        assert len(next_polls) == 3
+
+
+class TestPollScheduler:
+    """Test the startup first refresh limit."""
+
+    @pytest.mark.asyncio
+    async def test_first_refresh_concurrency(self):
+        """Test that no more than max_concurrent first refreshes run at once."""
+        scheduler = PollScheduler(max_concurrent=2)
+        running = 0
+        peak = 0
+
+        async def _refresh():
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        coordinators = [MagicMock(async_refresh=_refresh) for _ in range(5)]
+        await asyncio.gather(*(scheduler.async_first_refresh(c) for c in coordinators))
+
+        assert peak == 2
+        assert scheduler.waiting == scheduler.running == 0
+
+    def test_startup_delay(self):
+        """Test that warm-started refreshes are spread over the startup window."""
+        scheduler = PollScheduler(startup_spread=60)
+
+        assert scheduler.startup_delay(0) == 0
+        assert scheduler.startup_delay(0.5) == 30
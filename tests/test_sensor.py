@@ -69,6 +69,215 @@ class TestNorwayAlertsCoordinator:
         assert len(result) == 0
 
 
+    @pytest.mark.asyncio
+    async def test_restore_snapshot(self, mock_hass, mock_county_api_response):
+        """Test that recent saved warnings are shown and served if the next fetch fails."""
+        from datetime import timedelta
+        from homeassistant.util import dt as dt_util
+        from custom_components.norway_alerts.models import WarningModel
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator
+        
+        store = MagicMock()
+        store.async_load = AsyncMock(return_value={
+            "saved_at": (dt_util.utcnow() - timedelta(minutes=10)).isoformat(),
+            "query": [WARNING_TYPE_LANDSLIDE, "46", None, None, "en"],
+            "warnings": mock_county_api_response,
+        })
+        
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+                snapshot_store=store,
+            )
+        
+        with patch.object(coordinator, "async_set_updated_data") as mock_set_data:
+            assert await coordinator.async_restore_snapshot(timedelta(minutes=60))
+        
+        mock_set_data.assert_called_once()
+        restored = mock_set_data.call_args[0][0]
+        assert all(isinstance(warning, WarningModel) for warning in restored)
+        assert [warning["Id"] for warning in restored] == [warning["Id"] for warning in mock_county_api_response]
+        assert coordinator.stale
+        
+        # The next fetch fails: the restored warnings are kept
+        with patch.object(coordinator.api_client, "_fetch_county_warnings", AsyncMock(return_value=None)):
+            result = await coordinator._async_update_data()
+        
+        assert result == restored
+        store.async_delay_save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_restore_snapshot_too_old(self, mock_hass, mock_county_api_response):
+        """Test that snapshots older than the max age are ignored."""
+        from datetime import timedelta
+        from homeassistant.util import dt as dt_util
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator
+        
+        store = MagicMock()
+        store.async_load = AsyncMock(return_value={
+            "saved_at": (dt_util.utcnow() - timedelta(hours=5)).isoformat(),
+            "query": [WARNING_TYPE_LANDSLIDE, "46", None, None, "en"],
+            "warnings": mock_county_api_response,
+        })
+        
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+                snapshot_store=store,
+            )
+        
+        assert not await coordinator.async_restore_snapshot(timedelta(hours=3))
+        assert coordinator.api_client is None
+        
+        # A successful fetch schedules a new snapshot
+        with patch("custom_components.norway_alerts.sensor.WarningAPIFactory") as mock_factory:
+            mock_api = MagicMock()
+            mock_api.fetch_warnings = AsyncMock(return_value=mock_county_api_response)
+            mock_api.stale = False
+            mock_factory.return_value.get_api.return_value = mock_api
+            
+            await coordinator._async_update_data()
+        
+        store.async_delay_save.assert_called_once()
+        snapshot = store.async_delay_save.call_args.args[0]()
+        assert snapshot["warnings"] == mock_county_api_response
+        assert snapshot["query"] == [WARNING_TYPE_LANDSLIDE, "46", None, None, "en"]
+
+    @pytest.mark.asyncio
+    async def test_restore_snapshot_other_query(self, mock_hass, mock_county_api_response):
+        """Test that a snapshot saved before the entry's county changed is not restored."""
+        from datetime import timedelta
+        from homeassistant.util import dt as dt_util
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator
+        
+        store = MagicMock()
+        store.async_load = AsyncMock(return_value={
+            "saved_at": (dt_util.utcnow() - timedelta(minutes=10)).isoformat(),
+            "query": [WARNING_TYPE_LANDSLIDE, "42", None, None, "en"],
+            "warnings": mock_county_api_response,
+        })
+        
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+                snapshot_store=store,
+            )
+        
+        assert not await coordinator.async_restore_snapshot(timedelta(minutes=60))
+
+
+    def test_nve_times_in_norwegian_time(self, mock_hass):
+        """Test that NVE times without an offset are read as Norwegian local time."""
+        from datetime import timedelta
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator
+        
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+            )
+        
+        assert coordinator._parse_nve_time("2025-07-01T12:00:00").utcoffset() == timedelta(hours=2)
+        assert coordinator._parse_nve_time("2025-12-19T12:00:00").utcoffset() == timedelta(hours=1)
+        assert coordinator._parse_nve_time("2025-12-19T12:00:00Z").utcoffset() == timedelta(0)
+
+    def test_adaptive_update_interval(self, mock_hass):
+        """Test that the poll interval follows alert levels and expected publication times."""
+        from datetime import timedelta
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator
+        
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+                min_poll_interval=timedelta(minutes=5),
+                max_poll_interval=timedelta(minutes=120),
+            )
+        
+        now = datetime.fromisoformat("2025-12-19T09:00:00+01:00")
+        
+        # Nothing active: back off to the maximum
+        assert coordinator._compute_update_interval([], now) == timedelta(minutes=120)
+        # Yellow and orange alerts poll faster
+        assert coordinator._compute_update_interval([{"ActivityLevel": "2"}], now) == timedelta(minutes=30)
+        assert coordinator._compute_update_interval([{"ActivityLevel": "3"}], now) == timedelta(minutes=10)
+        
+        # Poll shortly after the announced next warning
+        next_warning = [{"ActivityLevel": "2", "NextWarningTime": "2025-12-19T09:15:00+01:00"}]
+        assert coordinator._compute_update_interval(next_warning, now) == timedelta(minutes=17)
+        
+        # Without NextWarningTime, expect the next publication a day after PublishTime
+        published = [{"ActivityLevel": "1", "PublishTime": "2025-12-18T10:00:00+01:00"}]
+        assert coordinator._compute_update_interval(published, now) == timedelta(minutes=62)
+        
+        # Never below the minimum
+        imminent = [{"ActivityLevel": "3", "DangerIncreaseDateTime": "2025-12-19T09:00:30+01:00"}]
+        assert coordinator._compute_update_interval(imminent, now) == timedelta(minutes=5)
+
+
+    def test_reconcile_shares_unchanged_alerts(self, mock_hass):
+        """Test that unchanged alerts are carried over by reference between polls."""
+        from custom_components.norway_alerts.models import NveWarningModel
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator
+        
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+            )
+        
+        def _poll(*levels):
+            return [
+                NveWarningModel({"Id": alert_id, "ActivityLevel": level, "_warning_type": WARNING_TYPE_LANDSLIDE})
+                for alert_id, level in enumerate(levels)
+            ]
+        
+        coordinator.data = coordinator._reconcile(_poll("2", "3"))
+        assert coordinator.generation == 1
+        assert len(coordinator.changeset["added"]) == 2
+        first = coordinator.data
+        
+        # Same content: the previous list is kept and the generation does not change
+        assert coordinator._reconcile(_poll("2", "3")) is first
+        assert coordinator.generation == 1
+        assert coordinator.changeset == {"added": [], "changed": [], "removed": []}
+        
+        # One alert changed, one removed: the unchanged alert keeps its object
+        coordinator.data = coordinator._reconcile(_poll("3"))
+        assert coordinator.generation == 2
+        assert coordinator.changeset == {
+            "added": [],
+            "changed": [(WARNING_TYPE_LANDSLIDE, 0, None)],
+            "removed": [(WARNING_TYPE_LANDSLIDE, 1, None)],
+        }
+        
+        coordinator.data = coordinator._reconcile(_poll("3", "2"))
+        assert coordinator.data[0] is not first[0]
+        second = coordinator.data
+        assert coordinator._reconcile(_poll("3", "4"))[0] is second[0]
+
+
 class TestNorwayAlertsSensor:
     """Test Norway Alerts sensor entity."""
 
@@ -152,3 +361,252 @@ class TestNorwayAlertsSensor:
         )
         
         assert sensor.native_value == 0
+
+    def test_sensor_view_computed_once_per_update(self):
+        """Test that state, attributes and icon are computed once per coordinator update."""
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator, NorwayAlertsSensor
+        mock_hass = MagicMock()
+
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+                cap_format=False,
+            )
+        coordinator.data = [{"ActivityLevel": "3", "Id": 123, "_warning_type": WARNING_TYPE_LANDSLIDE}]
+        
+        sensor = NorwayAlertsSensor(
+            coordinator=coordinator,
+            entry_id="test_entry",
+            county_name="Vestland",
+            warning_type=WARNING_TYPE_LANDSLIDE,
+        )
+        
+        with patch.object(sensor, "_build_attributes", wraps=sensor._build_attributes) as build:
+            assert sensor.native_value == 1
+            assert sensor.extra_state_attributes["highest_level"] == "orange"
+            assert sensor.entity_picture == "/norway_alerts/icons/landslide-orange.svg"
+            assert build.call_count == 1
+            
+            # New data from the coordinator is materialized once and then served from the view
+            coordinator.data = []
+            with patch.object(sensor, "async_write_ha_state"):
+                sensor._handle_coordinator_update()
+            assert sensor.native_value == 0
+            assert sensor.extra_state_attributes["active_alerts"] == 0
+            assert sensor.entity_picture is None
+            assert build.call_count == 1
+
+    def test_cap_conversion_shared(self):
+        """Test that CAP conversions are reused across polls and sensors without modifying alerts."""
+        from custom_components.norway_alerts.models import NveWarningModel
+        from custom_components.norway_alerts.sensor import CapCache, NorwayAlertsCoordinator, NorwayAlertsSensor
+        mock_hass = MagicMock()
+
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+            )
+        raw = {"ActivityLevel": "2", "Id": 123, "_warning_type": WARNING_TYPE_LANDSLIDE,
+               "MunicipalityList": [{"Id": "4601", "Name": "Bergen"}]}
+        coordinator.data = [NveWarningModel(raw)]
+        
+        cache = CapCache()
+        with patch("custom_components.norway_alerts.sensor.CAP_CACHE", cache):
+            main = NorwayAlertsSensor(coordinator, "test_entry", "Vestland", WARNING_TYPE_LANDSLIDE)
+            filtered = NorwayAlertsSensor(coordinator, "test_entry", "Vestland", WARNING_TYPE_LANDSLIDE,
+                                          municipality_filter="Bergen", is_main=False)
+            first = main.extra_state_attributes["alerts"][0]
+            assert filtered.extra_state_attributes["alerts"][0] is first
+            
+            # Next poll returns the same warning as a new object
+            coordinator.data = [NveWarningModel(dict(raw))]
+            assert main.extra_state_attributes["alerts"][0] is first
+        
+        assert cache.misses == 1 and cache.hits == 2
+        assert first["event"] == "Landslide"
+        assert "entity_picture" not in coordinator.data[0]
+
+    def test_filtered_sensor_merges_only_shown_alerts(self):
+        """Test that a "My Area" sensor merges municipalities of the alerts it shows, not of every alert."""
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator, NorwayAlertsSensor
+        mock_hass = MagicMock()
+
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+                cap_format=False,
+            )
+        coordinator.data = [
+            {"Id": 1, "MasterId": 100, "ActivityLevel": "2", "_warning_type": WARNING_TYPE_LANDSLIDE,
+             "MunicipalityList": [{"Id": "4601", "Name": "Bergen"}, {"Id": "4621", "Name": "Voss"}]},
+            {"Id": 2, "MasterId": 100, "ActivityLevel": "2", "_warning_type": WARNING_TYPE_LANDSLIDE,
+             "MunicipalityList": [{"Id": "4640", "Name": "Sogndal"}]},
+        ]
+        main = NorwayAlertsSensor(coordinator, "test_entry", "Vestland", WARNING_TYPE_LANDSLIDE,
+                                  municipality_filter="Bergen", is_main=True)
+        bergen = NorwayAlertsSensor(coordinator, "test_entry", "Vestland", WARNING_TYPE_LANDSLIDE,
+                                    municipality_filter="Bergen", is_main=False)
+        both = NorwayAlertsSensor(coordinator, "test_entry", "Vestland", WARNING_TYPE_LANDSLIDE,
+                                  municipality_filter="Voss, Sogndal", is_main=False)
+
+        assert main.extra_state_attributes["alerts"][0]["municipalities"] == ["Bergen", "Sogndal", "Voss"]
+        assert bergen.extra_state_attributes["alerts"][0]["municipalities"] == ["Bergen", "Voss"]
+        assert both.extra_state_attributes["alerts"][0]["municipalities"] == ["Bergen", "Sogndal", "Voss"]
+
+    def test_unchanged_state_not_written(self):
+        """Test that coordinator updates without visible changes skip the state write."""
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator, NorwayAlertsSensor
+        mock_hass = MagicMock()
+
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+            )
+        sensor = NorwayAlertsSensor(coordinator, "test_entry", "Vestland", WARNING_TYPE_LANDSLIDE)
+        
+        with patch.object(sensor, "async_write_ha_state") as write:
+            coordinator.data = [{"ActivityLevel": "2", "Id": 123, "_warning_type": WARNING_TYPE_LANDSLIDE}]
+            sensor._handle_coordinator_update()
+            # A new poll with the same content
+            coordinator.data = [{"ActivityLevel": "2", "Id": 123, "_warning_type": WARNING_TYPE_LANDSLIDE}]
+            sensor._handle_coordinator_update()
+            assert write.call_count == 1
+            
+            coordinator.data = [{"ActivityLevel": "3", "Id": 123, "_warning_type": WARNING_TYPE_LANDSLIDE}]
+            sensor._handle_coordinator_update()
+            assert write.call_count == 2
+        
+        assert coordinator.write_stats == {"writes": 2, "skipped": 1}
+
+    @pytest.mark.asyncio
+    async def test_identical_polls_written_once(self, mock_county_api_response, mock_aiohttp_session):
+        """Test that identical polls through the API client write state once, although last_success moves."""
+        import json
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator, NorwayAlertsSensor
+        mock_hass = MagicMock()
+
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+            )
+        sensor = NorwayAlertsSensor(coordinator, "test_entry", "Vestland", WARNING_TYPE_LANDSLIDE)
+        
+        responses = []
+        for _ in range(3):
+            response = MagicMock()
+            response.status = 200
+            response.headers = {"Content-Type": "application/json"}
+            response.read = AsyncMock(return_value=json.dumps(mock_county_api_response).encode())
+            responses.append(response)
+        
+        last_successes = []
+        with patch("aiohttp.ClientSession", mock_aiohttp_session(*responses)), \
+                patch.object(sensor, "async_write_ha_state") as write:
+            for _ in range(3):
+                # Past the response cache TTL, so every poll downloads again
+                if coordinator.api_client is not None:
+                    coordinator.api_client.session_provider.response_cache.ttl = 0
+                coordinator.data = await coordinator._async_update_data()
+                last_successes.append(coordinator.last_success)
+                sensor._handle_coordinator_update()
+        
+        assert len(set(last_successes)) == 3
+        assert write.call_count == 1
+        assert coordinator.write_stats == {"writes": 1, "skipped": 2}
+
+    @pytest.mark.asyncio
+    async def test_failed_first_fetch_fails_update(self, mock_aiohttp_session):
+        """Test that a failed fetch without an earlier result fails the update instead of showing no warnings."""
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator
+        mock_hass = MagicMock()
+
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+            )
+        
+        unavailable = MagicMock()
+        unavailable.status = 503
+        unavailable.headers = {}
+        
+        with patch("aiohttp.ClientSession", mock_aiohttp_session(unavailable)):
+            await coordinator.async_refresh()
+        
+        assert not coordinator.last_update_success
+        assert coordinator.data is None
+
+    def test_next_status_change(self):
+        """Test that the next alert start or end time is found for re-rendering the status."""
+        from datetime import timedelta
+        from homeassistant.util import dt as dt_util
+        from custom_components.norway_alerts.sensor import _next_status_change
+        
+        now = dt_util.utcnow().replace(microsecond=0)
+        alerts = [
+            {"starttime": (now - timedelta(hours=1)).isoformat(), "endtime": (now + timedelta(hours=5)).isoformat()},
+            {"starttime": (now + timedelta(hours=2)).isoformat(), "endtime": "not a time"},
+        ]
+        
+        assert _next_status_change(alerts) == now + timedelta(hours=2)
+        assert _next_status_change([{"starttime": (now - timedelta(hours=1)).isoformat()}]) is None
+
+    def test_lean_sensor_attributes(self):
+        """Test that lean sensors add alert IDs and do not record alert details."""
+        from custom_components.norway_alerts.sensor import NorwayAlertsCoordinator, NorwayAlertsLeanSensor
+        mock_hass = MagicMock()
+
+        with patch("homeassistant.helpers.frame.report_usage"):
+            coordinator = NorwayAlertsCoordinator(
+                hass=mock_hass,
+                county_id="46",
+                county_name="Vestland",
+                warning_type=WARNING_TYPE_LANDSLIDE,
+                lang="en",
+                cap_format=False,
+            )
+        coordinator.data = [{"ActivityLevel": "2", "Id": 123, "_warning_type": WARNING_TYPE_LANDSLIDE}]
+        sensor = NorwayAlertsLeanSensor(coordinator, "test_entry", "Vestland", WARNING_TYPE_LANDSLIDE)
+        
+        assert sensor.extra_state_attributes["alert_ids"] == [123]
+        
+        # What the recorder keeps: Home Assistant drops the entity's combined unrecorded attributes
+        unrecorded = sensor._Entity__combined_unrecorded_attributes
+        
+        def recorded():
+            return {key: value for key, value in sensor.extra_state_attributes.items() if key not in unrecorded}
+        
+        assert set(recorded()) == {
+            "active_alerts", "highest_level", "highest_level_numeric", "alert_ids",
+            "county_name", "county_id", "municipality_filter",
+        }
+        
+        # A later successful poll with the same alerts records identical attributes
+        before = recorded()
+        coordinator.last_success = datetime(2025, 12, 19, 12, 0)
+        coordinator.data = [{"ActivityLevel": "2", "Id": 123, "_warning_type": WARNING_TYPE_LANDSLIDE}]
+        assert "last_success" in sensor.extra_state_attributes
+        assert recorded() == before
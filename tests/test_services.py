@@ -0,0 +1,59 @@
+"""Unit tests for the get_alerts service and websocket command."""
+import pytest
+from unittest.mock import MagicMock
+
+from homeassistant.exceptions import ServiceValidationError
+
+from custom_components.norway_alerts.const import DOMAIN, WARNING_TYPE_LANDSLIDE
+from custom_components.norway_alerts.models import NveWarningModel
+from custom_components.norway_alerts.services import async_get_alert_details, websocket_get_alerts
+
+
+@pytest.fixture
+def hass_with_entry():
+    """Return a hass mock with one loaded entry and its coordinator."""
+    entry = MagicMock(entry_id="entry_1", title="Landslide Vestland")
+    coordinator = MagicMock(warning_type=WARNING_TYPE_LANDSLIDE, generation=3, stale=False, last_success=None)
+    coordinator.data = [
+        NveWarningModel({"Id": 1, "ActivityLevel": "2", "MountainWeather": {"Wind": "Storm"}}),
+        NveWarningModel({"Id": 2, "ActivityLevel": "3"}),
+    ]
+    hass = MagicMock()
+    hass.data = {DOMAIN: {"entry_1": coordinator}}
+    hass.config_entries.async_entries.return_value = [entry, MagicMock(entry_id="not_loaded")]
+    return hass
+
+
+class TestAlertDetails:
+    """Test full alert details served from the coordinators."""
+
+    def test_all_entries(self, hass_with_entry):
+        """Test that all loaded entries are returned with every alert field."""
+        details = async_get_alert_details(hass_with_entry)
+
+        assert list(details["entries"]) == ["entry_1"]
+        entry = details["entries"]["entry_1"]
+        assert entry["generation"] == 3
+        assert entry["alerts"][0]["MountainWeather"] == {"Wind": "Storm"}
+        assert len(entry["alerts"]) == 2
+
+    def test_filter_by_alert(self, hass_with_entry):
+        """Test selecting one entry and one alert."""
+        details = async_get_alert_details(hass_with_entry, "entry_1", "2")
+
+        assert [alert["Id"] for alert in details["entries"]["entry_1"]["alerts"]] == [2]
+
+    def test_unknown_entry(self, hass_with_entry):
+        """Test that an unknown or unloaded entry is a validation error."""
+        with pytest.raises(ServiceValidationError):
+            async_get_alert_details(hass_with_entry, "not_loaded")
+
+    def test_websocket_command(self, hass_with_entry):
+        """Test that the websocket command sends the same details."""
+        connection = MagicMock()
+
+        websocket_get_alerts(hass_with_entry, connection, {"id": 5, "type": "norway_alerts/alerts"})
+        connection.send_result.assert_called_once_with(5, async_get_alert_details(hass_with_entry))
+
+        websocket_get_alerts(hass_with_entry, connection, {"id": 6, "type": "norway_alerts/alerts", "config_entry_id": "x"})
+        assert connection.send_error.call_args[0][0] == 6
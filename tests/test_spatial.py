@@ -0,0 +1,251 @@
+"""Unit tests for coordinate conversion, spatial indexes and boundary lookups."""
+from math import cos, radians, sin
+from pathlib import Path
+import random
+
+import pytest
+
+from custom_components.norway_alerts.municipality_lookup import (
+    COUNTY_BOUNDARIES,
+    get_county_from_coordinates,
+    get_municipality_from_coordinates,
+    get_municipality_from_coordinates_precise,
+    load_county_boundaries,
+    load_geojson_boundaries,
+)
+from custom_components.norway_alerts.spatial import (
+    GridIndex,
+    PolygonShape,
+    STRtree,
+    utm33_from_wgs84,
+    wgs84_from_utm33,
+)
+
+FYLKER_ZIP = Path(__file__).parent.parent / "municipalities" / "Basisdata_0000_Norge_25833_Fylker_GeoJSON.zip"
+
+CITIES = [
+    (60.39, 5.32, ("Vestland", "46")),  # Bergen
+    (59.91, 10.75, ("Oslo", "03")),
+    (63.43, 10.39, ("Trøndelag", "50")),  # Trondheim
+    (69.65, 18.96, ("Troms", "55")),  # Tromsø
+    (70.66, 23.68, ("Finnmark", "56")),  # Hammerfest
+    (59.27, 10.41, ("Vestfold", "39")),  # Tønsberg
+]
+
+
+def _meridian_arc(latitude: float, steps: int = 20000) -> float:
+    """Return the GRS80 meridian arc length to a latitude by numerical integration."""
+    a, f = 6378137.0, 1 / 298.257222101
+    e2 = f * (2 - f)
+    phi = radians(latitude)
+    h = phi / steps
+    total = 0.0
+    for i in range(steps):
+        mid = (i + 0.5) * h
+        total += a * (1 - e2) / (1 - e2 * sin(mid) ** 2) ** 1.5 * h
+    return total
+
+
+@pytest.fixture(scope="module")
+def counties():
+    """Return the full county boundaries from Kartverket's Fylker zip."""
+    return load_geojson_boundaries(str(FYLKER_ZIP))
+
+
+class TestProjection:
+    """Test EPSG:25833 <-> WGS84 conversion."""
+
+    def test_central_meridian(self):
+        """Test that the central meridian maps to the false easting and the scaled meridian arc."""
+        easting, northing = utm33_from_wgs84(60.0, 15.0)
+
+        assert easting == pytest.approx(500000.0, abs=1e-6)
+        assert northing == pytest.approx(0.9996 * _meridian_arc(60.0), abs=0.01)
+
+    def test_round_trip(self):
+        """Test that converting back and forth returns the same point (well below a millimetre)."""
+        for latitude, longitude in ((58.0, 4.5), (60.39, 5.32), (69.65, 18.96), (71.1, 31.0)):
+            back = wgs84_from_utm33(*utm33_from_wgs84(latitude, longitude))
+            assert back == pytest.approx((latitude, longitude), abs=1e-9)
+
+
+class TestPolygonShape:
+    """Test exact point-in-polygon tests."""
+
+    def test_polygon_with_hole(self):
+        """Test points inside, outside and in the hole of a polygon."""
+        outer = [(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)]
+        hole = [(4, 4), (6, 4), (6, 6), (4, 6), (4, 4)]
+        shape = PolygonShape([outer, hole], "area")
+
+        assert shape.bbox == (0, 0, 10, 10)
+        assert shape.contains(1, 1)
+        assert shape.contains(8, 5)
+        assert not shape.contains(5, 5)
+        assert not shape.contains(11, 5)
+
+    def test_matches_brute_force(self):
+        """Test that banded edges give the same answer as testing every edge."""
+        rng = random.Random(1)
+        ring = [
+            (cos(radians(angle)) * rng.uniform(5, 10), sin(radians(angle)) * rng.uniform(5, 10))
+            for angle in range(0, 360, 3)
+        ]
+        shape = PolygonShape([ring], "star")
+
+        def brute_force(x, y):
+            inside = False
+            for (x1, y1), (x2, y2) in zip(ring, ring[1:] + ring[:1]):
+                if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+                    inside = not inside
+            return inside
+
+        for _ in range(2000):
+            x, y = rng.uniform(-11, 11), rng.uniform(-11, 11)
+            assert shape.contains(x, y) == brute_force(x, y)
+
+
+class TestSTRtree:
+    """Test the packed R-tree."""
+
+    def test_query_point(self):
+        """Test that point queries return exactly the boxes containing the point."""
+        rng = random.Random(2)
+        boxes = []
+        for i in range(500):
+            x, y = rng.uniform(0, 100), rng.uniform(0, 100)
+            boxes.append(((x, y, x + rng.uniform(0, 10), y + rng.uniform(0, 10)), i))
+        tree = STRtree(boxes)
+
+        assert len(tree) == 500
+        for _ in range(200):
+            x, y = rng.uniform(0, 110), rng.uniform(0, 110)
+            expected = {i for (x1, y1, x2, y2), i in boxes if x1 <= x <= x2 and y1 <= y <= y2}
+            assert set(tree.query_point(x, y)) == expected
+
+    def test_empty(self):
+        """Test that an empty tree finds nothing."""
+        assert list(STRtree([]).query_point(0, 0)) == []
+
+
+class TestGridIndex:
+    """Test the uniform grid index."""
+
+    def test_matches_brute_force(self):
+        """Test that grid lookups agree with testing every polygon."""
+        rng = random.Random(3)
+        shapes = []
+        for i in range(40):
+            cx, cy = rng.uniform(0, 100), rng.uniform(0, 100)
+            ring = [
+                (cx + cos(radians(angle)) * rng.uniform(2, 8), cy + sin(radians(angle)) * rng.uniform(2, 8))
+                for angle in range(0, 360, 10)
+            ]
+            shapes.append(PolygonShape([ring], i))
+        grid = GridIndex(shapes, cell_count=400)
+
+        for _ in range(5000):
+            x, y = rng.uniform(-5, 105), rng.uniform(-5, 105)
+            expected = {shape.value for shape in shapes if shape.contains(x, y)}
+            assert {shape.value for shape in grid.candidates(x, y) if shape.contains(x, y)} == expected
+            if len(expected) <= 1:
+                assert grid.lookup(x, y) == next(iter(expected), None)
+
+    def test_single_polygon_cells(self):
+        """Test that cells inside one polygon resolve without a test and cells outside to None."""
+        square = PolygonShape([[(0, 0), (100, 0), (100, 100), (0, 100)]], "square")
+        grid = GridIndex([square, PolygonShape([[(200, 200), (210, 200), (210, 210)]], "far")], cell_count=900)
+
+        assert grid.single_polygon_cells > 0
+        assert grid.candidates(50, 50) == (square,)
+        assert grid.lookup(50, 50) == "square"
+        assert grid.lookup(150, 150) is None
+        assert grid.candidates(150, 150) == ()
+        assert grid.lookup(-1, 50) is None
+        assert grid.lookup(50, 1000) is None
+
+    def test_boundary_on_cell_border(self):
+        """Test that points on a boundary lying on a cell border get the polygon as candidate."""
+        square = PolygonShape([[(0, 0), (10, 0), (10, 10), (0, 10)]], "square")
+        grid = GridIndex([square, PolygonShape([[(0, 0), (20, 0), (20, 20), (0, 20)]], "outer")], cell_count=4)
+
+        for x, y in ((10, 5), (5, 10), (10, 10), (0, 0)):
+            assert square in grid.candidates(x, y)
+
+    def test_empty(self):
+        """Test that an empty grid finds nothing."""
+        assert GridIndex([]).lookup(0, 0) is None
+        assert GridIndex([]).candidates(0, 0) == ()
+
+
+class TestApproximateLookup:
+    """Test the bounding box lookup over MUNICIPALITY_LOOKUP."""
+
+    def test_edges_inclusive(self):
+        """Test that points on a box edge are inside it."""
+        assert get_municipality_from_coordinates(60.3, 5.1) == ("Bergen", "46")
+        assert get_municipality_from_coordinates(59.91, 10.75) is None
+
+    def test_overlap_uses_nearest_centre(self):
+        """Test that overlapping boxes resolve to the one whose centre is nearest, not the first in the table."""
+        # Alver, Askøy and Øygarden all contain the point; Øygarden's centre is nearest
+        assert get_municipality_from_coordinates(60.5, 5.02) == ("Øygarden", "46")
+
+    def test_overlap_tie_uses_table_order(self):
+        """Test that boxes with the same centre resolve to the first in the table."""
+        # Bergen and "Vestland fylkeskommune" are both centred on the point; Bergen comes first
+        assert get_municipality_from_coordinates(60.4, 5.3) == ("Bergen", "46")
+
+
+class TestCountyLookup:
+    """Test precise county lookups over the Fylker data."""
+
+    @pytest.mark.parametrize(("latitude", "longitude", "expected"), CITIES)
+    def test_lookup(self, counties, latitude, longitude, expected):
+        """Test that cities are found in their county."""
+        assert get_municipality_from_coordinates_precise(latitude, longitude, counties) == expected
+
+    def test_outside_norway(self, counties):
+        """Test that points outside every county are not found."""
+        assert get_municipality_from_coordinates_precise(60.0, 2.0, counties) is None
+        assert get_municipality_from_coordinates_precise(59.33, 18.07, counties) is None  # Stockholm
+
+    def test_matches_polygon_scan(self, counties):
+        """Test that county lookups through the grid agree with testing every polygon."""
+        rng = random.Random(4)
+        for _ in range(2000):
+            latitude, longitude = rng.uniform(57.9, 71.2), rng.uniform(4.5, 31.2)
+            x, y = utm33_from_wgs84(latitude, longitude)
+            expected = next((shape.value for shape in counties._grid.shapes if shape.contains(x, y)), None)
+            assert get_municipality_from_coordinates_precise(latitude, longitude, counties) == expected
+
+
+class TestBundledCounties:
+    """Test the simplified county boundaries shipped with the integration."""
+
+    def test_small(self):
+        """Test that the bundled file stays small enough to load for a single lookup."""
+        assert COUNTY_BOUNDARIES.stat().st_size < 100_000
+        assert len(load_county_boundaries()) < 200
+
+    @pytest.mark.parametrize(("latitude", "longitude", "expected"), CITIES)
+    def test_lookup(self, latitude, longitude, expected):
+        """Test that cities are found in their county."""
+        assert get_county_from_coordinates(latitude, longitude) == expected[1]
+
+    def test_agrees_with_full_boundaries(self, counties):
+        """Test that points only resolve to another county than in the full data right at a border."""
+        simplified = load_county_boundaries()
+        rng = random.Random(5)
+        for _ in range(2000):
+            latitude, longitude = rng.uniform(57.9, 71.2), rng.uniform(4.5, 31.2)
+            area = get_municipality_from_coordinates_precise(latitude, longitude, simplified)
+            if area is None or area == get_municipality_from_coordinates_precise(latitude, longitude, counties):
+                continue
+            # Simplified rings stay within 250 m of the real ones
+            x, y = utm33_from_wgs84(latitude, longitude)
+            nearby = {
+                counties._grid.lookup(x + 300 * cos(radians(angle)), y + 300 * sin(radians(angle)))
+                for angle in range(0, 360, 15)
+            }
+            assert area in nearby